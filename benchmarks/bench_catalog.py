@@ -0,0 +1,154 @@
+"""
+Benchmark catalog builds: paginated GraphQL vs. the single streamed REST request.
+
+Offline (default): serves a synthetic REST problem list shaped like
+``api/problems/algorithms/`` from an in-process transport and compares peak
+Python memory of decoding it with ``response.json()`` against the streaming
+decoder used by ``_build_cache_from_api``.
+
+Live (--live): builds the catalog from leetcode.com with both sources and
+reports wall time and peak memory, to decide whether ``catalog_source="rest"``
+(INTERVIEW_PREP_CATALOG_SOURCE=rest) is faster from your network.
+
+Usage:
+    python benchmarks/bench_catalog.py [--problems 3500]
+    python benchmarks/bench_catalog.py --live
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Tuple
+from unittest.mock import patch
+import httpx
+from interview_prep_mcp.leetcode.client import LeetCodeClient, _problem_info_from_pair
+from interview_prep_mcp.leetcode.types import CachedProblemInfo
+
+
+def synthetic_payload(problems: int) -> bytes:
+    """Build a REST problem list with realistic per-entry fields."""
+    pairs = []
+    for i in range(1, problems + 1):
+        pairs.append(
+            {
+                "stat": {
+                    "question_id": i,
+                    "question__article__live": None,
+                    "question__article__slug": None,
+                    "question__article__has_video_solution": None,
+                    "question__title": f"Synthetic Problem Number {i}",
+                    "question__title_slug": f"synthetic-problem-number-{i}",
+                    "question__hide": False,
+                    "total_acs": 1000 * i,
+                    "total_submitted": 2500 * i,
+                    "frontend_question_id": i,
+                    "is_new_question": False,
+                },
+                "status": None,
+                "difficulty": {"level": i % 3 + 1},
+                "paid_only": i % 7 == 0,
+                "is_favor": False,
+                "frequency": 0,
+                "progress": 0,
+            }
+        )
+    return json.dumps(
+        {
+            "user_name": "",
+            "num_solved": 0,
+            "num_total": problems,
+            "ac_easy": 0,
+            "ac_medium": 0,
+            "ac_hard": 0,
+            "stat_status_pairs": pairs,
+            "frequency_high": 0,
+            "frequency_mid": 0,
+            "category_slug": "algorithms",
+        }
+    ).encode()
+
+
+async def chunked(body: bytes, size: int = 64 * 1024) -> AsyncIterator[bytes]:
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+def measure(run: Callable[[], Awaitable[int]]) -> Tuple[int, float, float]:
+    """Run a build, returning (entries, seconds, peak MiB)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    entries = asyncio.run(run())
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return entries, elapsed, peak / (1024 * 1024)
+
+
+def offline(problems: int) -> List[Tuple[str, int, float, float]]:
+    # Built outside the measured region, like bytes arriving from the network
+    body = synthetic_payload(problems)
+    print(f"synthetic payload: {len(body) / (1024 * 1024):.1f} MiB, {problems} problems\n")
+    real_async_client = httpx.AsyncClient
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=chunked(body))
+
+    def make_client(*args: object, **kwargs: object) -> httpx.AsyncClient:
+        return real_async_client(transport=httpx.MockTransport(handler))
+
+    async def whole_body() -> int:
+        # Previous implementation: read everything, decode the full tree, then convert
+        async with make_client() as client:
+            response = await client.get("https://leetcode.com/api/problems/algorithms/")
+            data = response.json()
+            catalog: Dict[str, CachedProblemInfo] = {}
+            for item in data["stat_status_pairs"]:
+                problem = _problem_info_from_pair(item)
+                if problem is not None:
+                    catalog[problem.questionFrontendId] = problem
+            return len(catalog)
+
+    async def streamed() -> int:
+        with patch("httpx.AsyncClient", side_effect=make_client):
+            return len(await LeetCodeClient()._build_cache_from_api())
+
+    return [
+        ("response.json()", *measure(whole_body)),
+        ("streaming decode", *measure(streamed)),
+    ]
+
+
+def live() -> List[Tuple[str, int, float, float]]:
+    def build(source: str) -> Callable[[], Awaitable[int]]:
+        async def run() -> int:
+            client = LeetCodeClient()
+            if source == "rest":
+                return len(await client._build_cache_from_api())
+            return len(await client._build_id_to_slug_cache())
+
+        return run
+
+    return [
+        ("graphql (paginated)", *measure(build("graphql"))),
+        ("rest (streamed)", *measure(build("rest"))),
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--problems", type=int, default=3500)
+    parser.add_argument("--live", action="store_true", help="build from leetcode.com")
+    args = parser.parse_args()
+
+    rows = live() if args.live else offline(args.problems)
+    print(f"{'path':<22}{'entries':>9}{'elapsed':>10}{'peak MiB':>10}")
+    for name, entries, elapsed, peak in rows:
+        print(f"{name:<22}{entries:>9}{elapsed:>9.2f}s{peak:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
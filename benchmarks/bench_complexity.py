@@ -0,0 +1,95 @@
+"""
+Benchmark the complexity estimator: accuracy and time spent on reference solutions.
+
+Runs the estimator's measurement and fit on solutions of known complexity
+(constant, linear, n log n in C and in Python, quadratic, exponential) and
+prints the class it reports, the largest n reached and the wall time.
+
+Usage:
+    python benchmarks/bench_complexity.py [--budget 5]
+"""
+
+import argparse
+import time
+from typing import Any, List, Tuple
+from interview_prep_mcp.runner.cases import Signature
+from interview_prep_mcp.runner.complexity import best_fit, fit_models, measure
+from interview_prep_mcp.runner.pool import WorkerPool
+
+LIST = Signature(method="f", params=["nums"], annotations=["List[int]"], returns="int")
+INT = Signature(method="f", params=["n"], annotations=["int"], returns="int")
+SOLUTIONS: List[Tuple[str, str, Signature, List[Any], str]] = [
+    ("O(1)", "first element", LIST, [[2, 7, 11, 15]], "        return nums[0]\n"),
+    (
+        "O(n)",
+        "running sum",
+        LIST,
+        [[2, 7, 11, 15]],
+        "        t = 0\n        for x in nums:\n            t += x\n        return t\n",
+    ),
+    ("O(n log n)", "sorted()", LIST, [[2, 7, 11, 15]], "        return sorted(nums)[0]\n"),
+    (
+        "O(n log n)",
+        "merge sort",
+        LIST,
+        [[2, 7, 11, 15]],
+        (
+            "        def sort(a):\n"
+            "            if len(a) < 2:\n"
+            "                return a\n"
+            "            left, right = sort(a[:len(a) // 2]), sort(a[len(a) // 2:])\n"
+            "            return list(merge(left, right))\n"
+            "        return sort(nums)[0]\n"
+        ),
+    ),
+    (
+        "O(n^2)",
+        "count inversions",
+        LIST,
+        [[2, 7, 11, 15]],
+        (
+            "        count = 0\n"
+            "        for i in range(len(nums)):\n"
+            "            for j in range(i):\n"
+            "                count += nums[j] > nums[i]\n"
+            "        return count\n"
+        ),
+    ),
+    (
+        "O(2^n)",
+        "naive fibonacci",
+        INT,
+        [3],
+        "        return n if n < 2 else self.f(n - 1) + self.f(n - 2)\n",
+    ),
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--budget", type=float, default=5.0, help="seconds of measurement per solution"
+    )
+    args = parser.parse_args()
+
+    pool = WorkerPool(size=2)
+    pool.start()
+    try:
+        print(f"{'expected':<12}{'solution':<18}{'reported':<12}{'max n':>10}{'wall':>9}")
+        for expected, label, signature, example, body in SOLUTIONS:
+            code = f"class Solution:\n    def f(self, {signature.params[0]}):\n{body}"
+            start = time.perf_counter()
+            samples, _ = measure(
+                pool, code, signature, example, 1_000_000, args.budget, args.budget, 512
+            )
+            best = best_fit(fit_models(samples), samples)
+            elapsed = time.perf_counter() - start
+            print(f"{expected:<12}{label:<18}{best.model:<12}{samples[-1].n:>10,}{elapsed:>8.1f}s")
+    finally:
+        pool.close()
+
+
+if __name__ == "__main__":
+    main()
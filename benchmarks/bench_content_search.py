@@ -0,0 +1,125 @@
+"""
+Benchmark TF-IDF content search: build time and query latency.
+
+Indexes a synthetic corpus of problem descriptions with a Zipf-like word
+distribution (or the real descriptions in a problem store with ``--store``)
+and times ``ContentIndex`` queries against a pure-Python baseline that
+scores every document's term dictionary and sorts all scores.
+
+Usage:
+    python benchmarks/bench_content_search.py [--problems 3500] [--words 250] [--repeat 200]
+    python benchmarks/bench_content_search.py --store ~/.cache/interview-prep-mcp/problems.sqlite3
+"""
+
+import argparse
+import math
+import random
+import time
+from typing import Callable, Dict, List, Tuple
+from interview_prep_mcp.leetcode.content_search import ContentIndex, html_to_text, tokenize
+from interview_prep_mcp.leetcode.store import ProblemStore
+
+QUERIES = [
+    "maximum sum of a contiguous subarray",
+    "shortest path in a grid with obstacles",
+    "number of ways to decode a string",
+    "word17 word230 word4000",
+]
+# Common problem words mixed into the synthetic vocabulary, so the queries hit
+COMMON = (
+    "array sum subarray maximum shortest path grid obstacle number way decode string contiguous"
+).split()
+
+
+def synthetic_corpus(problems: int, words: int, seed: int = 0) -> List[Tuple[str, str]]:
+    rng = random.Random(seed)
+    vocabulary = COMMON + [f"word{i}" for i in range(20000)]
+    weights = [1.0 / (rank + 1) for rank in range(len(vocabulary))]
+    return [
+        (f"synthetic-problem-{i}", " ".join(rng.choices(vocabulary, weights=weights, k=words)))
+        for i in range(problems)
+    ]
+
+
+def store_corpus(path: str) -> List[Tuple[str, str]]:
+    return [
+        (slug, f"{title}\n{html_to_text(content)}")
+        for slug, title, content in ProblemStore(path).load_problem_texts_sync()
+    ]
+
+
+def python_baseline(
+    documents: List[Tuple[str, str]],
+) -> Callable[[str, int], List[Tuple[str, float]]]:
+    """The same TF-IDF weighting with dictionaries and a full sort."""
+    vectors: List[Dict[str, float]] = []
+    df: Dict[str, int] = {}
+    for _, text in documents:
+        counts: Dict[str, int] = {}
+        for token in tokenize(text):
+            counts[token] = counts.get(token, 0) + 1
+        vectors.append({term: 1 + math.log(n) for term, n in counts.items()})
+        for term in counts:
+            df[term] = df.get(term, 0) + 1
+    idf = {term: math.log((1 + len(documents)) / (1 + n)) + 1 for term, n in df.items()}
+    for vector in vectors:
+        for term in vector:
+            vector[term] *= idf[term]
+        norm = math.sqrt(sum(w * w for w in vector.values()))
+        for term in vector:
+            vector[term] /= norm
+
+    def search(query: str, limit: int) -> List[Tuple[str, float]]:
+        terms = [t for t in tokenize(query) if t in idf]
+        scores = [
+            (slug, sum(vector.get(term, 0.0) * idf[term] for term in terms))
+            for (slug, _), vector in zip(documents, vectors, strict=True)
+        ]
+        scores.sort(key=lambda item: -item[1])
+        return [item for item in scores[:limit] if item[1] > 0]
+
+    return search
+
+
+def per_call(run: Callable[[], object], repeat: int) -> float:
+    """Microseconds per call of ``run``."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        run()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--problems", type=int, default=3500)
+    parser.add_argument("--words", type=int, default=250, help="words per synthetic description")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--store", help="index the descriptions in this problem store instead")
+    args = parser.parse_args()
+
+    documents = (
+        store_corpus(args.store) if args.store else synthetic_corpus(args.problems, args.words)
+    )
+    start = time.perf_counter()
+    index = ContentIndex.build(documents)
+    build_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    baseline = python_baseline(documents)
+    baseline_ms = (time.perf_counter() - start) * 1000
+    print(f"{len(index)} documents, {len(index.vocabulary)} terms, {len(index.data)} postings")
+    print(f"build: {build_ms:.0f} ms (dictionary baseline {baseline_ms:.0f} ms)\n")
+
+    print(f"{'query':<40}{'hits':>6}{'python µs':>11}{'numpy µs':>10}{'speedup':>9}")
+    for query in QUERIES:
+        hits = len(index.search(query, limit=len(index)))
+        python_us = per_call(lambda query=query: baseline(query, 10), max(args.repeat // 10, 1))
+        numpy_us = per_call(lambda query=query: index.search(query, 10), args.repeat)
+        print(
+            f"{query:<40}{hits:>6}{python_us:>11.0f}{numpy_us:>10.0f}{python_us / numpy_us:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
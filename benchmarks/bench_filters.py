@@ -0,0 +1,118 @@
+"""
+Benchmark tag/difficulty filters: linear catalog scan vs. the bitset index.
+
+Builds a synthetic catalog with LeetCode-like tag frequencies and times
+combined filters ("medium dynamic-programming", "hard graph + bfs", ...)
+answered by scanning every problem's tag list against ``CatalogIndex``
+bitset intersections, plus the one-off cost of building the index.
+
+Usage:
+    python benchmarks/bench_filters.py [--problems 3500] [--repeat 200]
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, List, Optional, Tuple
+from interview_prep_mcp.leetcode.catalog_index import CatalogIndex
+from interview_prep_mcp.leetcode.types import CachedProblemInfo
+
+DIFFICULTIES = ["Easy", "Medium", "Hard"]
+# A few very common tags and a long tail, like the real catalog
+TAGS = [
+    "array",
+    "string",
+    "hash-table",
+    "dynamic-programming",
+    "math",
+    "sorting",
+    "greedy",
+    "depth-first-search",
+    "breadth-first-search",
+    "graph",
+    "tree",
+    "binary-search",
+] + [f"tag-{i}" for i in range(60)]
+
+FILTERS: List[Tuple[Optional[str], List[str]]] = [
+    ("Medium", ["dynamic-programming"]),
+    ("Hard", ["graph", "breadth-first-search"]),
+    (None, ["array", "hash-table"]),
+    ("Easy", ["tag-42"]),
+]
+
+
+def synthetic_catalog(problems: int, seed: int = 0) -> List[CachedProblemInfo]:
+    rng = random.Random(seed)
+    weights = [1.0 / (rank + 1) for rank in range(len(TAGS))]
+    catalog = []
+    for i in range(1, problems + 1):
+        tags = sorted(set(rng.choices(TAGS, weights=weights, k=rng.randint(1, 5))))
+        catalog.append(
+            CachedProblemInfo(
+                questionFrontendId=str(i),
+                title=f"Synthetic Problem {i}",
+                titleSlug=f"synthetic-problem-{i}",
+                difficulty=rng.choice(DIFFICULTIES),
+                paidOnly=rng.random() < 0.15,
+                tags=tags,
+            )
+        )
+    return catalog
+
+
+def scan(catalog: List[CachedProblemInfo], difficulty: Optional[str], tags: List[str]) -> int:
+    """Previous approach: check every problem against every filter."""
+    return sum(
+        1
+        for p in catalog
+        if (difficulty is None or p.difficulty == difficulty)
+        and all(tag in p.tags for tag in tags)
+        and not p.paidOnly
+    )
+
+
+def indexed(index: CatalogIndex, difficulty: Optional[str], tags: List[str]) -> int:
+    return sum(1 for _ in index.iter_matches(index.mask(difficulty, tags, include_paid=False)))
+
+
+def per_call(run: Callable[[], int], repeat: int) -> Tuple[int, float]:
+    """Run a filter ``repeat`` times, returning (matches, microseconds per call)."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        matches = run()
+    return matches, (time.perf_counter() - start) / repeat * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--problems", type=int, default=3500)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    catalog = synthetic_catalog(args.problems)
+    start = time.perf_counter()
+    index = CatalogIndex(catalog)
+    print(
+        f"index build: {(time.perf_counter() - start) * 1000:.1f} ms for {args.problems} problems\n"
+    )
+
+    print(f"{'filter':<36}{'matches':>8}{'scan µs':>10}{'index µs':>10}{'speedup':>9}")
+    for difficulty, tags in FILTERS:
+        label = f"{difficulty or 'any'} {'+'.join(tags)}"
+        matches, scan_us = per_call(
+            lambda difficulty=difficulty, tags=tags: scan(catalog, difficulty, tags), args.repeat
+        )
+        indexed_matches, index_us = per_call(
+            lambda difficulty=difficulty, tags=tags: indexed(index, difficulty, tags), args.repeat
+        )
+        assert matches == indexed_matches
+        print(
+            f"{label:<36}{matches:>8}{scan_us:>10.0f}{index_us:>10.0f}{scan_us / index_us:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+Benchmark LeetCodeClient over HTTP/1.1 vs. multiplexed HTTP/2.
+
+Runs concurrent fetch_problem calls against local stand-ins for the LeetCode
+GraphQL endpoint (one speaking HTTP/1.1, one speaking cleartext HTTP/2) that
+answer every request after a fixed simulated latency, and reports throughput
+and how many TCP connections each path opened.
+
+Usage:
+    python benchmarks/bench_http2.py [--requests 200] [--latency-ms 20]
+
+Requires the http2 extra: pip install -e ".[http2]"
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import List, Tuple
+import h2.config
+import h2.connection
+import h2.events
+import httpx
+from aiolimiter import AsyncLimiter
+from interview_prep_mcp.leetcode.client import LeetCodeClient
+
+RESPONSE_BODY = json.dumps(
+    {
+        "data": {
+            "question": {
+                "questionId": "1",
+                "questionFrontendId": "1",
+                "title": "Two Sum",
+                "titleSlug": "two-sum",
+                "difficulty": "Easy",
+                "content": "<p>Given an array of integers nums and an integer target...</p>" * 20,
+                "topicTags": [{"name": "Array", "slug": "array"}],
+                "codeSnippets": [
+                    {"lang": "Python3", "langSlug": "python3", "code": "class Solution:"}
+                ],
+                "exampleTestcases": "[2,7,11,15]\n9",
+                "sampleTestCase": "[2,7,11,15]\n9",
+                "hints": [],
+            }
+        }
+    }
+).encode()
+
+
+class StandIn:
+    """Base for local GraphQL stand-ins that count accepted connections."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.connections = 0
+        self.server: asyncio.AbstractServer
+
+    async def start(self) -> int:
+        self.server = await asyncio.start_server(self._accept, "127.0.0.1", 0)
+        port: int = self.server.sockets[0].getsockname()[1]
+        return port
+
+    async def stop(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _accept(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            await self.handle(reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        raise NotImplementedError
+
+
+class Http1StandIn(StandIn):
+    """Keep-alive HTTP/1.1 server answering every POST with RESPONSE_BODY."""
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                name, _, value = line.partition(b":")
+                if name.strip().lower() == b"content-length":
+                    length = int(value)
+            await reader.readexactly(length)
+            await asyncio.sleep(self.latency)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                + f"Content-Length: {len(RESPONSE_BODY)}\r\n\r\n".encode()
+                + RESPONSE_BODY
+            )
+            await writer.drain()
+
+
+class Http2StandIn(StandIn):
+    """Cleartext (prior-knowledge) HTTP/2 server answering every stream with RESPONSE_BODY."""
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        conn = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False))
+        conn.initiate_connection()
+        writer.write(conn.data_to_send())
+        pending: List["asyncio.Task[None]"] = []
+
+        async def respond(stream_id: int) -> None:
+            await asyncio.sleep(self.latency)
+            conn.send_headers(
+                stream_id,
+                [
+                    (":status", "200"),
+                    ("content-type", "application/json"),
+                    ("content-length", str(len(RESPONSE_BODY))),
+                ],
+            )
+            conn.send_data(stream_id, RESPONSE_BODY, end_stream=True)
+            writer.write(conn.data_to_send())
+
+        while True:
+            data = await reader.read(65535)
+            if not data:
+                break
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.DataReceived):
+                    conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                elif isinstance(event, h2.events.StreamEnded):
+                    pending.append(asyncio.create_task(respond(event.stream_id)))
+            writer.write(conn.data_to_send())
+            await writer.drain()
+        for task in pending:
+            task.cancel()
+
+
+async def run(client: LeetCodeClient, url: str, requests: int) -> float:
+    """Issue ``requests`` concurrent fetches and return the elapsed seconds."""
+    client.url = url
+    # Measure the transport, not the politeness limiter
+    client._rate_limiter = AsyncLimiter(requests, 1)
+    start = time.perf_counter()
+    results = await asyncio.gather(*(client.fetch_problem(f"problem-{i}") for i in range(requests)))
+    elapsed = time.perf_counter() - start
+    assert all(result is not None for result in results)
+    return elapsed
+
+
+async def bench(requests: int, latency: float) -> List[Tuple[str, float, int]]:
+    rows: List[Tuple[str, float, int]] = []
+
+    http1 = Http1StandIn(latency)
+    port = await http1.start()
+    elapsed = await run(LeetCodeClient(), f"http://127.0.0.1:{port}/graphql/", requests)
+    rows.append(("HTTP/1.1 (default)", elapsed, http1.connections))
+    await http1.stop()
+
+    http2 = Http2StandIn(latency)
+    port = await http2.start()
+    client = LeetCodeClient(http2=True)
+    # The stand-in speaks cleartext HTTP/2, so skip the TLS/ALPN upgrade path
+    client._shared_http_client = httpx.AsyncClient(http1=False, http2=True)
+    elapsed = await run(client, f"http://127.0.0.1:{port}/graphql/", requests)
+    await client.aclose()
+    rows.append(("HTTP/2 (http2=True)", elapsed, http2.connections))
+    await http2.stop()
+
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    rows = asyncio.run(bench(args.requests, args.latency_ms / 1000))
+    print(
+        f"{args.requests} concurrent fetch_problem calls, {args.latency_ms:.0f}ms server latency\n"
+    )
+    print(f"{'transport':<22}{'elapsed':>10}{'req/s':>10}{'connections':>13}")
+    for name, elapsed, connections in rows:
+        print(f"{name:<22}{elapsed:>9.2f}s{args.requests / elapsed:>10.0f}{connections:>13}")
+
+
+if __name__ == "__main__":
+    main()
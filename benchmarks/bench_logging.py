@@ -0,0 +1,98 @@
+"""
+Benchmark the cost of logging on the hottest path: a cached fetch_problem.
+
+Times cache hits with logging off, with cache events at the default 10%
+sample rate, with every cache event logged through the queue, and with the
+same events formatted and written synchronously by a plain FileHandler
+(what logging from the event loop without the queue would cost). Calls are
+spaced by a short idle gap, as requests are in a server, and only the time
+inside fetch_problem is counted: the queue moves formatting and writing
+into those gaps, it does not make them free.
+
+Usage:
+    python benchmarks/bench_logging.py [--calls 20000] [--gap-us 200]
+"""
+
+import argparse
+import asyncio
+import logging
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+from interview_prep_mcp import logs
+from interview_prep_mcp.leetcode.client import LeetCodeClient
+from interview_prep_mcp.leetcode.types import Problem
+from interview_prep_mcp.logs import JSONFormatter, configure_logging, stop_logging
+
+PROBLEM = Problem(
+    questionId="1",
+    questionFrontendId="1",
+    title="Two Sum",
+    titleSlug="two-sum",
+    difficulty="Easy",
+    content="<p>Two Sum</p>",
+    topicTags=[],
+    codeSnippets=[],
+)
+
+
+async def time_hits(calls: int, gap: float) -> float:
+    client = LeetCodeClient()
+    client._fetched_problems.set("two-sum", PROBLEM)
+    total = 0.0
+    for _ in range(calls):
+        start = time.perf_counter()
+        await client.fetch_problem("two-sum")
+        total += time.perf_counter() - start
+        await asyncio.sleep(gap)
+    return total / calls
+
+
+def run(
+    label: str,
+    calls: int,
+    gap: float,
+    destination: Optional[Path],
+    rate: float,
+    synchronous: bool = False,
+) -> None:
+    sync_handler: Optional[logging.Handler] = None
+    if destination is not None and synchronous:
+        sync_handler = logging.FileHandler(destination)
+        sync_handler.setFormatter(JSONFormatter())
+        package = logging.getLogger(logs.PACKAGE_LOGGER)
+        package.addHandler(sync_handler)
+        package.setLevel(logging.DEBUG)
+        logs._sample_rates["cache.hit"] = rate
+    elif destination is not None:
+        configure_logging(str(destination), level="DEBUG", sample_rates={"cache.hit": rate})
+    per_call = asyncio.run(time_hits(calls, gap))
+    if sync_handler is not None:
+        logging.getLogger(logs.PACKAGE_LOGGER).removeHandler(sync_handler)
+        sync_handler.close()
+    stop_logging()
+    print(f"{label:<28}{per_call * 1e6:>8.2f} us/call")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--calls", type=int, default=20_000, help="cache hits per configuration")
+    parser.add_argument(
+        "--gap-us", type=int, default=200, help="idle time between calls, in microseconds"
+    )
+    args = parser.parse_args()
+    gap = args.gap_us / 1e6
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "bench.log"
+        run("logging off", args.calls, gap, None, 1.0)
+        run("queue, 10% sampled", args.calls, gap, path, 0.1)
+        run("queue, every event", args.calls, gap, path, 1.0)
+        run("synchronous, every event", args.calls, gap, path, 1.0, synchronous=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark running a solution against test cases: warm worker pool vs. a fresh interpreter.
+
+Runs Two Sum's examples through a WorkerPool (first run, which starts the
+workers, and warm reruns) and, for comparison, through a new ``python``
+process per case, which is what running a stub from the shell costs.
+
+Usage:
+    python benchmarks/bench_run_tests.py [--runs 20]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from typing import List
+from interview_prep_mcp.runner.pool import WorkerPool
+
+SOLUTION = """
+class Solution:
+    def twoSum(self, nums: List[int], target: int) -> List[int]:
+        seen = {}
+        for i, n in enumerate(nums):
+            if target - n in seen:
+                return [seen[target - n], i]
+            seen[n] = i
+"""
+CASES = [["[2,7,11,15]", "9"], ["[3,2,4]", "6"], ["[3,3]", "6"]]
+SCRIPT = (
+    "from typing import *\n"
+    + SOLUTION
+    + "\nimport json, sys\nprint(Solution().twoSum(*map(json.loads, sys.argv[1:])))\n"
+)
+
+
+def report(label: str, samples: List[float]) -> None:
+    print(
+        f"  {label:<28}median {statistics.median(samples) * 1000:>8.2f} ms"
+        f"   max {max(samples) * 1000:>8.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{len(CASES)} cases per run, {args.runs} runs:")
+    pool = WorkerPool(size=2)
+    try:
+        start = time.perf_counter()
+        pool.run(SOLUTION, "twoSum", ["List[int]", "int"], "List[int]", CASES, 2, 256)
+        report("pool, first run", [time.perf_counter() - start])
+        warm = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            pool.run(SOLUTION, "twoSum", ["List[int]", "int"], "List[int]", CASES, 2, 256)
+            warm.append(time.perf_counter() - start)
+        report("pool, warm", warm)
+    finally:
+        pool.close()
+
+    cold = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        for case in CASES:
+            subprocess.run([sys.executable, "-c", SCRIPT, *case], check=True, capture_output=True)
+        cold.append(time.perf_counter() - start)
+    report("interpreter per case", cold)
+
+
+if __name__ == "__main__":
+    main()
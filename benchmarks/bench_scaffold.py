@@ -0,0 +1,108 @@
+"""
+Benchmark workspace scaffolding: rendering and writing stubs for many problems.
+
+Renders stubs for synthetic problems with LeetCode-sized descriptions and
+writes them into a temporary workspace, timing a cold run, an incremental
+rerun (nothing changed) and a run after every template changed, with one
+I/O thread vs. a thread pool.
+
+Usage:
+    python benchmarks/bench_scaffold.py [--problems 500] [--workers 8] [--dir PATH]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+from interview_prep_mcp.file_generator.scaffold import WorkspaceScaffold, render_stub, stub_filename
+from interview_prep_mcp.languages import resolve_language
+from interview_prep_mcp.leetcode.types import CodeSnippet, Problem
+
+PARAGRAPH = (
+    "<p>Given an array of integers <code>nums</code>&nbsp;and an integer <code>target</code>, "
+    "return <em>indices of the two numbers such that they add up to <code>target</code></em>.</p>\n"
+)
+EXAMPLE = (
+    "<pre><strong>Input:</strong> nums = [2,7,11,15], target = 9\n"
+    "<strong>Output:</strong> [0,1]</pre>\n"
+)
+
+
+def synthetic_problems(count: int) -> List[Problem]:
+    return [
+        Problem(
+            questionId=str(i),
+            questionFrontendId=str(i),
+            title=f"Synthetic Problem {i}",
+            titleSlug=f"synthetic-problem-{i}",
+            difficulty="Medium",
+            content=PARAGRAPH * 6 + EXAMPLE * 3,
+            topicTags=[],
+            exampleTestcases="[2,7,11,15]\n9\n[3,2,4]\n6",
+            codeSnippets=[
+                CodeSnippet(
+                    lang="Python3",
+                    langSlug="python3",
+                    code=(
+                        "class Solution:\n"
+                        "    def solve(self, nums: List[int], target: int) -> List[int]:\n"
+                        "        "
+                    ),
+                )
+            ],
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def render(problems: List[Problem], suffix: str = "") -> List[Tuple[str, str]]:
+    language = resolve_language("python3")
+    assert language is not None
+    stubs = []
+    for problem in problems:
+        content = render_stub(problem, language)
+        assert content is not None
+        stubs.append((stub_filename(problem, language), content + suffix))
+    return stubs
+
+
+def timed(label: str, workspace: Path, stubs: List[Tuple[str, str]], workers: int) -> None:
+    start = time.perf_counter()
+    outcomes = WorkspaceScaffold(workspace, workers).write(stubs)
+    elapsed = (time.perf_counter() - start) * 1000
+    counts: dict[str, int] = {}
+    for outcome in outcomes.values():
+        counts[outcome] = counts.get(outcome, 0) + 1
+    print(f"  {label:<22}{elapsed:>8.0f} ms  {counts}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--problems", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument(
+        "--dir", help="create workspaces under this directory (default: a temporary one)"
+    )
+    args = parser.parse_args()
+
+    problems = synthetic_problems(args.problems)
+    start = time.perf_counter()
+    stubs = render(problems)
+    print(f"render {len(stubs)} stubs: {(time.perf_counter() - start) * 1000:.0f} ms\n")
+    changed = render(problems, suffix="\n")
+
+    base: Optional[str] = args.dir
+    with tempfile.TemporaryDirectory(dir=base) as root:
+        for workers in (1, args.workers):
+            workspace = Path(root) / f"workers-{workers}"
+            print(f"{workers} I/O thread(s):")
+            timed("cold", workspace, stubs, workers)
+            timed("rerun, unchanged", workspace, stubs, workers)
+            timed("rerun, all changed", workspace, changed, workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark stress input generation: NumPy against the standard library.
+
+Generates the maximal inputs of typical constraints (10^5 integers in
+[-10^9, 10^9], 10^5 distinct integers, a 10^5-character string, 10^4
+words of length 100, a 1000 x 1000 grid) with the NumPy generator and with
+an equivalent ``random``-module loop, and prints the time of each,
+including the JSON serialization of the input line.
+
+Usage:
+    python benchmarks/bench_stress.py [--repeats 3]
+"""
+
+import argparse
+import json
+import random
+import string
+import time
+from typing import Any, Callable, List, Tuple
+from interview_prep_mcp.runner.constraints import Constraints, Range
+from interview_prep_mcp.runner.stress import StressGenerator
+
+CONSTRAINTS = Constraints(
+    lengths={
+        "nums": Range(high=10**5),
+        "s": Range(high=10**5),
+        "words": Range(high=10**4),
+        "words[i]": Range(high=100),
+        "grid": Range(high=1000),
+        "grid[i]": Range(high=1000),
+    },
+    values={"nums[i]": Range(low=-(10**9), high=10**9), "grid[i][i]": Range(low=0, high=10**4)},
+    alphabets={"s": string.ascii_lowercase, "words[i]": string.ascii_lowercase},
+)
+CASES: List[Tuple[str, str, Any, Callable[[random.Random], Any]]] = [
+    (
+        "10^5 integers",
+        "List[int]",
+        [1, 2],
+        lambda rng: [rng.randint(-(10**9), 10**9) for _ in range(10**5)],
+    ),
+    (
+        "10^5 distinct",
+        "List[int]",
+        [1, 2],
+        lambda rng: rng.sample(range(-(10**9), 10**9 + 1), 10**5),
+    ),
+    (
+        "10^5-char string",
+        "str",
+        "ab",
+        lambda rng: "".join(rng.choices(string.ascii_lowercase, k=10**5)),
+    ),
+    (
+        "10^4 words x 100",
+        "List[str]",
+        ["ab", "cd"],
+        lambda rng: ["".join(rng.choices(string.ascii_lowercase, k=100)) for _ in range(10**4)],
+    ),
+    (
+        "1000 x 1000 grid",
+        "List[List[int]]",
+        [[1, 2, 3]],
+        lambda rng: [[rng.randint(0, 10**4) for _ in range(1000)] for _ in range(1000)],
+    ),
+]
+
+
+def best_of(repeats: int, run: Callable[[], Any]) -> float:
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        json.dumps(run(), separators=(",", ":"))
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--repeats", type=int, default=3, help="runs per case; the fastest is kept")
+    args = parser.parse_args()
+
+    distinct = CONSTRAINTS.model_copy(update={"distinct": ["nums"]})
+    print(f"{'input':<20}{'numpy':>10}{'random':>10}{'speedup':>9}")
+    for label, annotation, example, pure in CASES:
+        constraints = distinct if "distinct" in label else CONSTRAINTS
+        param = {"str": "s", "List[str]": "words", "List[List[int]]": "grid"}.get(
+            annotation, "nums"
+        )
+        vectorized = best_of(
+            args.repeats,
+            lambda constraints=constraints, param=param, annotation=annotation, example=example: (
+                StressGenerator(constraints).generate(param, annotation, example)[0]
+            ),
+        )
+        rng = random.Random(0)
+        looped = best_of(args.repeats, lambda pure=pure, rng=rng: pure(rng))
+        print(
+            f"{label:<20}{vectorized * 1000:>8.1f}ms{looped * 1000:>8.1f}ms"
+            f"{looped / vectorized:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
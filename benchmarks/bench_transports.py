@@ -0,0 +1,222 @@
+"""
+Load test: one HTTP server shared by many clients vs. one stdio process per client.
+
+Seeds a temporary problem store (INTERVIEW_PREP_STORE) with a synthetic catalog
+and problems so every server starts warm without touching leetcode.com, then
+runs the same workload both ways:
+
+- stdio: N ``python -m interview_prep_mcp.server`` processes, one MCP session each
+- http: one ``interview-prep-mcp --http`` process, N concurrent Streamable HTTP
+  sessions against ``/mcp``
+- http --workers W (with --workers): the same against W pre-forked workers
+
+Each session makes --calls ``load_problem`` calls. Reported: time until every
+session is ready (process start + MCP initialize), and tool calls per second
+once ready.
+
+Usage:
+    python benchmarks/bench_transports.py [--clients 8] [--calls 200] [--problems 500] [--workers 4]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import AsyncExitStack
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Tuple
+import httpx
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+from mcp.client.streamable_http import streamablehttp_client
+from interview_prep_mcp.leetcode.store import ProblemStore
+from interview_prep_mcp.leetcode.types import CachedProblemInfo, CodeSnippet, Problem, TopicTag
+
+
+def seed_store(path: Path, problems: int) -> None:
+    """Write a synthetic catalog and problems of realistic size."""
+    store = ProblemStore(path)
+    store.save_catalog_sync(
+        [
+            CachedProblemInfo(
+                questionFrontendId=str(i),
+                title=f"Synthetic Problem {i}",
+                titleSlug=f"synthetic-problem-{i}",
+                difficulty=("Easy", "Medium", "Hard")[i % 3],
+            )
+            for i in range(1, problems + 1)
+        ]
+    )
+    for i in range(1, problems + 1):
+        store.put_problem_sync(
+            Problem(
+                questionId=str(i),
+                questionFrontendId=str(i),
+                title=f"Synthetic Problem {i}",
+                titleSlug=f"synthetic-problem-{i}",
+                difficulty=("Easy", "Medium", "Hard")[i % 3],
+                content="<p>Given an array of integers <code>nums</code>, return...</p>" * 30,
+                topicTags=[TopicTag(name="Array", slug="array")],
+                codeSnippets=[
+                    CodeSnippet(
+                        lang=lang, langSlug=lang.lower(), code="class Solution:\n    pass\n" * 5
+                    )
+                    for lang in ("Python3", "Java", "Cpp", "Golang", "JavaScript", "Rust")
+                ],
+                exampleTestcases="[2,7,11,15]\n9",
+                hints=["Use a hash map."],
+            )
+        )
+
+
+OpenSession = Callable[[AsyncExitStack], Awaitable[ClientSession]]
+
+
+async def run_sessions(
+    open_session: OpenSession, clients: int, calls: int, problems: int
+) -> Tuple[float, float]:
+    """Open ``clients`` sessions, then drive ``calls`` calls through each."""
+    # Each session lives entirely in its own task (anyio cancel scopes must be
+    # exited by the task that entered them); a barrier separates setup from load.
+    opened = 0
+    all_open = asyncio.Event()
+    go = asyncio.Event()
+
+    async def client(seed: int) -> None:
+        nonlocal opened
+        async with AsyncExitStack() as stack:
+            session = await open_session(stack)
+            opened += 1
+            if opened == clients:
+                all_open.set()
+            await go.wait()
+            rng = random.Random(seed)
+            for _ in range(calls):
+                slug = f"synthetic-problem-{rng.randint(1, problems)}"
+                result = await session.call_tool(
+                    "load_problem", {"title_slug": slug, "language": "python3"}
+                )
+                assert not result.isError, result.content
+
+    start = time.perf_counter()
+    tasks = [asyncio.create_task(client(seed)) for seed in range(clients)]
+    await all_open.wait()
+    ready = time.perf_counter() - start
+
+    start = time.perf_counter()
+    go.set()
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+    return ready, clients * calls / elapsed
+
+
+async def bench_stdio(
+    env: Dict[str, str], clients: int, calls: int, problems: int
+) -> Tuple[float, float]:
+    params = StdioServerParameters(
+        command=sys.executable, args=["-m", "interview_prep_mcp.server"], env=env
+    )
+
+    async def open_session(stack: AsyncExitStack) -> ClientSession:
+        read, write = await stack.enter_async_context(stdio_client(params))
+        session = await stack.enter_async_context(ClientSession(read, write))
+        await session.initialize()
+        return session
+
+    return await run_sessions(open_session, clients, calls, problems)
+
+
+async def bench_http(
+    env: Dict[str, str], clients: int, calls: int, problems: int, workers: int = 1
+) -> Tuple[float, float]:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    url = f"http://127.0.0.1:{port}/mcp"
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "interview_prep_mcp.server",
+            "--http",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+        ],
+        env=env,
+    )
+    try:
+        async with httpx.AsyncClient() as probe:
+            while True:
+                try:
+                    await probe.get(url)
+                    break
+                except httpx.TransportError:
+                    await asyncio.sleep(0.05)
+        server_ready = time.perf_counter() - start
+
+        async def open_session(stack: AsyncExitStack) -> ClientSession:
+            read, write, _ = await stack.enter_async_context(streamablehttp_client(url))
+            session = await stack.enter_async_context(ClientSession(read, write))
+            await session.initialize()
+            return session
+
+        ready, throughput = await run_sessions(open_session, clients, calls, problems)
+        return server_ready + ready, throughput
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--calls", type=int, default=200, help="tool calls per client")
+    parser.add_argument("--problems", type=int, default=500)
+    parser.add_argument(
+        "--workers", type=int, default=0, help="also run http with this many worker processes"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store_path = Path(tmp) / "problems.sqlite3"
+        seed_store(store_path, args.problems)
+        env = {**os.environ, "INTERVIEW_PREP_STORE": str(store_path)}
+
+        print(f"{args.clients} clients x {args.calls} load_problem calls\n")
+        rows: List[Tuple[str, float, float]] = [
+            (
+                f"stdio ({args.clients} processes)",
+                *asyncio.run(bench_stdio(env, args.clients, args.calls, args.problems)),
+            ),
+            (
+                "http (1 process)",
+                *asyncio.run(bench_http(env, args.clients, args.calls, args.problems)),
+            ),
+        ]
+        if args.workers > 1:
+            rows.append(
+                (
+                    f"http ({args.workers} workers)",
+                    *asyncio.run(
+                        bench_http(env, args.clients, args.calls, args.problems, args.workers)
+                    ),
+                )
+            )
+
+    print(f"{'transport':<24}{'ready':>9}{'calls/s':>10}")
+    for name, ready, throughput in rows:
+        print(f"{name:<24}{ready:>8.2f}s{throughput:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
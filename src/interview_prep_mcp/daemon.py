@@ -0,0 +1,375 @@
+"""Shared local daemon that owns the tools and caches for every stdio session.
+
+Each MCP client launches its own ``interview-prep-mcp`` process. In daemon mode
+those processes become thin shims: they speak MCP over stdio as usual but
+forward every tool call over a Unix domain socket to one long-lived daemon, so
+the catalog is built, the problems are cached and the HTTP connections are
+opened once per machine instead of once per session.
+
+The socket protocol is newline-delimited JSON. Requests are
+``{"id": 1, "tool": "load_problem", "arguments": {...}}`` and responses are
+``{"id": 1, "result": ...}`` or ``{"id": 1, "error": "message"}``. Requests on
+one connection are handled concurrently and may be answered out of order.
+"""
+
+import asyncio
+import fcntl
+import itertools
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import (
+    AbstractSet,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypedDict,
+    Union,
+    cast,
+)
+
+ToolHandler = Callable[[str, Dict[str, object]], Awaitable[object]]
+
+# Problem payloads with every code snippet are a few hundred KB at most
+MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+
+# The daemon builds the catalog before it starts listening
+DAEMON_START_TIMEOUT = 60.0
+
+# Tool arguments naming a file or directory; the daemon runs in another
+# working directory, so shims send them as absolute paths
+PATH_ARGUMENTS = ("workspace", "output_path")
+
+
+class DaemonRequest(TypedDict):
+    """Type for a tool call sent to the daemon."""
+
+    id: int
+    tool: str
+    arguments: Dict[str, object]
+
+
+class DaemonResponse(TypedDict, total=False):
+    """Type for the daemon's answer: the request's id and a result or an error."""
+
+    id: object
+    result: object
+    error: str
+
+
+class DaemonError(Exception):
+    """Raised when the daemon cannot be reached or a tool call failed in it."""
+
+
+class RequestNotSentError(ConnectionError):
+    """Raised when the connection failed before a request was written to it."""
+
+
+def default_socket_path() -> Path:
+    """Per-user location of the daemon socket."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    base = Path(runtime_dir) if runtime_dir else Path.home() / ".cache" / "interview-prep-mcp"
+    return base / "interview-prep-mcp.sock"
+
+
+def _encode(message: Union[DaemonRequest, DaemonResponse]) -> bytes:
+    return json.dumps(message).encode() + b"\n"
+
+
+def absolute_paths(arguments: Dict[str, object]) -> Dict[str, object]:
+    """
+    Resolve the PATH_ARGUMENTS of a tool call against this process's working directory.
+
+    Args:
+        arguments: Tool arguments as received from the MCP client
+
+    Returns:
+        A copy of the arguments with relative (or ~) paths made absolute
+    """
+    resolved = dict(arguments)
+    for name in PATH_ARGUMENTS:
+        value = resolved.get(name)
+        if isinstance(value, str) and value:
+            resolved[name] = str(Path(value).expanduser().absolute())
+    return resolved
+
+
+async def serve(
+    socket_path: Path,
+    handler: ToolHandler,
+    started: Optional[Callable[[], Awaitable[None]]] = None,
+) -> None:
+    """
+    Serve tool calls on a Unix domain socket until cancelled.
+
+    Only one daemon may own a socket path: an exclusive lock on a sibling
+    ``.lock`` file is taken first, and if another daemon already holds it this
+    returns immediately. A socket file left behind by a crashed daemon is
+    replaced.
+
+    Args:
+        socket_path: Path of the Unix domain socket to listen on
+        handler: Coroutine called with (tool name, arguments) for each request;
+            its return value must be JSON-serializable
+        started: Optional coroutine awaited after the lock is taken and before
+            the socket is bound, e.g. to warm caches
+    """
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    lock_file = open(socket_path.with_name(socket_path.name + ".lock"), "w")
+    try:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return
+
+        if started is not None:
+            await started()
+
+        async def handle_connection(
+            reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+        ) -> None:
+            tasks: Set["asyncio.Task[None]"] = set()
+            write_lock = asyncio.Lock()
+
+            async def send(response: DaemonResponse) -> None:
+                async with write_lock:
+                    writer.write(_encode(response))
+                    await writer.drain()
+
+            async def respond(request: object) -> None:
+                if not isinstance(request, dict):
+                    await send({"id": None, "error": "Request must be a JSON object"})
+                    return
+                message = cast(Dict[str, object], request)
+                response: DaemonResponse = {"id": message.get("id")}
+                try:
+                    tool, arguments = message["tool"], message.get("arguments") or {}
+                    if not isinstance(tool, str) or not isinstance(arguments, dict):
+                        raise ValueError("Request needs a tool name and an arguments object")
+                    response["result"] = await handler(tool, cast(Dict[str, object], arguments))
+                except Exception as e:
+                    response["error"] = str(e)
+                await send(response)
+
+            try:
+                while line := await reader.readline():
+                    try:
+                        request: object = json.loads(line)
+                    except ValueError:
+                        # One bad line says nothing about the ones after it
+                        await send({"id": None, "error": "Request is not valid JSON"})
+                        continue
+                    task = asyncio.create_task(respond(request))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+            except (ConnectionError, ValueError):
+                pass
+            finally:
+                for task in tasks:
+                    task.cancel()
+                writer.close()
+
+        socket_path.unlink(missing_ok=True)
+        old_umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(
+                handle_connection, path=str(socket_path), limit=MAX_MESSAGE_BYTES
+            )
+        finally:
+            os.umask(old_umask)
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            socket_path.unlink(missing_ok=True)
+    finally:
+        lock_file.close()
+
+
+def spawn_daemon(socket_path: Path) -> "subprocess.Popen[bytes]":
+    """
+    Start a detached daemon process listening on ``socket_path``.
+
+    The daemon inherits the environment, so settings such as
+    INTERVIEW_PREP_STORE apply to it. Its output goes to a ``.log`` file next
+    to the socket.
+    """
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(socket_path.with_name(socket_path.name + ".log"), "ab") as log:
+        return subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "interview_prep_mcp.server",
+                "--daemon",
+                "--socket",
+                str(socket_path),
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            start_new_session=True,
+        )
+
+
+class DaemonClient:
+    """
+    Connection from a stdio shim to the shared daemon.
+
+    Connects lazily on the first call, starting the daemon if nothing is
+    listening. Calls are multiplexed over one connection. If the connection
+    drops (e.g. the daemon was restarted), a call is retried once on a new
+    connection only if it was never written to the old one, or if the tool is
+    one of ``read_only_tools``: other tools write files or run code, and the
+    daemon may already have run them.
+    """
+
+    def __init__(
+        self,
+        socket_path: Path,
+        autospawn: bool = True,
+        start_timeout: float = DAEMON_START_TIMEOUT,
+        read_only_tools: AbstractSet[str] = frozenset(),
+    ) -> None:
+        """
+        Args:
+            socket_path: Path of the daemon's Unix domain socket
+            autospawn: Start a daemon if nothing is listening
+            start_timeout: Seconds to wait for a spawned daemon to listen
+            read_only_tools: Tools that are safe to run twice
+        """
+        self.socket_path = socket_path
+        self.autospawn = autospawn
+        self.start_timeout = start_timeout
+        self.read_only_tools = read_only_tools
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._read_task: Optional["asyncio.Task[None]"] = None
+        self._pending: Dict[int, "asyncio.Future[DaemonResponse]"] = {}
+        self._ids = itertools.count(1)
+        self._connect_lock = asyncio.Lock()
+        self._spawned: List["subprocess.Popen[bytes]"] = []
+
+    async def call(self, tool: str, arguments: Dict[str, object]) -> object:
+        """
+        Run a tool in the daemon.
+
+        Args:
+            tool: Tool name
+            arguments: Tool arguments
+
+        Returns:
+            The tool's JSON result
+
+        Raises:
+            DaemonError: If the daemon is unreachable or the tool call failed
+        """
+        try:
+            response = await self._send(tool, arguments)
+        except ConnectionError as e:
+            if not isinstance(e, RequestNotSentError) and tool not in self.read_only_tools:
+                raise DaemonError(
+                    f"Lost connection to daemon at {self.socket_path} during {tool}; "
+                    "it may have run"
+                ) from e
+            try:
+                response = await self._send(tool, arguments)
+            except ConnectionError as e:
+                raise DaemonError(f"Lost connection to daemon at {self.socket_path}") from e
+        if "error" in response:
+            raise DaemonError(response["error"])
+        return response.get("result")
+
+    async def _send(self, tool: str, arguments: Dict[str, object]) -> DaemonResponse:
+        try:
+            writer = await self._ensure_connected()
+        except ConnectionError as e:
+            raise RequestNotSentError(str(e)) from e
+        request_id = next(self._ids)
+        future: "asyncio.Future[DaemonResponse]" = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            writer.write(_encode({"id": request_id, "tool": tool, "arguments": arguments}))
+            await writer.drain()
+            return await future
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def _ensure_connected(self) -> asyncio.StreamWriter:
+        async with self._connect_lock:
+            if self._writer is not None and not self._writer.is_closing():
+                return self._writer
+            self._reader, self._writer = await self._connect()
+            self._read_task = asyncio.create_task(self._read_responses(self._reader))
+            return self._writer
+
+    async def _connect(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        try:
+            return await asyncio.open_unix_connection(
+                str(self.socket_path), limit=MAX_MESSAGE_BYTES
+            )
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            if not self.autospawn:
+                raise DaemonError(f"No daemon listening at {self.socket_path}") from e
+
+        process = spawn_daemon(self.socket_path)
+        self._spawned.append(process)
+        deadline = time.monotonic() + self.start_timeout
+        while True:
+            await asyncio.sleep(0.05)
+            try:
+                return await asyncio.open_unix_connection(
+                    str(self.socket_path), limit=MAX_MESSAGE_BYTES
+                )
+            except (FileNotFoundError, ConnectionRefusedError) as e:
+                # Exit code 0 means another daemon won the race for the lock
+                if process.poll() not in (None, 0):
+                    raise DaemonError(
+                        f"Daemon exited with code {process.returncode}; see {self.socket_path}.log"
+                    ) from e
+                if time.monotonic() > deadline:
+                    raise DaemonError(
+                        f"Daemon did not start listening at {self.socket_path} within "
+                        f"{self.start_timeout:.0f}s; see {self.socket_path}.log"
+                    ) from e
+
+    async def _read_responses(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while line := await reader.readline():
+                message: object = json.loads(line)
+                if not isinstance(message, dict):
+                    continue
+                response = cast(DaemonResponse, message)
+                request_id = response.get("id")
+                future = self._pending.get(request_id) if isinstance(request_id, int) else None
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            if self._reader is reader:
+                if self._writer is not None:
+                    self._writer.close()
+                self._reader = self._writer = None
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("daemon connection closed"))
+
+    async def aclose(self) -> None:
+        """Close the connection; the daemon keeps running."""
+        if self._writer is not None:
+            self._writer.close()
+        if self._read_task is not None:
+            self._read_task.cancel()
+            try:
+                await self._read_task
+            except asyncio.CancelledError:
+                pass
@@ -1,5 +1,6 @@
 """Utilities for generating consistent file names."""
 import re
+from ..languages import resolve_language
 
 
 def slugify(title: str) -> str:
@@ -47,36 +48,13 @@ def suggest_filename(problem_id: str, title: str, language: str) -> str:
     Args:
         problem_id: Problem ID
         title: Problem title
-        language: Language slug (e.g., "python3", "java", "golang")
+        language: Language slug, name or alias (e.g., "python3", "java", "golang", "go")
 
     Returns:
         Suggested filename with extension
     """
     slug = slugify(title)
 
-    # Map common language slugs to file extensions
-    extension_map = {
-        "python3": "py",
-        "python": "py",
-        "java": "java",
-        "golang": "go",
-        "cpp": "cpp",
-        "c": "c",
-        "csharp": "cs",
-        "javascript": "js",
-        "typescript": "ts",
-        "ruby": "rb",
-        "swift": "swift",
-        "kotlin": "kt",
-        "rust": "rs",
-        "scala": "scala",
-        "php": "php",
-        "mysql": "sql",
-        "mssql": "sql",
-        "oraclesql": "sql",
-        "elixir": "ex",
-        "racket": "rkt",
-    }
-
-    ext = extension_map.get(language.lower(), "txt")
-    return f"{problem_id}_{slug}.{ext}"
\ No newline at end of file
+    registered = resolve_language(language)
+    ext = registered.extension if registered is not None else "txt"
+    return f"{problem_id}_{slug}.{ext}"
@@ -0,0 +1,167 @@
+"""Solution stubs for a workspace of problems."""
+
+import hashlib
+import json
+import os
+import textwrap
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, cast
+from bs4 import BeautifulSoup
+from ..languages import Language
+from ..leetcode.types import Problem
+from .naming import suggest_filename
+
+# Hashes of the stubs last written, so reruns can tell our files from user edits
+MANIFEST_NAME = ".interview-prep-scaffold.json"
+HEADER_WIDTH = 88
+
+# Outcomes of writing one stub
+WRITTEN = "written"  # New file
+UPDATED = "updated"  # Our previous stub, regenerated with new content
+UNCHANGED = "unchanged"  # Same content as last time; not touched
+KEPT = "kept"  # Edited since it was generated; left alone
+
+
+def render_stub(problem: Problem, language: Language) -> Optional[str]:
+    """
+    Render a solution stub: a commented header with the description and
+    example tests, followed by the code template.
+
+    Args:
+        problem: The problem to scaffold
+        language: Language of the stub
+
+    Returns:
+        The stub's content, or None if the problem has no template in that language
+    """
+    snippet = problem.code_snippet(language.slug)
+    if snippet is None:
+        return None
+
+    description = BeautifulSoup(problem.content, "html.parser").get_text(separator="\n")
+    header = [
+        f"{problem.questionFrontendId}. {problem.title} ({problem.difficulty})",
+        f"https://leetcode.com/problems/{problem.titleSlug}/",
+        "",
+    ]
+    paragraphs = [line.strip() for line in description.splitlines()]
+    for paragraph in paragraphs:
+        if paragraph:
+            header.extend(textwrap.wrap(paragraph, HEADER_WIDTH - len(language.comment) - 1))
+        elif header[-1]:
+            header.append("")
+    if problem.exampleTestcases:
+        if header[-1]:
+            header.append("")
+        header.append("Example test cases:")
+        header.extend(f"  {line}" for line in problem.exampleTestcases.splitlines())
+
+    commented = [f"{language.comment} {line}".rstrip() for line in header]
+    return "\n".join(commented) + "\n\n" + snippet.code.rstrip() + "\n"
+
+
+def content_hash(content: bytes) -> str:
+    """SHA-256 hex digest of file content."""
+    return hashlib.sha256(content).hexdigest()
+
+
+class WorkspaceScaffold:
+    """
+    Writes solution stubs into a workspace directory.
+
+    Writes are incremental: a stub whose content hash matches the one recorded
+    in the workspace manifest is not touched (a ``stat`` is the only I/O), and a
+    file whose hash no longer matches the manifest has been edited by the user
+    and is kept unless ``overwrite`` is set. File I/O runs on a thread pool;
+    each file is replaced atomically so a crash never leaves half a stub.
+    """
+
+    def __init__(self, workspace: Path, max_workers: int = 8) -> None:
+        self.workspace = workspace
+        self.max_workers = max_workers
+        self.manifest_path = workspace / MANIFEST_NAME
+
+    def load_manifest(self) -> Dict[str, str]:
+        """Filename -> content hash of the stubs last written (empty if none)."""
+        try:
+            data = cast(object, json.loads(self.manifest_path.read_text(encoding="utf-8")))
+        except (FileNotFoundError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {
+            str(name): digest
+            for name, digest in cast(Dict[object, object], data).items()
+            if isinstance(digest, str)
+        }
+
+    def write(self, stubs: Sequence[Tuple[str, str]], overwrite: bool = False) -> Dict[str, str]:
+        """
+        Write stubs, skipping unchanged and user-edited files.
+
+        Args:
+            stubs: (filename, content) pairs; filenames are relative to the workspace
+            overwrite: Replace files edited since they were generated
+
+        Returns:
+            Filename -> outcome (WRITTEN, UPDATED, UNCHANGED or KEPT)
+        """
+        self.workspace.mkdir(parents=True, exist_ok=True)
+        manifest = self.load_manifest()
+
+        def write_one(stub: Tuple[str, str]) -> Tuple[str, str, Optional[str]]:
+            name, content = stub
+            return (
+                name,
+                *self._write_file(name, content.encode("utf-8"), manifest.get(name), overwrite),
+            )
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            results: List[Tuple[str, str, Optional[str]]] = list(pool.map(write_one, stubs))
+
+        outcomes: Dict[str, str] = {}
+        changed = False
+        for name, outcome, digest in results:
+            outcomes[name] = outcome
+            if digest is not None and manifest.get(name) != digest:
+                manifest[name] = digest
+                changed = True
+        if changed:
+            self._replace(
+                self.manifest_path, json.dumps(manifest, indent=1, sort_keys=True).encode("utf-8")
+            )
+        return outcomes
+
+    def _write_file(
+        self, name: str, content: bytes, recorded: Optional[str], overwrite: bool
+    ) -> Tuple[str, Optional[str]]:
+        """Write one stub; returns its outcome and the hash to record (None = keep the entry)."""
+        path = self.workspace / name
+        digest = content_hash(content)
+        if recorded == digest and path.exists():
+            return UNCHANGED, None
+
+        try:
+            current: Optional[str] = content_hash(path.read_bytes())
+        except FileNotFoundError:
+            current = None
+        if current == digest:
+            return UNCHANGED, digest
+        if current is not None and current != recorded and not overwrite:
+            return KEPT, None
+
+        self._replace(path, content)
+        return (WRITTEN if current is None else UPDATED), digest
+
+    @staticmethod
+    def _replace(path: Path, content: bytes) -> None:
+        """Atomically replace a file's content."""
+        temporary = path.with_name(f".{path.name}.tmp")
+        temporary.write_bytes(content)
+        os.replace(temporary, path)
+
+
+def stub_filename(problem: Problem, language: Language) -> str:
+    """Workspace filename of a problem's stub (e.g., ``1_two_sum.py``)."""
+    return suggest_filename(problem.questionFrontendId, problem.title, language.slug)
@@ -0,0 +1,72 @@
+"""Registry of LeetCode's solution languages."""
+
+from typing import Dict, Optional, Tuple
+from pydantic import BaseModel, ConfigDict
+
+
+class Language(BaseModel):
+    """A language LeetCode offers code snippets in."""
+
+    model_config = ConfigDict(frozen=True)
+
+    slug: str  # LeetCode's langSlug (e.g., "golang")
+    name: str  # LeetCode's display name (e.g., "Go")
+    extension: str  # File extension, without the dot
+    comment: str  # Line comment prefix
+    aliases: Tuple[str, ...] = ()  # Other names users type (e.g., "go")
+
+
+LANGUAGES: Tuple[Language, ...] = (
+    Language(slug="cpp", name="C++", extension="cpp", comment="//", aliases=("c++", "cplusplus")),
+    Language(slug="java", name="Java", extension="java", comment="//"),
+    Language(slug="python", name="Python", extension="py", comment="#"),
+    Language(slug="python3", name="Python3", extension="py", comment="#", aliases=("py", "python")),
+    Language(slug="c", name="C", extension="c", comment="//"),
+    Language(slug="csharp", name="C#", extension="cs", comment="//", aliases=("c#", "cs")),
+    Language(slug="javascript", name="JavaScript", extension="js", comment="//", aliases=("js",)),
+    Language(slug="typescript", name="TypeScript", extension="ts", comment="//", aliases=("ts",)),
+    Language(slug="php", name="PHP", extension="php", comment="//"),
+    Language(slug="swift", name="Swift", extension="swift", comment="//"),
+    Language(slug="kotlin", name="Kotlin", extension="kt", comment="//", aliases=("kt",)),
+    Language(slug="dart", name="Dart", extension="dart", comment="//"),
+    Language(slug="golang", name="Go", extension="go", comment="//", aliases=("go",)),
+    Language(slug="ruby", name="Ruby", extension="rb", comment="#", aliases=("rb",)),
+    Language(slug="scala", name="Scala", extension="scala", comment="//"),
+    Language(slug="rust", name="Rust", extension="rs", comment="//", aliases=("rs",)),
+    Language(slug="racket", name="Racket", extension="rkt", comment=";"),
+    Language(slug="erlang", name="Erlang", extension="erl", comment="%"),
+    Language(slug="elixir", name="Elixir", extension="ex", comment="#"),
+    Language(slug="mysql", name="MySQL", extension="sql", comment="--"),
+    Language(slug="mssql", name="MS SQL Server", extension="sql", comment="--"),
+    Language(slug="oraclesql", name="Oracle", extension="sql", comment="--"),
+    Language(slug="postgresql", name="PostgreSQL", extension="sql", comment="--"),
+    Language(slug="pythondata", name="Pandas", extension="py", comment="#", aliases=("pandas",)),
+    Language(slug="bash", name="Bash", extension="sh", comment="#"),
+)
+
+
+BY_SLUG: Dict[str, Language] = {language.slug: language for language in LANGUAGES}
+
+# Slugs win over display names, which win over aliases: "python" is Python 2's
+# slug and only an alias of Python3
+_BY_KEY: Dict[str, Language] = {}
+for _language in LANGUAGES:
+    _BY_KEY.setdefault(_language.slug, _language)
+for _language in LANGUAGES:
+    _BY_KEY.setdefault(_language.name.lower(), _language)
+for _language in LANGUAGES:
+    for _alias in _language.aliases:
+        _BY_KEY.setdefault(_alias, _language)
+
+
+def resolve_language(language: str) -> Optional[Language]:
+    """
+    Look up a language by slug, display name or alias (case-insensitive).
+
+    Args:
+        language: e.g., "python3", "Python3", "py", "golang", "Go", "c++"
+
+    Returns:
+        The Language, or None if it is not one LeetCode offers
+    """
+    return _BY_KEY.get(language.lower())
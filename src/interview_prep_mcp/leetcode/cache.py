@@ -0,0 +1,82 @@
+"""In-memory caches for data fetched from LeetCode."""
+
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class StaleWhileRevalidateCache(Generic[T]):
+    """
+    Keyed cache whose entries go stale after ``ttl`` seconds.
+
+    Stale entries are still returned so callers can serve the last known good
+    value immediately and refresh it in the background. Age never evicts an
+    entry; once more than ``max_entries`` are stored, the least recently used
+    one is dropped.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_entries: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            ttl: Seconds after which an entry is reported stale
+            max_entries: Entries kept before the least recently used is
+                evicted (unbounded if None)
+            clock: Monotonic time source
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[T, float]]" = OrderedDict()
+
+    def lookup(self, key: str) -> Optional[Tuple[T, bool]]:
+        """
+        Look up an entry of any age.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (value, is_stale), or None if the key was never stored
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        value, stored_at = entry
+        return value, self._clock() - stored_at >= self.ttl
+
+    def get(self, key: str) -> Optional[T]:
+        """Return the stored value regardless of age, or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def set(self, key: str, value: T, age: float = 0.0) -> None:
+        """Store a value fetched ``age`` seconds ago, evicting the least recently used if full."""
+        self._entries[key] = (value, self._clock() - age)
+        self._entries.move_to_end(key)
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def values(self) -> List[T]:
+        """All stored values regardless of age."""
+        return [value for value, _ in self._entries.values()]
+
+    def discard(self, key: str) -> None:
+        """Remove an entry if present."""
+        self._entries.pop(key, None)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,145 @@
+"""Bitset index over the problem catalog for tag and difficulty filters."""
+
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from .types import CachedProblemInfo
+
+# Sequels share the original's slug plus a numeral: house-robber-ii,
+# two-sum-ii-input-array-is-sorted
+VARIANT_MARKER = re.compile(r"-(ii|iii|iv|v)(?=-|$)")
+VARIANT_RANK = {"ii": 1, "iii": 2, "iv": 3, "v": 4}
+
+
+def normalize_tag(tag: str) -> str:
+    """Turn a tag name or slug ("Dynamic Programming") into its slug form."""
+    return "-".join(tag.lower().split())
+
+
+def variant_of(title_slug: str) -> Tuple[str, int]:
+    """
+    The original problem's slug and the sequel number of a slug.
+
+    ``house-robber-iii`` is (``house-robber``, 2); ``two-sum`` is itself, 0.
+    """
+    marker = VARIANT_MARKER.search(title_slug)
+    if marker is None:
+        return title_slug, 0
+    return title_slug[: marker.start()], VARIANT_RANK[marker.group(1)]
+
+
+class CatalogIndex:
+    """
+    Per-tag and per-difficulty bitsets over catalog positions.
+
+    Bit ``i`` of each set stands for ``problems[i]``. Sets are plain Python
+    integers, so a combined filter such as "medium, dynamic-programming and
+    graph, not paid-only" is a handful of word-wise ANDs over ~3,500 bits
+    instead of a scan of every problem and its tag list.
+
+    For random picks, the free (not paid-only) problems are also bucketed by
+    (difficulty, tag), with None meaning "any", so a uniform choice under at
+    most one tag is a dict lookup and an index into a list. Numbered sequels
+    are grouped under their original's slug the same way.
+    """
+
+    def __init__(self, problems: List[CachedProblemInfo]) -> None:
+        self.problems = problems
+        self.all = (1 << len(problems)) - 1
+        self.paid_only = 0
+        self.by_difficulty: Dict[str, int] = {}
+        self.by_tag: Dict[str, int] = {}
+        self.positions: Dict[str, int] = {}
+        self.buckets: Dict[Tuple[Optional[str], Optional[str]], List[int]] = {}
+        sequels: Dict[str, List[Tuple[int, str]]] = {}
+        for position, problem in enumerate(problems):
+            bit = 1 << position
+            self.positions[problem.titleSlug] = position
+            base, rank = variant_of(problem.titleSlug)
+            sequels.setdefault(base, []).append((rank, problem.titleSlug))
+            if not problem.paidOnly:
+                difficulties = [None, problem.difficulty.lower()] if problem.difficulty else [None]
+                for difficulty in difficulties:
+                    for tag in [None, *problem.tags]:
+                        self.buckets.setdefault((difficulty, tag), []).append(position)
+            if problem.paidOnly:
+                self.paid_only |= bit
+            if problem.difficulty:
+                key = problem.difficulty.lower()
+                self.by_difficulty[key] = self.by_difficulty.get(key, 0) | bit
+            for tag in problem.tags:
+                self.by_tag[tag] = self.by_tag.get(tag, 0) | bit
+        self.variants: Dict[str, List[str]] = {
+            base: [slug for _, slug in sorted(ranked)]
+            for base, ranked in sequels.items()
+            if len(ranked) > 1
+        }
+
+    def mask(
+        self,
+        difficulty: Optional[str] = None,
+        tags: Optional[Iterable[str]] = None,
+        include_paid: bool = True,
+    ) -> int:
+        """
+        Bitset of the problems matching every given filter.
+
+        Args:
+            difficulty: "Easy", "Medium" or "Hard" (case-insensitive)
+            tags: Tag slugs or names; a problem must have all of them
+            include_paid: Whether paid-only problems may match
+
+        Returns:
+            Integer whose set bits are the matching catalog positions
+        """
+        selected = self.all
+        if difficulty:
+            selected &= self.by_difficulty.get(difficulty.lower(), 0)
+        for tag in tags or ():
+            selected &= self.by_tag.get(normalize_tag(tag), 0)
+        if not include_paid:
+            selected &= ~self.paid_only
+        return selected
+
+    def free_positions(
+        self, difficulty: Optional[str] = None, tags: Optional[Iterable[str]] = None
+    ) -> List[int]:
+        """
+        Catalog positions of the free problems matching the filters.
+
+        With at most one tag this is a precomputed bucket (do not modify it);
+        with several, the smallest of their buckets is intersected with the rest.
+
+        Args:
+            difficulty: "Easy", "Medium" or "Hard" (case-insensitive)
+            tags: Tag slugs or names; a problem must have all of them
+
+        Returns:
+            Positions in catalog order
+        """
+        key = difficulty.lower() if difficulty else None
+        slugs = sorted({normalize_tag(tag) for tag in tags or ()})
+        if len(slugs) <= 1:
+            return self.buckets.get((key, slugs[0] if slugs else None), [])
+        mask = self.mask(difficulty, slugs, include_paid=False)
+        smallest = min((self.buckets.get((key, tag), []) for tag in slugs), key=len)
+        return [position for position in smallest if mask >> position & 1]
+
+    def variants_of(self, title_slug: str) -> List[str]:
+        """Catalog slugs of a problem's original and numbered sequels, in order (itself too)."""
+        return self.variants.get(variant_of(title_slug)[0], [])
+
+    def is_paid_only(self, title_slug: str) -> bool:
+        """Whether a catalog problem requires a subscription."""
+        position = self.positions.get(title_slug)
+        return position is not None and bool(self.paid_only >> position & 1)
+
+    def iter_matches(self, mask: int) -> Iterator[CachedProblemInfo]:
+        """Yield the problems in a bitset, in catalog order."""
+        while mask:
+            lowest = mask & -mask
+            yield self.problems[lowest.bit_length() - 1]
+            mask ^= lowest
+
+    def count(self, mask: int) -> int:
+        """Number of problems in a bitset."""
+        return bin(mask).count("1")
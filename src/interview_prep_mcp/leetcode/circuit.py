@@ -0,0 +1,120 @@
+"""Circuit breaker guarding requests to LeetCode."""
+
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+import httpx
+from .retry import is_retryable_error
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of contacting LeetCode while the circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Fail fast while the upstream is unhealthy.
+
+    While closed, requests flow and consecutive upstream failures (network
+    errors, timeouts, retryable statuses) are counted. After
+    ``failure_threshold`` of them the circuit opens and every request fails
+    immediately with CircuitOpenError. Once ``reset_timeout`` seconds have
+    passed a single trial request is let through (half-open): success closes
+    the circuit, failure opens it for another ``reset_timeout``.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        """Current state: CLOSED, OPEN or HALF_OPEN."""
+        if self._opened_at is None:
+            return self.CLOSED
+        if self._clock() - self._opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    @property
+    def is_open(self) -> bool:
+        """True while requests would be rejected without a trial."""
+        return self.state == self.OPEN
+
+    def before_request(self) -> None:
+        """
+        Admit or reject a request.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a
+                trial request already in flight
+        """
+        state = self.state
+        if state == self.CLOSED:
+            return
+        if state == self.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return
+        raise CircuitOpenError("LeetCode is unavailable (circuit open); try again shortly")
+
+    def record_success(self) -> None:
+        """Close the circuit and reset the failure count."""
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count an upstream failure, opening the circuit at the threshold."""
+        self._failures += 1
+        if self._trial_in_flight or self._failures >= self.failure_threshold:
+            self._opened_at = self._clock()
+        self._trial_in_flight = False
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """
+        Run one upstream request under the breaker.
+
+        Errors that indicate an unhealthy upstream count as failures; any other
+        outcome (including 404s and GraphQL errors) shows the upstream is
+        answering and counts as success. Throttling (429) is neither: it is
+        left to the retry policy and its Retry-After handling.
+
+        Raises:
+            CircuitOpenError: If the request is rejected
+        """
+        self.before_request()
+        try:
+            yield
+        except Exception as error:
+            if _is_throttled(error):
+                self._trial_in_flight = False
+            elif is_retryable_error(error):
+                self.record_failure()
+            else:
+                self.record_success()
+            raise
+        except BaseException:
+            # Cancelled: no verdict on upstream health, but free the trial slot
+            self._trial_in_flight = False
+            raise
+        else:
+            self.record_success()
+
+
+def _is_throttled(error: BaseException) -> bool:
+    """Check whether an upstream request was rejected with 429 Too Many Requests."""
+    return isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 429
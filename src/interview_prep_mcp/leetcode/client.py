@@ -1,14 +1,51 @@
 """LeetCode GraphQL API client."""
+import asyncio
+import importlib.util
+import logging
+import time
 import httpx
-from typing import Optional, Dict, List, Union, cast, TypedDict
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Coroutine,
+    Iterable,
+    Literal,
+    Optional,
+    Dict,
+    List,
+    Set,
+    Tuple,
+    Union,
+    cast,
+    TypedDict,
 )
 from aiolimiter import AsyncLimiter
-from .types import Problem, ProblemSummary, CachedProblemInfo
+from ..logs import log_event
+from .cache import StaleWhileRevalidateCache
+from .catalog_index import CatalogIndex
+from .circuit import CircuitBreaker
+from .retry import upstream_retry
+from .scheduler import Priority, UpstreamScheduler
+from .similar import SimilarityGraph
+from .store import ProblemStore
+from .streaming import JSONArrayStream
+from .types import (
+    DailyChallenge,
+    Problem,
+    ProblemList,
+    ProblemListGroup,
+    ProblemSummary,
+    CachedProblemInfo,
+    similar_question_slugs,
+)
+
+if TYPE_CHECKING:
+    from .content_search import ContentIndex
+
+logger = logging.getLogger(__name__)
 
 
 class GraphQLError(TypedDict):
@@ -29,6 +66,7 @@ class QuestionData(TypedDict, total=False):
     exampleTestcases: str
     sampleTestCase: str
     hints: List[str]
+    similarQuestions: str
 
 
 class GraphQLQuestionResponse(TypedDict, total=False):
@@ -37,12 +75,67 @@ class GraphQLQuestionResponse(TypedDict, total=False):
     errors: Optional[List[GraphQLError]]
 
 
+class DailyChallengeData(TypedDict, total=False):
+    """Type for activeDailyCodingChallengeQuestion."""
+
+    date: str
+    link: str
+    question: Optional[QuestionData]
+
+
+class GraphQLDailyResponse(TypedDict, total=False):
+    """Type for GraphQL daily challenge response."""
+
+    data: Optional[Dict[str, Optional[DailyChallengeData]]]
+    errors: Optional[List[GraphQLError]]
+
+
+class GraphQLSimilarResponse(TypedDict, total=False):
+    """Type for a batch of aliased similarQuestions lookups."""
+
+    data: Optional[Dict[str, Optional[Dict[str, str]]]]
+    errors: Optional[List[GraphQLError]]
+
+
+class StudyPlanGroup(TypedDict, total=False):
+    """Type for a study plan sub-group."""
+
+    slug: str
+    name: str
+    questions: List[Dict[str, str]]
+
+
+class StudyPlanDetail(TypedDict, total=False):
+    """Type for studyPlanV2Detail."""
+
+    slug: str
+    name: str
+    planSubGroups: List[StudyPlanGroup]
+
+
+class FavoriteQuestionPage(TypedDict, total=False):
+    """Type for one page of favoriteQuestionList."""
+
+    questions: List[Dict[str, str]]
+    totalLength: int
+    hasMore: bool
+
+
+class GraphQLProblemListResponse(TypedDict, total=False):
+    """Type for studyPlanV2Detail and favoriteQuestionList responses."""
+
+    data: Optional[Dict[str, object]]
+    errors: Optional[List[GraphQLError]]
+
+
 class QuestionListItem(TypedDict):
     """Type for question list item."""
     questionFrontendId: str
     title: str
     titleSlug: str
     difficulty: Optional[str]
+    paidOnly: bool
+    topicTags: List[Dict[str, str]]
 
 
 class ProblemsetQuestionList(TypedDict):
@@ -73,6 +166,7 @@ class StatStatusPair(TypedDict, total=False):
     """Type for stat status pair from REST API."""
     stat: StatData
     difficulty: DifficultyData
+    paid_only: bool
 
 
 class RestAPIResponse(TypedDict, total=False):
@@ -83,30 +177,188 @@ class RestAPIResponse(TypedDict, total=False):
 LEETCODE_GRAPHQL_URL = "https://leetcode.com/graphql/"
 LEETCODE_API_URL = "https://leetcode.com/api/problems/algorithms/"
 
+# Difficulty levels used by the REST API
+REST_DIFFICULTY_LEVELS: Dict[int, str] = {1: "Easy", 2: "Medium", 3: "Hard"}
+
+# Where the catalog is built from first: "graphql" pages through questionList
+# (~35 requests), "rest" downloads the whole list in one streamed request. Either
+# falls back to the other on failure.
+CatalogSource = Literal["graphql", "rest"]
+# Raised while reading a catalog response that is truncated or not shaped as
+# expected; the build then falls back to the other source
+MALFORMED_CATALOG_ERRORS = (ValueError, KeyError, TypeError)
+# "study_plan" is a LeetCode study plan (leetcode.com/studyplan/<slug>), "list" a
+# public problem list (leetcode.com/problem-list/<slug>)
+ProblemListKind = Literal["study_plan", "list"]
+# Where preload_problem found a problem: this process's cache, the shared store, or LeetCode
+ProblemSource = Literal["memory", "disk", "network"]
+
+# Fetched problems are served from memory; after this age they are still served
+# but refreshed in the background.
+PROBLEM_TTL_SECONDS = 60 * 60
+# Problems kept in memory; the least recently used are dropped beyond this
+# (the shared store, when configured, still has them)
+PROBLEM_CACHE_MAX_ENTRIES = 1000
+# Same for the catalog (id -> slug map and problem list)
+CATALOG_TTL_SECONDS = 6 * 60 * 60
+# Problems whose similarQuestions are requested per GraphQL request in a bulk pass
+SIMILAR_BATCH_SIZE = 50
+# Fields of a question that make up a Problem
+QUESTION_FIELDS = """
+                questionId
+                questionFrontendId
+                title
+                titleSlug
+                difficulty
+                content
+                topicTags {
+                    name
+                    slug
+                }
+                codeSnippets {
+                    lang
+                    langSlug
+                    code
+                }
+                exampleTestcases
+                sampleTestCase
+                hints
+                similarQuestions
+            """
+# While LeetCode still reports yesterday's daily challenge after midnight UTC,
+# ask again at most this often
+DAILY_RETRY_SECONDS = 60
+# Problems per favoriteQuestionList page
+PROBLEM_LIST_PAGE_SIZE = 100
+# Newly fetched problems are added to the content search index at most this often
+CONTENT_INDEX_REBUILD_SECONDS = 5 * 60
+
+
+def utc_today() -> str:
+    """Today's date in UTC (YYYY-MM-DD), the day LeetCode's daily challenge follows."""
+    return datetime.now(timezone.utc).date().isoformat()
+
+
+def _problem_info_from_pair(item: StatStatusPair) -> Optional[CachedProblemInfo]:
+    """
+    Reduce one REST ``stat_status_pairs`` entry to the fields we cache.
+
+    Args:
+        item: Decoded stat status pair
+
+    Returns:
+        CachedProblemInfo, or None if the entry has no ID or slug
+    """
+    stat = item.get("stat", {})
+    difficulty_info = item.get("difficulty", {})
+
+    frontend_id_int = stat.get("frontend_question_id", 0)
+    frontend_id = str(frontend_id_int)
+    slug = stat.get("question__title_slug", "")
+    title = stat.get("question__title", "")
+    difficulty_level = difficulty_info.get("level", 0)
+
+    # Map difficulty level to string
+    difficulty: Optional[str] = REST_DIFFICULTY_LEVELS.get(difficulty_level)
+
+    if not frontend_id or not slug:
+        return None
+    # The REST API has no topic tags
+    return CachedProblemInfo(
+        questionFrontendId=frontend_id,
+        title=title,
+        titleSlug=slug,
+        difficulty=difficulty,
+        paidOnly=item.get("paid_only", False),
+    )
+
 
 class LeetCodeClient:
     """Client for interacting with LeetCode GraphQL API."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        http2: bool = False,
+        catalog_source: CatalogSource = "graphql",
+        store: Optional[ProblemStore] = None,
+    ) -> None:
+        """
+        Args:
+            http2: Send all requests over one long-lived HTTP/2 connection, so
+                concurrent GraphQL POSTs are multiplexed instead of each opening
+                its own HTTP/1.1 connection. Requires the ``h2`` package
+                (``pip install interview-prep-mcp[http2]``).
+            catalog_source: Build the catalog from paginated GraphQL ("graphql")
+                or the single streamed REST request ("rest"); see
+                benchmarks/bench_catalog.py to measure which is faster.
+            store: Persistent store shared with other server processes; the
+                catalog and fetched problems are read from it before going to
+                LeetCode and written back after every fetch.
+
+        Raises:
+            ImportError: If http2 is requested but ``h2`` is not installed
+        """
+        if http2 and importlib.util.find_spec("h2") is None:
+            raise ImportError(
+                "HTTP/2 support requires the 'h2' package: pip install 'interview-prep-mcp[http2]'"
+            )
+        self.http2 = http2
+        self.catalog_source = catalog_source
+        self.store = store
+        self._shared_http_client: Optional[httpx.AsyncClient] = None
         self.url = LEETCODE_GRAPHQL_URL
         self.api_url = LEETCODE_API_URL
         self._id_to_slug_cache: Optional[Dict[str, str]] = None
         self._problem_cache: Optional[List[CachedProblemInfo]] = None
+        # Tag/difficulty bitsets over _problem_cache, rebuilt when it is replaced
+        self._catalog_index: Optional[CatalogIndex] = None
+        # Similar-question links from fetched problems and collect_similar_questions()
+        self.similar = SimilarityGraph()
+        self._similar_loaded = False
+        # TF-IDF index over locally available descriptions (requires NumPy)
+        self._content_index: Optional["ContentIndex"] = None
+        # Incremented on each content index build; a search cursor is valid within one
+        self._content_generation = 0
+        self._content_indexed_at = 0.0
+        self._content_dirty = False
+        self._content_refreshing = False
+        self._catalog_built_at: Optional[float] = None
+        # Last known good copy of recently used problems, keyed by title slug
+        self._fetched_problems: StaleWhileRevalidateCache[Problem] = StaleWhileRevalidateCache(
+            PROBLEM_TTL_SECONDS, PROBLEM_CACHE_MAX_ENTRIES
+        )
+        # Slugs of problems being refreshed in the background
+        self._revalidating: Set[str] = set()
+        self._catalog_refreshing = False
+        # Study plan and list definitions with the monotonic time they were fetched
+        self._problem_lists: Dict[Tuple[str, str], Tuple[ProblemList, float]] = {}
+        # Today's daily challenge and its problem, kept until the UTC day changes
+        self._daily: Optional[Tuple[DailyChallenge, Problem]] = None
+        self._daily_checked_at = 0.0
+        self._daily_lock = asyncio.Lock()
+        self._background_tasks: Set[asyncio.Task[None]] = set()
         # Rate limiter: 10 requests per second to be respectful to LeetCode API
         self._rate_limiter = AsyncLimiter(10, 1)
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type((httpx.HTTPStatusError, httpx.TimeoutException, httpx.ConnectError, httpx.NetworkError)),
-        reraise=True,
-    )
-    async def fetch_problem(self, title_slug: str) -> Optional[Problem]:
+        # Hands out rate-limit tokens to interactive requests before prefetch
+        # and background work (catalog builds, stale refreshes)
+        self.scheduler = UpstreamScheduler(self._rate_limiter)
+        # Fail fast instead of waiting on timeouts while LeetCode is down
+        self._circuit_breaker = CircuitBreaker()
+
+    async def fetch_problem(
+        self, title_slug: str, priority: Priority = Priority.INTERACTIVE
+    ) -> Optional[Problem]:
         """
         Fetch a problem by its title slug.
 
+        Previously fetched problems are returned from memory (or the shared
+        store); once older than PROBLEM_TTL_SECONDS they are still returned
+        immediately while a fresh copy is fetched in the background. Only the
+        upstream request is retried, never the cache lookups.
+
         Args:
             title_slug: The URL-friendly slug of the problem (e.g., "two-sum")
+            priority: Scheduling class of the upstream request, if one is needed
 
         Returns:
             Problem object if found, None otherwise
@@ -114,36 +366,520 @@ class LeetCodeClient:
         Raises:
             httpx.HTTPError: If the request fails
             ValueError: If the response format is invalid
+            CircuitOpenError: If LeetCode is failing and nothing is cached
+        """
+        cached = self._fetched_problems.lookup(title_slug)
+        if cached is not None:
+            problem, is_stale = cached
+            log_event(logger, logging.DEBUG, "cache.hit", title_slug=title_slug, stale=is_stale)
+            if is_stale:
+                self._revalidate_problem(title_slug)
+            return problem
+
+        if self.store is not None:
+            stored = await self.store.get_problem(title_slug)
+            if stored is not None:
+                problem, age = stored
+                log_event(
+                    logger,
+                    logging.DEBUG,
+                    "cache.store_hit",
+                    title_slug=title_slug,
+                    age_seconds=round(age),
+                )
+                self._fetched_problems.set(title_slug, problem, age=age)
+                self._note_similar(problem)
+                if age >= PROBLEM_TTL_SECONDS:
+                    self._revalidate_problem(title_slug)
+                return problem
+
+        log_event(
+            logger,
+            logging.DEBUG,
+            "cache.miss",
+            title_slug=title_slug,
+            priority=priority.name.lower(),
+        )
+        return await self._fetch_problem_upstream(title_slug, priority)
+
+    def is_cached(self, title_slug: str) -> bool:
+        """Whether a problem is in the in-memory cache (fresh or stale)."""
+        return title_slug in self._fetched_problems
+
+    async def prefetch_problem(self, title_slug: str) -> bool:
+        """
+        Load a problem into the cache ahead of a likely request.
+
+        Checks the shared store first, then fetches at prefetch priority with no
+        retries, so speculative work never spends the retry budget. Errors are
+        swallowed.
+
+        Args:
+            title_slug: The URL-friendly slug of the problem
+
+        Returns:
+            True if the problem is now cached
+        """
+        if self.is_cached(title_slug):
+            return True
+        if self.store is not None:
+            stored = await self.store.get_problem(title_slug)
+            if stored is not None:
+                problem, age = stored
+                self._fetched_problems.set(title_slug, problem, age=age)
+                self._note_similar(problem)
+                return True
+        if self._circuit_breaker.is_open:
+            return False
+        try:
+            return await self._request_problem(title_slug, Priority.PREFETCH) is not None
+        except Exception:
+            return False
+
+    async def preload_problem(
+        self, title_slug: str, priority: Priority = Priority.BACKGROUND
+    ) -> ProblemSource:
+        """
+        Load a problem into the cache and report where it came from.
+
+        Used to warm the cache at startup: like fetch_problem, but at
+        background priority by default, and telling a memory or shared-store
+        hit from an upstream fetch.
+
+        Args:
+            title_slug: The URL-friendly slug of the problem
+            priority: Scheduling class of the upstream request, if one is needed
+
+        Returns:
+            "memory", "disk" (the shared store) or "network"
+
+        Raises:
+            ValueError: If LeetCode has no such problem
+            httpx.HTTPError: If the request fails
+            CircuitOpenError: If LeetCode is failing
+        """
+        if self.is_cached(title_slug):
+            return "memory"
+        if self.store is not None:
+            stored = await self.store.get_problem(title_slug)
+            if stored is not None:
+                problem, age = stored
+                self._fetched_problems.set(title_slug, problem, age=age)
+                self._note_similar(problem)
+                if age >= PROBLEM_TTL_SECONDS:
+                    self._revalidate_problem(title_slug)
+                return "disk"
+        if await self._request_problem(title_slug, priority) is None:
+            raise ValueError(f"Problem not found: {title_slug}")
+        return "network"
+
+    @upstream_retry
+    async def _fetch_problem_upstream(
+        self, title_slug: str, priority: Priority = Priority.INTERACTIVE
+    ) -> Optional[Problem]:
+        """
+        Fetch a problem from LeetCode, retrying transient failures.
+
+        Args:
+            title_slug: The URL-friendly slug of the problem
+            priority: Scheduling class of the request
+
+        Returns:
+            Problem object if found, None otherwise
+
+        Raises:
+            httpx.HTTPError: If the request fails after retries
+            ValueError: If the response format is invalid
+            CircuitOpenError: If the circuit breaker rejects the request
+        """
+        return await self._request_problem(title_slug, priority)
+
+    async def _request_problem(
+        self, title_slug: str, priority: Priority = Priority.INTERACTIVE
+    ) -> Optional[Problem]:
+        """
+        Fetch a problem from LeetCode once and store it in the problem cache.
+
+        Args:
+            title_slug: The URL-friendly slug of the problem
+            priority: Scheduling class of the request
+
+        Returns:
+            Problem object if found, None otherwise
+
+        Raises:
+            httpx.HTTPError: If the request fails
+            ValueError: If the response format is invalid
+            CircuitOpenError: If the circuit breaker rejects the request
         """
         query = """
         query questionContent($titleSlug: String!) {
-            question(titleSlug: $titleSlug) {
-                questionId
-                questionFrontendId
-                title
-                titleSlug
-                difficulty
-                content
-                topicTags {
-                    name
+            question(titleSlug: $titleSlug) {%s}
+        }
+        """ % QUESTION_FIELDS
+
+        variables = {"titleSlug": title_slug}
+
+        with self._circuit_breaker.guard():
+            problem = await self._post_question_query(query, variables, priority)
+
+        if problem is None:
+            self._fetched_problems.discard(title_slug)
+        else:
+            await self._remember_problem(problem)
+        return problem
+
+    async def _remember_problem(self, problem: Problem) -> None:
+        """Cache and persist a problem fetched from LeetCode."""
+        self._fetched_problems.set(problem.titleSlug, problem)
+        self._content_dirty = True
+        if self.store is not None:
+            await self.store.put_problem(problem)
+        if (
+            self._note_similar(problem)
+            and self.store is not None
+            and problem.similarQuestions is not None
+        ):
+            await self.store.save_similar({problem.titleSlug: problem.similarQuestions})
+
+    def _note_similar(self, problem: Problem) -> bool:
+        """Add a problem's similar questions to the graph; True if they were new."""
+        if problem.similarQuestions is None:
+            return False
+        return self.similar.add(problem.titleSlug, problem.similarQuestions)
+
+    async def load_similar_graph(self) -> SimilarityGraph:
+        """Similar-question graph, merged with the shared store on first use."""
+        if not self._similar_loaded:
+            self._similar_loaded = True
+            if self.store is not None:
+                for title_slug, similar in (await self.store.load_similar()).items():
+                    if not self.similar.is_collected(title_slug):
+                        self.similar.add(title_slug, similar)
+        return self.similar
+
+    async def collect_similar_questions(
+        self, title_slugs: Optional[List[str]] = None, batch_size: int = SIMILAR_BATCH_SIZE
+    ) -> int:
+        """
+        Bulk-collect similar questions without fetching whole problems.
+
+        Each request asks for ``batch_size`` problems' ``similarQuestions`` via
+        aliased GraphQL fields, at background priority, so indexing the full
+        catalog takes ~70 requests instead of one per problem. Results go into
+        the graph and the shared store; failed batches are skipped.
+
+        Args:
+            title_slugs: Problems to collect (default: every catalog problem
+                whose list is not collected yet)
+            batch_size: Problems per request
+
+        Returns:
+            Number of problems whose lists were collected
+        """
+        graph = await self.load_similar_graph()
+        if title_slugs is None:
+            index = await self.load_catalog_index()
+            title_slugs = [
+                p.titleSlug for p in index.problems if not graph.is_collected(p.titleSlug)
+            ]
+
+        collected = 0
+        for start in range(0, len(title_slugs), batch_size):
+            try:
+                batch = await self._fetch_similar_batch(title_slugs[start : start + batch_size])
+            except Exception:
+                continue
+            for title_slug, similar in batch.items():
+                graph.add(title_slug, similar)
+            if self.store is not None:
+                await self.store.save_similar(batch)
+            collected += len(batch)
+        return collected
+
+    @upstream_retry
+    async def _fetch_similar_batch(self, title_slugs: List[str]) -> Dict[str, List[str]]:
+        """
+        Fetch ``similarQuestions`` for several problems in one request.
+
+        Returns:
+            Similar title slugs keyed by problem, for the problems that exist
+
+        Raises:
+            httpx.HTTPError: If the request fails after retries
+            ValueError: If the response reports errors
+        """
+        params = ", ".join(f"$s{i}: String!" for i in range(len(title_slugs)))
+        fields = "\n".join(
+            f"q{i}: question(titleSlug: $s{i}) {{ titleSlug similarQuestions }}"
+            for i in range(len(title_slugs))
+        )
+        json_payload: Dict[str, Union[str, Dict[str, str]]] = {
+            "query": f"query similarQuestions({params}) {{\n{fields}\n}}",
+            "variables": {f"s{i}": slug for i, slug in enumerate(title_slugs)},
+        }
+        with self._circuit_breaker.guard():
+            async with self.scheduler.slot(Priority.BACKGROUND, "similarQuestions"):
+                async with self._http_client() as client:
+                    response = await client.post(
+                        self.url,
+                        json=json_payload,
+                        headers={
+                            "Content-Type": "application/json",
+                            "Referer": "https://leetcode.com",
+                        },
+                        timeout=30.0,
+                    )
+                    response.raise_for_status()
+                    data = cast(GraphQLSimilarResponse, response.json())
+
+        if data.get("errors") and not data.get("data"):
+            messages = [error.get("message", "") for error in (data["errors"] or [])]
+            raise ValueError(f"GraphQL errors: {', '.join(messages)}")
+
+        result: Dict[str, List[str]] = {}
+        for question in (data.get("data") or {}).values():
+            if question is None or not question.get("titleSlug"):
+                continue
+            similar = similar_question_slugs(question.get("similarQuestions"))
+            result[question["titleSlug"]] = similar or []
+        return result
+
+    async def fetch_problem_list(
+        self,
+        slug: str,
+        kind: ProblemListKind = "study_plan",
+        priority: Priority = Priority.INTERACTIVE,
+    ) -> Optional[ProblemList]:
+        """
+        Fetch which problems a study plan or a public problem list contains.
+
+        Definitions are cached for CATALOG_TTL_SECONDS: plans and curated
+        lists change far less often than anyone reloads them.
+
+        Args:
+            slug: The plan or list slug (e.g., "top-interview-150")
+            kind: "study_plan" or "list"
+            priority: Scheduling class of the upstream requests
+
+        Returns:
+            The list definition, or None if LeetCode has no such plan or list
+
+        Raises:
+            httpx.HTTPError: If the request fails
+            ValueError: If the response reports errors
+            CircuitOpenError: If LeetCode is failing
+        """
+        cached = self._problem_lists.get((kind, slug))
+        if cached is not None and time.monotonic() - cached[1] < CATALOG_TTL_SECONDS:
+            return cached[0]
+
+        if kind == "study_plan":
+            problem_list = await self._fetch_study_plan(slug, priority)
+        else:
+            problem_list = await self._fetch_favorite_list(slug, priority)
+        if problem_list is not None:
+            self._problem_lists[(kind, slug)] = (problem_list, time.monotonic())
+        return problem_list
+
+    async def _fetch_study_plan(self, slug: str, priority: Priority) -> Optional[ProblemList]:
+        query = """
+        query studyPlanDetail($slug: String!) {
+            studyPlanV2Detail(planSlug: $slug) {
+                slug
+                name
+                planSubGroups {
                     slug
+                    name
+                    questions {
+                        titleSlug
+                    }
                 }
-                codeSnippets {
-                    lang
-                    langSlug
-                    code
+            }
+        }
+        """
+        data = await self._post_list_query(query, {"slug": slug}, priority)
+        plan = cast(Optional[StudyPlanDetail], data.get("studyPlanV2Detail"))
+        if not plan:
+            return None
+        groups = [
+            ProblemListGroup(
+                name=group.get("name") or group.get("slug", ""),
+                titleSlugs=[
+                    q["titleSlug"] for q in group.get("questions", []) if q.get("titleSlug")
+                ],
+            )
+            for group in plan.get("planSubGroups", [])
+        ]
+        return ProblemList(
+            kind="study_plan", slug=slug, name=plan.get("name") or slug, groups=groups
+        )
+
+    async def _fetch_favorite_list(self, slug: str, priority: Priority) -> Optional[ProblemList]:
+        query = """
+        query favoriteQuestionList($slug: String!, $limit: Int, $skip: Int) {
+            favoriteDetailV2(favoriteSlug: $slug) {
+                name
+            }
+            favoriteQuestionList(favoriteSlug: $slug, limit: $limit, skip: $skip) {
+                questions {
+                    titleSlug
                 }
-                exampleTestcases
-                sampleTestCase
-                hints
+                totalLength
+                hasMore
             }
         }
         """
+        name: Optional[str] = None
+        title_slugs: List[str] = []
+        # Counts every question returned, so entries without a slug cannot
+        # shift the next page back onto ones already seen
+        skip = 0
+        while True:
+            variables = {"slug": slug, "limit": PROBLEM_LIST_PAGE_SIZE, "skip": skip}
+            data = await self._post_list_query(query, variables, priority)
+            page = cast(Optional[FavoriteQuestionPage], data.get("favoriteQuestionList"))
+            if not page:
+                if title_slugs:
+                    break
+                return None
+            if name is None:
+                detail = cast(Optional[Dict[str, str]], data.get("favoriteDetailV2")) or {}
+                name = detail.get("name") or slug
+            questions = page.get("questions", [])
+            skip += len(questions)
+            title_slugs.extend(q["titleSlug"] for q in questions if q.get("titleSlug"))
+            if not page.get("hasMore") or not questions:
+                break
+        return ProblemList(
+            kind="list",
+            slug=slug,
+            name=name or slug,
+            groups=[ProblemListGroup(name=name or slug, titleSlugs=title_slugs)],
+        )
+
+    @upstream_retry
+    async def _post_list_query(
+        self, query: str, variables: Dict[str, Union[str, int]], priority: Priority
+    ) -> Dict[str, object]:
+        """Send a study plan or list query; returns its ``data`` (empty for an unknown slug)."""
+        with self._circuit_breaker.guard():
+            async with self.scheduler.slot(priority, "problemList"):
+                async with self._http_client() as client:
+                    response = await client.post(
+                        self.url,
+                        json={"query": query, "variables": variables},
+                        headers={
+                            "Content-Type": "application/json",
+                            "Referer": "https://leetcode.com",
+                        },
+                        timeout=30.0,
+                    )
+                    response.raise_for_status()
+                    data = cast(GraphQLProblemListResponse, response.json())
+
+        if data.get("errors") and not data.get("data"):
+            messages = [error.get("message", "") for error in (data["errors"] or [])]
+            raise ValueError(f"GraphQL errors: {', '.join(messages)}")
+        return data.get("data") or {}
+
+    async def fetch_daily_challenge(
+        self, priority: Priority = Priority.INTERACTIVE
+    ) -> Optional[Tuple[DailyChallenge, Problem]]:
+        """
+        Today's daily coding challenge and its problem.
 
-        variables = {"titleSlug": title_slug}
+        One request per UTC day: ``activeDailyCodingChallengeQuestion`` is
+        asked for the pointer and the full question together, and both are
+        kept until the date changes (concurrent callers share the request).
+        Just after midnight LeetCode may still report yesterday's challenge;
+        that is served, and asked again at most every DAILY_RETRY_SECONDS.
 
-        async with self._rate_limiter:
-            async with httpx.AsyncClient() as client:
+        Args:
+            priority: Scheduling class of the upstream request, if one is needed
+
+        Returns:
+            The challenge and its problem, or None if LeetCode reports none
+
+        Raises:
+            httpx.HTTPError: If the request fails and nothing is cached
+            ValueError: If the response format is invalid
+            CircuitOpenError: If LeetCode is failing and nothing is cached
+        """
+        if self._daily_is_current():
+            return self._daily
+        async with self._daily_lock:
+            if self._daily_is_current():
+                return self._daily
+            try:
+                daily = await self._fetch_daily_upstream(priority)
+            except Exception:
+                if self._daily is None:
+                    raise
+                return self._daily
+            finally:
+                self._daily_checked_at = time.monotonic()
+            if daily is not None:
+                self._daily = daily
+            return self._daily
+
+    def _daily_is_current(self) -> bool:
+        return self._daily is not None and (
+            self._daily[0].date >= utc_today()
+            or time.monotonic() - self._daily_checked_at < DAILY_RETRY_SECONDS
+        )
+
+    @upstream_retry
+    async def _fetch_daily_upstream(
+        self, priority: Priority
+    ) -> Optional[Tuple[DailyChallenge, Problem]]:
+        query = """
+        query questionOfToday {
+            activeDailyCodingChallengeQuestion {
+                date
+                link
+                question {%s}
+            }
+        }
+        """ % QUESTION_FIELDS
+        with self._circuit_breaker.guard():
+            async with self.scheduler.slot(priority, "questionOfToday"):
+                async with self._http_client() as client:
+                    response = await client.post(
+                        self.url,
+                        json={"query": query, "variables": {}},
+                        headers={
+                            "Content-Type": "application/json",
+                            "Referer": "https://leetcode.com",
+                        },
+                        timeout=30.0,
+                    )
+                    response.raise_for_status()
+                    data = cast(GraphQLDailyResponse, response.json())
+
+        if data.get("errors"):
+            messages = [error.get("message", "") for error in (data["errors"] or [])]
+            raise ValueError(f"GraphQL errors: {', '.join(messages)}")
+        challenge = (data.get("data") or {}).get("activeDailyCodingChallengeQuestion")
+        if not challenge or not challenge.get("question"):
+            return None
+
+        problem = Problem.model_validate(challenge["question"])
+        await self._remember_problem(problem)
+        path = challenge.get("link") or f"/problems/{problem.titleSlug}/"
+        pointer = DailyChallenge(
+            date=challenge.get("date") or utc_today(),
+            link=f"https://leetcode.com{path}",
+            titleSlug=problem.titleSlug,
+        )
+        return pointer, problem
+
+    async def _post_question_query(
+        self, query: str, variables: Dict[str, str], priority: Priority = Priority.INTERACTIVE
+    ) -> Optional[Problem]:
+        """Send the questionContent query and validate the result."""
+        async with self.scheduler.slot(priority, "questionContent"):
+            async with self._http_client() as client:
                 json_payload: Dict[str, Union[str, Dict[str, str]]] = {
                     "query": query,
                     "variables": variables
@@ -191,10 +927,18 @@ class LeetCodeClient:
             httpx.HTTPError: If the request fails
             ValueError: If the response format is invalid
         """
+        rest_failed = False
+        if self.catalog_source == "rest":
+            try:
+                return await self._build_cache_from_api()
+            except (httpx.HTTPError, *MALFORMED_CATALOG_ERRORS):
+                # Fall through to paginated GraphQL
+                rest_failed = True
+
         cache: Dict[str, str] = {}
         problem_list: List[CachedProblemInfo] = []
 
-        # GraphQL query with pagination - now includes title and difficulty
+        # GraphQL query with pagination - includes title, difficulty and tags for filtering
         query = """
         query problemsetQuestionList($categorySlug: String, $limit: Int, $skip: Int, $filters: QuestionListFilterInput) {
             problemsetQuestionList: questionList(
@@ -209,6 +953,10 @@ class LeetCodeClient:
                     title
                     titleSlug
                     difficulty
+                    paidOnly: isPaidOnly
+                    topicTags {
+                        slug
+                    }
                 }
             }
         }
@@ -217,7 +965,7 @@ class LeetCodeClient:
         limit = 100
         skip = 0
 
-        async with httpx.AsyncClient() as client:
+        async with self._http_client() as client:
             while True:
                 variables: Dict[str, Union[str, int, Dict[str, Union[str, int]]]] = {
                     "categorySlug": "",
@@ -226,27 +974,14 @@ class LeetCodeClient:
                     "filters": {}
                 }
 
-                try:
-                    json_payload: Dict[str, Union[str, Dict[str, Union[str, int, Dict[str, Union[str, int]]]]]] = {
-                        "query": query,
-                        "variables": variables
-                    }
-                    async with self._rate_limiter:
-                        response = await client.post(
-                            self.url,
-                            json=json_payload,
-                            headers={
-                                "Content-Type": "application/json",
-                                "Referer": "https://leetcode.com",
-                            },
-                            timeout=30.0,
-                        )
-                        response.raise_for_status()
-                        data: GraphQLListResponse = cast(GraphQLListResponse, response.json())
+                json_payload: Dict[
+                    str, Union[str, Dict[str, Union[str, int, Dict[str, Union[str, int]]]]]
+                ] = {"query": query, "variables": variables}
 
+                try:
+                    data = await self._fetch_catalog_page(client, json_payload)
                     if data.get("errors"):
-                        # Try fallback API
-                        return await self._build_cache_from_api()
+                        raise ValueError("GraphQL errors in catalog page")
 
                     if not data.get("data") or not data["data"]:
                         break
@@ -256,86 +991,153 @@ class LeetCodeClient:
                     if not questions:
                         break
 
-                    # Add to both caches
-                    for question in questions:
-                        question_id = question["questionFrontendId"]
-                        title_slug = question["titleSlug"]
-                        cache[question_id] = title_slug
-                        problem_list.append(CachedProblemInfo(
+                    page = [
+                        CachedProblemInfo(
                             questionFrontendId=question["questionFrontendId"],
                             title=question["title"],
                             titleSlug=question["titleSlug"],
-                            difficulty=question["difficulty"]
-                        ))
-
-                    # Check if we've fetched all problems
+                            difficulty=question["difficulty"],
+                            paidOnly=question.get("paidOnly") or False,
+                            tags=[tag["slug"] for tag in question.get("topicTags") or []],
+                        )
+                        for question in questions
+                    ]
                     total = problem_set_data["total"]
-                    skip += limit
-                    if skip >= total:
-                        break
-
-                except Exception:
-                    # Try fallback API
+                except (httpx.HTTPError, *MALFORMED_CATALOG_ERRORS):
+                    if rest_failed:
+                        # The REST API already failed; don't request it again
+                        raise
+                    # Retries are exhausted or the page is malformed; try fallback API
                     return await self._build_cache_from_api()
 
+                # Add to both caches
+                for problem in page:
+                    cache[problem.questionFrontendId] = problem.titleSlug
+                    problem_list.append(problem)
+
+                # Check if we've fetched all problems
+                skip += limit
+                if skip >= total:
+                    break
+
         # Store the full problem cache
         self._problem_cache = problem_list
+        self._catalog_built_at = time.monotonic()
         return cache
 
+    @upstream_retry
+    async def _fetch_catalog_page(
+        self,
+        client: httpx.AsyncClient,
+        json_payload: Dict[str, Union[str, Dict[str, Union[str, int, Dict[str, Union[str, int]]]]]],
+    ) -> GraphQLListResponse:
+        """
+        Fetch one page of the problem list, retrying transient failures.
+
+        Args:
+            client: HTTP client shared by all pages of the catalog build
+            json_payload: GraphQL query and pagination variables
+
+        Returns:
+            Decoded GraphQL list response
+
+        Raises:
+            httpx.HTTPError: If the request fails after retries
+            ValueError: If the response is not valid JSON
+        """
+        with self._circuit_breaker.guard():
+            async with self.scheduler.slot(Priority.BACKGROUND, "problemsetQuestionList"):
+                response = await client.post(
+                    self.url,
+                    json=json_payload,
+                    headers={
+                        "Content-Type": "application/json",
+                        "Referer": "https://leetcode.com",
+                    },
+                    timeout=30.0,
+                )
+                response.raise_for_status()
+                return cast(GraphQLListResponse, response.json())
+
     async def _build_cache_from_api(self) -> Dict[str, str]:
         """
-        Fallback method to build cache using REST API.
+        Build the cache with a single request to the REST API.
         Also populates _problem_cache with full problem info.
 
+        The request is not retried: it is either the first choice, with
+        paginated GraphQL (retried per page) as its fallback, or the fallback
+        itself.
+
+        The several-megabyte response is decoded incrementally: each entry of
+        ``stat_status_pairs`` is reduced to the fields we keep as soon as its
+        bytes arrive, so the raw body and full JSON tree are never held at once.
+
         Returns:
             Dictionary mapping questionFrontendId to titleSlug
 
         Raises:
             httpx.HTTPError: If the request fails
+            ValueError: If the response is truncated or malformed
+            KeyError, TypeError: If an entry is not shaped as expected
         """
         cache: Dict[str, str] = {}
         problem_list: List[CachedProblemInfo] = []
-
-        async with httpx.AsyncClient() as client:
-            async with self._rate_limiter:
-                response = await client.get(
-                    self.api_url,
-                    headers={"Referer": "https://leetcode.com"},
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                data: RestAPIResponse = cast(RestAPIResponse, response.json())
-
-            if data.get("stat_status_pairs"):
-                stat_status_pairs = data["stat_status_pairs"]
-                for item in stat_status_pairs:
-                    stat = item.get("stat", {})
-                    difficulty_info = item.get("difficulty", {})
-
-                    frontend_id_int = stat.get("frontend_question_id", 0)
-                    frontend_id = str(frontend_id_int)
-                    slug = stat.get("question__title_slug", "")
-                    title = stat.get("question__title", "")
-                    difficulty_level = difficulty_info.get("level", 0)
-
-                    # Map difficulty level to string
-                    difficulty_map: Dict[int, str] = {1: "Easy", 2: "Medium", 3: "Hard"}
-                    difficulty: Optional[str] = difficulty_map.get(difficulty_level)
-
-                    if frontend_id and slug:
-                        cache[frontend_id] = slug
-                        problem_list.append(CachedProblemInfo(
-                            questionFrontendId=frontend_id,
-                            title=title,
-                            titleSlug=slug,
-                            difficulty=difficulty
-                        ))
+        pairs = JSONArrayStream("stat_status_pairs")
+
+        async with self._http_client() as client:
+            with self._circuit_breaker.guard():
+                async with self.scheduler.slot(Priority.BACKGROUND, "restCatalog"):
+                    async with client.stream(
+                        "GET",
+                        self.api_url,
+                        headers={"Referer": "https://leetcode.com"},
+                        timeout=30.0,
+                    ) as response:
+                        response.raise_for_status()
+                        async for chunk in response.aiter_bytes():
+                            for item in pairs.feed(chunk):
+                                if not isinstance(item, dict):
+                                    continue
+                                problem = _problem_info_from_pair(cast(StatStatusPair, item))
+                                if problem is not None:
+                                    cache[problem.questionFrontendId] = problem.titleSlug
+                                    problem_list.append(problem)
+                        pairs.close()
 
         # Store the full problem cache
         self._problem_cache = problem_list
+        self._catalog_built_at = time.monotonic()
         return cache
 
-    async def _get_slug_by_id(self, problem_id: int) -> Optional[str]:
+    async def _load_catalog(self) -> Dict[str, str]:
+        """
+        Populate the catalog from the shared store, or build it from LeetCode.
+
+        Returns:
+            Dictionary mapping questionFrontendId to titleSlug
+        """
+        if self.store is not None:
+            stored = await self.store.load_catalog()
+            if stored is not None:
+                problem_list, age = stored
+                self._problem_cache = problem_list
+                self._catalog_built_at = time.monotonic() - age
+                self._id_to_slug_cache = {
+                    problem.questionFrontendId: problem.titleSlug for problem in problem_list
+                }
+                self._revalidate_catalog()
+                return self._id_to_slug_cache
+
+        cache = await self._build_id_to_slug_cache()
+        await self._save_catalog()
+        return cache
+
+    async def _save_catalog(self) -> None:
+        """Write the current catalog to the shared store, if any."""
+        if self.store is not None and self._problem_cache is not None:
+            await self.store.save_catalog(self._problem_cache)
+
+    async def get_slug_by_id(self, problem_id: int) -> Optional[str]:
         """
         Get title slug for a given problem ID, using cache.
 
@@ -347,16 +1149,21 @@ class LeetCodeClient:
         """
         # Build cache on first use
         if self._id_to_slug_cache is None:
-            self._id_to_slug_cache = await self._build_id_to_slug_cache()
+            self._id_to_slug_cache = await self._load_catalog()
+        else:
+            self._revalidate_catalog()
 
         return self._id_to_slug_cache.get(str(problem_id))
 
-    async def fetch_problem_by_id(self, problem_id: int) -> Optional[Problem]:
+    async def fetch_problem_by_id(
+        self, problem_id: int, priority: Priority = Priority.INTERACTIVE
+    ) -> Optional[Problem]:
         """
         Fetch a problem by its frontend ID.
 
         Args:
             problem_id: The frontend ID of the problem (e.g., 1 for "Two Sum")
+            priority: Scheduling class of the upstream request, if one is needed
 
         Returns:
             Problem object if found, None otherwise
@@ -366,28 +1173,50 @@ class LeetCodeClient:
             ValueError: If the response format is invalid
         """
         # Get title slug from cache
-        title_slug = await self._get_slug_by_id(problem_id)
+        title_slug = await self.get_slug_by_id(problem_id)
 
         if not title_slug:
             return None
 
         # Fetch the full problem details using the title slug
-        return await self.fetch_problem(title_slug)
-
-    async def search_problems(self, query: str, limit: int = 10) -> List[ProblemSummary]:
+        return await self.fetch_problem(title_slug, priority)
+
+    async def search_problems(
+        self,
+        query: str,
+        limit: int = 10,
+        difficulty: Optional[str] = None,
+        tags: Optional[Iterable[str]] = None,
+        include_paid: bool = True,
+        after: Optional[str] = None,
+    ) -> List[ProblemSummary]:
         """
         Search for problems by title or keywords using cached data.
 
+        Filters are answered from the catalog's bitset index before the title
+        match, so "medium dynamic-programming" problems are found without
+        scanning every problem's tags. Matches come in catalog order; passing
+        the last slug of a page as ``after`` resumes the scan right after it.
+
         Args:
-            query: Search query (title or keywords)
+            query: Search query (title or keywords); empty matches every problem
             limit: Maximum number of results to return (default: 10)
+            difficulty: Only problems of this difficulty ("Easy", "Medium", "Hard")
+            tags: Only problems with all of these topic tags (slugs or names)
+            include_paid: Whether to include paid-only problems
+            after: Title slug of the last result of the previous page
 
         Returns:
-            List of ProblemSummary objects matching the query
+            List of ProblemSummary objects matching the query and filters
+
+        Raises:
+            ValueError: If ``after`` is not in the catalog
         """
         # Build cache if not already built
         if self._problem_cache is None:
-            await self._build_id_to_slug_cache()
+            self._id_to_slug_cache = await self._load_catalog()
+        else:
+            self._revalidate_catalog()
 
         # Search through cached problems (fast, no API calls)
         query_lower = query.lower()
@@ -396,20 +1225,265 @@ class LeetCodeClient:
         # Assert that cache is not None after initialization
         assert self._problem_cache is not None, "Problem cache should be initialized"
 
-        for problem in self._problem_cache:
+        start = 0
+        if after is not None:
+            position = self.catalog_index().positions.get(after)
+            if position is None:
+                raise ValueError(f"Cannot resume search after unknown problem: {after}")
+            start = position + 1
+
+        problems = self._problem_cache
+        # Index from the resume position instead of skipping the first ``start`` problems
+        candidates: Iterable[CachedProblemInfo] = (problems[i] for i in range(start, len(problems)))
+        if difficulty or tags or not include_paid:
+            index = self.catalog_index()
+            # Clear the bits before the resume position
+            candidates = index.iter_matches(
+                index.mask(difficulty, tags, include_paid) >> start << start
+            )
+
+        for problem in candidates:
             title_lower: str = problem.title.lower()
             slug_lower: str = problem.titleSlug.lower()
 
             # Match if query is in title or slug
             if query_lower in title_lower or query_lower in slug_lower:
-                matches.append(ProblemSummary(
+                matches.append(
+                    ProblemSummary(
+                        questionFrontendId=problem.questionFrontendId,
+                        title=problem.title,
+                        titleSlug=problem.titleSlug,
+                        difficulty=problem.difficulty,
+                        paidOnly=problem.paidOnly,
+                        tags=problem.tags,
+                    )
+                )
+
+                if len(matches) >= limit:
+                    break
+
+        return matches
+
+    async def search_content(
+        self,
+        query: str,
+        limit: int = 10,
+        difficulty: Optional[str] = None,
+        tags: Optional[Iterable[str]] = None,
+        include_paid: bool = True,
+        after: Optional[Tuple[float, str]] = None,
+        generation: Optional[int] = None,
+    ) -> List[ProblemSummary]:
+        """
+        Search problem descriptions by relevance (TF-IDF cosine similarity).
+
+        Only problems available locally are searched: those fetched by this
+        process or, with a store, by any process sharing it. A page is resumed
+        with ``after`` and the ``content_generation`` it was returned under.
+
+        Args:
+            query: Free-text query (e.g., "sliding window maximum of subarray")
+            limit: Maximum number of results to return
+            difficulty: Only problems of this difficulty
+            tags: Only problems with all of these topic tags
+            include_paid: Whether to include paid-only problems
+            after: (score, title slug) of the last result of the previous page
+            generation: ``content_generation`` when the previous page was returned
+
+        Returns:
+            Matching ProblemSummary objects, best first, with the exact ``score`` set
+
+        Raises:
+            ImportError: If NumPy is not installed
+            ValueError: If the index was rebuilt since the previous page
+        """
+        from .content_search import bitset_to_array
+
+        content = await self.load_content_index()
+        index = await self.load_catalog_index()
+        positions = content.catalog_positions(index.positions)
+        in_catalog = positions >= 0
+        allowed = in_catalog
+        if difficulty or tags or not include_paid:
+            selected = bitset_to_array(
+                index.mask(difficulty, tags, include_paid), len(index.problems)
+            )
+            allowed = in_catalog & selected[positions]
+
+        matches: List[ProblemSummary] = []
+        for slug, score in content.search(query, limit, allowed, after, generation):
+            problem = index.problems[index.positions[slug]]
+            matches.append(
+                ProblemSummary(
                     questionFrontendId=problem.questionFrontendId,
                     title=problem.title,
                     titleSlug=problem.titleSlug,
-                    difficulty=problem.difficulty
-                ))
+                    difficulty=problem.difficulty,
+                    paidOnly=problem.paidOnly,
+                    tags=problem.tags,
+                    score=score,
+                )
+            )
+        return matches
 
-                if len(matches) >= limit:
-                    break
+    async def load_content_index(self) -> "ContentIndex":
+        """
+        Content search index, built on first use.
+
+        Problems fetched since the last build are added by a background
+        rebuild at most every CONTENT_INDEX_REBUILD_SECONDS; the previous index
+        is served meanwhile.
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if importlib.util.find_spec("numpy") is None:
+            raise ImportError(
+                "Content search requires NumPy: pip install 'interview-prep-mcp[search]'"
+            )
+        if self._content_index is None:
+            await self._rebuild_content_index()
+        elif (
+            self._content_dirty
+            and time.monotonic() - self._content_indexed_at >= CONTENT_INDEX_REBUILD_SECONDS
+            and not self._content_refreshing
+        ):
+            self._content_refreshing = True
+            self._spawn(self._refresh_content_index())
+        assert self._content_index is not None
+        return self._content_index
+
+    @property
+    def content_generation(self) -> int:
+        """Generation of the content index being served (0 before the first build)."""
+        return self._content_index.generation if self._content_index is not None else 0
+
+    async def _rebuild_content_index(self) -> None:
+        """Index every locally available problem description."""
+        from .content_search import ContentIndex
+
+        self._content_dirty = False
+        texts: Dict[str, Tuple[str, str, str]] = {}
+        if self.store is not None:
+            for slug, title, content in await self.store.load_problem_texts():
+                texts[slug] = (slug, title, content)
+        for problem in self._fetched_problems.values():
+            texts[problem.titleSlug] = (problem.titleSlug, problem.title, problem.content)
+        index = await asyncio.to_thread(ContentIndex.from_html, list(texts.values()))
+        self._content_generation += 1
+        index.generation = self._content_generation
+        self._content_index = index
+        self._content_indexed_at = time.monotonic()
+
+    async def _refresh_content_index(self) -> None:
+        try:
+            await self._rebuild_content_index()
+        except Exception:
+            # Keep serving the previous index; the next search tries again
+            self._content_dirty = True
+        finally:
+            self._content_refreshing = False
+
+    def catalog_index(self) -> CatalogIndex:
+        """
+        Filter index over the loaded catalog, rebuilt whenever the catalog is.
 
-        return matches
\ No newline at end of file
+        Raises:
+            RuntimeError: If the catalog has not been loaded
+        """
+        if self._problem_cache is None:
+            raise RuntimeError("Catalog not loaded")
+        if self._catalog_index is None or self._catalog_index.problems is not self._problem_cache:
+            self._catalog_index = CatalogIndex(self._problem_cache)
+        return self._catalog_index
+
+    async def load_catalog_index(self) -> CatalogIndex:
+        """Filter index over the catalog, loading the catalog on first use."""
+        if self._problem_cache is None:
+            self._id_to_slug_cache = await self._load_catalog()
+        else:
+            self._revalidate_catalog()
+        return self.catalog_index()
+
+    @asynccontextmanager
+    async def _http_client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        Provide an HTTP client for one operation.
+
+        In HTTP/2 mode every operation shares one client (and so one multiplexed
+        connection); otherwise each operation gets its own short-lived client.
+        """
+        if not self.http2:
+            async with httpx.AsyncClient() as client:
+                yield client
+            return
+
+        if self._shared_http_client is None or self._shared_http_client.is_closed:
+            self._shared_http_client = httpx.AsyncClient(http2=True)
+        yield self._shared_http_client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP/2 connection, if one is open."""
+        if self._shared_http_client is not None:
+            await self._shared_http_client.aclose()
+            self._shared_http_client = None
+
+    def reset_after_fork(self) -> None:
+        """
+        Drop event-loop-bound state inherited from a parent process.
+
+        Cached problems and the catalog are kept. Call this in a forked worker
+        before its event loop starts; the parent must have called aclose().
+        """
+        self._shared_http_client = None
+        self._background_tasks = set()
+        self._revalidating = set()
+        self._catalog_refreshing = False
+        self._content_refreshing = False
+        self._daily_lock = asyncio.Lock()
+        self._rate_limiter = AsyncLimiter(10, 1)
+        self.scheduler = UpstreamScheduler(self._rate_limiter, self.scheduler.caps)
+
+    def _revalidate_problem(self, title_slug: str) -> None:
+        """Refresh a stale problem in the background, once at a time per slug."""
+        if title_slug in self._revalidating or self._circuit_breaker.is_open:
+            return
+        self._revalidating.add(title_slug)
+        self._spawn(self._refresh_problem(title_slug))
+
+    async def _refresh_problem(self, title_slug: str) -> None:
+        try:
+            await self._request_problem(title_slug, Priority.BACKGROUND)
+        except Exception:
+            # Keep serving the stale copy; the next request tries again
+            pass
+        finally:
+            self._revalidating.discard(title_slug)
+
+    def _revalidate_catalog(self) -> None:
+        """Rebuild a stale catalog in the background while the old one is served."""
+        if (
+            self._catalog_built_at is None
+            or time.monotonic() - self._catalog_built_at < CATALOG_TTL_SECONDS
+            or self._catalog_refreshing
+            or self._circuit_breaker.is_open
+        ):
+            return
+        self._catalog_refreshing = True
+        self._spawn(self._refresh_catalog())
+
+    async def _refresh_catalog(self) -> None:
+        try:
+            self._id_to_slug_cache = await self._build_id_to_slug_cache()
+            await self._save_catalog()
+        except Exception:
+            # Keep serving the stale catalog; the next lookup tries again
+            pass
+        finally:
+            self._catalog_refreshing = False
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Run a coroutine in the background, keeping a reference until it finishes."""
+        task = asyncio.get_running_loop().create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
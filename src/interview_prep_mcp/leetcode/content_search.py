@@ -0,0 +1,244 @@
+"""TF-IDF search over problem descriptions, vectorized with NumPy."""
+
+import html
+import re
+from typing import Dict, List, Optional, Sequence, Tuple, TypeAlias, cast
+import numpy as np
+import numpy.typing as npt
+
+# Arrays of the index; NumPy's stubs type most computed arrays' dtypes as Any,
+# so results are cast back to these
+FloatArray: TypeAlias = "npt.NDArray[np.float32]"
+IntArray: TypeAlias = "npt.NDArray[np.int64]"
+DocArray: TypeAlias = "npt.NDArray[np.int32]"
+BoolArray: TypeAlias = "npt.NDArray[np.bool_]"
+
+TAG_PATTERN = re.compile(r"<[^>]+>")
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an and are as at be by can each for from given has have if in into is it its of on or "
+    "return such than that the their then there these this to was which will with you your".split()
+)
+
+
+def html_to_text(content: str) -> str:
+    """Render problem HTML to plain text (tags dropped, entities decoded)."""
+    return html.unescape(TAG_PATTERN.sub(" ", content))
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into index terms.
+
+    Lowercased alphanumeric runs of two or more characters, minus stopwords,
+    with a plural "s" stripped so "subarrays" matches "subarray".
+    """
+    terms: List[str] = []
+    for token in cast(List[str], TOKEN_PATTERN.findall(text.lower())):
+        if len(token) < 2 or token in STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        terms.append(token)
+    return terms
+
+
+def bitset_to_array(mask: int, size: int) -> BoolArray:
+    """Expand an integer bitset (bit i = item i) into a boolean array."""
+    packed = cast(
+        "npt.NDArray[np.uint8]",
+        np.frombuffer(mask.to_bytes((size + 7) // 8, "little"), dtype="uint8"),
+    )
+    bits = cast("npt.NDArray[np.uint8]", np.unpackbits(packed, bitorder="little"))
+    return cast(BoolArray, bits[:size].astype(bool))
+
+
+class ContentIndex:
+    """
+    Sparse TF-IDF matrix over problem texts, stored column-wise.
+
+    Weights are sublinear term frequency times smoothed IDF, with each
+    document's row L2-normalized, so a query's score is its cosine similarity.
+    The matrix is kept in CSC form (``indptr``/``indices``/``data`` per term):
+    scoring gathers the postings of the query's few terms and sums them with
+    one ``np.bincount``, and the top-k are picked with ``np.argpartition``
+    instead of sorting every score.
+    """
+
+    def __init__(
+        self,
+        slugs: List[str],
+        vocabulary: Dict[str, int],
+        idf: FloatArray,
+        indptr: IntArray,
+        indices: DocArray,
+        data: FloatArray,
+    ) -> None:
+        self.slugs = slugs
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+        # Set by the owner on each rebuild; cursors from another generation are rejected
+        self.generation = 0
+        self._positions_for: Optional[Dict[str, int]] = None
+        self._positions = cast(IntArray, np.zeros(0, dtype="int64"))
+
+    def catalog_positions(self, positions: Dict[str, int]) -> IntArray:
+        """
+        Catalog position of every document (-1 if not in the catalog).
+
+        Cached per catalog, so filters map onto documents without a Python
+        loop per query.
+        """
+        if self._positions_for is not positions:
+            self._positions_for = positions
+            catalog: List[int] = [positions.get(slug, -1) for slug in self.slugs]
+            self._positions = cast(IntArray, np.array(catalog, dtype="int64"))
+        return self._positions
+
+    @classmethod
+    def build(cls, documents: Sequence[Tuple[str, str]]) -> "ContentIndex":
+        """
+        Index documents.
+
+        Args:
+            documents: (title slug, plain text) pairs
+
+        Returns:
+            ContentIndex over the documents, in the given order
+        """
+        vocabulary: Dict[str, int] = {}
+        doc_ids: List[int] = []
+        term_ids: List[int] = []
+        counts: List[int] = []
+        for doc, (_, text) in enumerate(documents):
+            frequencies: Dict[int, int] = {}
+            for token in tokenize(text):
+                term = vocabulary.setdefault(token, len(vocabulary))
+                frequencies[term] = frequencies.get(term, 0) + 1
+            doc_ids.extend([doc] * len(frequencies))
+            term_ids.extend(frequencies)
+            counts.extend(frequencies.values())
+
+        n_docs = len(documents)
+        rows = cast(DocArray, np.array(doc_ids, dtype="int32"))
+        cols = cast(DocArray, np.array(term_ids, dtype="int32"))
+        df = np.bincount(cols, minlength=len(vocabulary))
+        inverse = cast(FloatArray, np.divide(1 + n_docs, df + 1, dtype="float32"))
+        idf = cast(FloatArray, np.log(inverse) + 1)
+        term_counts = cast(FloatArray, np.array(counts, dtype="float32"))
+        term_frequency = cast(FloatArray, np.log(term_counts) + 1)
+        weights = cast(FloatArray, term_frequency * idf[cols])
+        squares = cast(FloatArray, weights * weights)
+        norms = cast(
+            FloatArray,
+            np.sqrt(np.bincount(rows, weights=squares, minlength=n_docs), dtype="float32"),
+        )
+        weights /= norms[rows]
+
+        order = np.argsort(cols, kind="stable")
+        indptr = cast(IntArray, np.zeros(len(vocabulary) + 1, dtype="int64"))
+        np.cumsum(df, out=indptr[1:])
+        return cls(
+            [slug for slug, _ in documents], vocabulary, idf, indptr, rows[order], weights[order]
+        )
+
+    @classmethod
+    def from_html(cls, problems: Sequence[Tuple[str, str, str]]) -> "ContentIndex":
+        """Index (title slug, title, HTML content) triples by their rendered text."""
+        return cls.build(
+            [(slug, f"{title}\n{html_to_text(content)}") for slug, title, content in problems]
+        )
+
+    def __len__(self) -> int:
+        return len(self.slugs)
+
+    def scores(self, query: str) -> FloatArray:
+        """Cosine similarity of the query to every document."""
+        frequencies: Dict[int, int] = {}
+        for token in tokenize(query):
+            term = self.vocabulary.get(token)
+            if term is not None:
+                frequencies[term] = frequencies.get(term, 0) + 1
+        if not frequencies:
+            return cast(FloatArray, np.zeros(len(self.slugs), dtype="float32"))
+
+        terms = cast(IntArray, np.fromiter(frequencies, dtype="int64", count=len(frequencies)))
+        counts = cast(
+            FloatArray, np.fromiter(frequencies.values(), dtype="float32", count=len(frequencies))
+        )
+        term_frequency = cast(FloatArray, np.log(counts) + 1)
+        query_weights = cast(FloatArray, term_frequency * self.idf[terms])
+        query_weights /= cast(float, np.linalg.norm(query_weights))
+
+        starts = self.indptr[terms]
+        lengths = cast(IntArray, self.indptr[terms + 1] - starts)
+        # Positions of every posting of every query term, without a Python loop
+        cumulative = np.cumsum(lengths)
+        firsts = cast(IntArray, starts - cumulative)
+        firsts += lengths
+        steps = cast(IntArray, np.arange(cumulative.item(-1), dtype="int64"))
+        offsets = cast(IntArray, np.repeat(firsts, lengths) + steps)
+        contributions = cast(FloatArray, self.data[offsets] * np.repeat(query_weights, lengths))
+        scores = np.bincount(
+            self.indices[offsets], weights=contributions, minlength=len(self.slugs)
+        )
+        return cast(FloatArray, scores.astype("float32"))
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        allowed: Optional[BoolArray] = None,
+        after: Optional[Tuple[float, str]] = None,
+        generation: Optional[int] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Best-matching documents for a query.
+
+        Results are ordered by score, then slug, so pages are stable: passing
+        the last (score, slug) of a page as ``after`` returns the next one.
+        Scores change when the index is rebuilt, so ``after`` is only valid
+        with the generation of the index that produced it.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of results
+            allowed: Optional per-document mask; other documents are skipped
+            after: Return only documents ranked after this (score, slug)
+            generation: Generation of the index ``after`` came from
+
+        Returns:
+            (title slug, score) pairs, best first; documents sharing no term
+            with the query are never returned
+
+        Raises:
+            ValueError: If ``after`` comes from another generation of the index
+        """
+        if after is not None and generation != self.generation:
+            raise ValueError(
+                "The search index changed since this cursor was issued; "
+                "repeat the search without it"
+            )
+        scores = self.scores(query)
+        if allowed is not None:
+            scores[~allowed] = 0
+        if after is not None:
+            score, slug = after
+            is_tied = cast(BoolArray, scores == score)
+            tied: List[int] = np.flatnonzero(is_tied).tolist()
+            scores[scores >= score] = 0
+            for doc in tied:
+                if self.slugs[doc] > slug:
+                    scores[doc] = score
+        candidates = np.flatnonzero(scores > 0)
+        if candidates.size > limit:
+            # Keep every document tied with the limit-th score, so the slug order decides among them
+            candidate_scores = scores[candidates]
+            threshold = -np.partition(-candidate_scores, limit - 1).item(limit - 1)
+            candidates = candidates[candidate_scores >= threshold]
+        documents: List[int] = candidates.tolist()
+        ranked = sorted((-scores.item(doc), self.slugs[doc]) for doc in documents)[:limit]
+        return [(slug, -negated) for negated, slug in ranked]
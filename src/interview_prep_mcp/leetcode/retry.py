@@ -0,0 +1,211 @@
+"""Retry policy shared by all upstream LeetCode requests."""
+
+import logging
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional
+import httpx
+from tenacity import (
+    RetryCallState,
+    retry,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+from tenacity.retry import retry_base
+from tenacity.wait import wait_base
+from ..logs import log_event
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth retrying: timeouts, throttling and transient server failures.
+# Everything else (400, 403, 404, ...) fails the same way on every attempt.
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+# Never wait longer than this for a single Retry-After; a longer hint means the
+# upstream wants us gone for a while, so the error is surfaced instead.
+MAX_RETRY_AFTER_SECONDS = 30.0
+
+# Attempts per upstream request, including the first one
+UPSTREAM_ATTEMPTS = 3
+
+
+class RetryBudget:
+    """
+    Token bucket that caps how many retries may be issued across all callers.
+
+    Every retry withdraws one token and tokens refill at a fixed rate up to
+    ``capacity``. While the bucket is empty, failures are surfaced immediately
+    instead of being retried, so an upstream outage with many concurrent
+    requests cannot turn into a retry storm.
+    """
+
+    def __init__(
+        self,
+        capacity: float = 10.0,
+        refill_per_second: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._clock = clock
+        self._tokens = capacity
+        self._updated_at = clock()
+
+    @property
+    def tokens(self) -> float:
+        """Number of retries currently available."""
+        self._refill()
+        return self._tokens
+
+    def try_acquire(self) -> bool:
+        """
+        Withdraw one token if available.
+
+        Returns:
+            True if a retry may be issued, False if the budget is exhausted
+        """
+        self._refill()
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        return True
+
+    def reset(self) -> None:
+        """Refill the bucket to capacity."""
+        self._tokens = self.capacity
+        self._updated_at = self._clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_per_second)
+
+
+# Process-wide budget shared by every client and every request path
+retry_budget = RetryBudget()
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """
+    Check whether a failed upstream request is worth retrying.
+
+    Args:
+        error: The exception raised by the request
+
+    Returns:
+        True for network errors, timeouts and retryable HTTP statuses
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(error, (httpx.TimeoutException, httpx.NetworkError))
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """
+    Extract the delay requested by a Retry-After header.
+
+    Args:
+        error: The exception raised by the request
+
+    Returns:
+        Seconds to wait, or None if the response carries no usable hint
+    """
+    if not isinstance(error, httpx.HTTPStatusError):
+        return None
+    headers = error.response.headers
+    if "Retry-After" not in headers:
+        return None
+    value = headers["Retry-After"].strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class retry_if_retryable_within_budget(retry_base):
+    """
+    Retry retryable errors while the shared retry budget has tokens.
+
+    A token is only withdrawn when another attempt will follow, so the final
+    failed attempt does not drain the budget.
+    """
+
+    def __init__(self, budget: RetryBudget, max_attempts: int) -> None:
+        self.budget = budget
+        self.max_attempts = max_attempts
+
+    def __call__(self, retry_state: RetryCallState) -> bool:
+        if retry_state.outcome is None or not retry_state.outcome.failed:
+            return False
+        error = retry_state.outcome.exception()
+        if error is None or not is_retryable_error(error):
+            return False
+        delay = retry_after_seconds(error)
+        if delay is not None and delay > MAX_RETRY_AFTER_SECONDS:
+            return False
+        if retry_state.attempt_number >= self.max_attempts:
+            return False
+        if not self.budget.try_acquire():
+            log_event(
+                logger,
+                logging.WARNING,
+                "upstream.retry_budget_exhausted",
+                error=type(error).__name__,
+            )
+            return False
+        return True
+
+
+class wait_retry_after_or_jitter(wait_base):
+    """Honor Retry-After when present, otherwise use full-jitter backoff."""
+
+    def __init__(self, fallback: wait_base) -> None:
+        self.fallback = fallback
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        jitter = self.fallback(retry_state)
+        if retry_state.outcome is None:
+            return jitter
+        error = retry_state.outcome.exception()
+        delay = retry_after_seconds(error) if error is not None else None
+        if delay is None:
+            return jitter
+        return max(delay, jitter)
+
+
+def log_retry(retry_state: RetryCallState) -> None:
+    """
+    Log an ``upstream.retry`` event before sleeping between attempts.
+
+    The failed attempt's operation is in the ``upstream.request`` event just
+    before it.
+    """
+    error = retry_state.outcome.exception() if retry_state.outcome is not None else None
+    log_event(
+        logger,
+        logging.WARNING,
+        "upstream.retry",
+        attempt=retry_state.attempt_number,
+        delay_seconds=round(retry_state.upcoming_sleep, 3),
+        error=type(error).__name__ if error is not None else None,
+        status=error.response.status_code if isinstance(error, httpx.HTTPStatusError) else None,
+    )
+
+
+# Decorator for requests to LeetCode: up to ``UPSTREAM_ATTEMPTS`` attempts, retrying only network
+# errors, timeouts and retryable statuses with full-jitter exponential backoff
+# (or the server's Retry-After), each retry drawing from ``retry_budget``.
+upstream_retry = retry(
+    stop=stop_after_attempt(UPSTREAM_ATTEMPTS),
+    wait=wait_retry_after_or_jitter(wait_random_exponential(multiplier=1, max=10)),
+    retry=retry_if_retryable_within_budget(retry_budget, UPSTREAM_ATTEMPTS),
+    before_sleep=log_retry,
+    reraise=True,
+)
@@ -0,0 +1,162 @@
+"""Priority-aware admission of upstream requests to LeetCode."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import AsyncIterator, Callable, Deque, Dict, Mapping, Optional
+from aiolimiter import AsyncLimiter
+from pydantic import BaseModel
+from ..logs import log_event
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """Request classes, most urgent first."""
+
+    INTERACTIVE = 0
+    PREFETCH = 1
+    BACKGROUND = 2
+
+
+# Concurrent requests allowed per class (None = unlimited)
+DEFAULT_CAPS: Dict[Priority, Optional[int]] = {
+    Priority.INTERACTIVE: None,
+    Priority.PREFETCH: 2,
+    Priority.BACKGROUND: 2,
+}
+
+
+class PriorityClassStats(BaseModel):
+    """Queue-depth and wait metrics for one priority class."""
+
+    queued: int = 0
+    in_flight: int = 0
+    max_queued: int = 0
+    admitted: int = 0
+    total_wait_seconds: float = 0.0
+
+
+class UpstreamScheduler:
+    """
+    Admits upstream requests in priority order under one shared rate limit.
+
+    Waiting requests are queued per class. Only the single request at the head
+    of the line waits for a rate-limit token; the head is always the oldest
+    request of the most urgent class that is under its concurrency cap, so an
+    interactive request never queues behind a backlog of catalog pages or
+    prefetches, it only waits for the next token.
+    """
+
+    def __init__(
+        self,
+        limiter: AsyncLimiter,
+        caps: Optional[Mapping[Priority, Optional[int]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.limiter = limiter
+        self.caps: Dict[Priority, Optional[int]] = {**DEFAULT_CAPS, **(caps or {})}
+        self._clock = clock
+        self._waiting: Dict[Priority, Deque["asyncio.Future[None]"]] = {
+            p: deque() for p in Priority
+        }
+        self._stats: Dict[Priority, PriorityClassStats] = {
+            p: PriorityClassStats() for p in Priority
+        }
+        self._head_busy = False
+
+    @asynccontextmanager
+    async def slot(
+        self, priority: Priority = Priority.INTERACTIVE, operation: str = "request"
+    ) -> AsyncIterator[None]:
+        """
+        Wait for permission to send one upstream request.
+
+        Every request is logged as an ``upstream.request`` event with its
+        queueing and request time and its outcome.
+
+        Args:
+            priority: Class of the request
+            operation: Name of the request in the log (e.g., "questionContent")
+
+        Yields:
+            Once the request may be sent; the class's concurrency slot is held
+            until the block exits
+        """
+        stats = self._stats[priority]
+        enqueued_at = self._clock()
+        future: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        self._waiting[priority].append(future)
+        stats.queued += 1
+        stats.max_queued = max(stats.max_queued, stats.queued)
+        self._promote()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.cancelled():
+                self._waiting[priority].remove(future)
+                stats.queued -= 1
+            else:
+                # Promoted to head just as we were cancelled
+                stats.in_flight -= 1
+                self._head_busy = False
+                self._promote()
+            raise
+
+        try:
+            try:
+                await self.limiter.acquire()
+            finally:
+                self._head_busy = False
+                self._promote()
+            stats.admitted += 1
+            admitted_at = self._clock()
+            stats.total_wait_seconds += admitted_at - enqueued_at
+            outcome = "ok"
+            try:
+                yield
+            except BaseException as e:
+                outcome = type(e).__name__
+                raise
+            finally:
+                # Checked first so the clock is only read when the event is logged
+                if logger.isEnabledFor(logging.INFO):
+                    log_event(
+                        logger,
+                        logging.INFO,
+                        "upstream.request",
+                        operation=operation,
+                        priority=priority.name.lower(),
+                        outcome=outcome,
+                        wait_seconds=round(admitted_at - enqueued_at, 4),
+                        seconds=round(self._clock() - admitted_at, 4),
+                    )
+        finally:
+            stats.in_flight -= 1
+            self._promote()
+
+    def _promote(self) -> None:
+        """Make the most urgent eligible waiter the head of the line."""
+        if self._head_busy:
+            return
+        for priority in Priority:
+            waiting = self._waiting[priority]
+            cap = self.caps[priority]
+            stats = self._stats[priority]
+            if waiting and (cap is None or stats.in_flight < cap):
+                future = waiting.popleft()
+                stats.queued -= 1
+                stats.in_flight += 1
+                self._head_busy = True
+                future.set_result(None)
+                return
+
+    def metrics(self) -> Dict[str, PriorityClassStats]:
+        """Snapshot of per-class queue depth, concurrency and wait time."""
+        return {
+            priority.name.lower(): stats.model_copy() for priority, stats in self._stats.items()
+        }
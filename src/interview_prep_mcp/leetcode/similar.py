@@ -0,0 +1,90 @@
+"""Graph of LeetCode's "similar questions" links."""
+
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+
+class SimilarityGraph:
+    """
+    Adjacency lists of similar-question links, queried locally.
+
+    ``similar[slug]`` is the list LeetCode shows on the problem page, kept for
+    persistence; queries walk the undirected graph, so a problem whose own list
+    has not been collected yet is still reachable through problems linking to
+    it. Neighbour sets are insertion-ordered dicts, which keeps results in
+    LeetCode's order and deterministic.
+    """
+
+    def __init__(self) -> None:
+        self.similar: Dict[str, List[str]] = {}
+        self._neighbours: Dict[str, Dict[str, None]] = {}
+
+    def add(self, title_slug: str, similar: Iterable[str]) -> bool:
+        """
+        Record the similar questions listed on one problem.
+
+        Args:
+            title_slug: Problem whose list this is
+            similar: Title slugs from its ``similarQuestions``
+
+        Returns:
+            True if the list was new or changed
+        """
+        targets: List[str] = []
+        for slug in similar:
+            if slug != title_slug and slug not in targets:
+                targets.append(slug)
+        previous = self.similar.get(title_slug)
+        if previous == targets:
+            return False
+        self.similar[title_slug] = targets
+        self._neighbours.setdefault(title_slug, {})
+        for target in previous or []:
+            # Drop links that are gone, unless the other side still lists this problem
+            if target not in targets and title_slug not in self.similar.get(target, []):
+                self._neighbours[title_slug].pop(target, None)
+                self._neighbours[target].pop(title_slug, None)
+        for target in targets:
+            self._neighbours[title_slug][target] = None
+            self._neighbours.setdefault(target, {})[title_slug] = None
+        return True
+
+    def is_collected(self, title_slug: str) -> bool:
+        """Whether the problem's own similar-questions list is known."""
+        return title_slug in self.similar
+
+    def neighbours(
+        self, title_slug: str, hops: int = 1, limit: Optional[int] = None
+    ) -> List[Tuple[str, int]]:
+        """
+        Problems within ``hops`` links of a problem, nearest first.
+
+        Args:
+            title_slug: Problem to start from
+            hops: Maximum number of links to follow
+            limit: Maximum number of results
+
+        Returns:
+            List of (title slug, distance) in breadth-first order, excluding
+            the problem itself
+        """
+        distances: Dict[str, int] = {title_slug: 0}
+        queue: Deque[str] = deque([title_slug])
+        found: List[Tuple[str, int]] = []
+        while queue:
+            current = queue.popleft()
+            distance = distances[current]
+            if distance == hops:
+                continue
+            for neighbour in self._neighbours.get(current, {}):
+                if neighbour in distances:
+                    continue
+                distances[neighbour] = distance + 1
+                found.append((neighbour, distance + 1))
+                if limit is not None and len(found) >= limit:
+                    return found
+                queue.append(neighbour)
+        return found
+
+    def __len__(self) -> int:
+        return len(self.similar)
@@ -0,0 +1,320 @@
+"""SQLite-backed problem store shared by all server processes on a machine."""
+
+import asyncio
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union, cast
+from contextlib import contextmanager
+from pydantic import ValidationError
+from .types import CachedProblemInfo, Problem
+
+# Bumped whenever a table or the stored Problem JSON changes shape; a store
+# with another version is emptied and refilled from LeetCode
+SCHEMA_VERSION = 4
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS problems (
+    title_slug TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS catalog (
+    position INTEGER PRIMARY KEY,
+    question_frontend_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    title_slug TEXT NOT NULL,
+    difficulty TEXT,
+    paid_only INTEGER NOT NULL DEFAULT 0,
+    -- Comma-separated topic tag slugs
+    tags TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS similar (
+    title_slug TEXT PRIMARY KEY,
+    -- Comma-separated title slugs of the problem's similar questions
+    similar TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value REAL NOT NULL
+);
+"""
+
+# Row shapes of the queries below; sqlite3 types every row as Any
+ProblemRow = Tuple[str, float]
+TextRow = Tuple[str, Optional[str], Optional[str]]
+CatalogRow = Tuple[str, str, str, Optional[str], int, str]
+SimilarRow = Tuple[str, str]
+
+
+def default_store_path() -> Path:
+    """Per-user location of the shared store."""
+    return Path.home() / ".cache" / "interview-prep-mcp" / "problems.sqlite3"
+
+
+class ProblemStore:
+    """
+    Persistent store for the catalog and fetched problems.
+
+    Every MCP client session runs its own server process; pointing them all at
+    one store means a problem fetched by one session is a local read for the
+    others. The database runs in WAL mode, so readers never block the single
+    writer, and every operation uses its own short-lived connection with a
+    busy timeout, which makes the store safe for concurrent use from multiple
+    processes and threads. Blocking SQLite calls run in a worker thread.
+
+    Timestamps are wall-clock (time.time()) so ages are comparable across
+    processes.
+
+    The async methods treat the store as a best-effort cache: SQLite errors
+    (a locked or corrupt database, a full disk) are swallowed so they never
+    fail a request. The ``*_sync`` methods raise them.
+    """
+
+    def __init__(self, path: Union[str, Path], busy_timeout: float = 5.0) -> None:
+        self.path = Path(path)
+        self.busy_timeout = busy_timeout
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            if self._schema_version(conn) != SCHEMA_VERSION:
+                self._migrate(conn)
+
+    @staticmethod
+    def _schema_version(conn: sqlite3.Connection) -> int:
+        (version,) = cast(Tuple[int], conn.execute("PRAGMA user_version").fetchone())
+        return version
+
+    def _migrate(self, conn: sqlite3.Connection) -> None:
+        """
+        Recreate the tables at SCHEMA_VERSION, discarding their contents.
+
+        Runs under the write lock and re-reads the version first, so when
+        several processes open an outdated store at once only the first one
+        migrates and the others keep what it has written since.
+        """
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if self._schema_version(conn) != SCHEMA_VERSION:
+                # Everything is refetched from LeetCode rather than migrated.
+                # executescript() would commit, so statements run one by one.
+                for table in ("problems", "catalog", "similar", "metadata"):
+                    conn.execute(f"DROP TABLE IF EXISTS {table}")
+                for statement in SCHEMA.split(";"):
+                    if statement.strip():
+                        conn.execute(statement)
+                conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+        try:
+            conn.execute("PRAGMA synchronous=NORMAL")
+            yield conn
+        finally:
+            conn.close()
+
+    # Problems
+
+    def get_problem_sync(self, title_slug: str) -> Optional[Tuple[Problem, float]]:
+        """
+        Read a stored problem.
+
+        Args:
+            title_slug: The URL-friendly slug of the problem
+
+        A row that no longer validates as a Problem (corrupt, or written by
+        an incompatible version) is deleted and reported as not stored.
+
+        Returns:
+            Tuple of (problem, age in seconds), or None if not stored
+        """
+        with self._connect() as conn:
+            row = cast(
+                Optional[ProblemRow],
+                conn.execute(
+                    "SELECT data, fetched_at FROM problems WHERE title_slug = ?", (title_slug,)
+                ).fetchone(),
+            )
+            if row is None:
+                return None
+            data, fetched_at = row
+            try:
+                problem = Problem.model_validate_json(data)
+            except ValidationError:
+                conn.execute("DELETE FROM problems WHERE title_slug = ?", (title_slug,))
+                return None
+        return problem, max(0.0, time.time() - fetched_at)
+
+    def put_problem_sync(self, problem: Problem) -> None:
+        """Insert or replace a problem, marking it fetched now."""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO problems (title_slug, data, fetched_at) VALUES (?, ?, ?)",
+                (problem.titleSlug, problem.model_dump_json(), time.time()),
+            )
+
+    def load_problem_texts_sync(self) -> List[Tuple[str, str, str]]:
+        """
+        Titles and HTML content of every stored problem, for content search.
+
+        Extracted inside SQLite so the full problem JSON is never decoded here.
+
+        Returns:
+            List of (title slug, title, content)
+        """
+        with self._connect() as conn:
+            rows = cast(
+                List[TextRow],
+                conn.execute(
+                    "SELECT title_slug, json_extract(data, '$.title'), "
+                    "json_extract(data, '$.content') FROM problems"
+                ).fetchall(),
+            )
+        return [(slug, title or "", content or "") for slug, title, content in rows]
+
+    async def get_problem(self, title_slug: str) -> Optional[Tuple[Problem, float]]:
+        """Async version of get_problem_sync; returns None on SQLite errors."""
+        try:
+            return await asyncio.to_thread(self.get_problem_sync, title_slug)
+        except sqlite3.Error:
+            return None
+
+    async def load_problem_texts(self) -> List[Tuple[str, str, str]]:
+        """Async version of load_problem_texts_sync; returns [] on SQLite errors."""
+        try:
+            return await asyncio.to_thread(self.load_problem_texts_sync)
+        except sqlite3.Error:
+            return []
+
+    async def put_problem(self, problem: Problem) -> None:
+        """Async version of put_problem_sync; ignores SQLite errors."""
+        try:
+            await asyncio.to_thread(self.put_problem_sync, problem)
+        except sqlite3.Error:
+            pass
+
+    # Catalog
+
+    def load_catalog_sync(self) -> Optional[Tuple[List[CachedProblemInfo], float]]:
+        """
+        Read the stored catalog.
+
+        Returns:
+            Tuple of (problems in catalog order, age in seconds), or None if
+            no catalog has been saved
+        """
+        with self._connect() as conn:
+            # One read transaction so the catalog and its timestamp match
+            conn.execute("BEGIN")
+            built = cast(
+                Optional[Tuple[float]],
+                conn.execute(
+                    "SELECT value FROM metadata WHERE key = 'catalog_built_at'"
+                ).fetchone(),
+            )
+            if built is None:
+                conn.execute("COMMIT")
+                return None
+            rows = cast(
+                List[CatalogRow],
+                conn.execute(
+                    "SELECT question_frontend_id, title, title_slug, difficulty, paid_only, tags "
+                    "FROM catalog ORDER BY position"
+                ).fetchall(),
+            )
+            conn.execute("COMMIT")
+        problems = [
+            CachedProblemInfo(
+                questionFrontendId=frontend_id,
+                title=title,
+                titleSlug=slug,
+                difficulty=difficulty,
+                paidOnly=bool(paid_only),
+                tags=tags.split(",") if tags else [],
+            )
+            for frontend_id, title, slug, difficulty, paid_only, tags in rows
+        ]
+        return problems, max(0.0, time.time() - built[0])
+
+    def save_catalog_sync(self, problems: List[CachedProblemInfo]) -> None:
+        """Atomically replace the stored catalog."""
+        rows = [
+            (
+                position,
+                p.questionFrontendId,
+                p.title,
+                p.titleSlug,
+                p.difficulty,
+                p.paidOnly,
+                ",".join(p.tags),
+            )
+            for position, p in enumerate(problems)
+        ]
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("DELETE FROM catalog")
+                conn.executemany(
+                    "INSERT INTO catalog (position, question_frontend_id, title, title_slug, "
+                    "difficulty, paid_only, tags) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO metadata (key, value) VALUES ('catalog_built_at', ?)",
+                    (time.time(),),
+                )
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    # Similar questions
+
+    def load_similar_sync(self) -> Dict[str, List[str]]:
+        """Read every stored similar-questions list, keyed by title slug."""
+        with self._connect() as conn:
+            rows = cast(
+                List[SimilarRow], conn.execute("SELECT title_slug, similar FROM similar").fetchall()
+            )
+        return {slug: similar.split(",") if similar else [] for slug, similar in rows}
+
+    def save_similar_sync(self, similar: Dict[str, List[str]]) -> None:
+        """Insert or replace the similar-questions lists of some problems."""
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO similar (title_slug, similar) VALUES (?, ?)",
+                [(slug, ",".join(targets)) for slug, targets in similar.items()],
+            )
+
+    async def load_similar(self) -> Dict[str, List[str]]:
+        """Async version of load_similar_sync; returns {} on SQLite errors."""
+        try:
+            return await asyncio.to_thread(self.load_similar_sync)
+        except sqlite3.Error:
+            return {}
+
+    async def save_similar(self, similar: Dict[str, List[str]]) -> None:
+        """Async version of save_similar_sync; ignores SQLite errors."""
+        try:
+            await asyncio.to_thread(self.save_similar_sync, similar)
+        except sqlite3.Error:
+            pass
+
+    async def load_catalog(self) -> Optional[Tuple[List[CachedProblemInfo], float]]:
+        """Async version of load_catalog_sync; returns None on SQLite errors."""
+        try:
+            return await asyncio.to_thread(self.load_catalog_sync)
+        except sqlite3.Error:
+            return None
+
+    async def save_catalog(self, problems: List[CachedProblemInfo]) -> None:
+        """Async version of save_catalog_sync; ignores SQLite errors."""
+        try:
+            await asyncio.to_thread(self.save_catalog_sync, problems)
+        except sqlite3.Error:
+            pass
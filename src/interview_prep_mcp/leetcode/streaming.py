@@ -0,0 +1,105 @@
+"""Incremental decoding of large LeetCode JSON payloads."""
+
+import codecs
+import json
+from typing import List, Tuple, cast
+
+
+class JSONArrayStream:
+    """
+    Decode the elements of one top-level array field as bytes arrive.
+
+    Only the text of the element currently being decoded is buffered; the
+    surrounding document is never materialized. Used for the REST problem list,
+    whose ``stat_status_pairs`` array is several megabytes.
+
+    Usage:
+        stream = JSONArrayStream("stat_status_pairs")
+        async for chunk in response.aiter_bytes():
+            for item in stream.feed(chunk):
+                ...
+        stream.close()
+    """
+
+    def __init__(self, field: str) -> None:
+        self._marker = json.dumps(field)
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._in_array = False
+        self._done = False
+
+    @property
+    def done(self) -> bool:
+        """True once the closing bracket of the array has been seen."""
+        return self._done
+
+    def feed(self, chunk: bytes) -> List[object]:
+        """
+        Consume the next chunk of the response body.
+
+        Args:
+            chunk: Raw bytes, split anywhere
+
+        Returns:
+            Array elements completed by this chunk, in order
+        """
+        if self._done:
+            return []
+        self._buffer += self._text_decoder.decode(chunk)
+        if not self._in_array and not self._seek_array():
+            return []
+        return self._drain()
+
+    def close(self) -> None:
+        """
+        Signal the end of the body.
+
+        Raises:
+            ValueError: If the field was missing or the array was truncated
+        """
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        if not self._done:
+            if not self._in_array:
+                raise ValueError(f"Field {self._marker} not found in response")
+            raise ValueError(f"Response ended inside the {self._marker} array")
+
+    def _seek_array(self) -> bool:
+        """Skip ahead to just after the array's opening bracket."""
+        position = self._buffer.find(self._marker)
+        if position < 0:
+            # Keep a tail long enough to match a marker split across chunks
+            self._buffer = self._buffer[-len(self._marker) :]
+            return False
+        bracket = self._buffer.find("[", position + len(self._marker))
+        if bracket < 0:
+            self._buffer = self._buffer[position:]
+            return False
+        self._buffer = self._buffer[bracket + 1 :]
+        self._in_array = True
+        return True
+
+    def _drain(self) -> List[object]:
+        """Decode every complete element currently in the buffer."""
+        items: List[object] = []
+        buffer = self._buffer
+        index = 0
+        length = len(buffer)
+        while True:
+            while index < length and buffer[index] in " \t\r\n,":
+                index += 1
+            if index >= length:
+                break
+            if buffer[index] == "]":
+                self._done = True
+                index += 1
+                break
+            try:
+                item, end = cast(Tuple[object, int], self._decoder.raw_decode(buffer, index))
+            except json.JSONDecodeError:
+                # Element continues in the next chunk
+                break
+            items.append(item)
+            index = end
+        self._buffer = "" if self._done else buffer[index:]
+        return items
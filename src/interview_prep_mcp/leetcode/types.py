@@ -1,6 +1,35 @@
 """Data models for LeetCode problems."""
-from typing import Optional
-from pydantic import BaseModel
+import hashlib
+import json
+from functools import cached_property
+from typing import Dict, List, Optional, cast
+from pydantic import BaseModel, field_validator
+from ..languages import BY_SLUG
+
+
+def similar_question_slugs(value: object) -> Optional[List[str]]:
+    """
+    Normalize ``similarQuestions`` to a list of title slugs.
+
+    GraphQL returns a JSON-encoded string of ``{"title", "titleSlug",
+    "difficulty", ...}`` objects; stored problems already hold slugs.
+
+    Returns:
+        Title slugs, or None if the value is missing
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = cast(object, json.loads(value)) if value.strip() else []
+    if not isinstance(value, list):
+        raise ValueError("similarQuestions must be a list or a JSON-encoded list")
+    slugs: List[str] = []
+    for item in cast(List[object], value):
+        if isinstance(item, str):
+            slugs.append(item)
+        elif isinstance(item, dict) and isinstance(item.get("titleSlug"), str):
+            slugs.append(cast(str, item["titleSlug"]))
+    return slugs
 
 
 class TopicTag(BaseModel):
@@ -29,6 +58,100 @@ class Problem(BaseModel):
     exampleTestcases: Optional[str] = None
     sampleTestCase: Optional[str] = None
     hints: list[str] = []
+    # Title slugs of related problems; None if not fetched (older cached copies)
+    similarQuestions: Optional[list[str]] = None
+
+    @field_validator("similarQuestions", mode="before")
+    @classmethod
+    def _similar_slugs(cls, value: object) -> Optional[List[str]]:
+        return similar_question_slugs(value)
+
+    @cached_property
+    def snippet_map(self) -> Dict[str, CodeSnippet]:
+        """
+        Lowercase langSlug, display name and registered alias -> snippet.
+
+        Built once per problem; keys claim snippets in the same order as
+        languages.resolve_language (slugs, then names, then aliases).
+        """
+        snippets: Dict[str, CodeSnippet] = {}
+        for snippet in self.codeSnippets:
+            snippets.setdefault(snippet.langSlug.lower(), snippet)
+        for snippet in self.codeSnippets:
+            snippets.setdefault(snippet.lang.lower(), snippet)
+        for snippet in self.codeSnippets:
+            language = BY_SLUG.get(snippet.langSlug.lower())
+            for alias in language.aliases if language is not None else ():
+                snippets.setdefault(alias, snippet)
+        return snippets
+
+    @cached_property
+    def content_hash(self) -> str:
+        """
+        Fingerprint of everything load_problem shows of this problem.
+
+        Stable across processes and re-fetches: it changes only when the
+        description, examples, hints, tags or code templates do.
+        """
+        shown = self.model_dump_json(
+            include={
+                "questionFrontendId",
+                "title",
+                "titleSlug",
+                "difficulty",
+                "content",
+                "topicTags",
+                "codeSnippets",
+                "exampleTestcases",
+                "hints",
+            }
+        )
+        return hashlib.sha256(shown.encode()).hexdigest()[:16]
+
+    def code_snippet(self, language: str) -> Optional[CodeSnippet]:
+        """
+        Snippet for a language slug, name or alias (case-insensitive).
+
+        Args:
+            language: e.g., "python3", "Python3", "py", "golang", "go"
+
+        Returns:
+            The CodeSnippet, or None if the problem has none in that language
+        """
+        return self.snippet_map.get(language.lower())
+
+
+class ProblemListGroup(BaseModel):
+    """A section of a problem list (a study plan's sub-group)."""
+
+    name: str
+    titleSlugs: list[str]
+
+
+class ProblemList(BaseModel):
+    """A study plan or a public problem (favorite) list."""
+
+    kind: str  # "study_plan" or "list"
+    slug: str
+    name: str
+    groups: list[ProblemListGroup]
+
+    @property
+    def title_slugs(self) -> List[str]:
+        """Every problem of the list, in order and without duplicates."""
+        slugs: Dict[str, None] = {}
+        for group in self.groups:
+            for slug in group.titleSlugs:
+                slugs.setdefault(slug, None)
+        return list(slugs)
+
+
+class DailyChallenge(BaseModel):
+    """The daily coding challenge of one UTC day."""
+
+    date: str  # YYYY-MM-DD (UTC)
+    link: str
+    titleSlug: str
 
 
 class ProblemSummary(BaseModel):
@@ -37,6 +160,10 @@ class ProblemSummary(BaseModel):
     title: str
     titleSlug: str
     difficulty: Optional[str] = None
+    paidOnly: bool = False
+    tags: list[str] = []
+    # Relevance of a content search match (cosine similarity, 0-1)
+    score: Optional[float] = None
 
 
 class CachedProblemInfo(BaseModel):
@@ -44,4 +171,7 @@ class CachedProblemInfo(BaseModel):
     questionFrontendId: str
     title: str
     titleSlug: str
-    difficulty: Optional[str] = None
\ No newline at end of file
+    difficulty: Optional[str] = None
+    paidOnly: bool = False
+    # Topic tag slugs; empty when the catalog came from the REST API
+    tags: list[str] = []
@@ -0,0 +1,209 @@
+"""Structured JSON logging that stays off the request path.
+
+Modules log named events with ``log_event(logger, level, "upstream.request",
+seconds=0.21, ...)``. Nothing is emitted until ``configure_logging`` is
+called; until then an event costs one cached level check.
+
+Once configured, an event that passes its level and its sample rate becomes
+a record that is put on an in-memory queue as is: rendering it to JSON and
+writing it happen on a listener thread, so the event loop never formats a
+message or waits on the log file. Field values must therefore not be
+mutated after they are logged.
+
+Output goes to stderr or a rotating file, never to stdout, which carries
+the MCP stdio protocol.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Mapping, Optional
+
+# Parent of every logger in the package (logging.getLogger(__name__))
+PACKAGE_LOGGER = "interview_prep_mcp"
+# Above CRITICAL: every level check fails until logging is configured
+DISABLED = logging.CRITICAL + 1
+# Level names accepted by configure_logging
+LEVELS: Dict[str, int] = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+# Share of each event kept by default; unlisted events are all kept
+DEFAULT_SAMPLE_RATES: Dict[str, float] = {"cache.hit": 0.1}
+# Rotating log file: size of one file and how many old files are kept
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+_package_logger = logging.getLogger(PACKAGE_LOGGER)
+_package_logger.addHandler(logging.NullHandler())
+_package_logger.propagate = False
+_package_logger.setLevel(DISABLED)
+
+_sample_rates: Dict[str, float] = dict(DEFAULT_SAMPLE_RATES)
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional["DeferredQueueHandler"] = None
+
+
+class EventRecord(logging.LogRecord):
+    """A log record for a named event and its fields."""
+
+    def __init__(
+        self, name: str, level: int, event: str, fields: Dict[str, object], sample_rate: float
+    ) -> None:
+        super().__init__(name, level, "", 0, event, None, None)
+        self.fields = fields
+        self.sample_rate = sample_rate
+
+
+def log_event(logger: logging.Logger, level: int, event: str, **fields: object) -> None:
+    """
+    Log a named event with structured fields.
+
+    Args:
+        logger: Logger of the calling module
+        level: logging level (logging.INFO, ...)
+        event: Dotted event name ("upstream.retry"); also the sampling key
+        **fields: JSON-serializable values (others are logged with str())
+    """
+    if not logger.isEnabledFor(level):
+        return
+    rate = _sample_rates.get(event, 1.0)
+    if rate < 1.0 and random.random() >= rate:
+        return
+    logger.handle(EventRecord(logger.name, level, event, fields, rate))
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, pid, event and fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, object] = {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created))
+            + f".{int(record.msecs):03d}Z",
+            "level": record.levelname.lower(),
+            "logger": record.name,
+            "pid": record.process,
+            "event": record.getMessage(),
+        }
+        if isinstance(record, EventRecord):
+            payload.update(record.fields)
+            if record.sample_rate < 1.0:
+                payload["sample_rate"] = record.sample_rate
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """Queue handler that leaves formatting to the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def parse_sample_rates(text: str) -> Dict[str, float]:
+    """
+    Parse per-event sample rates: ``"cache.hit=0.01, upstream.request=0.5"``.
+
+    Raises:
+        ValueError: If an entry is not ``event=rate`` with a rate in [0, 1]
+    """
+    rates: Dict[str, float] = {}
+    for entry in text.split(","):
+        if not entry.strip():
+            continue
+        event, _, value = entry.partition("=")
+        try:
+            rate = float(value)
+        except ValueError:
+            rate = -1.0
+        if not event.strip() or not 0.0 <= rate <= 1.0:
+            raise ValueError(
+                f"Invalid sample rate {entry.strip()!r}: expected event=rate with 0 <= rate <= 1"
+            )
+        rates[event.strip()] = rate
+    return rates
+
+
+def configure_logging(
+    destination: str, level: str = "INFO", sample_rates: Optional[Mapping[str, float]] = None
+) -> None:
+    """
+    Start writing the package's log events as JSON lines.
+
+    Args:
+        destination: "stderr", or the path of a file rotated at LOG_MAX_BYTES
+        level: Minimum level name, a key of LEVELS ("DEBUG" includes cache decisions)
+        sample_rates: Share of each event to keep, on top of DEFAULT_SAMPLE_RATES
+
+    Raises:
+        ValueError: If the destination is stdout or the level is unknown
+    """
+    global _listener, _queue_handler
+    if destination.lower() in ("stdout", "-", "/dev/stdout"):
+        raise ValueError("Logs cannot go to stdout: it carries the MCP protocol")
+    if level.upper() not in LEVELS:
+        raise ValueError(f"Unknown log level {level!r}: expected one of {', '.join(LEVELS)}")
+    stop_logging()
+
+    output: logging.Handler
+    if destination.lower() == "stderr":
+        output = logging.StreamHandler(sys.stderr)
+    else:
+        path = os.path.expanduser(destination)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        output = RotatingFileHandler(
+            path, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, encoding="utf-8"
+        )
+    output.setFormatter(JSONFormatter())
+
+    _sample_rates.clear()
+    _sample_rates.update(DEFAULT_SAMPLE_RATES)
+    _sample_rates.update(sample_rates or {})
+    records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _queue_handler = DeferredQueueHandler(records)
+    _package_logger.addHandler(_queue_handler)
+    _package_logger.setLevel(LEVELS[level.upper()])
+    _listener = QueueListener(records, output)
+    _listener.start()
+
+
+def restart_logging_after_fork() -> None:
+    """
+    Give a forked worker its own queue and listener thread.
+
+    Threads do not survive fork, so without this a worker's events would be
+    queued forever. Call it in the child before it logs anything.
+    """
+    global _listener
+    if _listener is None or _queue_handler is None:
+        return
+    records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _queue_handler.queue = records
+    _listener = QueueListener(records, *_listener.handlers)
+    _listener.start()
+
+
+def stop_logging() -> None:
+    """Write out queued events and stop the listener thread (registered with atexit)."""
+    global _listener, _queue_handler
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+    if _queue_handler is not None:
+        _package_logger.removeHandler(_queue_handler)
+        _queue_handler = None
+    _package_logger.setLevel(DISABLED)
+
+
+atexit.register(stop_logging)
@@ -0,0 +1,108 @@
+"""Pre-fork worker supervisor for the HTTP transport.
+
+The parent builds the catalog once, binds the listening socket and then forks
+the workers. Each worker inherits the catalog as a copy-on-write snapshot of
+the parent's memory, so N workers cost one catalog build, and the kernel
+spreads incoming connections across them through the shared socket.
+
+The parent only supervises: it never runs an event loop after forking, so a
+crashed worker can be replaced by forking again from the same snapshot.
+"""
+
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+import traceback
+from types import FrameType
+from typing import Callable, Dict, Optional
+
+# A worker that dies sooner than this after starting is crash-looping
+MIN_WORKER_LIFETIME = 1.0
+
+
+def bind_socket(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    """Create the listening TCP socket shared by all workers."""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def run_workers(workers: int, target: Callable[[], None]) -> None:
+    """
+    Fork ``workers`` processes running ``target`` and supervise them.
+
+    Workers that exit while the supervisor is running are replaced. SIGINT
+    and SIGTERM stop the supervisor, which then terminates the workers and
+    waits for them. Must be called with no event loop running.
+
+    Args:
+        workers: Number of worker processes
+        target: Function each worker runs; the worker exits when it returns
+    """
+    # Keep objects created so far out of the collector so its bookkeeping does
+    # not touch (and copy) the shared pages in every worker
+    gc.collect()
+    gc.freeze()
+
+    children: Dict[int, float] = {}
+    stopping = False
+
+    def spawn() -> None:
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            code = 0
+            try:
+                target()
+            except BaseException:
+                traceback.print_exc()
+                code = 1
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(code)
+        children[pid] = time.monotonic()
+
+    def stop(signum: int, frame: Optional[FrameType]) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    previous_int = signal.signal(signal.SIGINT, stop)
+    previous_term = signal.signal(signal.SIGTERM, stop)
+    try:
+        for _ in range(workers):
+            spawn()
+        while children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            started = children.pop(pid, None)
+            if started is None or stopping:
+                continue
+            code = os.waitstatus_to_exitcode(status)
+            print(
+                f"interview-prep-mcp: worker {pid} exited with status {code}; restarting",
+                file=sys.stderr,
+            )
+            if time.monotonic() - started < MIN_WORKER_LIFETIME:
+                time.sleep(MIN_WORKER_LIFETIME)
+            if not stopping:
+                spawn()
+    finally:
+        signal.signal(signal.SIGINT, previous_int)
+        signal.signal(signal.SIGTERM, previous_term)
+        gc.unfreeze()
@@ -0,0 +1 @@
+"""Local execution of solutions against example test cases."""
@@ -0,0 +1,141 @@
+"""Test cases and method signatures parsed from LeetCode problems."""
+
+import json
+import re
+from typing import List, Optional, Tuple, cast
+from bs4 import BeautifulSoup
+from pydantic import BaseModel
+
+METHOD_PATTERN = re.compile(
+    r"^[ \t]+def (\w+)\(self(?:,\s*(.*?))?\)\s*(?:->\s*(.+?))?\s*:", re.MULTILINE
+)
+OUTPUT_PATTERN = re.compile(r"^\s*Output:?\s*(.+?)\s*$", re.MULTILINE)
+BLOCK_TAGS = ["pre", "p", "div", "li"]
+# Absolute tolerance for float outputs, as LeetCode's judge uses
+FLOAT_TOLERANCE = 1e-5
+
+
+class Signature(BaseModel):
+    """The method a problem's ``class Solution`` template asks for."""
+
+    method: str
+    params: List[str]
+    annotations: List[str]  # Source text of each parameter's annotation ("" if none)
+    returns: Optional[str] = None
+
+
+def split_params(params: str) -> List[str]:
+    """Split a parameter list on top-level commas (``Dict[int, str]`` stays whole)."""
+    parts: List[str] = []
+    depth = 0
+    current = ""
+    for char in params:
+        if char in "[(":
+            depth += 1
+        elif char in "])":
+            depth -= 1
+        if char == "," and depth == 0:
+            parts.append(current.strip())
+            current = ""
+        else:
+            current += char
+    if current.strip():
+        parts.append(current.strip())
+    return parts
+
+
+def parse_signature(template: str) -> Signature:
+    """
+    Find the method to call in a Python3 code template.
+
+    Args:
+        template: The problem's python3 code snippet
+
+    Returns:
+        Signature of the first public method of ``class Solution``
+
+    Raises:
+        ValueError: If the template has no ``class Solution`` method (design problems)
+    """
+    start = template.find("class Solution")
+    if start < 0:
+        raise ValueError(
+            "Only problems with a `class Solution` template can be run (not design problems)"
+        )
+    for match in METHOD_PATTERN.finditer(template, start):
+        name, params, returns = cast(Tuple[str, Optional[str], Optional[str]], match.groups())
+        if name.startswith("_"):
+            continue
+        names: List[str] = []
+        annotations: List[str] = []
+        for param in split_params(params or ""):
+            param_name, _, annotation = param.partition(":")
+            names.append(param_name.strip())
+            annotations.append(annotation.strip())
+        return Signature(method=name, params=names, annotations=annotations, returns=returns)
+    raise ValueError("The `class Solution` template has no method")
+
+
+def split_cases(text: str, arity: int) -> List[List[str]]:
+    """
+    Group LeetCode's one-argument-per-line test input into cases.
+
+    Args:
+        text: Input in ``exampleTestcases`` form (JSON values, one per line)
+        arity: Number of arguments the method takes
+
+    Returns:
+        One list of input lines per case
+
+    Raises:
+        ValueError: If the lines do not divide into cases
+    """
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    if arity < 1:
+        raise ValueError("Methods without arguments cannot be run against test input")
+    if not lines:
+        raise ValueError("No test input")
+    if len(lines) % arity:
+        raise ValueError(f"Expected {arity} line(s) per case, got {len(lines)} line(s) of input")
+    return [lines[start : start + arity] for start in range(0, len(lines), arity)]
+
+
+def expected_outputs(content: str) -> List[str]:
+    """The ``Output:`` value of each example in a problem's description, in order."""
+    soup = BeautifulSoup(content, "html.parser")
+    # Adjacent example blocks would otherwise run together on one line
+    for block in soup.find_all(BLOCK_TAGS):
+        block.append("\n")
+    text = soup.get_text()
+    return [match.group(1) for match in OUTPUT_PATTERN.finditer(text)]
+
+
+def as_list(value: object) -> Optional[List[object]]:
+    """A parsed JSON value as a list, or None if it is not one."""
+    return cast(List[object], value) if isinstance(value, list) else None
+
+
+def parse_expected(expected: str) -> object:
+    """An expected output as JSON, or the raw text if it is not JSON."""
+    try:
+        return cast(object, json.loads(expected))
+    except ValueError:
+        return expected
+
+
+def outputs_match(output: object, expected: object) -> bool:
+    """Compare an output with an expected value (floats within FLOAT_TOLERANCE)."""
+    if isinstance(expected, str) and not isinstance(output, str):
+        # Non-JSON expectations: compare compact JSON text
+        return json.dumps(output, separators=(",", ":")) == re.sub(r"\s+", "", expected)
+    if isinstance(output, bool) or isinstance(expected, bool):
+        return output is expected
+    if isinstance(output, (int, float)) and isinstance(expected, (int, float)):
+        return abs(output - expected) <= FLOAT_TOLERANCE
+    if isinstance(output, list) and isinstance(expected, list):
+        items = cast(List[object], output)
+        wanted = cast(List[object], expected)
+        return len(items) == len(wanted) and all(
+            outputs_match(a, b) for a, b in zip(items, wanted, strict=True)
+        )
+    return output == expected
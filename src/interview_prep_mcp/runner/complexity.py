@@ -0,0 +1,337 @@
+"""Empirical time complexity: time a solution on growing inputs and fit growth models."""
+
+import json
+import math
+import random
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from pydantic import BaseModel
+from .cases import Signature, as_list
+from .pool import WorkerPool
+from .worker import CaseResult
+
+# Sizes grow by sqrt(2) per step from here: two points per doubling
+FIRST_SIZE = 8
+GROWTH = math.sqrt(2)
+# Repeats per size while a run is fast; the minimum is kept, as noise only adds time
+REPEATS = 5
+# Runs slower than this are not repeated
+REPEAT_BELOW_SECONDS = 0.1
+# A fitted model within this factor of the best error loses to a simpler one
+SIMPLER_MODEL_MARGIN = 1.1
+# Models within this factor of the best error are reported as also consistent
+# with the timings (O(n) vs O(n log n) is often this close)
+CONSISTENT_MARGIN = 1.5
+# Timing jitter of a single call (caches are cold after building a large input);
+# differences below this say nothing about growth
+NOISE_FLOOR_SECONDS = 1e-4
+# Above this n, exponential growth is not considered
+MAX_EXPONENTIAL_N = 64
+EXPONENTIAL = "O(2^n)"
+
+POLYNOMIAL_MODELS: Dict[str, Callable[[float], float]] = {
+    "O(1)": lambda n: 1.0,
+    "O(log n)": lambda n: math.log2(n),
+    "O(n)": lambda n: n,
+    "O(n log n)": lambda n: n * math.log2(n),
+    "O(n^2)": lambda n: n * n,
+    "O(n^3)": lambda n: n**3,
+}
+
+
+class Sample(BaseModel):
+    """Fastest time of a solution on generated inputs of one size."""
+
+    n: int
+    seconds: float
+
+
+class StoppedRun(CaseResult):
+    """The result that ended a measurement early, with the size it was run at."""
+
+    n: int
+
+
+class Fit(BaseModel):
+    """
+    Least-squares fit of ``seconds = constant + coefficient * f(n)``.
+
+    For O(2^n) the base is fitted too: ``seconds = constant * coefficient^n``.
+    """
+
+    model: str
+    coefficient: float
+    constant: float
+    error: float  # Root mean square error relative to (seconds + NOISE_FLOOR_SECONDS)
+
+    def predict(self, n: int) -> float:
+        """Seconds the fitted model predicts at size n."""
+        if self.model == EXPONENTIAL:
+            try:
+                return self.constant * self.coefficient**n
+            except OverflowError:
+                return math.inf
+        return self.constant + self.coefficient * POLYNOMIAL_MODELS[self.model](max(n, 2))
+
+
+def _least_squares(x: List[float], y: List[float], w: List[float]) -> Tuple[float, float]:
+    """Weighted fit of ``y = intercept + slope * x``; returns (intercept, slope)."""
+    total = sum(w)
+    sx = sum(wi * xi for wi, xi in zip(w, x, strict=True))
+    sy = sum(wi * yi for wi, yi in zip(w, y, strict=True))
+    sxx = sum(wi * xi * xi for wi, xi in zip(w, x, strict=True))
+    sxy = sum(wi * xi * yi for wi, xi, yi in zip(w, x, y, strict=True))
+    determinant = total * sxx - sx * sx
+    slope = (total * sxy - sx * sy) / determinant if determinant > 1e-12 * total * sxx else 0.0
+    return (sy - slope * sx) / total, slope
+
+
+def _relative_error(fit: Fit, samples: List[Sample]) -> float:
+    return math.sqrt(
+        sum(
+            ((sample.seconds - fit.predict(sample.n)) / (sample.seconds + NOISE_FLOOR_SECONDS)) ** 2
+            for sample in samples
+        )
+        / len(samples)
+    )
+
+
+def fit_models(samples: List[Sample]) -> List[Fit]:
+    """
+    Fit every growth model to the samples, simplest model first.
+
+    Samples are weighted by their relative error (plus the noise floor), so
+    fast small sizes are not drowned out by slow large ones, and timings
+    within jitter of each other do not count as growth. Exponential growth
+    is fitted in log space and only considered for small n.
+
+    Raises:
+        ValueError: If there are fewer than two samples
+    """
+    if len(samples) < 2:
+        raise ValueError("At least two samples are needed to fit a model")
+    seconds = [sample.seconds for sample in samples]
+    weights = [1 / (t + NOISE_FLOOR_SECONDS) ** 2 for t in seconds]
+    fits: List[Fit] = []
+    for model, f in POLYNOMIAL_MODELS.items():
+        constant, coefficient = _least_squares(
+            [f(max(sample.n, 2)) for sample in samples], seconds, weights
+        )
+        if coefficient < 0:
+            # Time never shrinks as inputs grow: a negative slope means "constant"
+            weighted = sum(w * t for w, t in zip(weights, seconds, strict=True))
+            constant, coefficient = weighted / sum(weights), 0.0
+        fit = Fit(model=model, coefficient=coefficient, constant=constant, error=0.0)
+        fit.error = _relative_error(fit, samples)
+        fits.append(fit)
+
+    if max(sample.n for sample in samples) <= MAX_EXPONENTIAL_N:
+        logs = [math.log(max(t, 1e-9)) for t in seconds]
+        log_constant, log_base = _least_squares(
+            [float(sample.n) for sample in samples], logs, [1.0] * len(samples)
+        )
+        if log_base > 0:
+            fit = Fit(
+                model=EXPONENTIAL,
+                coefficient=math.exp(log_base),
+                constant=math.exp(log_constant),
+                error=0.0,
+            )
+            fit.error = _relative_error(fit, samples)
+            fits.append(fit)
+    return fits
+
+
+def best_fit(fits: List[Fit], samples: List[Sample]) -> Fit:
+    """
+    The simplest model whose error is within SIMPLER_MODEL_MARGIN of the best.
+
+    If no sample is slower than the fastest by more than the noise floor,
+    growth is not measurable and O(1) is returned (O(log n) usually lands here).
+    """
+    fastest = min(sample.seconds for sample in samples)
+    if all(sample.seconds - fastest <= NOISE_FLOOR_SECONDS for sample in samples):
+        return fits[0]
+    lowest = min(fit.error for fit in fits)
+    return next(fit for fit in fits if fit.error <= lowest * SIMPLER_MODEL_MARGIN)
+
+
+def sizes(max_size: int) -> List[int]:
+    """Input sizes to try: FIRST_SIZE growing by GROWTH up to max_size."""
+    result: List[int] = []
+    step = 0
+    while True:
+        n = round(FIRST_SIZE * GROWTH**step)
+        if n > max_size:
+            return result
+        if not result or n > result[-1]:
+            result.append(n)
+        step += 1
+
+
+def grow_scalars(items: List[object], n: int, rng: random.Random) -> List[object]:
+    """n values like the example's: integers spread over a range that widens with n."""
+    if not items:
+        return rng.choices(range(n + 1), k=n)
+    integers = [item for item in items if isinstance(item, int) and not isinstance(item, bool)]
+    if len(integers) == len(items):
+        low, high = min(integers), max(integers)
+        # Widen the range so large inputs are not mostly duplicates
+        return rng.choices(range(low, max(high, low + n) + 1), k=n)
+    numbers = [
+        item for item in items if isinstance(item, (int, float)) and not isinstance(item, bool)
+    ]
+    if len(numbers) == len(items):
+        low_number, high_number = min(numbers), max(numbers)
+        return [rng.uniform(low_number, high_number) for _ in range(n)]
+    return rng.choices(items, k=n)
+
+
+def is_grid(value: object) -> bool:
+    """Whether an example argument is a grid: equal rows wider than two."""
+    items = as_list(value)
+    if not items:
+        return False
+    rows = [row for row in map(as_list, items) if row is not None]
+    if len(rows) != len(items):
+        return False
+    widths = {len(row) for row in rows}
+    return len(widths) == 1 and widths.pop() > 2
+
+
+def grow_value(value: object, n: int, rng: random.Random) -> Tuple[object, int]:
+    """
+    Scale an example argument to size n.
+
+    Strings and lists get n elements drawn from the example's own, so
+    their alphabet and value range carry over. Lists of pairs or ragged
+    lists (intervals, edges, words) get n copies of example items; lists of
+    equal rows wider than two (grids) become square with about n cells.
+
+    Returns:
+        The grown value and its actual size
+    """
+    if isinstance(value, str):
+        alphabet = sorted(set(value)) or list("abcdefghijklmnopqrstuvwxyz")
+        return "".join(rng.choices(alphabet, k=n)), n
+    values = as_list(value)
+    if values is None:
+        return value, n
+    if is_grid(values):
+        side = max(1, math.isqrt(n))
+        cells = [cell for row in values for cell in as_list(row) or []]
+        return [grow_scalars(cells, side, rng) for _ in range(side)], side * side
+    items = [item for item in values if item is not None]
+    if items and all(isinstance(item, list) for item in items):
+        return rng.choices(items, k=n), n
+    return grow_scalars(items, n, rng), n
+
+
+def size_parameters(example: List[object]) -> List[int]:
+    """
+    Indexes of the arguments that grow with n.
+
+    Lists and strings grow; integers only when there is nothing else
+    (``climbStairs(n)``), so ``target`` and ``k`` keep their example value.
+    """
+    sized = [i for i, value in enumerate(example) if isinstance(value, (list, str))]
+    if sized:
+        return sized
+    return [
+        i
+        for i, value in enumerate(example)
+        if isinstance(value, int) and not isinstance(value, bool)
+    ]
+
+
+def grow_case(
+    example: List[object], grown: List[int], n: int, rng: random.Random
+) -> Tuple[List[str], int]:
+    """Input lines of a case of size n, and its actual size."""
+    lines: List[str] = []
+    actual = 0
+    for i, value in enumerate(example):
+        if i in grown:
+            value, size = grow_value(value, n, rng) if not isinstance(value, int) else (n, n)
+            actual = max(actual, size)
+        lines.append(json.dumps(value, separators=(",", ":")))
+    return lines, actual
+
+
+def measure(
+    pool: WorkerPool,
+    code: str,
+    signature: Signature,
+    example: List[object],
+    max_size: int,
+    budget_seconds: float,
+    timeout: float,
+    memory_mb: int,
+    seed: int = 0,
+) -> Tuple[List[Sample], Optional[StoppedRun]]:
+    """
+    Time a solution on growing inputs until the budget, a size limit or a failure.
+
+    Blocking; call from a thread.
+
+    Args:
+        pool: Workers to run the solution in
+        code: Python source defining ``class Solution``
+        signature: The method to call
+        example: Parsed arguments of an example case, used as the shape of generated inputs
+        max_size: Largest n to try
+        budget_seconds: Total time to spend
+        timeout: Seconds a single run may take
+        memory_mb: Memory each run may allocate
+        seed: Seed of the input generator
+
+    Returns:
+        The samples, and the result that stopped the measurement early (a
+        timeout, error or memory limit), if any
+
+    Raises:
+        SolutionError: If the solution fails to load
+        ValueError: If the example has nothing that can grow
+    """
+    grown = size_parameters(example)
+    if not grown:
+        raise ValueError("The method takes no list, string or integer argument to grow")
+    rng = random.Random(seed)
+    deadline = time.monotonic() + budget_seconds
+    samples: List[Sample] = []
+    for n in sizes(max_size):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        lines, actual = grow_case(example, grown, n, rng)
+        if samples and actual <= samples[-1].n:
+            continue
+        call_timeout = min(timeout, remaining)
+        results = pool.run(
+            code,
+            signature.method,
+            signature.annotations,
+            signature.returns,
+            [lines],
+            call_timeout,
+            memory_mb,
+        )
+        if results[0]["status"] != "ok":
+            return samples, {**results[0], "n": actual}
+        fastest = float(results[0]["seconds"])
+        if fastest < REPEAT_BELOW_SECONDS:
+            repeats = pool.run(
+                code,
+                signature.method,
+                signature.annotations,
+                signature.returns,
+                [lines] * (REPEATS - 1),
+                call_timeout,
+                memory_mb,
+            )
+            fastest = min([fastest] + [float(r["seconds"]) for r in repeats if r["status"] == "ok"])
+        samples.append(Sample(n=actual, seconds=fastest))
+        # The next size would most likely not finish in time
+        if fastest * 2 > deadline - time.monotonic():
+            break
+    return samples, None
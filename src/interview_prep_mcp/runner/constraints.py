@@ -0,0 +1,280 @@
+"""Constraints parsed from a problem's description (``1 <= nums.length <= 10^4``)."""
+
+import re
+import string
+from fractions import Fraction
+from typing import Dict, List, Optional, Tuple, cast
+from bs4 import BeautifulSoup
+from pydantic import BaseModel
+
+CONSTRAINTS_PATTERN = re.compile(r"Constraints:?(.*)", re.DOTALL)
+# A number as LeetCode writes them: 10^4, 5 * 10^4, 2^31 - 1, 1e9 + 7
+NUMBER = r"-?\d+(?:\.\d+)?(?:\s*[*x×]\s*\d+)?(?:\s*\^\s*-?\d+)?(?:\s*[+-]\s*\d+)?"
+NUMBER_PATTERN = re.compile(
+    r"^(\d+(?:\.\d+)?)(?:\s*[*x×]\s*(\d+))?(?:\s*\^\s*(-?\d+))?(?:\s*([+-])\s*(\d+))?$"
+)
+# nums, nums.length, grid[i][j], words[i].length, Node.val
+SUBJECT = r"[A-Za-z_][\w.]*?(?:\[\w+\])*(?:\.length|\.val)?"
+SUBJECTS = rf"{SUBJECT}(?:\s*,\s*{SUBJECT})*"
+# "1 <= nums.length <= 10^4", "m, n <= 200", "0 < k": optional lower bound, subjects,
+# optional upper bound
+RANGE_PATTERN = re.compile(
+    rf"(?:({NUMBER})\s*(<=?)\s*)?(?<![\w.\[\]])({SUBJECTS})(?:\s*(<=?)\s*({NUMBER}))?(?![\w.\[])"
+)
+# "0 <= nums[i] <= n", "1 <= k <= nums.length", "0 <= edges[i][j] < n": a bound given by
+# another name
+REFERENCE_PATTERN = re.compile(
+    rf"(?<![\w.\[\]])({SUBJECTS})\s*(<=?)\s*({SUBJECT})(?:\s*-\s*(\d+))?(?![\w.\[])"
+)
+# "n == nums.length" and "nums.length == n"
+ALIAS_PATTERN = re.compile(
+    rf"(\w+)\s*==\s*({SUBJECT})\.length\b|({SUBJECT})\.length\s*==\s*(\w+)\s*$"
+)
+NODE_COUNT_PATTERN = re.compile(
+    rf"number of nodes in .*? is in the range \[\s*({NUMBER})\s*,\s*({NUMBER})\s*\]", re.IGNORECASE
+)
+# "s consists of lowercase English letters.", "s[i] is either '0' or '1'."
+ALPHABET_PATTERN = re.compile(
+    rf"^({SUBJECT}(?:(?:\s*,\s*|\s+and\s+){SUBJECT})*)\s+(?:consists?|contains?|is|are|only)\b(.*)$"
+)
+ALPHABETS = [
+    ("lowercase english letters", string.ascii_lowercase),
+    ("uppercase english letters", string.ascii_uppercase),
+    ("lowercase letters", string.ascii_lowercase),
+    ("uppercase letters", string.ascii_uppercase),
+    ("english letters", string.ascii_letters),
+    ("letters", string.ascii_letters),
+    ("digits", string.digits),
+    ("spaces", " "),
+    ("symbols", "!#$%&()*+,-./:;<=>?@[]^_{|}~"),
+]
+ORDERS = [
+    ("non-increasing", "desc"),
+    ("descending", "desc"),
+    ("decreasing", "desc"),
+    ("non-decreasing", "asc"),
+    ("ascending", "asc"),
+    ("increasing", "asc"),
+]
+
+
+class Range(BaseModel):
+    """Inclusive integer bounds; None where the constraints give none."""
+
+    low: Optional[int] = None
+    high: Optional[int] = None
+
+
+class Reference(BaseModel):
+    """An upper bound given by another name: ``name`` plus ``offset``."""
+
+    name: str  # A path, possibly ending in ".length"
+    offset: int = 0
+
+
+class Constraints(BaseModel):
+    """
+    A problem's constraints, keyed by path.
+
+    Paths are the constraint's subject with every index written ``[i]``:
+    ``lengths["nums"]`` bounds ``nums.length``, ``lengths["grid[i]"]`` the
+    row length, ``values["nums[i]"]`` the elements, ``values["target"]`` a
+    scalar and ``values["Node.val"]`` list or tree node values.
+    """
+
+    lengths: Dict[str, Range] = {}
+    values: Dict[str, Range] = {}
+    alphabets: Dict[str, str] = {}  # Characters of a string (or of its elements' strings)
+    aliases: Dict[str, str] = {}  # "n" -> "nums" for "n == nums.length"
+    references: Dict[str, Reference] = {}  # "nums[i]" -> n for "0 <= nums[i] <= n"
+    distinct: List[str] = []  # Names whose elements are all different
+    order: Dict[str, str] = {}  # Name -> "asc" or "desc" for sorted inputs
+    node_count: Optional[Range] = (
+        None  # "The number of nodes in the tree is in the range [0, 10^4]"
+    )
+
+
+def constraint_lines(content: str) -> List[str]:
+    """
+    The lines of a description's Constraints section, as plain text.
+
+    Exponents (``10<sup>4</sup>``) are kept as ``10^4`` and ``&lt;=`` and
+    friends are decoded.
+    """
+    soup = BeautifulSoup(content, "html.parser")
+    for sup in soup.find_all("sup"):
+        sup.replace_with(f"^{sup.get_text()}")
+    for item in soup.find_all(["li", "p", "pre"]):
+        item.append("\n")
+    match = CONSTRAINTS_PATTERN.search(soup.get_text())
+    if match is None:
+        return []
+    text = (
+        cast(str, match.group(1))
+        .replace("≤", "<=")
+        .replace("≥", ">=")
+        .replace("\xa0", " ")
+        .replace("−", "-")
+    )
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+def parse_number(text: str) -> Optional[int]:
+    """
+    Evaluate a bound such as ``10^4``, ``5 * 10^4`` or ``2^31 - 1``.
+
+    Returns:
+        The integer value (floats are truncated), or None if the text is not a number
+    """
+    text = re.sub(r"(\d)e(\d)", r"\1 * 10^\2", text.strip().replace(",", ""))
+    negative = text.startswith("-")
+    match = NUMBER_PATTERN.match(text.lstrip("-").strip())
+    if match is None:
+        return None
+    base, factor, power, sign, offset = cast(
+        Tuple[str, Optional[str], Optional[str], Optional[str], Optional[str]], match.groups()
+    )
+    # Exact arithmetic: floats lose precision past 2^53 ("2^63 - 1")
+    value = Fraction(base)
+    if factor is not None and power is not None:
+        value *= Fraction(int(factor)) ** int(power)
+    elif power is not None:
+        value **= int(power)
+    elif factor is not None:
+        value *= int(factor)
+    # "-2^31" is -(2^31), not (-2)^31
+    value = -value if negative else value
+    if sign is not None and offset is not None:
+        value += int(offset) if sign == "+" else -int(offset)
+    return int(value)
+
+
+def path(subject: str) -> str:
+    """Normalize a constraint subject: ``grid[r][c]`` -> ``grid[i][i]``."""
+    return re.sub(r"\[\w+\]", "[i]", subject.strip())
+
+
+def _bound(text: Optional[str], operator: Optional[str], strict_step: int) -> Optional[int]:
+    if text is None:
+        return None
+    value = parse_number(text)
+    if value is None:
+        return None
+    return value + strict_step if operator == "<" else value
+
+
+def _narrow(ranges: Dict[str, Range], key: str, low: Optional[int], high: Optional[int]) -> None:
+    current = ranges.setdefault(key, Range())
+    if low is not None:
+        current.low = low if current.low is None else max(current.low, low)
+    if high is not None:
+        current.high = high if current.high is None else min(current.high, high)
+
+
+def _alphabet(text: str) -> str:
+    """Characters a "consists of ..." phrase allows."""
+    lowered = text.lower()
+    characters = "".join(cast(List[str], re.findall(r"'(.)'", text)))
+    for phrase, alphabet in ALPHABETS:
+        if phrase in lowered:
+            characters += alphabet
+            lowered = lowered.replace(phrase, "")
+    return "".join(dict.fromkeys(characters, True))
+
+
+def parse_constraints(content: str) -> Constraints:
+    """
+    Parse the Constraints section of a problem's description.
+
+    Understands ranges (``-10^9 <= nums[i] <= 10^9``, ``1 <= m, n <= 300``,
+    one-sided and strict bounds), lengths defined through another name
+    (``n == nums.length``), bounds given by another name (``k <= nums.length``),
+    node counts of lists and trees, character sets (``s consists of
+    lowercase English letters``, ``'0' or '1'``), and "unique"/"sorted"
+    properties.
+    """
+    constraints = Constraints()
+    lines = constraint_lines(content)
+    for line in lines:
+        aliases = cast(List[Tuple[str, str, str, str]], ALIAS_PATTERN.findall(line))
+        for alias, target, target_first, alias_last in aliases:
+            if alias:
+                constraints.aliases[alias] = path(target)
+            else:
+                constraints.aliases[alias_last] = path(target_first)
+
+    for line in lines:
+        node_count = NODE_COUNT_PATTERN.search(line)
+        if node_count:
+            low_text, high_text = cast(Tuple[str, str], node_count.groups())
+            constraints.node_count = Range(low=parse_number(low_text), high=parse_number(high_text))
+            continue
+
+        for clause in re.split(r"[.;](?:\s|$)", line):
+            ranges = cast(List[Tuple[str, str, str, str, str]], RANGE_PATTERN.findall(clause))
+            for low_text, low_operator, subjects, high_operator, high_text in ranges:
+                low = _bound(low_text or None, low_operator, 1)
+                high = _bound(high_text or None, high_operator, -1)
+                if low is None and high is None:
+                    continue
+                for subject in subjects.split(","):
+                    key = path(subject)
+                    if key.endswith(".length"):
+                        _narrow(constraints.lengths, key[: -len(".length")], low, high)
+                        continue
+                    _narrow(constraints.values, key, low, high)
+                    if key in constraints.aliases:
+                        _narrow(constraints.lengths, constraints.aliases[key], low, high)
+            references = cast(List[Tuple[str, str, str, str]], REFERENCE_PATTERN.findall(clause))
+            for subjects, operator, name, offset in references:
+                reference = Reference(
+                    name=path(name), offset=-int(offset or 0) - (1 if operator == "<" else 0)
+                )
+                for subject in subjects.split(","):
+                    key = path(subject)
+                    if key.endswith(".length"):
+                        continue
+                    constraints.references.setdefault(key, reference)
+
+        alphabet = ALPHABET_PATTERN.match(line)
+        if alphabet:
+            subjects, phrase = cast(Tuple[str, str], alphabet.groups())
+            characters = _alphabet(phrase)
+            if characters:
+                for subject in re.split(r"\s*,\s*|\s+and\s+", subjects):
+                    constraints.alphabets[path(subject)] = characters
+
+    # Properties are sentences ("All the integers of nums are unique."): pick out names seen above
+    known = {
+        re.split(r"[.\[]", key)[0]
+        for key in [*constraints.lengths, *constraints.values, *constraints.alphabets]
+    }
+    for line in lines:
+        lowered = line.lower()
+        names = [name for name in cast(List[str], re.findall(r"\w+", line)) if name in known]
+        if "unique" in lowered or "distinct" in lowered:
+            constraints.distinct.extend(name for name in names if name not in constraints.distinct)
+        if "sorted" in lowered:
+            order = next((order for phrase, order in ORDERS if phrase in lowered), "asc")
+            for name in names:
+                constraints.order.setdefault(name, order)
+    return constraints
+
+
+def size_limit(content: str, params: List[str]) -> Optional[int]:
+    """
+    Largest input size the constraints allow for any of the given parameters.
+
+    Counts upper bounds on ``param.length`` (``1 <= nums.length <= 10^4``),
+    on integer parameters themselves (``1 <= n <= 45``), and on names defined
+    as a length (``n == nums.length``, then ``1 <= n <= 10^5``).
+
+    Returns:
+        The largest such bound, or None if the constraints give none
+    """
+    constraints = parse_constraints(content)
+    bounds: List[Tuple[str, Dict[str, Range]]] = [(param, constraints.lengths) for param in params]
+    bounds += [(param, constraints.values) for param in params]
+    highs = [ranges[name].high for name, ranges in bounds if name in ranges]
+    found = [high for high in highs if high is not None]
+    return max(found) if found else None
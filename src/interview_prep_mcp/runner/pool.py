@@ -0,0 +1,273 @@
+"""Pool of warm worker processes that run solutions against test cases."""
+
+import os
+import queue
+import socket
+import subprocess
+import sys
+import threading
+import time
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Dict, List, Optional
+from .worker import CaseResult, Request
+
+WORKER_MODULE = "interview_prep_mcp.runner.worker"
+# Loading a solution (compiling it, building Solution()) gets this much on top of the case timeout
+LOAD_GRACE_SECONDS = 2.0
+# Attempts to hand a request to a live worker before giving up
+MAX_DISPATCH_ATTEMPTS = 3
+# Attempts to start a replacement worker in the background, and the pause
+# before the first retry (doubled each time); a worker that still cannot start
+# is retried by the next run, which reports the error
+SPAWN_ATTEMPTS = 3
+SPAWN_RETRY_SECONDS = 0.5
+# Longest a run waits for a free worker before failing
+IDLE_WAIT_SECONDS = 60.0
+
+
+class SolutionError(ValueError):
+    """The solution could not be loaded (syntax error, no class Solution, ...)."""
+
+
+class _Worker:
+    def __init__(
+        self, process: "subprocess.Popen[bytes]", conn: "Connection[Request, CaseResult]"
+    ) -> None:
+        self.process = process
+        self.conn = conn
+        self.runs = 0
+
+
+class WorkerPool:
+    """
+    Worker processes kept warm between test runs.
+
+    Workers are started on first use and reused: a run pays neither
+    interpreter startup nor imports, only compiling the solution. A case that
+    exceeds its timeout (or its memory limit, or crashes the worker) costs that
+    worker, which is killed; the remaining cases continue on another worker
+    while a replacement starts in the background. Workers are also recycled
+    after ``max_runs`` runs, so state a solution leaves behind does not
+    accumulate.
+
+    Workers are ``python -m`` processes talking over a socketpair rather than
+    multiprocessing children: multiprocessing's spawn and forkserver modes
+    re-import the parent's ``__main__`` (the whole server) in every worker.
+
+    This isolates the server from runaway solutions, not from hostile ones:
+    it is meant for running your own code locally.
+    """
+
+    def __init__(self, size: int = 2, max_runs: int = 100) -> None:
+        self.size = size
+        self.max_runs = max_runs
+        self._started = False
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._workers: List[_Worker] = []
+        self._lock = threading.Lock()
+        # Workers that should exist but could not be started
+        self._missing = 0
+        self.spawned = 0
+        self.replaced = 0
+        self.spawn_failures = 0
+
+    def start(self) -> None:
+        """
+        Start the workers (idempotent).
+
+        Raises:
+            RuntimeError: If a worker cannot be started
+        """
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+            self._missing = self.size
+        self._restore()
+
+    def _restore(self) -> None:
+        """Start the workers that are missing, e.g. because a replacement failed to start."""
+        with self._lock:
+            missing, self._missing = self._missing, 0
+        for started in range(missing):
+            try:
+                self._idle.put(self._spawn())
+            except Exception as e:
+                with self._lock:
+                    self._missing += missing - started
+                    self.spawn_failures += 1
+                raise RuntimeError(f"Could not start a test worker: {e}") from e
+
+    def _replace(self) -> None:
+        """Start a worker in place of a killed one, retrying failed starts."""
+        for attempt in range(SPAWN_ATTEMPTS):
+            try:
+                self._idle.put(self._spawn())
+                return
+            except Exception:
+                with self._lock:
+                    self.spawn_failures += 1
+                if attempt + 1 < SPAWN_ATTEMPTS:
+                    time.sleep(SPAWN_RETRY_SECONDS * (1 << attempt))
+        with self._lock:
+            self._missing += 1
+
+    def _spawn(self) -> _Worker:
+        if os.name != "posix":
+            raise RuntimeError("Running tests needs a POSIX system (workers inherit a socket)")
+        parent, child = socket.socketpair()
+        # The package may not be installed (e.g., running from a checkout)
+        env = dict(os.environ)
+        source = str(Path(__file__).resolve().parents[2])
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [source, env.get("PYTHONPATH")]))
+        with child:
+            process = subprocess.Popen(
+                [sys.executable, "-m", WORKER_MODULE, str(child.fileno())],
+                pass_fds=(child.fileno(),),
+                # stdout may be the MCP stdio transport: nothing a solution does may reach it
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                env=env,
+            )
+        spawned = _Worker(process, Connection(parent.detach()))
+        with self._lock:
+            self.spawned += 1
+            self._workers.append(spawned)
+        return spawned
+
+    def _release(self, used: _Worker, healthy: bool) -> None:
+        used.runs += 1
+        if healthy and used.runs < self.max_runs:
+            self._idle.put(used)
+            return
+        self._kill(used)
+        with self._lock:
+            self.replaced += 1
+        # Off the caller's path: the next run takes whichever worker is idle first
+        threading.Thread(target=self._replace, daemon=True).start()
+
+    def _kill(self, used: _Worker) -> None:
+        used.process.kill()
+        used.process.wait()
+        used.conn.close()
+        with self._lock:
+            if used in self._workers:
+                self._workers.remove(used)
+
+    @staticmethod
+    def _receive(used: _Worker, timeout: float) -> Optional[CaseResult]:
+        """Next message from a worker; None on timeout, a "crashed" result if it died."""
+        try:
+            if not used.conn.poll(timeout):
+                return None
+            return used.conn.recv()
+        except (EOFError, OSError):
+            code = used.process.poll()
+            return {
+                "status": "crashed",
+                "error": f"Worker exited with code {code}" if code else "Worker exited",
+            }
+
+    def run(
+        self,
+        code: str,
+        method: str,
+        annotations: List[str],
+        returns: Optional[str],
+        cases: List[List[str]],
+        timeout: float,
+        memory_mb: int,
+    ) -> List[CaseResult]:
+        """
+        Run a solution against cases (blocking; call from a thread).
+
+        Args:
+            code: Python source defining ``class Solution``
+            method: Name of the method to call
+            annotations: Annotation source of each parameter (converts lists to ListNode/TreeNode)
+            returns: Return annotation ("None" means the first argument is the answer)
+            cases: Input lines of each case
+            timeout: Seconds each case may take
+            memory_mb: Memory each run may use on top of the worker's own
+
+        Returns:
+            One result per case: ``status`` ("ok", "error", "timeout",
+            "memory_limit" or "crashed") with ``output``, ``seconds``,
+            ``stdout`` and ``error`` as applicable
+
+        Raises:
+            SolutionError: If the solution fails to load
+            RuntimeError: If no worker can be started, or none becomes free
+                within IDLE_WAIT_SECONDS
+        """
+        self.start()
+        self._restore()
+        results: List[CaseResult] = []
+        pending = list(cases)
+        attempts = 0
+        while pending:
+            try:
+                used = self._idle.get(timeout=IDLE_WAIT_SECONDS)
+            except queue.Empty:
+                raise RuntimeError(
+                    f"No test worker became free within {IDLE_WAIT_SECONDS:g}s"
+                ) from None
+            healthy = True
+            try:
+                try:
+                    used.conn.send((code, method, annotations, returns, pending, memory_mb))
+                except OSError as e:
+                    healthy = False
+                    attempts += 1
+                    if attempts >= MAX_DISPATCH_ATTEMPTS:
+                        raise RuntimeError("Test workers keep failing to start") from e
+                    continue
+                loaded = self._receive(used, timeout + LOAD_GRACE_SECONDS)
+                if loaded is None or loaded["status"] != "ready":
+                    healthy = loaded is not None and loaded["status"] == "error"
+                    if loaded is None:
+                        raise SolutionError(
+                            f"Loading the solution took over {timeout + LOAD_GRACE_SECONDS:g}s"
+                        )
+                    if loaded["status"] == "memory_limit":
+                        raise SolutionError(
+                            f"Loading the solution exceeded the {memory_mb} MB memory limit"
+                        )
+                    raise SolutionError(str(loaded.get("error", loaded["status"])))
+
+                while pending:
+                    result = self._receive(used, timeout)
+                    pending.pop(0)
+                    if result is None:
+                        results.append({"status": "timeout", "seconds": timeout})
+                        healthy = False
+                        break
+                    results.append(result)
+                    if result["status"] in ("memory_limit", "crashed"):
+                        healthy = False
+                        break
+            finally:
+                self._release(used, healthy)
+        return results
+
+    def metrics(self) -> Dict[str, int]:
+        """Pool size and how many workers were started, replaced and failed to start."""
+        return {
+            "size": self.size,
+            "spawned": self.spawned,
+            "replaced": self.replaced,
+            "spawn_failures": self.spawn_failures,
+        }
+
+    def close(self) -> None:
+        """Stop every worker."""
+        with self._lock:
+            workers, self._workers = self._workers, []
+            self._started = False
+            self._missing = 0
+            self._idle = queue.Queue()
+        for used in workers:
+            used.process.kill()
+            used.process.wait()
+            used.conn.close()
@@ -0,0 +1,290 @@
+"""
+Child side of the test runner: runs a solution against parsed cases.
+
+Started as ``python -m interview_prep_mcp.runner.worker FD`` and kept alive
+between runs, so everything here (and the prelude solutions are executed
+with) is loaded once per worker. Only the standard library is used, to keep
+startup short.
+"""
+
+import io
+import json
+import signal
+import sys
+import time
+import traceback
+from contextlib import redirect_stdout
+from multiprocessing.connection import Connection
+from typing import (
+    AbstractSet,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    TypedDict,
+    cast,
+)
+
+try:
+    import resource
+except ImportError:  # Windows: no memory limits
+    resource = None  # type: ignore[assignment]
+
+# What LeetCode's Python environment has in scope without imports
+PRELUDE = """
+from typing import *
+from collections import *
+from heapq import *
+from bisect import *
+from math import *
+from itertools import *
+from functools import *
+import bisect, collections, functools, heapq, itertools, math, operator, random, re, string
+"""
+SOLUTION_FILENAME = "solution.py"
+MAX_STDOUT = 4096
+RECURSION_LIMIT = 100_000
+# What the server sends for each run: (code, method, annotations, returns, cases, memory_mb)
+Request = Tuple[str, str, List[str], Optional[str], List[List[str]], int]
+
+
+class CaseResult(TypedDict, total=False):
+    """A message from the worker: a loaded solution's "ready", or one case's result."""
+
+    status: str
+    output: object
+    error: str
+    seconds: float
+    stdout: str
+
+
+class SolutionMethod(Protocol):
+    """The bound ``Solution`` method a run calls."""
+
+    def __call__(self, *args: object) -> object: ...
+
+
+class ListNode:
+    """Singly-linked list node, as in LeetCode's templates."""
+
+    def __init__(self, val: object = 0, next: Optional["ListNode"] = None) -> None:
+        self.val = val
+        self.next = next
+
+
+class TreeNode:
+    """Binary tree node, as in LeetCode's templates."""
+
+    def __init__(
+        self, val: object = 0, left: Optional["TreeNode"] = None, right: Optional["TreeNode"] = None
+    ) -> None:
+        self.val = val
+        self.left = left
+        self.right = right
+
+
+def build_list(values: Optional[List[object]]) -> Optional[ListNode]:
+    head: Optional[ListNode] = None
+    for value in reversed(values or []):
+        head = ListNode(value, head)
+    return head
+
+
+def build_tree(values: Optional[List[object]]) -> Optional[TreeNode]:
+    """Build a tree from LeetCode's level-order form (``[1,null,2,3]``)."""
+    if not values or values[0] is None:
+        return None
+    root = TreeNode(values[0])
+    level = [root]
+    position = 1
+    while level and position < len(values):
+        children: List[TreeNode] = []
+        for node in level:
+            for side in ("left", "right"):
+                if position < len(values) and values[position] is not None:
+                    child = TreeNode(values[position])
+                    setattr(node, side, child)
+                    children.append(child)
+                position += 1
+        level = children
+    return root
+
+
+def tree_values(root: Optional[TreeNode]) -> List[object]:
+    values: List[object] = []
+    queue: List[Optional[TreeNode]] = [root]
+    for node in queue:
+        if node is None:
+            values.append(None)
+            continue
+        values.append(node.val)
+        queue.extend((node.left, node.right))
+    while values and values[-1] is None:
+        values.pop()
+    return values
+
+
+def to_argument(value: object, annotation: str) -> object:
+    """Convert a parsed input line to the type the method expects."""
+    if "ListNode" not in annotation and "TreeNode" not in annotation:
+        return value
+    build = build_list if "ListNode" in annotation else build_tree
+    if annotation.startswith("List["):
+        return [build(item) for item in cast(List[Optional[List[object]]], value)]
+    return build(cast(Optional[List[object]], value))
+
+
+def to_json(value: object) -> object:
+    """Convert a return value to LeetCode's JSON output form."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, ListNode):
+        values: List[object] = []
+        node: Optional[ListNode] = value
+        while node is not None and len(values) <= 100_000:
+            values.append(to_json(node.val))
+            node = node.next
+        return values
+    if isinstance(value, TreeNode):
+        return tree_values(value)
+    if isinstance(value, (list, tuple)):
+        return [to_json(item) for item in cast(Sequence[object], value)]
+    if isinstance(value, (set, frozenset)):
+        return sorted((to_json(item) for item in cast(AbstractSet[object], value)), key=repr)
+    if isinstance(value, dict):
+        return {str(key): to_json(item) for key, item in cast(Dict[object, object], value).items()}
+    return repr(value)
+
+
+def describe_error(error: BaseException) -> str:
+    """One-line error, with the solution line that raised it."""
+    message = "".join(traceback.format_exception_only(type(error), error)).strip()
+    lines = [
+        frame.lineno
+        for frame in traceback.extract_tb(error.__traceback__)
+        if frame.filename == SOLUTION_FILENAME
+    ]
+    return f"{message} (line {lines[-1]})" if lines else message
+
+
+def address_space() -> int:
+    """Current virtual memory size in bytes (0 if unknown)."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[0]) * resource.getpagesize()
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+
+def set_memory_limit(limit: Optional[int]) -> None:
+    """Cap (or uncap, with None) this process's address space."""
+    if resource is None or not hasattr(resource, "RLIMIT_AS"):
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    soft = resource.RLIM_INFINITY if limit is None else limit
+    if hard != resource.RLIM_INFINITY:
+        soft = hard if soft == resource.RLIM_INFINITY else min(soft, hard)
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+    except (ValueError, OSError):
+        pass
+
+
+def run_case(
+    method: SolutionMethod, lines: List[str], annotations: List[str], returns: Optional[str]
+) -> CaseResult:
+    """Run one case; the result's status is "ok", "error" or "memory_limit"."""
+    try:
+        args = [
+            to_argument(cast(object, json.loads(line)), annotation)
+            for line, annotation in zip(lines, annotations, strict=False)
+        ]
+    except ValueError as e:
+        return {"status": "error", "error": f"Could not parse input: {e}"}
+
+    stdout = io.StringIO()
+    started = time.perf_counter()
+    try:
+        with redirect_stdout(stdout):
+            output = method(*args)
+    except MemoryError:
+        return {"status": "memory_limit", "seconds": time.perf_counter() - started}
+    except BaseException as e:
+        return {
+            "status": "error",
+            "error": describe_error(e),
+            "seconds": time.perf_counter() - started,
+            "stdout": stdout.getvalue()[:MAX_STDOUT],
+        }
+    seconds = time.perf_counter() - started
+
+    # "Do not return anything, modify nums in-place": the answer is the first argument
+    if returns == "None" and args:
+        output = args[0]
+    return {
+        "status": "ok",
+        "output": to_json(output),
+        "seconds": seconds,
+        "stdout": stdout.getvalue()[:MAX_STDOUT],
+    }
+
+
+def serve(conn: "Connection[CaseResult, Request]") -> None:
+    """
+    Worker loop: for each request, load the solution and stream one result per case.
+
+    A request is ``(code, method, annotations, returns, cases, memory_mb)``.
+    The first reply is ``{"status": "ready"}`` or the error that kept the
+    solution from loading.
+    """
+    # Ctrl-C in the server's terminal is the parent's to handle
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    sys.setrecursionlimit(RECURSION_LIMIT)
+    base: Dict[str, object] = {}
+    exec(PRELUDE, base)
+    baseline = address_space()
+
+    while True:
+        try:
+            code, method_name, annotations, returns, cases, memory_mb = conn.recv()
+        except EOFError:
+            return
+        namespace: Dict[str, object] = dict(
+            base, ListNode=ListNode, TreeNode=TreeNode, __name__="solution"
+        )
+        set_memory_limit(baseline + memory_mb * 1024 * 1024 if baseline else None)
+        try:
+            try:
+                exec(compile(code, SOLUTION_FILENAME, "exec"), namespace)
+                method = cast(
+                    SolutionMethod,
+                    getattr(cast(Callable[[], object], namespace["Solution"])(), method_name),
+                )
+            except MemoryError:
+                conn.send({"status": "memory_limit"})
+                continue
+            except BaseException as e:
+                if isinstance(e, KeyError) and cast(Tuple[object, ...], e.args) == ("Solution",):
+                    conn.send(
+                        {"status": "error", "error": "The code does not define class Solution"}
+                    )
+                else:
+                    conn.send({"status": "error", "error": describe_error(e)})
+                continue
+            conn.send({"status": "ready"})
+            for lines in cases:
+                conn.send(run_case(method, lines, annotations, returns))
+        finally:
+            set_memory_limit(None)
+
+
+def main() -> None:
+    """Serve requests on the socket whose file descriptor is the first argument."""
+    serve(Connection(int(sys.argv[1])))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,162 @@
 """MCP server for LeetCode practice problem management."""
 
+import argparse
 import asyncio
 import json
-from typing import Any, Dict, Union, List, cast
+import logging
+import os
+import sqlite3
+import sys
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Optional, Union, List, cast, get_args
+import anyio
+import uvicorn
 from mcp.server import Server
+from mcp.server.fastmcp.server import StreamableHTTPASGIApp
+from mcp.server.sse import SseServerTransport
 from mcp.server.stdio import stdio_server
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
 from mcp.types import Tool, TextContent
-from .tools.load_problem import LoadProblemTool
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Mount, Route
+from .daemon import DaemonClient, DaemonError, absolute_paths, default_socket_path, serve
+from .logs import configure_logging, log_event, parse_sample_rates, restart_logging_after_fork
+from .prefork import bind_socket, run_workers
+from .leetcode.client import CatalogSource, LeetCodeClient
+from .leetcode.store import ProblemStore, default_store_path
+from .tools.load_problem import MAX_SEARCH_LIMIT, LoadProblemTool
+from .tools.warmup import read_manifest
+from .tools.random_problem import RandomProblemTool
+from .tools.similar_problems import MAX_HOPS, SimilarProblemsTool
+from .tools.scaffold import MAX_SCAFFOLD_PROBLEMS, ScaffoldTool
+from .tools.run_tests import MAX_MEMORY_MB, MAX_TIMEOUT_SECONDS, MIN_MEMORY_MB, RunTestsTool
+from .tools.estimate_complexity import MAX_BUDGET_SECONDS, MAX_SIZE, EstimateComplexityTool
+from .tools.stress_input import MAX_INLINE_CHARS, StressInputTool
+from .tools.problem_list import ProblemListTool
+from .tools.daily_problem import DailyProblemTool
+from .runner.pool import WorkerPool
+
+# Named explicitly: the daemon runs this module as __main__
+logger = logging.getLogger("interview_prep_mcp.server")
+
+
+def env_flag(name: str) -> bool:
+    """Read a boolean setting from the environment."""
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def env_catalog_source() -> CatalogSource:
+    """Read INTERVIEW_PREP_CATALOG_SOURCE ("graphql" or "rest")."""
+    value = os.environ.get("INTERVIEW_PREP_CATALOG_SOURCE", "graphql").strip().lower()
+    if value not in get_args(CatalogSource):
+        raise ValueError(
+            f"INTERVIEW_PREP_CATALOG_SOURCE must be 'graphql' or 'rest', got {value!r}"
+        )
+    return cast(CatalogSource, value)
+
+
+def env_store() -> Optional[ProblemStore]:
+    """
+    Read INTERVIEW_PREP_STORE: unset/off disables the shared store, "1"/"on"
+    uses the default path, anything else is taken as the database path.
+
+    A store that cannot be opened (unwritable or corrupt) is logged and the
+    server runs without one.
+    """
+    value = os.environ.get("INTERVIEW_PREP_STORE", "").strip()
+    if value.lower() in ("", "0", "false", "no", "off"):
+        return None
+    if value.lower() in ("1", "true", "yes", "on"):
+        path = default_store_path()
+    else:
+        path = Path(value).expanduser()
+    try:
+        return ProblemStore(path)
+    except (sqlite3.Error, OSError) as e:
+        log_event(logger, logging.ERROR, "store.unavailable", path=str(path), error=str(e))
+        return None
+
+
+def env_int(name: str, default: int) -> int:
+    """Read a positive integer setting from the environment."""
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return default
+    if not value.isdigit() or int(value) < 1:
+        raise ValueError(f"{name} must be a positive integer, got {value!r}")
+    return int(value)
+
+
+def env_logging() -> None:
+    """
+    Read INTERVIEW_PREP_LOG ("stderr" or a file path; unset/off disables
+    logging), INTERVIEW_PREP_LOG_LEVEL and INTERVIEW_PREP_LOG_SAMPLE
+    ("event=rate,...") and configure logging accordingly.
+    """
+    destination = os.environ.get("INTERVIEW_PREP_LOG", "").strip()
+    if destination.lower() in ("", "0", "false", "no", "off"):
+        return
+    configure_logging(
+        destination,
+        level=os.environ.get("INTERVIEW_PREP_LOG_LEVEL", "INFO").strip() or "INFO",
+        sample_rates=parse_sample_rates(os.environ.get("INTERVIEW_PREP_LOG_SAMPLE", "")),
+    )
+
+
+def env_warmup() -> Optional[List[str]]:
+    """Read INTERVIEW_PREP_WARMUP: a manifest file, or entries inline ("top 50, lru-cache")."""
+    value = os.environ.get("INTERVIEW_PREP_WARMUP", "").strip()
+    return read_manifest(value) if value else None
 
 
 # Initialize MCP server
 app = Server("interview-prep-mcp")
 
-# Initialize tools
-load_problem_tool: LoadProblemTool = LoadProblemTool()
+
+class ServerTools:
+    """The LeetCode client, the tools and the test worker pool of one server process."""
+
+    def __init__(self) -> None:
+        self.client = LeetCodeClient(
+            http2=env_flag("INTERVIEW_PREP_HTTP2"),
+            catalog_source=env_catalog_source(),
+            store=env_store(),
+        )
+        self.load_problem = LoadProblemTool(
+            self.client,
+            prefetch=env_flag("INTERVIEW_PREP_PREFETCH"),
+            warmup=env_warmup(),
+            warmup_concurrency=env_int("INTERVIEW_PREP_WARMUP_CONCURRENCY", 4),
+        )
+        self.random_problem = RandomProblemTool(self.load_problem)
+        self.similar_problems = SimilarProblemsTool(self.client)
+        self.scaffold = ScaffoldTool(self.client)
+        # Workers start on the first run_tests call, not with the server
+        self.test_pool = WorkerPool(env_int("INTERVIEW_PREP_TEST_WORKERS", 2))
+        self.run_tests = RunTestsTool(self.client, self.test_pool)
+        self.estimate_complexity = EstimateComplexityTool(self.client, self.test_pool)
+        self.stress_input = StressInputTool(self.client)
+        self.problem_list = ProblemListTool(self.load_problem)
+        self.daily_problem = DailyProblemTool(self.load_problem)
+
+
+_tools: Optional[ServerTools] = None
+
+
+def get_tools() -> ServerTools:
+    """
+    The process's tools, built from the environment on first use.
+
+    Stdio shims forward every call to the daemon and never build them.
+    """
+    global _tools
+    if _tools is None:
+        _tools = ServerTools()
+    return _tools
 
 
 @app.list_tools()
@@ -22,7 +165,13 @@ async def list_tools() -> list[Tool]:
     return [
         Tool(
             name="load_problem",
-            description="Load a LeetCode problem by its title slug, problem ID, or search by name. Optionally specify a language to get code for that language only.",
+            description=(
+                "Load a LeetCode problem by its title slug, problem ID, or search by name. "
+                "Searches can be filtered by difficulty and topic tags (e.g., medium "
+                "dynamic-programming problems), or match problem descriptions with "
+                "search_content. Search results are paged: pass next_cursor as cursor for more. "
+                "Optionally specify a language to get code for that language only."
+            ),
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -41,50 +190,635 @@ async def list_tools() -> list[Tool]:
                     "language": {
                         "type": "string",
                         "description": "Programming language for code snippet (e.g., 'python', 'java', 'golang', 'cpp'). If omitted, returns all available code snippets.",
-                    }
+                    },
+                    "difficulty": {
+                        "type": "string",
+                        "enum": ["Easy", "Medium", "Hard"],
+                        "description": (
+                            "Only search problems of this difficulty. Without problem_name, lists "
+                            "matching problems."
+                        ),
+                    },
+                    "tags": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": (
+                            "Only search problems having all of these topic tags (e.g., "
+                            "['dynamic-programming', 'graph']). Without problem_name, lists "
+                            "matching problems."
+                        ),
+                    },
+                    "search_content": {
+                        "type": "boolean",
+                        "description": (
+                            "Match problem_name against problem descriptions instead of titles "
+                            "(e.g., 'longest substring without repeating characters'), ranked by "
+                            "relevance. Only problems already fetched or stored locally are "
+                            "searched. Requires NumPy."
+                        ),
+                        "default": False,
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "maximum": MAX_SEARCH_LIMIT,
+                        "description": "Search results per page (default 10)",
+                    },
+                    "cursor": {
+                        "type": "string",
+                        "description": (
+                            "next_cursor from the previous page of the same search, to get the "
+                            "next page"
+                        ),
+                    },
+                    "if_none_match": {
+                        "type": "string",
+                        "description": (
+                            "content_hash of a copy of this problem you already have (same "
+                            "language filter). If it is unchanged, a short not_modified response "
+                            "is returned instead of the full problem."
+                        ),
+                    },
                 },
             },
-        )
+        ),
+        Tool(
+            name="random_problem",
+            description=(
+                "Pick a random free LeetCode problem, optionally filtered by difficulty and topic "
+                "tags (e.g., a random medium graph problem). Pass a seed for a reproducible pick."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "difficulty": {
+                        "type": "string",
+                        "enum": ["Easy", "Medium", "Hard"],
+                        "description": "Only pick problems of this difficulty",
+                    },
+                    "tags": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": (
+                            "Only pick problems having all of these topic tags (e.g., ['graph'])"
+                        ),
+                    },
+                    "seed": {
+                        "type": "integer",
+                        "description": (
+                            "Seed for a deterministic pick: the same seed and filters give the "
+                            "same problem"
+                        ),
+                    },
+                    "fetch": {
+                        "type": "boolean",
+                        "description": (
+                            "Return the full problem instead of a summary (default false)"
+                        ),
+                    },
+                    "language": {
+                        "type": "string",
+                        "description": (
+                            "Programming language for the code snippet when fetch is true"
+                        ),
+                    },
+                },
+            },
+        ),
+        Tool(
+            name="similar_problems",
+            description=(
+                "List problems similar to a given one, following LeetCode's similar-questions "
+                "links up to a few hops, nearest first."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "title_slug": {
+                        "type": "string",
+                        "description": "The URL-friendly slug of the problem (e.g., 'two-sum')",
+                    },
+                    "problem_id": {
+                        "type": "integer",
+                        "description": "The problem ID number (e.g., 1 for Two Sum)",
+                    },
+                    "hops": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "maximum": MAX_HOPS,
+                        "description": (
+                            "How many links to follow: 1 is LeetCode's own list, 2 adds problems "
+                            "similar to those (default 1)"
+                        ),
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of problems to return (default 20)",
+                    },
+                },
+            },
+        ),
+        Tool(
+            name="scaffold_workspace",
+            description=(
+                "Write solution stubs (description header, example test cases and code template) "
+                "for a list of problems into a workspace directory. Reruns only rewrite stubs "
+                "whose content changed and never clobber stubs you have edited unless overwrite "
+                "is set."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "workspace": {
+                        "type": "string",
+                        "description": "Directory to write the stubs into (created if missing)",
+                    },
+                    "title_slugs": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": (
+                            "Problems to scaffold by slug (e.g., ['two-sum', '3sum']). Up to "
+                            f"{MAX_SCAFFOLD_PROBLEMS} problems per call in total."
+                        ),
+                    },
+                    "problem_ids": {
+                        "type": "array",
+                        "items": {"type": "integer"},
+                        "description": "Problems to scaffold by ID (e.g., [1, 15])",
+                    },
+                    "language": {
+                        "type": "string",
+                        "description": (
+                            "Language of the stubs (e.g., 'python3', 'java', 'go'; default "
+                            "'python3')"
+                        ),
+                    },
+                    "overwrite": {
+                        "type": "boolean",
+                        "description": (
+                            "Replace stubs edited since they were generated (default false)"
+                        ),
+                    },
+                },
+                "required": ["workspace"],
+            },
+        ),
+        Tool(
+            name="run_tests",
+            description=(
+                "Run a Python3 solution locally against a problem's example test cases (or custom "
+                "input) and report each case's output, expected output, pass/fail status and "
+                "time. Cases run in warm worker processes with a per-case timeout and a memory "
+                "limit."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "code": {
+                        "type": "string",
+                        "description": (
+                            "Python3 source defining `class Solution`, as submitted to LeetCode"
+                        ),
+                    },
+                    "title_slug": {
+                        "type": "string",
+                        "description": "The URL-friendly slug of the problem (e.g., 'two-sum')",
+                    },
+                    "problem_id": {
+                        "type": "integer",
+                        "description": "The problem ID number (e.g., 1 for Two Sum)",
+                    },
+                    "test_input": {
+                        "type": "string",
+                        "description": (
+                            "Custom input instead of the examples, in LeetCode's format: one JSON "
+                            "value per argument per line (e.g., '[2,7,11,15]\\n9'). Custom cases "
+                            "are run but not judged."
+                        ),
+                    },
+                    "timeout": {
+                        "type": "number",
+                        "exclusiveMinimum": 0,
+                        "maximum": MAX_TIMEOUT_SECONDS,
+                        "description": "Seconds each case may run (default 2)",
+                    },
+                    "memory_mb": {
+                        "type": "integer",
+                        "minimum": MIN_MEMORY_MB,
+                        "maximum": MAX_MEMORY_MB,
+                        "description": "Memory the solution may allocate, in MB (default 256)",
+                    },
+                },
+                "required": ["code"],
+            },
+        ),
+        Tool(
+            name="estimate_complexity",
+            description=(
+                "Estimate a Python3 solution's time complexity empirically: time it on generated "
+                "inputs of growing size (shaped like the problem's first example), fit O(1), "
+                "O(log n), O(n), O(n log n), O(n^2), O(n^3) and O(2^n) models, and predict the "
+                "time at the problem's size constraint."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "code": {
+                        "type": "string",
+                        "description": (
+                            "Python3 source defining `class Solution`, as submitted to LeetCode"
+                        ),
+                    },
+                    "title_slug": {
+                        "type": "string",
+                        "description": "The URL-friendly slug of the problem (e.g., 'two-sum')",
+                    },
+                    "problem_id": {
+                        "type": "integer",
+                        "description": "The problem ID number (e.g., 1 for Two Sum)",
+                    },
+                    "max_seconds": {
+                        "type": "number",
+                        "exclusiveMinimum": 0,
+                        "maximum": MAX_BUDGET_SECONDS,
+                        "description": "Total time to spend measuring (default 10)",
+                    },
+                    "max_size": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "maximum": MAX_SIZE,
+                        "description": (
+                            "Largest input size to try (default: the problem's size constraint)"
+                        ),
+                    },
+                    "memory_mb": {
+                        "type": "integer",
+                        "minimum": MIN_MEMORY_MB,
+                        "maximum": MAX_MEMORY_MB,
+                        "description": "Memory each run may allocate, in MB (default 512)",
+                    },
+                    "seed": {
+                        "type": "integer",
+                        "description": "Seed of the input generator (default 0)",
+                    },
+                },
+                "required": ["code"],
+            },
+        ),
+        Tool(
+            name="generate_stress_input",
+            description=(
+                "Generate a worst-case-size test input for a problem from its constraints "
+                "(largest lengths, full value ranges, declared character sets, unique and sorted "
+                "properties), in LeetCode's input format, to stress-test a solution's performance "
+                "locally. Requires NumPy."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "title_slug": {
+                        "type": "string",
+                        "description": "The URL-friendly slug of the problem (e.g., 'two-sum')",
+                    },
+                    "problem_id": {
+                        "type": "integer",
+                        "description": "The problem ID number (e.g., 1 for Two Sum)",
+                    },
+                    "scale": {
+                        "type": "number",
+                        "exclusiveMinimum": 0,
+                        "maximum": 1,
+                        "description": "Fraction of the maximal sizes to generate (default 1)",
+                    },
+                    "seed": {
+                        "type": "integer",
+                        "description": "Seed of the random generator (default 0)",
+                    },
+                    "output_path": {
+                        "type": "string",
+                        "description": (
+                            "File to write the input to; required for inputs over "
+                            f"{MAX_INLINE_CHARS:,} characters"
+                        ),
+                    },
+                },
+            },
+        ),
+        Tool(
+            name="load_problem_list",
+            description=(
+                "Load every problem of a LeetCode study plan (leetcode.com/studyplan/<slug>, e.g. "
+                "'top-interview-150') or public problem list (leetcode.com/problem-list/<slug>) "
+                "in one call: description, hints, examples and the code template for one language "
+                "per problem. Problems that fail to load (e.g. premium ones) are listed in errors."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "slug": {
+                        "type": "string",
+                        "description": "Study plan or problem list slug, from its URL",
+                    },
+                    "kind": {
+                        "type": "string",
+                        "enum": ["study_plan", "list"],
+                        "description": (
+                            "Whether the slug is a study plan or a problem list (default "
+                            "study_plan)"
+                        ),
+                    },
+                    "language": {
+                        "type": "string",
+                        "description": "Language of the code templates (default python3)",
+                    },
+                    "include_description": {
+                        "type": "boolean",
+                        "description": (
+                            "Include each problem's description (default true); false keeps the "
+                            "response small"
+                        ),
+                    },
+                },
+                "required": ["slug"],
+            },
+        ),
+        Tool(
+            name="daily_problem",
+            description=(
+                "Load today's LeetCode daily coding challenge (UTC day), with its date and link, "
+                "in the same format as load_problem."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "language": {
+                        "type": "string",
+                        "description": (
+                            "Programming language for code snippet (e.g., 'python', 'java', "
+                            "'golang', 'cpp'). If omitted, returns all available code snippets."
+                        ),
+                    },
+                    "if_none_match": {
+                        "type": "string",
+                        "description": (
+                            "content_hash of a copy of this problem you already have (same "
+                            "language filter). If it is unchanged, a short not_modified response "
+                            "is returned instead of the full problem."
+                        ),
+                    },
+                },
+            },
+        ),
+        Tool(
+            name="server_stats",
+            description=(
+                "Report server performance metrics: upstream request queues per priority class, "
+                "prefetch hit rate and startup warm-up (if enabled) and test worker restarts."
+            ),
+            inputSchema={"type": "object", "properties": {}},
+        ),
     ]
 
 
-@app.call_tool()
-async def call_tool(name: str, arguments: Dict[str, Any]) -> list[TextContent]:
-    """Handle tool calls."""
+async def run_tool(
+    name: str, arguments: Dict[str, Any]
+) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Run a tool in this process and return its JSON-serializable result.
+
+    Each call is logged as a ``tool.call`` event with its duration and outcome.
+
+    Raises:
+        ValueError: If the tool is unknown, the arguments are invalid or the tool failed
+    """
+    started = time.perf_counter()
+    error: Optional[str] = None
+    try:
+        return await dispatch_tool(name, arguments)
+    except Exception as e:
+        error = str(e)
+        raise
+    finally:
+        log_event(
+            logger,
+            logging.INFO,
+            "tool.call",
+            tool=name,
+            arguments=sorted(arguments),
+            seconds=round(time.perf_counter() - started, 4),
+            ok=error is None,
+            error=error,
+        )
+
+
+async def dispatch_tool(
+    name: str, arguments: Dict[str, Any]
+) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+    """Run the named tool (see run_tool)."""
+    tools = get_tools()
     if name == "load_problem":
         # Casts are still useful to give types to variables from the untyped 'arguments' dict
         title_slug = cast(Union[str, None], arguments.get("title_slug"))
         problem_id = cast(Union[int, None], arguments.get("problem_id"))
         problem_name = cast(Union[str, None], arguments.get("problem_name"))
         language = cast(Union[str, None], arguments.get("language"))
+        difficulty = cast(Union[str, None], arguments.get("difficulty"))
+        tags = cast(Union[List[str], None], arguments.get("tags"))
+        search_content = cast(bool, arguments.get("search_content", False))
 
-        if not title_slug and not problem_id and not problem_name:
-            raise ValueError("Either title_slug, problem_id, or problem_name is required")
+        if not title_slug and not problem_id and not problem_name and not difficulty and not tags:
+            raise ValueError(
+                "Either title_slug, problem_id, problem_name, difficulty or tags is required"
+            )
 
         try:
-            result: Union[Dict[str, Any], List[Dict[str, Any]]] = await load_problem_tool.execute(
+            return await tools.load_problem.execute(
                 title_slug=title_slug,
                 problem_id=problem_id,
                 problem_name=problem_name,
-                language=language
+                language=language,
+                difficulty=difficulty,
+                tags=tags,
+                search_content=search_content,
+                limit=cast(int, arguments.get("limit", 10)),
+                cursor=cast(Union[str, None], arguments.get("cursor")),
+                if_none_match=cast(Union[str, None], arguments.get("if_none_match")),
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to load problem: {str(e)}") from e
+    elif name == "random_problem":
+        try:
+            return await tools.random_problem.execute(
+                difficulty=cast(Union[str, None], arguments.get("difficulty")),
+                tags=cast(Union[List[str], None], arguments.get("tags")),
+                seed=cast(Union[int, None], arguments.get("seed")),
+                fetch=bool(arguments.get("fetch", False)),
+                language=cast(Union[str, None], arguments.get("language")),
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to pick a problem: {str(e)}") from e
+    elif name == "similar_problems":
+        try:
+            return await tools.similar_problems.execute(
+                title_slug=cast(Union[str, None], arguments.get("title_slug")),
+                problem_id=cast(Union[int, None], arguments.get("problem_id")),
+                hops=cast(int, arguments.get("hops", 1)),
+                limit=cast(int, arguments.get("limit", 20)),
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to find similar problems: {str(e)}") from e
+    elif name == "scaffold_workspace":
+        workspace = cast(Union[str, None], arguments.get("workspace"))
+        if not workspace:
+            raise ValueError("workspace is required")
+        try:
+            return await tools.scaffold.execute(
+                workspace=workspace,
+                title_slugs=cast(Union[List[str], None], arguments.get("title_slugs")),
+                problem_ids=cast(Union[List[int], None], arguments.get("problem_ids")),
+                language=cast(str, arguments.get("language", "python3")),
+                overwrite=cast(bool, arguments.get("overwrite", False)),
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to scaffold workspace: {str(e)}") from e
+    elif name == "run_tests":
+        code = cast(Union[str, None], arguments.get("code"))
+        if not code:
+            raise ValueError("code is required")
+        try:
+            return await tools.run_tests.execute(
+                code=code,
+                title_slug=cast(Union[str, None], arguments.get("title_slug")),
+                problem_id=cast(Union[int, None], arguments.get("problem_id")),
+                test_input=cast(Union[str, None], arguments.get("test_input")),
+                timeout=float(cast(float, arguments.get("timeout", 2.0))),
+                memory_mb=cast(int, arguments.get("memory_mb", 256)),
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to run tests: {str(e)}") from e
+    elif name == "estimate_complexity":
+        code = cast(Union[str, None], arguments.get("code"))
+        if not code:
+            raise ValueError("code is required")
+        try:
+            return await tools.estimate_complexity.execute(
+                code=code,
+                title_slug=cast(Union[str, None], arguments.get("title_slug")),
+                problem_id=cast(Union[int, None], arguments.get("problem_id")),
+                max_seconds=float(cast(float, arguments.get("max_seconds", 10.0))),
+                max_size=cast(Union[int, None], arguments.get("max_size")),
+                memory_mb=cast(int, arguments.get("memory_mb", 512)),
+                seed=cast(int, arguments.get("seed", 0)),
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to estimate complexity: {str(e)}") from e
+    elif name == "generate_stress_input":
+        try:
+            return await tools.stress_input.execute(
+                title_slug=cast(Union[str, None], arguments.get("title_slug")),
+                problem_id=cast(Union[int, None], arguments.get("problem_id")),
+                scale=float(cast(float, arguments.get("scale", 1.0))),
+                seed=cast(int, arguments.get("seed", 0)),
+                output_path=cast(Union[str, None], arguments.get("output_path")),
             )
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2),
-                )
-            ]
         except Exception as e:
-            raise ValueError(f"Failed to load problem: {str(e)}")
+            raise ValueError(f"Failed to generate stress input: {str(e)}") from e
+    elif name == "load_problem_list":
+        slug = cast(Union[str, None], arguments.get("slug"))
+        if not slug:
+            raise ValueError("slug is required")
+        try:
+            return await tools.problem_list.execute(
+                slug=slug,
+                kind=cast(str, arguments.get("kind", "study_plan")),
+                language=cast(str, arguments.get("language", "python3")),
+                include_description=cast(bool, arguments.get("include_description", True)),
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to load problem list: {str(e)}") from e
+    elif name == "daily_problem":
+        try:
+            return await tools.daily_problem.execute(
+                language=cast(Union[str, None], arguments.get("language")),
+                if_none_match=cast(Union[str, None], arguments.get("if_none_match")),
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to load the daily problem: {str(e)}") from e
+    elif name == "server_stats":
+        prefetcher = tools.load_problem.prefetcher
+        return {
+            "upstream_queues": {
+                priority: stats.model_dump()
+                for priority, stats in tools.client.scheduler.metrics().items()
+            },
+            "prefetch": prefetcher.metrics() if prefetcher is not None else None,
+            "warmup": (
+                tools.load_problem.warmup.metrics()
+                if tools.load_problem.warmup is not None
+                else None
+            ),
+            "test_workers": tools.test_pool.metrics(),
+        }
     else:
         raise ValueError(f"Unknown tool: {name}")
 
 
-async def async_main() -> None:
-    """Run the MCP server."""
-    # Preload the problem cache on startup to hide latency
-    await load_problem_tool.initialize()
+# Set in shim mode: tool calls are forwarded to the shared daemon
+daemon_client: Optional[DaemonClient] = None
+
+# Tools without side effects, which a shim may resend if the daemon connection
+# drops mid-call; the others write files or run code
+READ_ONLY_TOOLS = frozenset(
+    {
+        "load_problem",
+        "random_problem",
+        "similar_problems",
+        "load_problem_list",
+        "daily_problem",
+        "server_stats",
+    }
+)
+
+# Caps tool calls in flight across all sessions; further calls wait their turn
+tool_call_slots: Optional[asyncio.Semaphore] = None
+
 
+def get_tool_call_slots() -> asyncio.Semaphore:
+    """
+    The process's tool call limit, read from INTERVIEW_PREP_MAX_CONCURRENT_CALLS
+    on first use.
+
+    Raises:
+        ValueError: If the setting is not a positive integer
+    """
+    global tool_call_slots
+    if tool_call_slots is None:
+        tool_call_slots = asyncio.Semaphore(env_int("INTERVIEW_PREP_MAX_CONCURRENT_CALLS", 32))
+    return tool_call_slots
+
+
+@app.call_tool()
+async def call_tool(name: str, arguments: Dict[str, Any]) -> list[TextContent]:
+    """Handle tool calls."""
+    result: object
+    async with get_tool_call_slots():
+        if daemon_client is not None:
+            try:
+                result = await daemon_client.call(name, absolute_paths(arguments))
+            except DaemonError as e:
+                raise ValueError(str(e)) from e
+        else:
+            result = await run_tool(name, arguments)
+    return [
+        TextContent(
+            type="text",
+            text=json.dumps(result, indent=2),
+        )
+    ]
+
+
+async def run_stdio() -> None:
+    """Serve MCP over stdio until the client disconnects."""
     async with stdio_server() as streams:
         read_stream, write_stream = streams
         await app.run(
@@ -94,10 +828,222 @@ async def async_main() -> None:
         )
 
 
+async def async_main() -> None:
+    """Run the MCP server."""
+    global daemon_client
+
+    if env_flag("INTERVIEW_PREP_DAEMON"):
+        # Thin shim: the daemon owns the client and its caches
+        daemon_client = DaemonClient(env_socket_path(), read_only_tools=READ_ONLY_TOOLS)
+        try:
+            await run_stdio()
+        finally:
+            await daemon_client.aclose()
+        return
+
+    # Preload the problem cache on startup to hide latency
+    tools = get_tools()
+    await tools.load_problem.initialize()
+
+    try:
+        await run_stdio()
+    finally:
+        await tools.client.aclose()
+
+
+async def async_daemon_main(socket_path: Path) -> None:
+    """Run the shared daemon that serves tool calls for stdio shims."""
+    tools = get_tools()
+    try:
+        await serve(socket_path, run_tool, started=tools.load_problem.initialize)
+    finally:
+        await tools.client.aclose()
+
+
+def create_http_app(stateless: bool = False) -> Starlette:
+    """
+    Build the ASGI app serving MCP over HTTP to any number of clients.
+
+    All sessions share this process's client, so the catalog is built once and
+    upstream requests reuse one connection pool. Endpoints:
+
+    - ``/mcp``: Streamable HTTP (current MCP spec)
+    - ``/sse`` + ``/messages/``: HTTP+SSE (older clients; not in stateless mode)
+
+    Args:
+        stateless: Keep no session state between requests, so any worker
+            process can answer any request
+    """
+    # Tools send no progress notifications, so answer each POST with plain JSON
+    # rather than opening an SSE stream per request
+    session_manager = StreamableHTTPSessionManager(app=app, json_response=True, stateless=stateless)
+    sse = SseServerTransport("/messages/")
+
+    async def handle_sse(request: Request) -> Response:
+        async with sse.connect_sse(request.scope, request.receive, request._send) as streams:
+            await app.run(streams[0], streams[1], app.create_initialization_options())
+        return Response()
+
+    @asynccontextmanager
+    async def lifespan(_: Starlette) -> AsyncIterator[None]:
+        # Preload the problem cache before accepting sessions
+        tools = get_tools()
+        await tools.load_problem.initialize()
+        try:
+            async with session_manager.run():
+                yield
+        finally:
+            await tools.client.aclose()
+
+    routes: List[Union[Route, Mount]] = [
+        Route("/mcp", endpoint=StreamableHTTPASGIApp(session_manager))
+    ]
+    if not stateless:
+        routes.append(Route("/sse", endpoint=handle_sse, methods=["GET"]))
+        routes.append(Mount("/messages/", app=sse.handle_post_message))
+    return Starlette(routes=routes, lifespan=lifespan)
+
+
+class ClosedStreamFilter(logging.Filter):
+    """
+    Drop the "Error in message router" traceback the MCP SDK logs after every
+    stateless request, when the finished request's stream is closed under it.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return not (record.exc_info and isinstance(record.exc_info[1], anyio.ClosedResourceError))
+
+
+async def index_similar() -> None:
+    """Collect similar questions for the whole catalog into the shared store."""
+    client = get_tools().client
+    if client.store is None:
+        raise SystemExit(
+            "--index-similar needs INTERVIEW_PREP_STORE so the index outlives this process"
+        )
+    try:
+        collected = await client.collect_similar_questions()
+        print(f"Collected similar questions for {collected} problems", file=sys.stderr)
+    finally:
+        await client.aclose()
+
+
+async def warm_catalog() -> None:
+    """Build the catalog and warm the cache, then release the connections (used before forking)."""
+    tools = get_tools()
+    try:
+        await tools.load_problem.initialize(wait_for_warmup=True)
+    finally:
+        await tools.client.aclose()
+
+
+def run_http(host: str, port: int, max_connections: Optional[int], workers: int = 1) -> None:
+    """
+    Serve MCP over HTTP.
+
+    With more than one worker the catalog is built once in this process, which
+    then forks ``workers`` stateless server processes sharing one listening
+    socket and a copy-on-write snapshot of the catalog.
+
+    Args:
+        host: Interface to bind; keep the loopback default unless behind a proxy
+        port: TCP port
+        max_connections: Concurrent connections per worker beyond which new
+            requests get HTTP 503, or None for no limit
+        workers: Number of server processes
+    """
+    if workers <= 1:
+        uvicorn.run(
+            create_http_app(),
+            host=host,
+            port=port,
+            limit_concurrency=max_connections,
+            log_level="warning",
+        )
+        return
+
+    asyncio.run(warm_catalog())
+    sock = bind_socket(host, port)
+
+    def worker() -> None:
+        restart_logging_after_fork()
+        get_tools().client.reset_after_fork()
+        logging.getLogger("mcp.server.streamable_http").addFilter(ClosedStreamFilter())
+        config = uvicorn.Config(
+            create_http_app(stateless=True),
+            limit_concurrency=max_connections,
+            log_level="warning",
+        )
+        uvicorn.Server(config).run(sockets=[sock])
+
+    try:
+        run_workers(workers, worker)
+    finally:
+        sock.close()
+
+
+def env_socket_path() -> Path:
+    """Read INTERVIEW_PREP_SOCKET, defaulting to the per-user daemon socket."""
+    value = os.environ.get("INTERVIEW_PREP_SOCKET", "").strip()
+    return Path(value).expanduser() if value else default_socket_path()
+
+
 def main() -> None:  # Added return type
     """Entry point for the MCP server."""
-    asyncio.run(async_main())
+    parser = argparse.ArgumentParser(prog="interview-prep-mcp", description=__doc__)
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="run the shared daemon that stdio shims (INTERVIEW_PREP_DAEMON=1) forward to",
+    )
+    parser.add_argument(
+        "--socket", type=Path, help="daemon socket path (default: INTERVIEW_PREP_SOCKET)"
+    )
+    parser.add_argument(
+        "--http",
+        action="store_true",
+        help="serve Streamable HTTP on /mcp and SSE on /sse instead of stdio",
+    )
+    parser.add_argument(
+        "--host", default="127.0.0.1", help="HTTP bind address (default: 127.0.0.1)"
+    )
+    parser.add_argument("--port", type=int, default=8000, help="HTTP port (default: 8000)")
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        help="reject requests with 503 beyond this many open HTTP connections",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="HTTP worker processes sharing one socket and one catalog build (default: 1)",
+    )
+    parser.add_argument(
+        "--index-similar",
+        action="store_true",
+        help=(
+            "collect similar questions for every catalog problem into INTERVIEW_PREP_STORE, then "
+            "exit"
+        ),
+    )
+    args = parser.parse_args()
+    env_logging()
+    try:
+        # Fail at startup, not on the first tool call
+        get_tool_call_slots()
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.index_similar:
+        asyncio.run(index_similar())
+    elif args.http:
+        run_http(args.host, args.port, args.max_connections, args.workers)
+    elif args.daemon:
+        asyncio.run(async_daemon_main(args.socket or env_socket_path()))
+    else:
+        asyncio.run(async_main())
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
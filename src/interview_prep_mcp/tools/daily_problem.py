@@ -0,0 +1,88 @@
+"""Tool for loading LeetCode's daily coding challenge."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any
+from ..leetcode.client import DAILY_RETRY_SECONDS, utc_today
+from ..leetcode.scheduler import Priority
+from .load_problem import LoadProblemTool
+
+# The next day's challenge is fetched this long after midnight UTC, when
+# LeetCode has published it but before most users ask for it
+PREWARM_DELAY_SECONDS = 120
+# Tries per night if LeetCode still reports the previous day's challenge
+PREWARM_ATTEMPTS = 10
+
+
+def seconds_until_prewarm(now: Optional[datetime] = None) -> float:
+    """Seconds from ``now`` (UTC) until PREWARM_DELAY_SECONDS past the next midnight."""
+    now = now if now is not None else datetime.now(timezone.utc)
+    midnight = datetime.combine(
+        now.date() + timedelta(days=1), datetime.min.time(), tzinfo=timezone.utc
+    )
+    return (midnight - now).total_seconds() + PREWARM_DELAY_SECONDS
+
+
+class DailyProblemTool:
+    """Tool for loading today's daily coding challenge, cached for the whole day."""
+
+    def __init__(self, loader: Optional[LoadProblemTool] = None) -> None:
+        """
+        Args:
+            loader: Tool used to format the problem (a new one by default)
+        """
+        self.loader = loader if loader is not None else LoadProblemTool()
+        self.client = self.loader.client
+        self._prewarm_task: Optional["asyncio.Task[None]"] = None
+
+    async def execute(
+        self, language: Optional[str] = None, if_none_match: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Load today's daily challenge.
+
+        The first call of a UTC day asks LeetCode; every other call that day
+        is answered from memory. The first call also starts a background
+        task that fetches each next day's challenge shortly after midnight.
+
+        Args:
+            language: Optional programming language filter for code snippets
+            if_none_match: content_hash of a copy the caller already has
+
+        Returns:
+            The formatted problem (as load_problem returns it) with the
+            challenge's date and link
+
+        Raises:
+            ValueError: If LeetCode reports no daily challenge
+        """
+        self.start()
+        daily = await self.client.fetch_daily_challenge()
+        if daily is None:
+            raise ValueError("LeetCode reports no daily challenge")
+        challenge, problem = daily
+        result = self.loader.format_response(problem, language, if_none_match)
+        result["date"] = challenge.date
+        result["link"] = challenge.link
+        return result
+
+    def start(self) -> None:
+        """Start pre-warming each next day's challenge, unless already running."""
+        if self._prewarm_task is None or self._prewarm_task.done():
+            self._prewarm_task = asyncio.get_running_loop().create_task(self._prewarm_forever())
+
+    async def _prewarm_forever(self) -> None:
+        while True:
+            await asyncio.sleep(seconds_until_prewarm())
+            await self.prewarm()
+
+    async def prewarm(self) -> None:
+        """Fetch today's challenge at background priority until LeetCode has published it."""
+        for _ in range(PREWARM_ATTEMPTS):
+            try:
+                daily = await self.client.fetch_daily_challenge(Priority.BACKGROUND)
+            except Exception:
+                daily = None
+            if daily is not None and daily[0].date >= utc_today():
+                return
+            await asyncio.sleep(DAILY_RETRY_SECONDS)
@@ -0,0 +1,166 @@
+"""Tool for estimating a solution's time complexity from timings on growing inputs."""
+
+import asyncio
+import json
+from typing import Optional, Dict, List, Any
+from ..leetcode.client import LeetCodeClient
+from ..runner.cases import parse_signature, split_cases
+from ..runner.complexity import (
+    CONSISTENT_MARGIN,
+    best_fit,
+    fit_models,
+    is_grid,
+    measure,
+    size_parameters,
+)
+from ..runner.constraints import size_limit
+from ..runner.pool import WorkerPool
+
+MAX_BUDGET_SECONDS = 60.0
+MAX_SIZE = 1_000_000
+# LeetCode's limits are per test file, but a solution predicted to take longer
+# than this on one maximal input locally is unlikely to pass
+TIME_LIMIT_SECONDS = 1.0
+
+
+class EstimateComplexityTool:
+    """Tool for estimating the time complexity of Python solutions empirically."""
+
+    def __init__(
+        self, client: Optional[LeetCodeClient] = None, pool: Optional[WorkerPool] = None
+    ) -> None:
+        """
+        Args:
+            client: LeetCode client to use (a new one by default)
+            pool: Worker processes to time solutions in (a new pool of 2 by default)
+        """
+        self.client = client if client is not None else LeetCodeClient()
+        self.pool = pool if pool is not None else WorkerPool()
+
+    async def execute(
+        self,
+        code: str,
+        title_slug: Optional[str] = None,
+        problem_id: Optional[int] = None,
+        max_seconds: float = 10.0,
+        max_size: Optional[int] = None,
+        memory_mb: int = 512,
+        seed: int = 0,
+    ) -> Dict[str, Any]:
+        """
+        Time a Python solution on inputs of growing size and fit complexity models.
+
+        Inputs are generated in the shape of the problem's first example
+        (lists and strings grow, drawing values from the example), at sizes
+        growing by sqrt(2) up to the problem's size constraint, until the time
+        budget runs out or a run times out.
+
+        Args:
+            code: Python source defining ``class Solution``
+            title_slug: The URL-friendly slug of the problem (e.g., "two-sum")
+            problem_id: The frontend ID of the problem (e.g., 1)
+            max_seconds: Total time to spend measuring
+            max_size: Largest input size to try (default: the problem's
+                      constraint, at most 1,000,000)
+            memory_mb: Memory each run may allocate
+            seed: Seed of the input generator
+
+        Returns:
+            Dictionary with the likely complexity class, the fitted models,
+            the timings, and the predicted time at the constraint's maximum
+
+        Raises:
+            ValueError: If the problem is not found or cannot be run, the
+                        arguments are invalid, or too few sizes finished
+        """
+        if not code.strip():
+            raise ValueError("code must not be empty")
+        if not title_slug and not problem_id:
+            raise ValueError("Either title_slug or problem_id must be provided")
+        if not 0 < max_seconds <= MAX_BUDGET_SECONDS:
+            raise ValueError(f"max_seconds must be between 0 and {MAX_BUDGET_SECONDS:g}")
+        if max_size is not None and not 1 <= max_size <= MAX_SIZE:
+            raise ValueError(f"max_size must be between 1 and {MAX_SIZE:,}")
+
+        if problem_id:
+            problem = await self.client.fetch_problem_by_id(problem_id)
+        else:
+            assert title_slug is not None
+            problem = await self.client.fetch_problem(title_slug)
+        if problem is None:
+            raise ValueError(f"Problem not found: {title_slug or f'ID {problem_id}'}")
+        template = problem.code_snippet("python3")
+        if template is None:
+            raise ValueError(f"{problem.titleSlug} has no Python3 template")
+
+        signature = parse_signature(template.code)
+        first = split_cases(problem.exampleTestcases or "", len(signature.params))[0]
+        try:
+            example: List[Any] = [json.loads(line) for line in first]
+        except ValueError as e:
+            raise ValueError(
+                "The example input is not JSON, so inputs cannot be generated from it"
+            ) from e
+        indexes = size_parameters(example)
+        grown = [signature.params[i] for i in indexes]
+        limit = size_limit(problem.content, grown)
+        if limit is not None and any(is_grid(example[i]) for i in indexes):
+            # n counts cells; the constraint bounds each side
+            limit *= limit
+        largest = max_size if max_size is not None else min(limit or MAX_SIZE, MAX_SIZE)
+
+        samples, stopped = await asyncio.to_thread(
+            measure,
+            self.pool,
+            code,
+            signature,
+            example,
+            largest,
+            max_seconds,
+            max_seconds,
+            memory_mb,
+            seed,
+        )
+        if len(samples) < 2:
+            reason = (
+                f" (stopped at n={stopped['n']}: {stopped.get('error', stopped['status'])})"
+                if stopped
+                else ""
+            )
+            raise ValueError(f"Too few input sizes finished to estimate complexity{reason}")
+
+        fits = fit_models(samples)
+        best = best_fit(fits, samples)
+        lowest = min(fit.error for fit in fits)
+        result: Dict[str, Any] = {
+            "title_slug": problem.titleSlug,
+            "method": signature.method,
+            "size_parameters": grown,
+            "complexity": best.model,
+            "also_consistent_with": [
+                fit.model
+                for fit in fits
+                if fit.model != best.model
+                and best.model != "O(1)"
+                and fit.error <= lowest * CONSISTENT_MARGIN
+            ],
+            "fits": [
+                {"model": fit.model, "error": round(fit.error, 4)}
+                for fit in sorted(fits, key=lambda fit: fit.error)
+            ],
+            "samples": [{"n": sample.n, "seconds": round(sample.seconds, 6)} for sample in samples],
+            "constraint_max_n": limit,
+        }
+        if stopped is not None:
+            result["stopped"] = {
+                key: stopped[key] for key in ("n", "status", "error") if key in stopped
+            }
+        if limit is not None:
+            predicted = best.predict(limit)
+            result["predicted_seconds_at_max_n"] = round(predicted, 4) if predicted < 1e9 else None
+            # Timing out below the constraint's maximum settles it
+            timed_out = (
+                stopped is not None and stopped["status"] == "timeout" and stopped["n"] <= limit
+            )
+            result["likely_tle"] = timed_out or predicted > TIME_LIMIT_SECONDS
+        return result
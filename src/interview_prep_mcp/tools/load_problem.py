@@ -1,32 +1,75 @@
 """Tool for loading LeetCode problems."""
-from typing import Optional, Union, Dict, List, Any
+import base64
+import binascii
+import hashlib
+import json
+import time
+from typing import Optional, Union, Dict, List, Any, Tuple
 from ..leetcode.client import LeetCodeClient
 from ..leetcode.types import Problem, ProblemSummary, CodeSnippet
 from ..file_generator.naming import suggest_filename
+from .prefetch import Prefetcher
+from .warmup import Warmup
 from bs4 import BeautifulSoup
 
+# Search results per page at most
+MAX_SEARCH_LIMIT = 50
+
 
 class LoadProblemTool:
     """Tool for fetching and formatting LeetCode problems."""
 
-    def __init__(self) -> None:
-        self.client = LeetCodeClient()
+    def __init__(
+        self,
+        client: Optional[LeetCodeClient] = None,
+        prefetch: bool = False,
+        warmup: Optional[List[str]] = None,
+        warmup_concurrency: int = 4,
+    ) -> None:
+        """
+        Args:
+            client: LeetCode client to use (a new one by default)
+            prefetch: After each load, fetch likely next problems in the background
+            warmup: Manifest entries (slugs, IDs, "top N") to load when the server starts
+            warmup_concurrency: Problems the warm-up loads at once
+        """
+        self.client = client if client is not None else LeetCodeClient()
+        self.prefetcher: Optional[Prefetcher] = Prefetcher(self.client) if prefetch else None
+        self.warmup: Optional[Warmup] = (
+            Warmup(self.client, warmup, warmup_concurrency) if warmup else None
+        )
 
-    async def initialize(self) -> None:
+    async def initialize(self, wait_for_warmup: bool = False) -> None:
         """
         Initialize the tool by preloading the problem ID cache.
         This should be called when the server starts to hide latency.
+
+        Args:
+            wait_for_warmup: Finish the warm-up manifest before returning
+                             (before forking workers); by default it runs in
+                             the background
         """
-        # Trigger cache build by calling _get_slug_by_id with a dummy ID
+        # Trigger cache build by calling get_slug_by_id with a dummy ID
         # This will populate the cache for all subsequent calls
-        await self.client._get_slug_by_id(1)
+        await self.client.get_slug_by_id(1)
+        if self.warmup is not None:
+            if wait_for_warmup:
+                await self.warmup.run()
+            else:
+                self.warmup.start()
 
     async def execute(
         self,
         title_slug: Optional[str] = None,
         problem_id: Optional[int] = None,
         problem_name: Optional[str] = None,
-        language: Optional[str] = None
+        language: Optional[str] = None,
+        difficulty: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        search_content: bool = False,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        if_none_match: Optional[str] = None,
     ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
         """
         Load a LeetCode problem by its title slug, problem ID, or name.
@@ -37,36 +80,91 @@ class LoadProblemTool:
             problem_name: Search query for problem name/title (e.g., "two sum")
             language: Optional language for code snippet (e.g., "python", "java", "golang")
                      If omitted, returns all available code snippets
+            difficulty: Restrict the name search to this difficulty (e.g., "Medium")
+            tags: Restrict the name search to problems with all of these topic tags
+                 (e.g., ["dynamic-programming"]); with no name, lists matching problems
+            search_content: Match problem_name against problem descriptions
+                           (ranked by relevance) instead of titles
+            limit: Search results per page (1 to MAX_SEARCH_LIMIT)
+            cursor: ``next_cursor`` of the previous page of the same search
+            if_none_match: ``content_hash`` of a copy of the problem the caller
+                           already has; if it is still current, only a short
+                           "not modified" response is returned
 
         Returns:
             Dictionary containing formatted problem information if single match,
             or list of dictionaries with search results if multiple matches
 
         Raises:
-            ValueError: If the problem is not found or fetch fails
+            ValueError: If the problem is not found or fetch fails, or the
+                        cursor belongs to a different search or to a content
+                        index that has since been rebuilt
         """
-        if not title_slug and not problem_id and not problem_name:
-            raise ValueError("Either title_slug, problem_id, or problem_name must be provided")
+        if not 1 <= limit <= MAX_SEARCH_LIMIT:
+            raise ValueError(f"limit must be between 1 and {MAX_SEARCH_LIMIT}")
+        filtered = bool(difficulty or tags)
+        if not title_slug and not problem_id and not problem_name and not filtered:
+            raise ValueError(
+                "Either title_slug, problem_id, or problem_name must be provided (or a "
+                "difficulty/tags filter)"
+            )
 
-        # Handle search by name
-        if problem_name:
-            matches = await self.client.search_problems(problem_name, limit=10)
+        # Handle search by name and/or filters
+        if problem_name or (filtered and not title_slug and not problem_id):
+            query = problem_name or ""
+            by_content = bool(search_content and problem_name)
+            search = self._search_key(query, difficulty, tags, by_content)
+            after, after_score, generation = (
+                self._decode_cursor(cursor, search) if cursor else (None, None, None)
+            )
+            # One extra result tells whether there is a next page
+            if by_content:
+                resume = (
+                    (after_score, after) if after is not None and after_score is not None else None
+                )
+                matches = await self.client.search_content(
+                    query,
+                    limit=limit + 1,
+                    difficulty=difficulty,
+                    tags=tags,
+                    after=resume,
+                    generation=generation,
+                )
+                # Read before the next await, so it is the generation these matches came from
+                generation = self.client.content_generation
+            elif filtered:
+                matches = await self.client.search_problems(
+                    query, limit=limit + 1, difficulty=difficulty, tags=tags, after=after
+                )
+            else:
+                matches = await self.client.search_problems(query, limit=limit + 1, after=after)
+            page = matches[:limit]
+            next_cursor = (
+                self._encode_cursor(search, page[-1], generation) if len(matches) > limit else None
+            )
 
-            if not matches:
-                raise ValueError(f"No problems found matching: {problem_name}")
+            if not page and cursor is None:
+                raise ValueError(
+                    f"No problems found matching: {self._describe_search(query, difficulty, tags)}"
+                )
 
-            # If exactly one match, load and return the full problem
-            if len(matches) == 1:
-                problem = await self.client.fetch_problem(matches[0].titleSlug)
+            # If the whole search is exactly one match, load and return the full problem
+            if len(page) == 1 and next_cursor is None and cursor is None:
+                started = time.perf_counter()
+                problem = await self.client.fetch_problem(page[0].titleSlug)
                 if problem:
-                    return self._format_problem(problem, language)
+                    self._after_load(problem, time.perf_counter() - started)
+                    return self.format_response(problem, language, if_none_match)
                 else:
-                    raise ValueError(f"Problem not found: {matches[0].titleSlug}")
+                    raise ValueError(f"Problem not found: {page[0].titleSlug}")
 
             # Multiple matches - return search results
-            return self._format_search_results(matches, problem_name)
+            return self._format_search_results(
+                page, self._describe_search(query, difficulty, tags), next_cursor
+            )
 
         # Handle fetch by ID or slug
+        started = time.perf_counter()
         if problem_id:
             problem = await self.client.fetch_problem_by_id(problem_id)
             identifier: str = f"ID {problem_id}"
@@ -78,7 +176,109 @@ class LoadProblemTool:
         if not problem:
             raise ValueError(f"Problem not found: {identifier}")
 
-        return self._format_problem(problem, language)
+        self._after_load(problem, time.perf_counter() - started)
+        return self.format_response(problem, language, if_none_match)
+
+    def _after_load(self, problem: Problem, seconds: float) -> None:
+        """Record the load for prefetch metrics and prefetch what comes next."""
+        if self.prefetcher is not None:
+            self.prefetcher.record_load(problem.titleSlug, seconds)
+            self.prefetcher.schedule(problem)
+
+    def format_response(
+        self, problem: Problem, language: Optional[str], if_none_match: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Format a problem as load_problem returns it.
+
+        Args:
+            problem: Problem to format
+            language: Only return this language's code template (all if None)
+            if_none_match: content_hash the caller already holds
+
+        Returns:
+            The formatted problem with its content_hash, a "not modified" stub
+            if if_none_match is current, or an error if the language has no
+            template
+        """
+        content_hash = self._content_hash(problem, language)
+        if content_hash is not None and if_none_match == content_hash:
+            # Skips rendering the description and serializing the snippets
+            return {
+                "not_modified": True,
+                "problem_id": problem.questionFrontendId,
+                "title_slug": problem.titleSlug,
+                "content_hash": content_hash,
+            }
+        result = self._format_problem(problem, language)
+        if content_hash is not None:
+            result["content_hash"] = content_hash
+        return result
+
+    @staticmethod
+    def _content_hash(problem: Problem, language: Optional[str]) -> Optional[str]:
+        """
+        Version of the response for a problem and language filter.
+
+        The language's snippet is part of what the caller holds, so each
+        language has its own hash. None if the language is not available.
+        """
+        if not language:
+            return problem.content_hash
+        snippet = problem.code_snippet(language)
+        return f"{problem.content_hash}-{snippet.langSlug}" if snippet is not None else None
+
+    @staticmethod
+    def _search_key(
+        query: str, difficulty: Optional[str], tags: Optional[List[str]], by_content: bool
+    ) -> str:
+        """Short fingerprint of a search, so a cursor cannot resume a different one."""
+        normalized = [query.lower(), (difficulty or "").lower(), sorted(tags or []), by_content]
+        return hashlib.sha256(json.dumps(normalized).encode()).hexdigest()[:12]
+
+    @staticmethod
+    def _encode_cursor(search: str, last: ProblemSummary, generation: Optional[int] = None) -> str:
+        """Opaque cursor resuming a search after its last returned match."""
+        position: Dict[str, Any] = {"search": search, "after": last.titleSlug}
+        if last.score is not None:
+            position["score"] = last.score
+        if generation is not None:
+            position["generation"] = generation
+        return base64.urlsafe_b64encode(json.dumps(position).encode()).decode().rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: str, search: str) -> Tuple[str, Optional[float], Optional[int]]:
+        """
+        The slug a cursor resumes after, and for content search its score and index generation.
+
+        Raises:
+            ValueError: If the cursor is malformed or from a different search
+        """
+        try:
+            position = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+            after, score, generation = (
+                str(position["after"]),
+                position.get("score"),
+                position.get("generation"),
+            )
+            generation = int(generation) if generation is not None else None
+        except (binascii.Error, ValueError, KeyError, TypeError) as e:
+            raise ValueError("Invalid cursor") from e
+        if position.get("search") != search:
+            raise ValueError(
+                "The cursor belongs to a different search; repeat the original query and filters"
+            )
+        return after, float(score) if score is not None else None, generation
+
+    @staticmethod
+    def _describe_search(query: str, difficulty: Optional[str], tags: Optional[List[str]]) -> str:
+        """Human-readable summary of a search and its filters."""
+        parts = [query] if query else []
+        if difficulty:
+            parts.append(f"difficulty={difficulty}")
+        if tags:
+            parts.append(f"tags={','.join(tags)}")
+        return " ".join(parts)
 
     def _find_code_snippet(self, problem: Problem, language: str) -> Optional[CodeSnippet]:
         """
@@ -91,41 +291,7 @@ class LoadProblemTool:
         Returns:
             CodeSnippet if found, None otherwise
         """
-        language_lower = language.lower()
-
-        # Try exact langSlug match first
-        for snippet in problem.codeSnippets:
-            if snippet.langSlug.lower() == language_lower:
-                return snippet
-
-        # Try language name match
-        for snippet in problem.codeSnippets:
-            if snippet.lang.lower() == language_lower:
-                return snippet
-
-        # Try common aliases
-        aliases = {
-            "py": "python3",
-            "python": "python3",
-            "js": "javascript",
-            "ts": "typescript",
-            "go": "golang",
-            "c++": "cpp",
-            "cplusplus": "cpp",
-            "c#": "csharp",
-            "cs": "csharp",
-            "rb": "ruby",
-            "kt": "kotlin",
-            "rs": "rust",
-        }
-
-        if language_lower in aliases:
-            target_slug = aliases[language_lower]
-            for snippet in problem.codeSnippets:
-                if snippet.langSlug.lower() == target_slug:
-                    return snippet
-
-        return None
+        return problem.code_snippet(language)
 
     def _format_problem(self, problem: Problem, language: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -190,28 +356,44 @@ class LoadProblemTool:
 
         return result
 
-    def _format_search_results(self, matches: list[ProblemSummary], query: str) -> Dict[str, Any]:
+    def _format_search_results(
+        self, matches: list[ProblemSummary], query: str, next_cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
-        Format search results for display.
+        Format a page of search results for display.
 
         Args:
             matches: List of matching problem summaries
             query: The original search query
+            next_cursor: Cursor of the next page, if there is one
 
         Returns:
             Dictionary with search results information
         """
+        formatted: List[Dict[str, Any]] = []
+        for match in matches:
+            entry: Dict[str, Any] = {
+                "problem_id": match.questionFrontendId,
+                "title": match.title,
+                "title_slug": match.titleSlug,
+                "difficulty": match.difficulty,
+                "topics": match.tags,
+                "paid_only": match.paidOnly,
+            }
+            if match.score is not None:
+                entry["score"] = round(match.score, 4)
+            formatted.append(entry)
+
+        message = (
+            f"Found {len(matches)} problems matching '{query}'. Use title_slug to load a specific "
+            "problem."
+        )
+        if next_cursor is not None:
+            message += " More matches: repeat the search with cursor=next_cursor."
         return {
             "query": query,
-            "matches": [
-                {
-                    "problem_id": match.questionFrontendId,
-                    "title": match.title,
-                    "title_slug": match.titleSlug,
-                    "difficulty": match.difficulty,
-                }
-                for match in matches
-            ],
+            "matches": formatted,
             "count": len(matches),
-            "message": f"Found {len(matches)} problems matching '{query}'. Use title_slug to load a specific problem."
-        }
\ No newline at end of file
+            "next_cursor": next_cursor,
+            "message": message,
+        }
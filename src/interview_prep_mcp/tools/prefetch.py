@@ -0,0 +1,139 @@
+"""Predictive prefetch of the problems a user is likely to load next."""
+
+import asyncio
+from collections import OrderedDict
+from typing import Dict, List, Set, Union
+from ..leetcode.catalog_index import CatalogIndex
+from ..leetcode.client import LeetCodeClient
+from ..leetcode.types import Problem
+
+
+class Prefetcher:
+    """
+    Fetches predicted next problems in the background after each load.
+
+    Predictions, in order: the original and numbered sequels of the same
+    problem (``house-robber`` -> ``house-robber-ii``, ``-iii``), the next and
+    previous problem IDs, then the following problems with the same difficulty
+    and topic tags. Only free problems present in the catalog and not already
+    cached are fetched, at most ``max_predictions`` per load, at prefetch
+    priority.
+
+    Every load is classified as a hit (it was prefetched and not yet used) or
+    a miss, and its latency recorded, so ``metrics()`` shows whether
+    prefetching actually makes loads faster.
+    """
+
+    def __init__(
+        self, client: LeetCodeClient, max_predictions: int = 3, max_tracked: int = 100
+    ) -> None:
+        self.client = client
+        self.max_predictions = max_predictions
+        self.max_tracked = max_tracked
+        # Prefetched problems not yet requested, oldest first
+        self._unused: "OrderedDict[str, None]" = OrderedDict()
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self.hits = 0
+        self.misses = 0
+        self.prefetched = 0
+        self.failed = 0
+        self.hit_seconds = 0.0
+        self.miss_seconds = 0.0
+
+    def record_load(self, title_slug: str, seconds: float) -> None:
+        """Classify a user load as a prefetch hit or miss."""
+        if title_slug in self._unused:
+            del self._unused[title_slug]
+            self.hits += 1
+            self.hit_seconds += seconds
+        else:
+            self.misses += 1
+            self.miss_seconds += seconds
+
+    async def predict(self, problem: Problem) -> List[str]:
+        """
+        Predict the problems most likely to be loaded after ``problem``.
+
+        Returns:
+            Title slugs in the catalog, most likely first, excluding ``problem``
+        """
+        index = await self.client.load_catalog_index()
+        candidates = list(index.variants_of(problem.titleSlug))
+
+        if problem.questionFrontendId.isdigit():
+            problem_id = int(problem.questionFrontendId)
+            for neighbour in (problem_id + 1, problem_id - 1):
+                slug = await self.client.get_slug_by_id(neighbour)
+                if slug:
+                    candidates.append(slug)
+
+        if problem.topicTags:
+            candidates.extend(self._similar(index, problem))
+
+        predictions: List[str] = []
+        for slug in candidates:
+            if slug == problem.titleSlug or slug not in index.positions or slug in predictions:
+                continue
+            if index.is_paid_only(slug):
+                continue
+            predictions.append(slug)
+            if len(predictions) == self.max_predictions:
+                break
+        return predictions
+
+    def _similar(self, index: CatalogIndex, problem: Problem) -> List[str]:
+        """Problems after ``problem`` in the catalog with its difficulty and tags."""
+        mask = index.mask(
+            problem.difficulty, [tag.slug for tag in problem.topicTags], include_paid=False
+        )
+        position = index.positions.get(problem.titleSlug)
+        if position is not None:
+            # Keep only the bits after the current problem
+            mask = mask >> (position + 1) << (position + 1)
+        return [
+            match.titleSlug
+            for _, match in zip(range(self.max_predictions), index.iter_matches(mask), strict=False)
+        ]
+
+    def schedule(self, problem: Problem) -> None:
+        """Prefetch predictions for ``problem`` in the background."""
+        task = asyncio.get_running_loop().create_task(self._prefetch(problem))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _prefetch(self, problem: Problem) -> None:
+        try:
+            predictions = await self.predict(problem)
+        except Exception:
+            return
+        for slug in predictions:
+            if slug in self._unused or self.client.is_cached(slug):
+                continue
+            if await self.client.prefetch_problem(slug):
+                self.prefetched += 1
+                self._unused[slug] = None
+                while len(self._unused) > self.max_tracked:
+                    self._unused.popitem(last=False)
+            else:
+                self.failed += 1
+
+    def metrics(self) -> Dict[str, Union[int, float, None]]:
+        """
+        Prefetch effectiveness.
+
+        ``hit_rate`` is the share of loads served by a prefetch, ``precision``
+        the share of prefetched problems that were then loaded; the mean
+        latencies compare hits with misses.
+        """
+        loads = self.hits + self.misses
+        return {
+            "loads": loads,
+            "hits": self.hits,
+            "misses": self.misses,
+            "prefetched": self.prefetched,
+            "failed": self.failed,
+            "hit_rate": self.hits / loads if loads else None,
+            "precision": self.hits / self.prefetched if self.prefetched else None,
+            "mean_hit_seconds": self.hit_seconds / self.hits if self.hits else None,
+            "mean_miss_seconds": self.miss_seconds / self.misses if self.misses else None,
+        }
@@ -0,0 +1,118 @@
+"""Tool for loading every problem of a study plan or problem list."""
+
+import asyncio
+from typing import Optional, Dict, List, Any, cast, get_args
+from ..leetcode.client import ProblemListKind
+from ..leetcode.scheduler import Priority
+from ..leetcode.types import Problem
+from .load_problem import LoadProblemTool
+
+# Problems fetched at once; the rest wait, so a large list cannot crowd out
+# other sessions' requests
+DEFAULT_CONCURRENCY = 8
+
+
+class ProblemListTool:
+    """Tool for loading a whole study plan or problem list in one call."""
+
+    def __init__(
+        self, loader: Optional[LoadProblemTool] = None, concurrency: int = DEFAULT_CONCURRENCY
+    ) -> None:
+        """
+        Args:
+            loader: Tool used to format the loaded problems (a new one by default)
+            concurrency: Problems fetched at once
+        """
+        self.loader = loader if loader is not None else LoadProblemTool()
+        self.client = self.loader.client
+        self.concurrency = concurrency
+
+    async def execute(
+        self,
+        slug: str,
+        kind: str = "study_plan",
+        language: str = "python3",
+        include_description: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Load every problem of a study plan or public problem list.
+
+        The definition is fetched with one GraphQL request (one per 100
+        problems for lists), then the problems are loaded ``concurrency`` at
+        a time; cached and stored problems cost nothing. A problem that fails
+        to load is reported in ``errors`` instead of failing the batch.
+
+        Args:
+            slug: Plan or list slug, as in leetcode.com/studyplan/<slug> or
+                  leetcode.com/problem-list/<slug>
+            kind: "study_plan" or "list"
+            language: Language of the one code template returned per problem
+            include_description: Include each problem's description (off for
+                                 just templates, examples and hints)
+
+        Returns:
+            Dictionary with the plan or list, its problems in order (each
+            formatted as by load_problem for one language, with its
+            content_hash), and per-problem errors
+
+        Raises:
+            ValueError: If the kind is invalid or the plan or list is not found
+        """
+        if kind not in get_args(ProblemListKind):
+            raise ValueError(f"kind must be 'study_plan' or 'list', got {kind!r}")
+
+        problem_list = await self.client.fetch_problem_list(slug, cast(ProblemListKind, kind))
+        if problem_list is None:
+            raise ValueError(
+                f"{'Study plan' if kind == 'study_plan' else 'Problem list'} not found: {slug}"
+            )
+        title_slugs = problem_list.title_slugs
+        group_of = {
+            title_slug: group.name
+            for group in reversed(problem_list.groups)
+            for title_slug in group.titleSlugs
+        }
+        index = await self.client.load_catalog_index()
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def load(title_slug: str) -> Optional[Problem]:
+            if index.is_paid_only(title_slug):
+                raise ValueError("Premium problem")
+            async with semaphore:
+                return await self.client.fetch_problem(title_slug, Priority.BACKGROUND)
+
+        loaded = await asyncio.gather(
+            *(load(title_slug) for title_slug in title_slugs), return_exceptions=True
+        )
+
+        problems: List[Dict[str, Any]] = []
+        errors: List[Dict[str, str]] = []
+        for title_slug, outcome in zip(title_slugs, loaded, strict=True):
+            if isinstance(outcome, BaseException):
+                errors.append(
+                    {"problem": title_slug, "error": str(outcome) or type(outcome).__name__}
+                )
+                continue
+            if outcome is None:
+                errors.append({"problem": title_slug, "error": "Problem not found"})
+                continue
+            formatted = self.loader.format_response(outcome, language)
+            if "error" in formatted:
+                errors.append({"problem": title_slug, "error": formatted["error"]})
+                continue
+            if not include_description:
+                del formatted["description"]
+            if len(problem_list.groups) > 1:
+                formatted["group"] = group_of[title_slug]
+            problems.append(formatted)
+
+        return {
+            "kind": problem_list.kind,
+            "slug": problem_list.slug,
+            "name": problem_list.name,
+            "total": len(title_slugs),
+            "loaded": len(problems),
+            "problems": problems,
+            "errors": errors,
+        }
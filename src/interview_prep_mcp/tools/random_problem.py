@@ -0,0 +1,73 @@
+"""Tool for picking a random LeetCode problem."""
+
+import random
+from typing import Optional, Dict, List, Any
+from .load_problem import LoadProblemTool
+
+
+class RandomProblemTool:
+    """Tool for picking a random free problem, optionally filtered by difficulty and tags."""
+
+    def __init__(self, loader: Optional[LoadProblemTool] = None) -> None:
+        """
+        Args:
+            loader: Tool used to fetch and format the picked problem (a new one by default)
+        """
+        self.loader = loader if loader is not None else LoadProblemTool()
+        self.client = self.loader.client
+        self._rng = random.Random()
+
+    async def execute(
+        self,
+        difficulty: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        seed: Optional[int] = None,
+        fetch: bool = False,
+        language: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Pick a problem uniformly at random among the free problems matching the filters.
+
+        Args:
+            difficulty: Only pick problems of this difficulty (e.g., "Medium")
+            tags: Only pick problems with all of these topic tags (e.g., ["graph"])
+            seed: Makes the pick deterministic: the same seed, filters and
+                  catalog always give the same problem
+            fetch: Load the full problem instead of returning a summary
+            language: Language for the code snippet when fetching
+
+        Returns:
+            Summary of the picked problem (or the full problem if ``fetch``),
+            with the number of candidates it was picked from
+
+        Raises:
+            ValueError: If no free problem matches the filters
+        """
+        index = await self.client.load_catalog_index()
+        candidates = index.free_positions(difficulty, tags)
+        if not candidates:
+            raise ValueError(
+                f"No free problems match difficulty={difficulty or 'any'}, tags={tags or []}"
+            )
+
+        rng = random.Random(seed) if seed is not None else self._rng
+        problem = index.problems[candidates[rng.randrange(len(candidates))]]
+
+        if fetch:
+            loaded = await self.loader.execute(title_slug=problem.titleSlug, language=language)
+            assert isinstance(loaded, dict), "Loading by slug returns a single problem"
+            result = loaded
+        else:
+            result = {
+                "problem_id": problem.questionFrontendId,
+                "title": problem.title,
+                "title_slug": problem.titleSlug,
+                "difficulty": problem.difficulty,
+                "topics": problem.tags,
+                "message": (
+                    "Use load_problem with this title_slug (or fetch=true) to load the full "
+                    "problem."
+                ),
+            }
+        result["candidates"] = len(candidates)
+        return result
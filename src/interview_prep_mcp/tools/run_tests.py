@@ -0,0 +1,145 @@
+"""Tool for running a solution against a problem's example test cases."""
+
+import asyncio
+import time
+from typing import Optional, Dict, List, Any
+from ..leetcode.client import LeetCodeClient
+from ..runner.cases import (
+    expected_outputs,
+    outputs_match,
+    parse_expected,
+    parse_signature,
+    split_cases,
+)
+from ..runner.pool import WorkerPool
+
+MAX_TIMEOUT_SECONDS = 10.0
+MIN_MEMORY_MB = 16
+MAX_MEMORY_MB = 2048
+MAX_CASES = 100
+
+
+class RunTestsTool:
+    """Tool for running Python solutions locally in a pool of warm worker processes."""
+
+    def __init__(
+        self, client: Optional[LeetCodeClient] = None, pool: Optional[WorkerPool] = None
+    ) -> None:
+        """
+        Args:
+            client: LeetCode client to use (a new one by default)
+            pool: Worker processes to run solutions in (a new pool of 2 by default)
+        """
+        self.client = client if client is not None else LeetCodeClient()
+        self.pool = pool if pool is not None else WorkerPool()
+
+    async def execute(
+        self,
+        code: str,
+        title_slug: Optional[str] = None,
+        problem_id: Optional[int] = None,
+        test_input: Optional[str] = None,
+        timeout: float = 2.0,
+        memory_mb: int = 256,
+    ) -> Dict[str, Any]:
+        """
+        Run a Python solution against a problem's examples (or custom input).
+
+        Example inputs come from the problem's ``exampleTestcases`` and expected
+        outputs from the "Output:" lines of its description; custom input has
+        no expected outputs, so its cases are only run.
+
+        Args:
+            code: Python source defining ``class Solution``
+            title_slug: The URL-friendly slug of the problem (e.g., "two-sum")
+            problem_id: The frontend ID of the problem (e.g., 1)
+            test_input: Custom input in LeetCode's format: one JSON value per
+                        argument per line
+            timeout: Seconds each case may run
+            memory_mb: Memory each run may allocate
+
+        Returns:
+            Dictionary with per-case status, output, expected output and
+            timing, and pass/fail counts
+
+        Raises:
+            ValueError: If the problem is not found or cannot be run, the
+                        arguments are invalid, or the solution fails to load
+        """
+        if not code.strip():
+            raise ValueError("code must not be empty")
+        if not title_slug and not problem_id:
+            raise ValueError("Either title_slug or problem_id must be provided")
+        if not 0 < timeout <= MAX_TIMEOUT_SECONDS:
+            raise ValueError(f"timeout must be between 0 and {MAX_TIMEOUT_SECONDS:g} seconds")
+        if not MIN_MEMORY_MB <= memory_mb <= MAX_MEMORY_MB:
+            raise ValueError(f"memory_mb must be between {MIN_MEMORY_MB} and {MAX_MEMORY_MB}")
+
+        if problem_id:
+            problem = await self.client.fetch_problem_by_id(problem_id)
+        else:
+            assert title_slug is not None
+            problem = await self.client.fetch_problem(title_slug)
+        if problem is None:
+            raise ValueError(f"Problem not found: {title_slug or f'ID {problem_id}'}")
+        template = problem.code_snippet("python3")
+        if template is None:
+            raise ValueError(f"{problem.titleSlug} has no Python3 template")
+
+        signature = parse_signature(template.code)
+        cases = split_cases(
+            test_input if test_input is not None else problem.exampleTestcases or "",
+            len(signature.params),
+        )
+        if len(cases) > MAX_CASES:
+            raise ValueError(f"At most {MAX_CASES} cases can be run at once")
+        expected = expected_outputs(problem.content) if test_input is None else []
+        if len(expected) != len(cases):
+            # Descriptions that do not line up with the inputs are not guessed at
+            expected = []
+
+        started = time.perf_counter()
+        results = await asyncio.to_thread(
+            self.pool.run,
+            code,
+            signature.method,
+            signature.annotations,
+            signature.returns,
+            cases,
+            timeout,
+            memory_mb,
+        )
+        wall_seconds = time.perf_counter() - started
+
+        entries: List[Dict[str, Any]] = []
+        counts: Dict[str, int] = {}
+        for number, (lines, result) in enumerate(zip(cases, results, strict=True), start=1):
+            inputs = dict(zip(signature.params, lines, strict=False))
+            entry: Dict[str, Any] = {"case": number, "input": inputs}
+            status = str(result["status"])
+            if status == "ok":
+                entry["output"] = result["output"]
+                if expected:
+                    wanted = parse_expected(expected[number - 1])
+                    entry["expected"] = wanted
+                    status = "passed" if outputs_match(result["output"], wanted) else "failed"
+                else:
+                    status = "ran"
+            entry["status"] = status
+            if "error" in result:
+                entry["error"] = result["error"]
+            if "seconds" in result:
+                entry["seconds"] = round(float(result["seconds"]), 6)
+            if result.get("stdout"):
+                entry["stdout"] = result["stdout"]
+            counts[status] = counts.get(status, 0) + 1
+            entries.append(entry)
+
+        return {
+            "title_slug": problem.titleSlug,
+            "method": signature.method,
+            "cases": entries,
+            "counts": counts,
+            "all_passed": bool(expected) and counts.get("passed", 0) == len(cases),
+            "wall_seconds": round(wall_seconds, 4),
+        }
@@ -0,0 +1,130 @@
+"""Tool for scaffolding solution stubs for many problems at once."""
+
+import asyncio
+from pathlib import Path
+from typing import Optional, Dict, List, Any, Tuple
+from ..file_generator.scaffold import WorkspaceScaffold, render_stub, stub_filename
+from ..languages import Language, resolve_language
+from ..leetcode.client import LeetCodeClient
+from ..leetcode.scheduler import Priority
+from ..leetcode.types import Problem
+
+# One call covers a study plan or a large list, not the whole catalog
+MAX_SCAFFOLD_PROBLEMS = 1000
+
+
+class ScaffoldTool:
+    """Tool for writing solution stubs for a list of problems into a workspace."""
+
+    def __init__(self, client: Optional[LeetCodeClient] = None, max_workers: int = 8) -> None:
+        """
+        Args:
+            client: LeetCode client to use (a new one by default)
+            max_workers: Threads used for file I/O
+        """
+        self.client = client if client is not None else LeetCodeClient()
+        self.max_workers = max_workers
+
+    async def execute(
+        self,
+        workspace: str,
+        title_slugs: Optional[List[str]] = None,
+        problem_ids: Optional[List[int]] = None,
+        language: str = "python3",
+        overwrite: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Write a stub (description header, example tests and code template) per problem.
+
+        Problems are fetched concurrently at background priority (cached and
+        stored problems cost nothing). Rerunning is cheap: stubs whose content
+        is unchanged are skipped, and stubs edited since they were generated
+        are kept unless ``overwrite`` is set.
+
+        Args:
+            workspace: Directory to write into (created if missing)
+            title_slugs: Problems to scaffold by slug
+            problem_ids: Problems to scaffold by frontend ID
+            language: Language of the stubs (slug, name or alias)
+            overwrite: Replace stubs that were edited since they were generated
+
+        Returns:
+            Dictionary with each file's outcome, counts per outcome, and
+            per-problem errors
+
+        Raises:
+            ValueError: If no problems are given, there are too many, or the
+                        language is unknown
+        """
+        requested: List[str] = list(title_slugs or []) + [
+            f"ID {problem_id}" for problem_id in problem_ids or []
+        ]
+        if not requested:
+            raise ValueError("Either title_slugs or problem_ids must be provided")
+        if len(requested) > MAX_SCAFFOLD_PROBLEMS:
+            raise ValueError(f"At most {MAX_SCAFFOLD_PROBLEMS} problems can be scaffolded at once")
+        registered = resolve_language(language)
+        if registered is None:
+            raise ValueError(f"Unknown language: {language}")
+
+        fetched = await asyncio.gather(
+            *(self._fetch(item) for item in requested), return_exceptions=True
+        )
+        problems: List[Problem] = []
+        errors: List[Dict[str, str]] = []
+        for item, outcome in zip(requested, fetched, strict=True):
+            if isinstance(outcome, Problem):
+                problems.append(outcome)
+            else:
+                message = (
+                    str(outcome) if isinstance(outcome, BaseException) else "Problem not found"
+                )
+                errors.append({"problem": item, "error": message})
+
+        root = Path(workspace).expanduser()
+        files, missing = await asyncio.to_thread(
+            self._scaffold, root, problems, registered, overwrite
+        )
+        errors.extend(
+            {"problem": slug, "error": f"No {registered.name} template"} for slug in missing
+        )
+
+        counts: Dict[str, int] = {}
+        for entry in files:
+            counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+        return {
+            "workspace": str(root),
+            "language": registered.slug,
+            "files": files,
+            "counts": counts,
+            "errors": errors,
+        }
+
+    async def _fetch(self, item: str) -> Optional[Problem]:
+        if item.startswith("ID "):
+            return await self.client.fetch_problem_by_id(int(item[3:]), Priority.BACKGROUND)
+        return await self.client.fetch_problem(item, Priority.BACKGROUND)
+
+    def _scaffold(
+        self, root: Path, problems: List[Problem], language: Language, overwrite: bool
+    ) -> Tuple[List[Dict[str, str]], List[str]]:
+        """Render and write stubs (runs in a worker thread)."""
+        stubs: List[Tuple[str, str]] = []
+        slugs: Dict[str, str] = {}
+        missing: List[str] = []
+        for problem in problems:
+            content = render_stub(problem, language)
+            if content is None:
+                missing.append(problem.titleSlug)
+                continue
+            name = stub_filename(problem, language)
+            if name not in slugs:
+                stubs.append((name, content))
+                slugs[name] = problem.titleSlug
+
+        outcomes = WorkspaceScaffold(root, self.max_workers).write(stubs, overwrite)
+        files = [
+            {"title_slug": slugs[name], "path": name, "status": outcome}
+            for name, outcome in outcomes.items()
+        ]
+        return files, missing
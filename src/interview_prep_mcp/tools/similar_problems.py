@@ -0,0 +1,86 @@
+"""Tool for finding problems similar to a given one."""
+
+from typing import Optional, Dict, List, Any
+from ..leetcode.client import LeetCodeClient
+
+# Deeper walks reach most of the catalog and stop being "similar"
+MAX_HOPS = 3
+
+
+class SimilarProblemsTool:
+    """Tool for walking LeetCode's similar-questions links locally."""
+
+    def __init__(self, client: Optional[LeetCodeClient] = None) -> None:
+        self.client = client if client is not None else LeetCodeClient()
+
+    async def execute(
+        self,
+        title_slug: Optional[str] = None,
+        problem_id: Optional[int] = None,
+        hops: int = 1,
+        limit: int = 20,
+    ) -> Dict[str, Any]:
+        """
+        List problems within ``hops`` similar-question links of a problem.
+
+        The graph is answered from memory; the problem itself is fetched only
+        if its similar questions have not been collected yet.
+
+        Args:
+            title_slug: The URL-friendly slug of the problem (e.g., "two-sum")
+            problem_id: The frontend ID of the problem (e.g., 1)
+            hops: How many links to follow (1 = LeetCode's own list, at most 3)
+            limit: Maximum number of problems to return
+
+        Returns:
+            Dictionary with the similar problems, nearest first
+
+        Raises:
+            ValueError: If the problem is not found or the arguments are invalid
+        """
+        if not title_slug and not problem_id:
+            raise ValueError("Either title_slug or problem_id must be provided")
+        if not 1 <= hops <= MAX_HOPS:
+            raise ValueError(f"hops must be between 1 and {MAX_HOPS}")
+
+        if problem_id:
+            title_slug = await self.client.get_slug_by_id(problem_id)
+            if not title_slug:
+                raise ValueError(f"Problem not found: ID {problem_id}")
+        assert title_slug is not None
+
+        graph = await self.client.load_similar_graph()
+        if not graph.is_collected(title_slug):
+            if await self.client.fetch_problem(title_slug) is None:
+                raise ValueError(f"Problem not found: {title_slug}")
+
+        index = await self.client.load_catalog_index()
+        similar: List[Dict[str, Any]] = []
+        uncollected = 0
+        for slug, distance in graph.neighbours(title_slug, hops, limit):
+            entry: Dict[str, Any] = {"title_slug": slug, "hops": distance}
+            position = index.positions.get(slug)
+            if position is not None:
+                problem = index.problems[position]
+                entry.update(
+                    {
+                        "problem_id": problem.questionFrontendId,
+                        "title": problem.title,
+                        "difficulty": problem.difficulty,
+                        "paid_only": problem.paidOnly,
+                    }
+                )
+            if not graph.is_collected(slug):
+                uncollected += 1
+            similar.append(entry)
+
+        result: Dict[str, Any] = {
+            "title_slug": title_slug,
+            "hops": hops,
+            "similar": similar,
+            "count": len(similar),
+        }
+        if hops > 1 and uncollected:
+            # Links out of these problems are only known once they are fetched or indexed
+            result["uncollected"] = uncollected
+        return result
@@ -0,0 +1,113 @@
+"""Tool for generating maximal-size test inputs from a problem's constraints."""
+
+import asyncio
+import importlib.util
+import json
+from pathlib import Path
+from typing import Optional, Dict, List, Any
+from ..leetcode.client import LeetCodeClient
+from ..runner.cases import parse_signature, split_cases
+from ..runner.constraints import parse_constraints
+
+# Larger inputs are only written to a file: they would flood the conversation
+MAX_INLINE_CHARS = 200_000
+
+
+class StressInputTool:
+    """Tool for generating worst-case-size inputs to stress-test solutions locally."""
+
+    def __init__(self, client: Optional[LeetCodeClient] = None) -> None:
+        """
+        Args:
+            client: LeetCode client to use (a new one by default)
+        """
+        self.client = client if client is not None else LeetCodeClient()
+
+    async def execute(
+        self,
+        title_slug: Optional[str] = None,
+        problem_id: Optional[int] = None,
+        scale: float = 1.0,
+        seed: int = 0,
+        output_path: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Generate one test case as large as the problem's constraints allow.
+
+        The case is in LeetCode's input format (one JSON value per argument
+        per line), so it can be pasted into the "Testcase" box or passed to
+        run_tests.
+
+        Args:
+            title_slug: The URL-friendly slug of the problem (e.g., "two-sum")
+            problem_id: The frontend ID of the problem (e.g., 1)
+            scale: Fraction of the maximal sizes to generate, in (0, 1]
+            seed: Seed of the random generator
+            output_path: File to write the input to (required when the input
+                         is longer than MAX_INLINE_CHARS)
+
+        Returns:
+            Dictionary with the parsed constraints, how each argument was
+            generated, and the input itself or the path it was written to
+
+        Raises:
+            ImportError: If NumPy is not installed
+            ValueError: If the problem is not found or has no JSON example, or
+                        the arguments are invalid
+        """
+        if importlib.util.find_spec("numpy") is None:
+            raise ImportError(
+                "Stress inputs require NumPy: pip install 'interview-prep-mcp[stress]'"
+            )
+        from ..runner.stress import stress_case
+
+        if not title_slug and not problem_id:
+            raise ValueError("Either title_slug or problem_id must be provided")
+        if not 0 < scale <= 1:
+            raise ValueError("scale must be greater than 0 and at most 1")
+
+        if problem_id:
+            problem = await self.client.fetch_problem_by_id(problem_id)
+        else:
+            assert title_slug is not None
+            problem = await self.client.fetch_problem(title_slug)
+        if problem is None:
+            raise ValueError(f"Problem not found: {title_slug or f'ID {problem_id}'}")
+        template = problem.code_snippet("python3")
+        if template is None:
+            raise ValueError(f"{problem.titleSlug} has no Python3 template")
+
+        signature = parse_signature(template.code)
+        first = split_cases(problem.exampleTestcases or "", len(signature.params))[0]
+        try:
+            example: List[Any] = [json.loads(line) for line in first]
+        except ValueError as e:
+            raise ValueError(
+                "The example input is not JSON, so inputs cannot be generated from it"
+            ) from e
+        constraints = parse_constraints(problem.content)
+
+        lines, arguments = await asyncio.to_thread(
+            stress_case, signature, example, constraints, scale, seed
+        )
+        text = "\n".join(lines) + "\n"
+        result: Dict[str, Any] = {
+            "title_slug": problem.titleSlug,
+            "method": signature.method,
+            "constraints": constraints.model_dump(exclude_defaults=True),
+            "arguments": [argument.model_dump(exclude_defaults=True) for argument in arguments],
+            "characters": len(text),
+        }
+        if output_path is not None:
+            path = Path(output_path).expanduser()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(path.write_text, text)
+            result["output_path"] = str(path)
+        elif len(text) > MAX_INLINE_CHARS:
+            raise ValueError(
+                f"The input has {len(text):,} characters (inline limit {MAX_INLINE_CHARS:,}): "
+                "pass output_path to write it to a file, or a smaller scale"
+            )
+        else:
+            result["input"] = text
+        return result
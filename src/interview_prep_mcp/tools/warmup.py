@@ -0,0 +1,152 @@
+"""Startup warm-up of the problem cache from a manifest."""
+
+import asyncio
+import re
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+from pydantic import BaseModel
+from ..leetcode.client import LeetCodeClient
+from ..leetcode.scheduler import Priority
+
+# "top 100" or "top:100": the first free problems of the catalog
+TOP_PATTERN = re.compile(r"top[\s:]*(\d+)", re.IGNORECASE)
+SLUG_PATTERN = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
+# Per-problem errors kept in the report; the rest are only counted
+MAX_REPORTED_ERRORS = 10
+
+
+def parse_manifest(text: str) -> List[str]:
+    """
+    Entries of a warm-up manifest: title slugs, problem IDs and "top N".
+
+    Entries are separated by newlines or commas; ``#`` starts a comment.
+
+    Raises:
+        ValueError: If an entry is none of the above
+    """
+    entries: List[str] = []
+    for line in text.splitlines():
+        for entry in line.split("#", 1)[0].split(","):
+            entry = entry.strip()
+            if not entry:
+                continue
+            if not (
+                entry.isdigit() or TOP_PATTERN.fullmatch(entry) or SLUG_PATTERN.fullmatch(entry)
+            ):
+                raise ValueError(
+                    f"Invalid warm-up entry {entry!r}: expected a title slug, a problem ID or "
+                    "'top N'"
+                )
+            entries.append(entry)
+    return entries
+
+
+def read_manifest(value: str) -> List[str]:
+    """Entries of a manifest given as a file path or inline (``"top 50, lru-cache"``)."""
+    path = Path(value).expanduser()
+    if path.is_file():
+        return parse_manifest(path.read_text())
+    return parse_manifest(value)
+
+
+class WarmupReport(BaseModel):
+    """Outcome of a warm-up run."""
+
+    status: str = "running"  # "running" or "done"
+    problems: int = 0  # Distinct problems the manifest resolved to
+    memory: int = 0  # Already cached in this process
+    disk: int = 0  # Loaded from the shared store
+    network: int = 0  # Fetched from LeetCode
+    failed: int = 0
+    seconds: float = 0.0
+    disk_fraction: Optional[float] = None  # Share of the loaded problems that came from the store
+    errors: List[Dict[str, str]] = []
+
+
+class Warmup:
+    """
+    Loads a manifest's problems into the cache when the server starts.
+
+    Problems are loaded at background priority, ``concurrency`` at a time,
+    so a user's first calls overtake the warm-up instead of queueing behind
+    it. A run happens once per process (and is inherited by forked workers).
+    """
+
+    def __init__(self, client: LeetCodeClient, entries: List[str], concurrency: int = 4) -> None:
+        """
+        Args:
+            client: LeetCode client whose cache to warm
+            entries: Manifest entries (see parse_manifest)
+            concurrency: Problems loaded at once
+        """
+        self.client = client
+        self.entries = entries
+        self.concurrency = concurrency
+        self.report: Optional[WarmupReport] = None
+        self._task: Optional["asyncio.Task[WarmupReport]"] = None
+
+    def start(self) -> None:
+        """Run the warm-up in the background, unless it already ran or is running."""
+        if self._task is None and self.report is None:
+            self._task = asyncio.get_running_loop().create_task(self.run())
+
+    async def run(self) -> WarmupReport:
+        """Run the warm-up (or wait for the one in progress) and return its report."""
+        if self._task is not None and asyncio.current_task() is not self._task:
+            return await self._task
+        if self.report is not None and self.report.status == "done":
+            return self.report
+
+        report = self.report = WarmupReport()
+        started = time.perf_counter()
+        slugs = await self._resolve(report)
+        report.problems = len(slugs)
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def load(slug: str) -> None:
+            async with semaphore:
+                try:
+                    source = await self.client.preload_problem(slug, Priority.BACKGROUND)
+                except Exception as e:
+                    self._fail(report, slug, str(e) or type(e).__name__)
+                    return
+            setattr(report, source, getattr(report, source) + 1)
+
+        await asyncio.gather(*(load(slug) for slug in slugs))
+        loaded = report.memory + report.disk + report.network
+        report.disk_fraction = round(report.disk / loaded, 3) if loaded else None
+        report.seconds = round(time.perf_counter() - started, 3)
+        report.status = "done"
+        return report
+
+    async def _resolve(self, report: WarmupReport) -> List[str]:
+        """Title slugs of the manifest's problems, in order and without duplicates."""
+        index = await self.client.load_catalog_index()
+        slugs: Dict[str, None] = {}
+        for entry in self.entries:
+            top = TOP_PATTERN.fullmatch(entry)
+            if top:
+                for position in index.free_positions()[: int(top.group(1))]:
+                    slugs.setdefault(index.problems[position].titleSlug, None)
+            elif entry.isdigit():
+                slug = await self.client.get_slug_by_id(int(entry))
+                if slug is None:
+                    self._fail(report, entry, "Unknown problem ID")
+                else:
+                    slugs.setdefault(slug, None)
+            elif entry not in index.positions:
+                self._fail(report, entry, "Not in the catalog")
+            else:
+                slugs.setdefault(entry, None)
+        return list(slugs)
+
+    @staticmethod
+    def _fail(report: WarmupReport, problem: str, error: str) -> None:
+        report.failed += 1
+        if len(report.errors) < MAX_REPORTED_ERRORS:
+            report.errors.append({"problem": problem, "error": error})
+
+    def metrics(self) -> Optional[Dict[str, object]]:
+        """The warm-up report so far, or None before it started."""
+        return self.report.model_dump() if self.report is not None else None
@@ -0,0 +1,46 @@
+"""Shared helpers for tests."""
+
+from typing import Optional, Sequence
+from interview_prep_mcp.leetcode.client import LeetCodeClient
+from interview_prep_mcp.leetcode.store import ProblemStore
+from interview_prep_mcp.leetcode.types import CachedProblemInfo, CodeSnippet, Problem, TopicTag
+
+
+def make_problem(
+    slug: str = "two-sum",
+    title: Optional[str] = None,
+    frontend_id: str = "1",
+    languages: Sequence[str] = ("python3",),
+) -> Problem:
+    """
+    Build a minimal problem.
+
+    Args:
+        slug: The problem's title slug
+        title: The problem's title (derived from the slug by default)
+        frontend_id: The problem's ID
+        languages: Language slugs of its code templates
+    """
+    return Problem(
+        questionId=frontend_id,
+        questionFrontendId=frontend_id,
+        title=title if title is not None else slug.replace("-", " ").title(),
+        titleSlug=slug,
+        difficulty="Easy",
+        content="<p>Problem</p>",
+        topicTags=[TopicTag(name="Array", slug="array")],
+        codeSnippets=[
+            CodeSnippet(lang=lang, langSlug=lang, code="class Solution: ...") for lang in languages
+        ],
+        hints=["hint"],
+    )
+
+
+def make_client(
+    catalog: Sequence[CachedProblemInfo] = (), store: Optional[ProblemStore] = None
+) -> LeetCodeClient:
+    """Client with a prebuilt catalog, so ID and catalog lookups need no network."""
+    client = LeetCodeClient(store=store)
+    client._problem_cache = list(catalog)
+    client._id_to_slug_cache = {info.questionFrontendId: info.titleSlug for info in catalog}
+    return client
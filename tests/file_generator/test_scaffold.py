@@ -0,0 +1,116 @@
+"""Tests for workspace scaffolding."""
+
+from pathlib import Path
+from interview_prep_mcp.file_generator.scaffold import (
+    KEPT,
+    MANIFEST_NAME,
+    UNCHANGED,
+    UPDATED,
+    WRITTEN,
+    WorkspaceScaffold,
+    render_stub,
+)
+from interview_prep_mcp.languages import resolve_language, Language
+from interview_prep_mcp.leetcode.types import CodeSnippet, Problem
+
+
+def language(name: str) -> Language:
+    registered = resolve_language(name)
+    assert registered is not None
+    return registered
+
+
+def two_sum() -> Problem:
+    return Problem(
+        questionId="1",
+        questionFrontendId="1",
+        title="Two Sum",
+        titleSlug="two-sum",
+        difficulty="Easy",
+        content=(
+            "<p>Given an array of integers <code>nums</code>&nbsp;and a target.</p>\n<p>&nbsp;</p>"
+        ),
+        topicTags=[],
+        exampleTestcases="[2,7,11,15]\n9",
+        codeSnippets=[
+            CodeSnippet(lang="Python3", langSlug="python3", code="class Solution:\n    pass\n"),
+            CodeSnippet(
+                lang="Go", langSlug="golang", code="func twoSum(nums []int, target int) []int {\n}"
+            ),
+        ],
+    )
+
+
+class TestRenderStub:
+    """Tests for render_stub."""
+
+    def test_commented_header_then_template(self) -> None:
+        """Test the stub layout and the language's comment syntax."""
+        stub = render_stub(two_sum(), language("python3"))
+
+        assert stub == (
+            "# 1. Two Sum (Easy)\n"
+            "# https://leetcode.com/problems/two-sum/\n"
+            "#\n"
+            "# Given an array of integers\n"
+            "# nums\n"
+            "# and a target.\n"
+            "#\n"
+            "# Example test cases:\n"
+            "#   [2,7,11,15]\n"
+            "#   9\n"
+            "\n"
+            "class Solution:\n"
+            "    pass\n"
+        )
+        go = render_stub(two_sum(), language("go"))
+        assert go is not None and go.startswith("// 1. Two Sum (Easy)\n")
+
+    def test_missing_template(self) -> None:
+        """Test that a language without a template renders nothing."""
+        assert render_stub(two_sum(), language("rust")) is None
+
+
+class TestWorkspaceScaffold:
+    """Tests for incremental writes."""
+
+    def test_rerun_skips_unchanged(self, tmp_path: Path) -> None:
+        """Test that identical stubs are not rewritten."""
+        scaffold = WorkspaceScaffold(tmp_path / "ws")
+        assert scaffold.write([("1_two_sum.py", "a\n"), ("15_3sum.py", "b\n")]) == {
+            "1_two_sum.py": WRITTEN,
+            "15_3sum.py": WRITTEN,
+        }
+        mtime = (tmp_path / "ws" / "1_two_sum.py").stat().st_mtime_ns
+
+        assert scaffold.write([("1_two_sum.py", "a\n"), ("15_3sum.py", "b2\n")]) == {
+            "1_two_sum.py": UNCHANGED,
+            "15_3sum.py": UPDATED,
+        }
+        assert (tmp_path / "ws" / "1_two_sum.py").stat().st_mtime_ns == mtime
+        assert (tmp_path / "ws" / "15_3sum.py").read_text() == "b2\n"
+        assert scaffold.load_manifest().keys() == {"1_two_sum.py", "15_3sum.py"}
+
+    def test_user_edits_are_kept(self, tmp_path: Path) -> None:
+        """Test that an edited stub survives a regeneration unless overwrite is set."""
+        scaffold = WorkspaceScaffold(tmp_path)
+        scaffold.write([("1_two_sum.py", "template\n")])
+        (tmp_path / "1_two_sum.py").write_text("my solution\n")
+
+        assert scaffold.write([("1_two_sum.py", "new template\n")]) == {"1_two_sum.py": KEPT}
+        assert (tmp_path / "1_two_sum.py").read_text() == "my solution\n"
+        assert scaffold.write([("1_two_sum.py", "new template\n")], overwrite=True) == {
+            "1_two_sum.py": UPDATED
+        }
+        assert (tmp_path / "1_two_sum.py").read_text() == "new template\n"
+
+    def test_existing_files_without_manifest(self, tmp_path: Path) -> None:
+        """Test that unknown files are kept and identical ones adopted."""
+        (tmp_path / "a.py").write_text("same\n")
+        (tmp_path / "b.py").write_text("mine\n")
+
+        outcomes = WorkspaceScaffold(tmp_path).write([("a.py", "same\n"), ("b.py", "template\n")])
+
+        assert outcomes == {"a.py": UNCHANGED, "b.py": KEPT}
+        assert WorkspaceScaffold(tmp_path).load_manifest().keys() == {"a.py"}
+        assert not (tmp_path / MANIFEST_NAME).with_name(f".{MANIFEST_NAME}.tmp").exists()
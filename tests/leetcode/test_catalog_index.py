@@ -0,0 +1,246 @@
+"""Tests for the catalog filter index and filtered search."""
+
+import pytest
+from pathlib import Path
+from typing import List
+from unittest.mock import AsyncMock, patch
+from interview_prep_mcp.leetcode.catalog_index import CatalogIndex, normalize_tag
+from interview_prep_mcp.leetcode.client import (
+    LeetCodeClient,
+    StatStatusPair,
+    _problem_info_from_pair,
+)
+from interview_prep_mcp.leetcode.store import ProblemStore
+from interview_prep_mcp.leetcode.types import CachedProblemInfo
+
+
+def catalog() -> List[CachedProblemInfo]:
+    """A small catalog with tags, difficulties and a paid-only problem."""
+    return [
+        CachedProblemInfo(
+            questionFrontendId="1",
+            title="Two Sum",
+            titleSlug="two-sum",
+            difficulty="Easy",
+            tags=["array", "hash-table"],
+        ),
+        CachedProblemInfo(
+            questionFrontendId="62",
+            title="Unique Paths",
+            titleSlug="unique-paths",
+            difficulty="Medium",
+            tags=["math", "dynamic-programming"],
+        ),
+        CachedProblemInfo(
+            questionFrontendId="198",
+            title="House Robber",
+            titleSlug="house-robber",
+            difficulty="Medium",
+            tags=["array", "dynamic-programming"],
+        ),
+        CachedProblemInfo(
+            questionFrontendId="256",
+            title="Paint House",
+            titleSlug="paint-house",
+            difficulty="Medium",
+            paidOnly=True,
+            tags=["array", "dynamic-programming"],
+        ),
+        CachedProblemInfo(
+            questionFrontendId="847",
+            title="Shortest Path Visiting All Nodes",
+            titleSlug="shortest-path-visiting-all-nodes",
+            difficulty="Hard",
+            tags=["dynamic-programming", "graph", "breadth-first-search"],
+        ),
+    ]
+
+
+def slugs(index: CatalogIndex, mask: int) -> List[str]:
+    return [problem.titleSlug for problem in index.iter_matches(mask)]
+
+
+class TestCatalogIndex:
+    """Tests for CatalogIndex."""
+
+    def test_tag_and_difficulty_intersection(self) -> None:
+        """Test that filters combine with AND, in catalog order."""
+        index = CatalogIndex(catalog())
+
+        mask = index.mask("medium", ["dynamic-programming"])
+
+        assert slugs(index, mask) == ["unique-paths", "house-robber", "paint-house"]
+        assert index.count(mask) == 3
+        assert slugs(index, index.mask(tags=["Dynamic Programming", "Array"])) == [
+            "house-robber",
+            "paint-house",
+        ]
+
+    def test_exclude_paid_only(self) -> None:
+        """Test that paid-only problems can be excluded."""
+        index = CatalogIndex(catalog())
+
+        assert slugs(index, index.mask("Medium", ["array"], include_paid=False)) == ["house-robber"]
+        assert index.is_paid_only("paint-house")
+        assert not index.is_paid_only("house-robber")
+        assert not index.is_paid_only("unknown")
+
+    def test_unknown_filters_match_nothing(self) -> None:
+        """Test that an unknown tag or difficulty yields an empty set."""
+        index = CatalogIndex(catalog())
+
+        assert index.mask(tags=["array", "no-such-tag"]) == 0
+        assert index.mask("Impossible") == 0
+        assert index.count(index.mask()) == 5
+
+    def test_free_positions_buckets(self) -> None:
+        """Test the precomputed (difficulty, tag) buckets of free problems."""
+        index = CatalogIndex(catalog())
+
+        assert index.free_positions("Medium", ["dynamic-programming"]) == [1, 2]
+        assert index.free_positions() == [0, 1, 2, 4]
+        assert index.free_positions(tags=["Array"]) == [0, 2]
+        assert index.free_positions("Hard", ["graph", "dynamic-programming"]) == [4]
+        assert index.free_positions(tags=["array", "math"]) == []
+        assert index.free_positions("Easy", ["graph"]) == []
+
+    def test_variants_of(self) -> None:
+        """Test that numbered sequels are grouped under their original, in order."""
+        problems = catalog() + [
+            CachedProblemInfo(
+                questionFrontendId="167",
+                title="Two Sum II - Input Array Is Sorted",
+                titleSlug="two-sum-ii-input-array-is-sorted",
+            ),
+            CachedProblemInfo(
+                questionFrontendId="337", title="House Robber III", titleSlug="house-robber-iii"
+            ),
+            CachedProblemInfo(
+                questionFrontendId="213", title="House Robber II", titleSlug="house-robber-ii"
+            ),
+        ]
+        index = CatalogIndex(problems)
+
+        assert index.variants_of("house-robber-iii") == [
+            "house-robber",
+            "house-robber-ii",
+            "house-robber-iii",
+        ]
+        assert index.variants_of("two-sum") == ["two-sum", "two-sum-ii-input-array-is-sorted"]
+        assert index.variants_of("unique-paths") == []
+
+    def test_normalize_tag(self) -> None:
+        """Test that tag names map to slugs."""
+        assert normalize_tag("Breadth-First Search") == "breadth-first-search"
+        assert normalize_tag(" Hash  Table ") == "hash-table"
+
+
+class TestFilteredSearch:
+    """Tests for search_problems with filters."""
+
+    @pytest.mark.asyncio
+    async def test_filters_with_query(self, client: LeetCodeClient) -> None:
+        """Test that filters narrow the title search."""
+        client._problem_cache = catalog()
+
+        results = await client.search_problems(
+            "house", difficulty="Medium", tags=["dynamic-programming"]
+        )
+
+        assert [r.titleSlug for r in results] == ["house-robber", "paint-house"]
+        assert results[1].paidOnly is True
+        assert results[0].tags == ["array", "dynamic-programming"]
+
+    @pytest.mark.asyncio
+    async def test_filters_without_query(self, client: LeetCodeClient) -> None:
+        """Test that an empty query lists every problem matching the filters."""
+        client._problem_cache = catalog()
+
+        results = await client.search_problems(
+            "", tags=["dynamic-programming"], include_paid=False, limit=2
+        )
+
+        assert [r.titleSlug for r in results] == ["unique-paths", "house-robber"]
+
+    @pytest.mark.asyncio
+    async def test_filters_resume_after(self, client: LeetCodeClient) -> None:
+        """Test that a filtered page skips every match up to the cursor."""
+        client._problem_cache = catalog()
+
+        results = await client.search_problems(
+            "", tags=["dynamic-programming"], after="house-robber"
+        )
+
+        assert [r.titleSlug for r in results] == ["paint-house", "shortest-path-visiting-all-nodes"]
+
+    @pytest.mark.asyncio
+    async def test_index_rebuilt_with_catalog(self, client: LeetCodeClient) -> None:
+        """Test that replacing the catalog replaces the index."""
+        client._problem_cache = catalog()
+        first = client.catalog_index()
+        assert client.catalog_index() is first
+
+        client._problem_cache = catalog()[:1]
+
+        assert client.catalog_index() is not first
+        assert await client.search_problems("", difficulty="Medium") == []
+
+
+class TestCatalogFields:
+    """Tests for reading tags and paid-only flags into the catalog."""
+
+    @pytest.mark.asyncio
+    async def test_graphql_pages_keep_tags_and_paid_only(self, client: LeetCodeClient) -> None:
+        """Test that catalog pages populate tags and paidOnly."""
+        page = {
+            "data": {
+                "problemsetQuestionList": {
+                    "total": 1,
+                    "questions": [
+                        {
+                            "questionFrontendId": "256",
+                            "title": "Paint House",
+                            "titleSlug": "paint-house",
+                            "difficulty": "Medium",
+                            "paidOnly": True,
+                            "topicTags": [{"slug": "array"}, {"slug": "dynamic-programming"}],
+                        }
+                    ],
+                }
+            }
+        }
+
+        with patch.object(client, "_fetch_catalog_page", new=AsyncMock(return_value=page)):
+            await client._build_id_to_slug_cache()
+
+        assert client._problem_cache is not None
+        assert client._problem_cache[0].paidOnly is True
+        assert client._problem_cache[0].tags == ["array", "dynamic-programming"]
+
+    def test_rest_entry_keeps_paid_only(self) -> None:
+        """Test that REST entries carry paid_only (but no tags)."""
+        item: StatStatusPair = {
+            "stat": {
+                "frontend_question_id": 256,
+                "question__title_slug": "paint-house",
+                "question__title": "Paint House",
+            },
+            "difficulty": {"level": 2},
+            "paid_only": True,
+        }
+
+        problem = _problem_info_from_pair(item)
+
+        assert problem is not None
+        assert problem.paidOnly is True
+        assert problem.tags == []
+
+    def test_store_round_trip(self, tmp_path: Path) -> None:
+        """Test that the store persists tags and paid-only flags."""
+        store = ProblemStore(tmp_path / "problems.sqlite3")
+        store.save_catalog_sync(catalog())
+
+        loaded = store.load_catalog_sync()
+
+        assert loaded is not None
+        assert loaded[0] == catalog()
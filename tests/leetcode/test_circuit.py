@@ -0,0 +1,172 @@
+"""Tests for the circuit breaker."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+import httpx
+from interview_prep_mcp.leetcode.circuit import CircuitBreaker, CircuitOpenError
+from interview_prep_mcp.leetcode.client import LeetCodeClient
+from interview_prep_mcp.leetcode.retry import retry_budget
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def fail_through(breaker: CircuitBreaker, error: Exception) -> None:
+    """Run one request under the breaker that raises the given error."""
+    with pytest.raises(type(error)):
+        with breaker.guard():
+            raise error
+
+
+def throttled_error() -> httpx.HTTPStatusError:
+    """Build the error raised for a 429 Too Many Requests response."""
+    request = httpx.Request("POST", "https://leetcode.com/graphql/")
+    response = httpx.Response(429, request=request)
+    return httpx.HTTPStatusError("429", request=request, response=response)
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker state transitions."""
+
+    def test_starts_closed(self) -> None:
+        """Test that a new breaker admits requests."""
+        breaker = CircuitBreaker()
+        assert breaker.state == CircuitBreaker.CLOSED
+        breaker.before_request()
+
+    def test_opens_after_threshold(self) -> None:
+        """Test that consecutive upstream failures open the circuit."""
+        breaker = CircuitBreaker(failure_threshold=3)
+        for _ in range(3):
+            fail_through(breaker, httpx.ConnectError("refused"))
+
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+    def test_success_resets_failure_count(self) -> None:
+        """Test that a success in between keeps the circuit closed."""
+        breaker = CircuitBreaker(failure_threshold=2)
+        fail_through(breaker, httpx.ConnectError("refused"))
+        with breaker.guard():
+            pass
+        fail_through(breaker, httpx.ConnectError("refused"))
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_non_upstream_errors_do_not_count(self) -> None:
+        """Test that GraphQL errors and 404s are not upstream failures."""
+        breaker = CircuitBreaker(failure_threshold=1)
+        fail_through(breaker, ValueError("GraphQL errors"))
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_throttling_does_not_count(self) -> None:
+        """Test that 429 responses are left to the retry policy."""
+        breaker = CircuitBreaker(failure_threshold=2)
+        throttled = throttled_error()
+        fail_through(breaker, throttled)
+        fail_through(breaker, throttled)
+
+        assert breaker.state == CircuitBreaker.CLOSED
+        fail_through(breaker, httpx.ConnectError("refused"))
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_throttled_trial_frees_slot(self) -> None:
+        """Test that a throttled half-open trial neither closes nor reopens the circuit."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        fail_through(breaker, httpx.ConnectError("refused"))
+        clock.now = 10
+        throttled = throttled_error()
+        fail_through(breaker, throttled)
+
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        breaker.before_request()
+
+    def test_half_open_allows_single_trial(self) -> None:
+        """Test that one trial request is admitted after the reset timeout."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        fail_through(breaker, httpx.ConnectError("refused"))
+
+        clock.now = 10
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        breaker.before_request()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+    def test_successful_trial_closes(self) -> None:
+        """Test that a successful trial closes the circuit."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        fail_through(breaker, httpx.ConnectError("refused"))
+
+        clock.now = 10
+        with breaker.guard():
+            pass
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_failed_trial_reopens(self) -> None:
+        """Test that a failed trial reopens the circuit for another timeout."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=5, reset_timeout=10, clock=clock)
+        for _ in range(5):
+            fail_through(breaker, httpx.ConnectError("refused"))
+
+        clock.now = 10
+        fail_through(breaker, httpx.ReadTimeout("slow"))
+
+        assert breaker.state == CircuitBreaker.OPEN
+        clock.now = 19
+        assert breaker.state == CircuitBreaker.OPEN
+
+
+class TestClientCircuitBreaker:
+    """Tests for the circuit breaker wired into LeetCodeClient."""
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self) -> None:
+        """Test that fetch_problem does not contact LeetCode while open."""
+        client = LeetCodeClient()
+        client._circuit_breaker = CircuitBreaker(failure_threshold=1)
+        fail_through(client._circuit_breaker, httpx.ConnectError("refused"))
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            with pytest.raises(CircuitOpenError):
+                await client.fetch_problem("two-sum")
+
+            mock_client_class.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_repeated_failures_open_circuit(self) -> None:
+        """Test that failing requests trip the breaker, then later calls fail fast."""
+        retry_budget.reset()
+        client = LeetCodeClient()
+        client._circuit_breaker = CircuitBreaker(failure_threshold=2)
+        mock_instance = MagicMock()
+        mock_instance.post = AsyncMock(side_effect=httpx.ConnectError("refused"))
+        mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
+        mock_instance.__aexit__ = AsyncMock(return_value=None)
+
+        async def no_sleep(seconds: float) -> None:
+            return None
+
+        with (
+            patch("httpx.AsyncClient", return_value=mock_instance),
+            patch("asyncio.sleep", new=no_sleep),
+        ):
+            # Two failed attempts open the circuit; the third attempt fails fast
+            with pytest.raises(CircuitOpenError):
+                await client.fetch_problem("two-sum")
+
+        assert mock_instance.post.call_count == 2
+        retry_budget.reset()
@@ -0,0 +1,258 @@
+"""Tests for TF-IDF content search."""
+
+import asyncio
+import pytest
+from pathlib import Path
+from typing import List, Tuple
+from unittest.mock import patch
+
+pytest.importorskip("numpy")
+
+from interview_prep_mcp.leetcode import client as client_module
+from interview_prep_mcp.leetcode.client import LeetCodeClient
+from interview_prep_mcp.leetcode.content_search import (
+    ContentIndex,
+    bitset_to_array,
+    html_to_text,
+    tokenize,
+)
+from interview_prep_mcp.leetcode.store import ProblemStore
+from interview_prep_mcp.leetcode.types import CachedProblemInfo, Problem
+from interview_prep_mcp.tools.load_problem import LoadProblemTool
+
+
+def documents() -> List[Tuple[str, str]]:
+    """A few problem texts with overlapping vocabulary."""
+    return [
+        ("two-sum", "Two Sum\nReturn indices of the two numbers such that they add up to target."),
+        ("maximum-subarray", "Maximum Subarray\nFind the subarray with the largest sum."),
+        (
+            "sliding-window-maximum",
+            "Sliding Window Maximum\nReturn the max sliding window of the array.",
+        ),
+        (
+            "valid-parentheses",
+            "Valid Parentheses\nDetermine if the input string of brackets is valid.",
+        ),
+    ]
+
+
+def problem(slug: str, title: str, content: str) -> Problem:
+    return Problem(
+        questionId=slug,
+        questionFrontendId=slug,
+        title=title,
+        titleSlug=slug,
+        difficulty="Medium",
+        content=content,
+        topicTags=[],
+        codeSnippets=[],
+    )
+
+
+class TestTokenize:
+    """Tests for text normalization."""
+
+    def test_terms(self) -> None:
+        """Test lowercasing, stopwords and plural stripping."""
+        assert tokenize("Return the Subarrays of nums, a 2D array!") == [
+            "subarray",
+            "num",
+            "2d",
+            "array",
+        ]
+        assert tokenize("class access is") == ["class", "access"]
+
+    def test_html_to_text(self) -> None:
+        """Test that tags are dropped and entities decoded."""
+        assert html_to_text("<p>1 &lt;= n</p><code>nums</code>").split() == ["1", "<=", "n", "nums"]
+
+
+class TestContentIndex:
+    """Tests for ContentIndex."""
+
+    def test_ranks_by_cosine_similarity(self) -> None:
+        """Test that the best-matching description comes first."""
+        index = ContentIndex.build(documents())
+
+        results = index.search("sliding window maximum")
+
+        assert [slug for slug, _ in results] == ["sliding-window-maximum", "maximum-subarray"]
+        assert 0 < results[1][1] < results[0][1] <= 1.0
+
+    def test_limit_and_unknown_terms(self) -> None:
+        """Test top-k selection and queries sharing no term with the corpus."""
+        index = ContentIndex.build(documents())
+
+        assert len(index.search("sum subarray window brackets", limit=2)) == 2
+        assert index.search("zebra") == []
+        assert index.search("the of") == []
+
+    def test_allowed_mask(self) -> None:
+        """Test that masked-out documents are never returned."""
+        index = ContentIndex.build(documents())
+        allowed = bitset_to_array(0b0101, len(index))
+
+        results = index.search("maximum sum", allowed=allowed)
+
+        assert {slug for slug, _ in results} == {"two-sum", "sliding-window-maximum"}
+
+    def test_pages_resume_after_cursor(self) -> None:
+        """Test that paging one result at a time, ties included, reproduces the full ranking."""
+        # A copy of two-sum ties with it
+        index = ContentIndex.build(documents() + [("two-sum-copy", documents()[0][1])])
+        ranking = index.search("sum numbers target", limit=10)
+
+        pages: List[Tuple[str, float]] = []
+        after = None
+        while True:
+            page = index.search(
+                "sum numbers target", limit=1, after=after, generation=index.generation
+            )
+            if not page:
+                break
+            pages += page
+            after = (page[-1][1], page[-1][0])
+
+        assert ranking[0][1] == ranking[1][1]
+        assert [slug for slug, _ in ranking[:2]] == ["two-sum", "two-sum-copy"]
+        assert pages == ranking
+
+    def test_cursor_from_another_generation(self) -> None:
+        """Test that resuming with a cursor from a rebuilt index is refused."""
+        index = ContentIndex.build(documents())
+        index.generation = 2
+
+        with pytest.raises(ValueError, match="search index changed"):
+            index.search("sum", after=(0.5, "two-sum"), generation=1)
+
+    def test_empty_corpus(self) -> None:
+        """Test that an empty index answers with no results."""
+        index = ContentIndex.build([])
+
+        assert len(index) == 0
+        assert index.search("anything") == []
+
+    def test_bitset_to_array(self) -> None:
+        """Test bitset expansion, including bits past the first byte."""
+        assert bitset_to_array(0b1000000101, 10).tolist() == [
+            True,
+            False,
+            True,
+            False,
+            False,
+            False,
+            False,
+            False,
+            False,
+            True,
+        ]
+        assert bitset_to_array(0, 3).tolist() == [False, False, False]
+
+
+class TestClientContentSearch:
+    """Tests for LeetCodeClient.search_content."""
+
+    @pytest.mark.asyncio
+    async def test_searches_stored_and_fetched_problems(self, tmp_path: Path) -> None:
+        """Test that the corpus covers stored and in-memory problems, with filters applied."""
+        store = ProblemStore(tmp_path / "problems.sqlite3")
+        store.put_problem_sync(
+            problem("two-sum", "Two Sum", "<p>Find two numbers adding up to target.</p>")
+        )
+        client = LeetCodeClient(store=store)
+        client._fetched_problems.set(
+            "three-sum", problem("three-sum", "3Sum", "<p>Find three numbers summing to zero.</p>")
+        )
+        client._problem_cache = [
+            CachedProblemInfo(
+                questionFrontendId="1",
+                title="Two Sum",
+                titleSlug="two-sum",
+                difficulty="Easy",
+                tags=["array"],
+            ),
+            CachedProblemInfo(
+                questionFrontendId="15",
+                title="3Sum",
+                titleSlug="three-sum",
+                difficulty="Medium",
+                tags=["array", "two-pointers"],
+            ),
+        ]
+
+        results = await client.search_content("find numbers", limit=5)
+        filtered = await client.search_content("find numbers", tags=["two-pointers"])
+
+        assert {r.titleSlug for r in results} == {"two-sum", "three-sum"}
+        assert all(r.score is not None and r.score > 0 for r in results)
+        assert [r.titleSlug for r in filtered] == ["three-sum"]
+        assert filtered[0].questionFrontendId == "15"
+
+    @pytest.mark.asyncio
+    async def test_new_problems_reindexed_in_background(self, client: LeetCodeClient) -> None:
+        """Test that a stale index is served while a rebuild picks up new problems."""
+        client._problem_cache = [
+            CachedProblemInfo(
+                questionFrontendId="1", title="Two Sum", titleSlug="two-sum", difficulty="Easy"
+            ),
+            CachedProblemInfo(
+                questionFrontendId="20",
+                title="Valid Parentheses",
+                titleSlug="valid-parentheses",
+                difficulty="Easy",
+            ),
+        ]
+        client._fetched_problems.set("two-sum", problem("two-sum", "Two Sum", "numbers target"))
+        assert await client.search_content("brackets") == []
+
+        client._fetched_problems.set(
+            "valid-parentheses", problem("valid-parentheses", "Valid Parentheses", "brackets")
+        )
+        client._content_dirty = True
+        with patch.object(client_module, "CONTENT_INDEX_REBUILD_SECONDS", 0):
+            assert await client.search_content("brackets") == []
+            await asyncio.gather(*client._background_tasks)
+
+        assert [r.titleSlug for r in await client.search_content("brackets")] == [
+            "valid-parentheses"
+        ]
+        assert client.content_generation == 2
+        with pytest.raises(ValueError, match="search index changed"):
+            await client.search_content("brackets", after=(0.5, "two-sum"), generation=1)
+
+    @pytest.mark.asyncio
+    async def test_cursor_rejected_after_rebuild(self, client: LeetCodeClient) -> None:
+        """Test that load_problem pages through content results until the index is rebuilt."""
+        slugs = ["two-sum", "three-sum", "four-sum"]
+        client._problem_cache = [
+            CachedProblemInfo(questionFrontendId=str(i), title=slug, titleSlug=slug)
+            for i, slug in enumerate(slugs)
+        ]
+        for slug in slugs:
+            client._fetched_problems.set(slug, problem(slug, slug, "numbers adding up to target"))
+        tool = LoadProblemTool(client)
+
+        first = await tool.execute(problem_name="numbers target", search_content=True, limit=1)
+        assert isinstance(first, dict)
+        second = await tool.execute(
+            problem_name="numbers target", search_content=True, limit=1, cursor=first["next_cursor"]
+        )
+        assert isinstance(second, dict)
+        await client._rebuild_content_index()
+
+        assert first["matches"][0]["title_slug"] != second["matches"][0]["title_slug"]
+        with pytest.raises(ValueError, match="search index changed"):
+            await tool.execute(
+                problem_name="numbers target",
+                search_content=True,
+                limit=1,
+                cursor=second["next_cursor"],
+            )
+
+    @pytest.mark.asyncio
+    async def test_requires_numpy(self, client: LeetCodeClient) -> None:
+        """Test the install hint when NumPy is missing."""
+        with patch("importlib.util.find_spec", return_value=None):
+            with pytest.raises(ImportError, match=r"interview-prep-mcp\[search\]"):
+                await client.search_content("two sum")
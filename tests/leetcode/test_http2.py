@@ -0,0 +1,74 @@
+"""Tests for the optional HTTP/2 transport."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from interview_prep_mcp.leetcode.client import LeetCodeClient
+
+
+def make_mock_http_client(mock_response_data):  # type: ignore[no-untyped-def]
+    """Create a mock httpx.AsyncClient returning the given payload."""
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.json.return_value = mock_response_data
+    mock_instance = MagicMock()
+    mock_instance.is_closed = False
+    mock_instance.post = AsyncMock(return_value=response)
+    mock_instance.aclose = AsyncMock()
+    mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
+    mock_instance.__aexit__ = AsyncMock(return_value=None)
+    return mock_instance
+
+
+class TestHttp2Transport:
+    """Tests for LeetCodeClient(http2=True)."""
+
+    def test_http2_disabled_by_default(self) -> None:
+        """Test that the default client uses per-request HTTP/1.1 clients."""
+        assert LeetCodeClient().http2 is False
+
+    def test_missing_h2_raises(self) -> None:
+        """Test that requesting HTTP/2 without h2 installed fails clearly."""
+        with patch("importlib.util.find_spec", return_value=None):
+            with pytest.raises(ImportError, match="h2"):
+                LeetCodeClient(http2=True)
+
+    @pytest.mark.asyncio
+    async def test_default_mode_opens_client_per_request(self, mock_response_data) -> None:  # type: ignore[no-untyped-def,misc]
+        """Test that HTTP/1.1 mode creates a new client for every request."""
+        client = LeetCodeClient()
+        mock_instance = make_mock_http_client(mock_response_data)
+
+        with patch("httpx.AsyncClient", return_value=mock_instance) as mock_client_class:
+            await client.fetch_problem("two-sum")
+            await client.fetch_problem("add-two-numbers")
+
+        assert mock_client_class.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_http2_mode_shares_one_client(self, mock_response_data) -> None:  # type: ignore[no-untyped-def,misc]
+        """Test that HTTP/2 mode reuses a single multiplexing client."""
+        pytest.importorskip("h2")
+        client = LeetCodeClient(http2=True)
+        mock_instance = make_mock_http_client(mock_response_data)
+
+        with patch("httpx.AsyncClient", return_value=mock_instance) as mock_client_class:
+            await client.fetch_problem("two-sum")
+            await client.fetch_problem("add-two-numbers")
+
+        mock_client_class.assert_called_once_with(http2=True)
+        assert mock_instance.post.call_count == 2
+        mock_instance.__aexit__.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_shared_client(self, mock_response_data) -> None:  # type: ignore[no-untyped-def,misc]
+        """Test that aclose() closes the shared connection."""
+        pytest.importorskip("h2")
+        client = LeetCodeClient(http2=True)
+        mock_instance = make_mock_http_client(mock_response_data)
+
+        with patch("httpx.AsyncClient", return_value=mock_instance):
+            await client.fetch_problem("two-sum")
+            await client.aclose()
+
+        mock_instance.aclose.assert_awaited_once()
+        assert client._shared_http_client is None
@@ -0,0 +1,69 @@
+"""Tests for the client's log events."""
+
+import json
+import pytest
+from pathlib import Path
+from typing import Iterator
+from unittest.mock import MagicMock, patch
+import httpx
+from interview_prep_mcp.leetcode.client import LeetCodeClient
+from interview_prep_mcp.leetcode.retry import retry_budget
+from interview_prep_mcp.logs import configure_logging, stop_logging
+from .conftest import mock_async_client
+
+
+@pytest.fixture
+def log_path(tmp_path: Path) -> Iterator[Path]:
+    """Log everything to a file; logging is switched off again after the test."""
+    path = tmp_path / "server.log"
+    configure_logging(str(path), level="DEBUG", sample_rates={"cache.hit": 1.0})
+    retry_budget.reset()
+    yield path
+    stop_logging()
+    retry_budget.reset()
+
+
+class TestClientLogging:
+    """Tests for upstream, retry and cache events."""
+
+    @pytest.mark.asyncio
+    async def test_retried_fetch_then_cache_hit(  # type: ignore[no-untyped-def,misc]
+        self, log_path: Path, mock_response_data
+    ) -> None:
+        """Test the events of a fetch that is retried once, then served from the cache."""
+        request = httpx.Request("POST", "https://leetcode.com/graphql/")
+        unavailable = httpx.Response(503, request=request)
+        ok = MagicMock()
+        ok.json.return_value = mock_response_data
+        responses = [unavailable, ok]
+
+        async def post(*args: object, **kwargs: object) -> object:
+            response = responses.pop(0)
+            if response is unavailable:
+                raise httpx.HTTPStatusError("503", request=request, response=unavailable)
+            return response
+
+        async def no_sleep(seconds: float) -> None:
+            pass
+
+        client = LeetCodeClient()
+        with mock_async_client(side_effect=post), patch("asyncio.sleep", new=no_sleep):
+            await client.fetch_problem("two-sum")
+            await client.fetch_problem("two-sum")
+
+        stop_logging()
+        events = [json.loads(line) for line in log_path.read_text().splitlines()]
+        assert [event["event"] for event in events] == [
+            "cache.miss",
+            "upstream.request",
+            "upstream.retry",
+            "upstream.request",
+            "cache.hit",
+        ]
+        assert (
+            events[1]["operation"] == "questionContent"
+            and events[1]["outcome"] == "HTTPStatusError"
+        )
+        assert events[2]["status"] == 503 and events[2]["attempt"] == 1
+        assert events[3]["outcome"] == "ok" and events[3]["priority"] == "interactive"
+        assert events[4]["stale"] is False
@@ -0,0 +1,92 @@
+"""Tests for fetching study plan and problem list definitions."""
+
+import pytest
+from typing import List, Mapping, cast
+from interview_prep_mcp.leetcode import client as client_module
+from interview_prep_mcp.leetcode.client import LeetCodeClient
+from .conftest import mock_async_client
+
+
+class TestFetchProblemList:
+    """Tests for LeetCodeClient.fetch_problem_list."""
+
+    @pytest.mark.asyncio
+    async def test_study_plan_groups_and_cache(self, mock_httpx_response) -> None:  # type: ignore[no-untyped-def,misc]
+        """Test that a plan keeps its sub-groups and is fetched once."""
+        client = LeetCodeClient()
+        mock_httpx_response.json.return_value = {
+            "data": {
+                "studyPlanV2Detail": {
+                    "slug": "top-interview-150",
+                    "name": "Top Interview 150",
+                    "planSubGroups": [
+                        {
+                            "slug": "array-string",
+                            "name": "Array / String",
+                            "questions": [
+                                {"titleSlug": "merge-sorted-array"},
+                                {"titleSlug": "two-sum"},
+                            ],
+                        },
+                        {
+                            "slug": "hashmap",
+                            "name": "Hashmap",
+                            "questions": [{"titleSlug": "two-sum"}],
+                        },
+                    ],
+                }
+            }
+        }
+
+        with mock_async_client(mock_httpx_response) as http:
+            plan = await client.fetch_problem_list("top-interview-150")
+            again = await client.fetch_problem_list("top-interview-150")
+
+        assert plan is not None and again is plan
+        assert http.post.call_count == 1
+        assert plan.name == "Top Interview 150"
+        assert [group.name for group in plan.groups] == ["Array / String", "Hashmap"]
+        assert plan.title_slugs == ["merge-sorted-array", "two-sum"]
+
+    @pytest.mark.asyncio
+    async def test_list_pages_and_unknown_slug(  # type: ignore[no-untyped-def,misc]
+        self, mock_httpx_response, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a list is read page by page, and an unknown one is None."""
+        monkeypatch.setattr(client_module, "PROBLEM_LIST_PAGE_SIZE", 2)
+        client = LeetCodeClient()
+        # An entry without a slug still counts towards the next page's skip
+        slugs = ["a", "", "b", "c"]
+        skips: List[int] = []
+
+        async def post(
+            url: str, json: Mapping[str, Mapping[str, object]], **kwargs: object
+        ) -> object:
+            variables = json["variables"]
+            if variables["slug"] != "blind-75":
+                mock_httpx_response.json.return_value = {
+                    "data": {"favoriteDetailV2": None, "favoriteQuestionList": None}
+                }
+                return mock_httpx_response
+            skip, limit = cast(int, variables["skip"]), cast(int, variables["limit"])
+            skips.append(skip)
+            mock_httpx_response.json.return_value = {
+                "data": {
+                    "favoriteDetailV2": {"name": "Blind 75"},
+                    "favoriteQuestionList": {
+                        "questions": [{"titleSlug": slug} for slug in slugs[skip : skip + limit]],
+                        "totalLength": len(slugs),
+                        "hasMore": skip + limit < len(slugs),
+                    },
+                }
+            }
+            return mock_httpx_response
+
+        with mock_async_client(side_effect=post):
+            problem_list = await client.fetch_problem_list("blind-75", "list")
+            missing = await client.fetch_problem_list("no-such-list", "list")
+
+        assert problem_list is not None and problem_list.name == "Blind 75"
+        assert problem_list.title_slugs == ["a", "b", "c"]
+        assert skips == [0, 2]
+        assert missing is None
@@ -0,0 +1,316 @@
+"""Tests for the upstream retry policy."""
+
+import pytest
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+import httpx
+from interview_prep_mcp.leetcode.client import LeetCodeClient
+from interview_prep_mcp.leetcode.retry import (
+    RetryBudget,
+    is_retryable_error,
+    retry_after_seconds,
+    retry_budget,
+)
+
+
+def make_status_error(
+    status_code: int, headers: dict[str, str] | None = None
+) -> httpx.HTTPStatusError:
+    """Build an HTTPStatusError carrying a real response."""
+    request = httpx.Request("POST", "https://leetcode.com/graphql/")
+    response = httpx.Response(status_code, headers=headers or {}, request=request)
+    return httpx.HTTPStatusError(f"{status_code}", request=request, response=response)
+
+
+@pytest.fixture(autouse=True)
+def full_budget():  # type: ignore[no-untyped-def]
+    """Start every test with a full shared retry budget."""
+    retry_budget.reset()
+    yield
+    retry_budget.reset()
+
+
+class TestRetryBudget:
+    """Tests for the token-bucket retry budget."""
+
+    def test_budget_exhausts(self) -> None:
+        """Test that acquisitions fail once the bucket is empty."""
+        budget = RetryBudget(capacity=2, refill_per_second=0, clock=lambda: 0.0)
+
+        assert budget.try_acquire()
+        assert budget.try_acquire()
+        assert not budget.try_acquire()
+
+    def test_budget_refills_over_time(self) -> None:
+        """Test that tokens refill at the configured rate up to capacity."""
+        now = 0.0
+        budget = RetryBudget(capacity=2, refill_per_second=1, clock=lambda: now)
+        budget.try_acquire()
+        budget.try_acquire()
+
+        now = 1.5
+        assert budget.tokens == pytest.approx(1.5)
+        now = 100.0
+        assert budget.tokens == 2
+
+
+class TestRetryClassification:
+    """Tests for deciding which failures are retried."""
+
+    def test_network_errors_are_retryable(self) -> None:
+        """Test that transport failures are retryable."""
+        assert is_retryable_error(httpx.ConnectError("refused"))
+        assert is_retryable_error(httpx.ReadTimeout("slow"))
+
+    @pytest.mark.parametrize("status_code", [429, 500, 502, 503, 504])
+    def test_transient_statuses_are_retryable(self, status_code: int) -> None:
+        """Test that throttling and server errors are retryable."""
+        assert is_retryable_error(make_status_error(status_code))
+
+    @pytest.mark.parametrize("status_code", [400, 403, 404])
+    def test_client_errors_are_not_retryable(self, status_code: int) -> None:
+        """Test that client errors are not retried."""
+        assert not is_retryable_error(make_status_error(status_code))
+
+    def test_value_error_is_not_retryable(self) -> None:
+        """Test that GraphQL errors are not retried."""
+        assert not is_retryable_error(ValueError("GraphQL errors"))
+
+    def test_retry_after_seconds(self) -> None:
+        """Test parsing a delay-seconds Retry-After header."""
+        assert retry_after_seconds(make_status_error(429, {"Retry-After": "7"})) == 7.0
+
+    def test_retry_after_http_date(self) -> None:
+        """Test parsing an HTTP-date Retry-After header."""
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=20)
+        error = make_status_error(503, {"Retry-After": format_datetime(retry_at, usegmt=True)})
+
+        delay = retry_after_seconds(error)
+
+        assert delay is not None
+        assert 15 <= delay <= 20
+
+    def test_retry_after_missing_or_invalid(self) -> None:
+        """Test that missing or garbage Retry-After headers are ignored."""
+        assert retry_after_seconds(make_status_error(503)) is None
+        assert retry_after_seconds(make_status_error(503, {"Retry-After": "soon"})) is None
+        assert retry_after_seconds(httpx.ConnectError("refused")) is None
+
+
+class TestFetchProblemRetryPolicy:
+    """Tests for the retry policy applied to fetch_problem."""
+
+    @staticmethod
+    def _patch_post(side_effect):  # type: ignore[no-untyped-def]
+        mock_instance = MagicMock()
+        mock_instance.post = AsyncMock(side_effect=side_effect)
+        mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
+        mock_instance.__aexit__ = AsyncMock(return_value=None)
+        return (
+            patch(
+                "interview_prep_mcp.leetcode.client.httpx.AsyncClient",
+                return_value=mock_instance,
+            ),
+            mock_instance,
+        )
+
+    @pytest.mark.asyncio
+    async def test_404_is_not_retried(self) -> None:
+        """Test that a 404 fails on the first attempt."""
+        client = LeetCodeClient()
+        response = MagicMock()
+        response.raise_for_status = MagicMock(side_effect=make_status_error(404))
+        patcher, mock_instance = self._patch_post([response])
+
+        with patcher:
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.fetch_problem("two-sum")
+
+        assert mock_instance.post.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_honors_retry_after(self) -> None:
+        """Test that a 429 waits for at least the Retry-After delay."""
+        client = LeetCodeClient()
+        throttled = MagicMock()
+        throttled.raise_for_status = MagicMock(
+            side_effect=make_status_error(429, {"Retry-After": "2"})
+        )
+        ok = MagicMock()
+        ok.raise_for_status = MagicMock()
+        ok.json.return_value = {"data": {"question": None}}
+        patcher, _ = self._patch_post([throttled, ok])
+        sleeps: list[float] = []
+
+        async def fake_sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+
+        with patcher, patch("asyncio.sleep", new=fake_sleep):
+            assert await client.fetch_problem("two-sum") is None
+
+        assert len(sleeps) == 1
+        assert sleeps[0] >= 2
+
+    @pytest.mark.asyncio
+    async def test_long_retry_after_is_not_retried(self) -> None:
+        """Test that a Retry-After beyond the cap surfaces the error."""
+        client = LeetCodeClient()
+        throttled = MagicMock()
+        throttled.raise_for_status = MagicMock(
+            side_effect=make_status_error(429, {"Retry-After": "3600"})
+        )
+        patcher, mock_instance = self._patch_post([throttled])
+
+        with patcher:
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.fetch_problem("two-sum")
+
+        assert mock_instance.post.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_exhausted_budget_stops_retries(self) -> None:
+        """Test that no retries are issued while the shared budget is empty."""
+        client = LeetCodeClient()
+        patcher, mock_instance = self._patch_post(httpx.ConnectError("refused"))
+
+        with patch.object(retry_budget, "try_acquire", return_value=False):
+            with patcher:
+                with pytest.raises(httpx.ConnectError):
+                    await client.fetch_problem("two-sum")
+
+        assert mock_instance.post.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_final_attempt_does_not_spend_budget(self) -> None:
+        """Test that only the retries actually issued withdraw budget tokens."""
+        client = LeetCodeClient()
+        patcher, mock_instance = self._patch_post(httpx.ConnectError("refused"))
+
+        async def no_sleep(seconds: float) -> None:
+            return None
+
+        with (
+            patcher,
+            patch("asyncio.sleep", new=no_sleep),
+            patch.object(retry_budget, "refill_per_second", 0.0),
+        ):
+            with pytest.raises(httpx.ConnectError):
+                await client.fetch_problem("two-sum")
+            assert retry_budget.tokens == retry_budget.capacity - 2
+
+        assert mock_instance.post.call_count == 3
+
+
+class TestProblemRetryPolicy:
+    """Tests for where fetch_problem retries."""
+
+    @pytest.mark.asyncio
+    async def test_cache_lookup_not_replayed(self, client) -> None:  # type: ignore[no-untyped-def,misc]
+        """Test that a retried upstream failure does not look the problem up again."""
+        problem = MagicMock()
+        upstream = AsyncMock(side_effect=[httpx.ConnectError("reset"), problem])
+
+        async def no_sleep(seconds: float) -> None:
+            return None
+
+        with (
+            patch.object(client, "_post_question_query", new=upstream),
+            patch.object(client, "_remember_problem", new=AsyncMock()),
+            patch.object(
+                client._fetched_problems, "lookup", wraps=client._fetched_problems.lookup
+            ) as lookup,
+            patch("asyncio.sleep", new=no_sleep),
+        ):
+            assert await client.fetch_problem("two-sum") is problem
+
+        assert upstream.call_count == 2
+        assert lookup.call_count == 1
+
+
+class TestCatalogRetryPolicy:
+    """Tests for the retry policy applied to the catalog build."""
+
+    @pytest.mark.asyncio
+    async def test_catalog_page_retried_before_fallback(self, client) -> None:  # type: ignore[no-untyped-def,misc]
+        """Test that a transient page failure is retried instead of falling back."""
+        ok = MagicMock()
+        ok.raise_for_status = MagicMock()
+        ok.json.return_value = {
+            "data": {
+                "problemsetQuestionList": {
+                    "total": 1,
+                    "questions": [
+                        {
+                            "questionFrontendId": "1",
+                            "title": "Two Sum",
+                            "titleSlug": "two-sum",
+                            "difficulty": "Easy",
+                        }
+                    ],
+                }
+            }
+        }
+        mock_instance = MagicMock()
+        mock_instance.post = AsyncMock(side_effect=[httpx.ConnectError("reset"), ok])
+        mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
+        mock_instance.__aexit__ = AsyncMock(return_value=None)
+
+        async def no_sleep(seconds: float) -> None:
+            return None
+
+        with (
+            patch("httpx.AsyncClient", return_value=mock_instance),
+            patch("asyncio.sleep", new=no_sleep),
+            patch.object(client, "_build_cache_from_api", new=AsyncMock()) as fallback,
+        ):
+            cache = await client._build_id_to_slug_cache()
+
+        assert cache == {"1": "two-sum"}
+        assert mock_instance.post.call_count == 2
+        fallback.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_malformed_page_falls_back(self, client) -> None:  # type: ignore[no-untyped-def,misc]
+        """Test that a page missing expected fields falls back to the REST catalog."""
+        page = {
+            "data": {"problemsetQuestionList": {"total": 1, "questions": [{"title": "Two Sum"}]}}
+        }
+        with (
+            patch.object(client, "_fetch_catalog_page", new=AsyncMock(return_value=page)),
+            patch.object(
+                client, "_build_cache_from_api", new=AsyncMock(return_value={"1": "two-sum"})
+            ) as fallback,
+        ):
+            cache = await client._build_id_to_slug_cache()
+
+        assert cache == {"1": "two-sum"}
+        fallback.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_programming_errors_are_not_swallowed(self, client) -> None:  # type: ignore[no-untyped-def,misc]
+        """Test that unexpected errors propagate instead of silently falling back."""
+        with (
+            patch.object(
+                client, "_fetch_catalog_page", new=AsyncMock(side_effect=RuntimeError("x"))
+            ),
+            patch.object(client, "_build_cache_from_api", new=AsyncMock()) as fallback,
+        ):
+            with pytest.raises(RuntimeError):
+                await client._build_id_to_slug_cache()
+
+        fallback.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rest_fallback_is_not_retried(self, client) -> None:  # type: ignore[no-untyped-def,misc]
+        """Test that the REST catalog request is made once, not retried after the page retries."""
+        mock_instance = MagicMock()
+        mock_instance.stream = MagicMock(side_effect=httpx.ConnectError("reset"))
+        mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
+        mock_instance.__aexit__ = AsyncMock(return_value=None)
+
+        with patch("httpx.AsyncClient", return_value=mock_instance):
+            with pytest.raises(httpx.ConnectError):
+                await client._build_cache_from_api()
+
+        assert mock_instance.stream.call_count == 1
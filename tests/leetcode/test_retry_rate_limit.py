@@ -12,13 +12,13 @@ class TestRetryLogic:
 
     @pytest.mark.asyncio
     async def test_retry_decorator_configuration(self) -> None:
-        """Test that the retry decorator is properly configured on fetch_problem."""
+        """Test that the retry decorator is properly configured on the upstream fetch."""
         client = LeetCodeClient()
 
         # Check that the method has retry attributes from tenacity
-        assert hasattr(client.fetch_problem, 'retry')
-        assert hasattr(client.fetch_problem.retry, 'stop')
-        assert hasattr(client.fetch_problem.retry, 'wait')
+        assert hasattr(client._fetch_problem_upstream, "retry")
+        assert hasattr(client._fetch_problem_upstream.retry, "stop")
+        assert hasattr(client._fetch_problem_upstream.retry, "wait")
 
     @pytest.mark.asyncio
     async def test_fetch_problem_retries_on_network_error(self) -> None:
@@ -0,0 +1,186 @@
+"""Tests for the priority scheduler of upstream requests."""
+
+import asyncio
+import pytest
+from typing import List
+from unittest.mock import AsyncMock, MagicMock, patch
+from aiolimiter import AsyncLimiter
+from interview_prep_mcp.leetcode.client import LeetCodeClient
+from interview_prep_mcp.leetcode.scheduler import Priority, UpstreamScheduler
+
+
+async def settle() -> None:
+    """Let queued tasks run until they block."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestUpstreamScheduler:
+    """Tests for UpstreamScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_interactive_overtakes_background_backlog(self) -> None:
+        """Test that an interactive request only waits for the next token."""
+        scheduler = UpstreamScheduler(AsyncLimiter(1, 0.02), caps={Priority.BACKGROUND: None})
+        order: List[str] = []
+
+        async def request(name: str, priority: Priority) -> None:
+            async with scheduler.slot(priority):
+                order.append(name)
+
+        background = [
+            asyncio.create_task(request(f"page-{i}", Priority.BACKGROUND)) for i in range(6)
+        ]
+        await settle()
+        await request("user", Priority.INTERACTIVE)
+        await asyncio.gather(*background)
+
+        assert order.index("user") <= 2
+        assert sorted(order) == sorted(["user"] + [f"page-{i}" for i in range(6)])
+
+    @pytest.mark.asyncio
+    async def test_prefetch_ranks_between_interactive_and_background(self) -> None:
+        """Test admission order across all three classes."""
+        scheduler = UpstreamScheduler(
+            AsyncLimiter(1, 0.02), caps={Priority.BACKGROUND: None, Priority.PREFETCH: None}
+        )
+        order: List[str] = []
+        gate = asyncio.Event()
+
+        async def blocker() -> None:
+            async with scheduler.slot(Priority.INTERACTIVE):
+                await gate.wait()
+
+        async def request(name: str, priority: Priority) -> None:
+            async with scheduler.slot(priority):
+                order.append(name)
+
+        # Drain the single token so everything else has to queue
+        first = asyncio.create_task(blocker())
+        await settle()
+        tasks = [
+            asyncio.create_task(request("background", Priority.BACKGROUND)),
+            asyncio.create_task(request("prefetch", Priority.PREFETCH)),
+            asyncio.create_task(request("interactive", Priority.INTERACTIVE)),
+        ]
+        await asyncio.gather(*tasks)
+        gate.set()
+        await first
+
+        # The background request took the head of the line before the others arrived
+        assert order == ["background", "interactive", "prefetch"]
+
+    @pytest.mark.asyncio
+    async def test_per_class_concurrency_cap(self) -> None:
+        """Test that a class at its cap queues while other classes proceed."""
+        scheduler = UpstreamScheduler(AsyncLimiter(1000, 1), caps={Priority.BACKGROUND: 1})
+        release = asyncio.Event()
+
+        async def hold(priority: Priority) -> None:
+            async with scheduler.slot(priority):
+                await release.wait()
+
+        tasks = [asyncio.create_task(hold(Priority.BACKGROUND)) for _ in range(3)]
+        await settle()
+        async with scheduler.slot(Priority.INTERACTIVE):
+            metrics = scheduler.metrics()
+
+        assert metrics["background"].in_flight == 1
+        assert metrics["background"].queued == 2
+        assert metrics["interactive"].in_flight == 1
+
+        release.set()
+        await asyncio.gather(*tasks)
+        metrics = scheduler.metrics()
+        assert metrics["background"].admitted == 3
+        assert metrics["background"].max_queued == 2
+        assert metrics["background"].in_flight == 0
+        assert metrics["background"].queued == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self) -> None:
+        """Test that cancelling a queued request frees its place."""
+        scheduler = UpstreamScheduler(AsyncLimiter(1000, 1), caps={Priority.PREFETCH: 1})
+        release = asyncio.Event()
+
+        async def hold() -> None:
+            async with scheduler.slot(Priority.PREFETCH):
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        waiter = asyncio.create_task(hold())
+        await settle()
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+
+        assert scheduler.metrics()["prefetch"].queued == 0
+        release.set()
+        await holder
+        async with scheduler.slot(Priority.PREFETCH):
+            assert scheduler.metrics()["prefetch"].in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_wait_time_recorded(self) -> None:
+        """Test that time spent queued is accumulated per class."""
+        # Clock readings at enqueue and at admission
+        scheduler = UpstreamScheduler(AsyncLimiter(1000, 1), clock=iter([10.0, 10.5]).__next__)
+
+        async with scheduler.slot(Priority.PREFETCH):
+            pass
+
+        assert scheduler.metrics()["prefetch"].admitted == 1
+        assert scheduler.metrics()["prefetch"].total_wait_seconds == 0.5
+
+
+class TestClientPriorities:
+    """Tests for the priorities LeetCodeClient assigns."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_problem_is_interactive(self, mock_response_data) -> None:  # type: ignore[no-untyped-def,misc]
+        """Test that a user fetch is scheduled as interactive."""
+        client = LeetCodeClient()
+        response = MagicMock()
+        response.json.return_value = mock_response_data
+        response.raise_for_status = MagicMock()
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_instance = MagicMock()
+            mock_instance.post = AsyncMock(return_value=response)
+            mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
+            mock_instance.__aexit__ = AsyncMock(return_value=None)
+            mock_client_class.return_value = mock_instance
+            await client.fetch_problem("two-sum")
+
+        assert client.scheduler.metrics()["interactive"].admitted == 1
+        assert client.scheduler.metrics()["background"].admitted == 0
+
+    @pytest.mark.asyncio
+    async def test_catalog_pages_are_background(self) -> None:
+        """Test that catalog pagination is scheduled as background work."""
+        client = LeetCodeClient()
+        response = MagicMock()
+        response.json.return_value = {
+            "data": {"problemsetQuestionList": {"total": 0, "questions": []}}
+        }
+        response.raise_for_status = MagicMock()
+        http = MagicMock()
+        http.post = AsyncMock(return_value=response)
+
+        await client._fetch_catalog_page(http, {"query": ""})
+
+        assert client.scheduler.metrics()["background"].admitted == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_refresh_is_background(self) -> None:
+        """Test that a stale-while-revalidate refresh is scheduled as background."""
+        client = LeetCodeClient()
+        priorities: List[Priority] = []
+
+        async def post(query: str, variables: object, priority: Priority) -> None:
+            priorities.append(priority)
+
+        with patch.object(client, "_post_question_query", side_effect=post):
+            await client._refresh_problem("two-sum")
+            await client.fetch_problem("two-sum")
+
+        assert priorities == [Priority.BACKGROUND, Priority.INTERACTIVE]
@@ -135,6 +135,28 @@ class TestSearchProblems:
 
         assert len(results) == 5
 
+    @pytest.mark.asyncio
+    async def test_search_problems_resumes_after(self, client) -> None:  # type: ignore[no-untyped-def,misc]
+        """Test that pages resume the scan right after the previous page's last match."""
+        client._problem_cache = [
+            CachedProblemInfo(
+                questionFrontendId=str(i),
+                title=f"Problem {i}",
+                titleSlug=f"problem-{i}",
+                difficulty="Easy",
+            )
+            for i in range(7)
+        ]
+
+        first = await client.search_problems("problem", limit=3)
+        second = await client.search_problems("problem", limit=3, after=first[-1].titleSlug)
+        last = await client.search_problems("problem", limit=3, after="problem-6")
+
+        assert [r.titleSlug for r in first + second] == [f"problem-{i}" for i in range(6)]
+        assert last == []
+        with pytest.raises(ValueError, match="unknown problem: gone"):
+            await client.search_problems("problem", after="gone")
+
     @pytest.mark.asyncio
     async def test_search_problems_builds_cache_if_needed(self, client) -> None:  # type: ignore[no-untyped-def,misc]
         """Test that search builds cache if not already built."""
@@ -192,4 +214,4 @@ class TestSearchProblems:
         results = await client.search_problems("two")
 
         assert len(results) == 2
-        assert all("two" in r.title.lower() or "two" in r.titleSlug.lower() for r in results)
\ No newline at end of file
+        assert all("two" in r.title.lower() or "two" in r.titleSlug.lower() for r in results)
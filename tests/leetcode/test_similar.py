@@ -0,0 +1,183 @@
+"""Tests for the similar-questions graph."""
+
+import json
+import pytest
+from pathlib import Path
+from typing import Dict, List, Mapping
+from unittest.mock import AsyncMock, patch
+from interview_prep_mcp.leetcode.client import LeetCodeClient
+from interview_prep_mcp.leetcode.similar import SimilarityGraph
+from interview_prep_mcp.leetcode.store import ProblemStore
+from interview_prep_mcp.leetcode.types import Problem
+from .conftest import mock_async_client
+
+
+def similar_json(*slugs: str) -> str:
+    """similarQuestions as GraphQL returns it: a JSON-encoded string."""
+    return json.dumps(
+        [
+            {
+                "title": slug.title(),
+                "titleSlug": slug,
+                "difficulty": "Medium",
+                "translatedTitle": None,
+            }
+            for slug in slugs
+        ]
+    )
+
+
+class TestSimilarityGraph:
+    """Tests for SimilarityGraph."""
+
+    def test_k_hop_neighbours_in_order(self) -> None:
+        """Test breadth-first neighbours with distances."""
+        graph = SimilarityGraph()
+        graph.add("two-sum", ["3sum", "two-sum-ii"])
+        graph.add("3sum", ["3sum-closest", "4sum"])
+
+        assert graph.neighbours("two-sum") == [("3sum", 1), ("two-sum-ii", 1)]
+        assert graph.neighbours("two-sum", hops=2) == [
+            ("3sum", 1),
+            ("two-sum-ii", 1),
+            ("3sum-closest", 2),
+            ("4sum", 2),
+        ]
+        assert graph.neighbours("two-sum", hops=2, limit=3) == [
+            ("3sum", 1),
+            ("two-sum-ii", 1),
+            ("3sum-closest", 2),
+        ]
+
+    def test_links_are_walked_both_ways(self) -> None:
+        """Test that a problem is reachable from problems that list it."""
+        graph = SimilarityGraph()
+        graph.add("3sum", ["two-sum"])
+
+        assert graph.neighbours("two-sum") == [("3sum", 1)]
+        assert not graph.is_collected("two-sum")
+        assert graph.is_collected("3sum")
+
+    def test_changed_list_replaces_links(self) -> None:
+        """Test that links dropped from a list disappear unless listed from the other side."""
+        graph = SimilarityGraph()
+        graph.add("a", ["b", "c", "a", "b"])
+        graph.add("c", ["a"])
+
+        assert graph.similar["a"] == ["b", "c"]
+        assert graph.add("a", ["b", "c"]) is False
+        assert graph.add("a", []) is True
+        assert graph.neighbours("a") == [("c", 1)]
+        assert graph.neighbours("b") == []
+
+    def test_unknown_problem(self) -> None:
+        """Test that an unknown problem has no neighbours."""
+        assert SimilarityGraph().neighbours("missing", hops=3) == []
+
+
+class TestSimilarQuestionsParsing:
+    """Tests for Problem.similarQuestions."""
+
+    def test_json_string_becomes_slugs(self) -> None:
+        """Test that the GraphQL JSON string is reduced to title slugs."""
+        problem = Problem.model_validate(
+            {
+                "questionId": "1",
+                "questionFrontendId": "1",
+                "title": "Two Sum",
+                "titleSlug": "two-sum",
+                "difficulty": "Easy",
+                "content": "",
+                "topicTags": [],
+                "codeSnippets": [],
+                "similarQuestions": similar_json("3sum", "4sum"),
+            }
+        )
+
+        assert problem.similarQuestions == ["3sum", "4sum"]
+        assert Problem.model_validate_json(problem.model_dump_json()).similarQuestions == [
+            "3sum",
+            "4sum",
+        ]
+
+    def test_missing_is_none(self) -> None:
+        """Test that problems fetched without the field report None, not []."""
+        problem = Problem.model_validate(
+            {
+                "questionId": "1",
+                "questionFrontendId": "1",
+                "title": "Two Sum",
+                "titleSlug": "two-sum",
+                "difficulty": "Easy",
+                "content": "",
+                "topicTags": [],
+                "codeSnippets": [],
+            }
+        )
+
+        assert problem.similarQuestions is None
+
+
+class TestClientSimilar:
+    """Tests for collecting similar questions in LeetCodeClient."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_records_and_persists_links(  # type: ignore[no-untyped-def,misc]
+        self, mock_response_data, mock_httpx_response, tmp_path: Path
+    ) -> None:
+        """Test that a fetched problem's links reach the graph and the store."""
+        mock_response_data["data"]["question"]["similarQuestions"] = similar_json("3sum")
+        mock_httpx_response.json.return_value = mock_response_data
+        store = ProblemStore(tmp_path / "problems.sqlite3")
+        client = LeetCodeClient(store=store)
+
+        with mock_async_client(mock_httpx_response):
+            await client.fetch_problem("two-sum")
+
+        assert client.similar.neighbours("two-sum") == [("3sum", 1)]
+        assert store.load_similar_sync() == {"two-sum": ["3sum"]}
+
+        # A new process sees the links without fetching anything
+        other = LeetCodeClient(store=store)
+        graph = await other.load_similar_graph()
+        assert graph.neighbours("3sum") == [("two-sum", 1)]
+
+    @pytest.mark.asyncio
+    async def test_bulk_collection_batches_aliased_queries(  # type: ignore[no-untyped-def,misc]
+        self, mock_httpx_response
+    ) -> None:
+        """Test that collect_similar_questions asks for several problems per request."""
+        client = LeetCodeClient()
+        requests: List[Mapping[str, object]] = []
+
+        async def post(url: str, json: Dict[str, Dict[str, str]], **kwargs: object) -> object:
+            requests.append(json)
+            slugs = list(json["variables"].values())
+            mock_httpx_response.json.return_value = {
+                "data": {
+                    f"q{i}": {"titleSlug": slug, "similarQuestions": similar_json(f"{slug}-ii")}
+                    for i, slug in enumerate(slugs)
+                }
+            }
+            return mock_httpx_response
+
+        with mock_async_client(side_effect=post):
+            collected = await client.collect_similar_questions(["a", "b", "c"], batch_size=2)
+
+        assert collected == 3
+        assert len(requests) == 2
+        assert "q1: question(titleSlug: $s1)" in str(requests[0]["query"])
+        assert client.similar.similar == {"a": ["a-ii"], "b": ["b-ii"], "c": ["c-ii"]}
+        assert client.scheduler.metrics()["background"].admitted == 2
+
+    @pytest.mark.asyncio
+    async def test_bulk_collection_skips_failed_batches(self) -> None:
+        """Test that a failing batch does not stop the pass."""
+        client = LeetCodeClient()
+        batches = [ValueError("GraphQL errors: rate limited"), {"c": ["d"]}]
+
+        with patch.object(client, "_fetch_similar_batch", new=AsyncMock(side_effect=batches)):
+            collected = await client.collect_similar_questions(["a", "b", "c"], batch_size=2)
+
+        assert collected == 1
+        assert client.similar.is_collected("c")
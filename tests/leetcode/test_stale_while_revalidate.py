@@ -0,0 +1,144 @@
+"""Tests for stale-while-revalidate serving of problems and the catalog."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+import httpx
+from interview_prep_mcp.leetcode import client as client_module
+from interview_prep_mcp.leetcode.cache import StaleWhileRevalidateCache
+from interview_prep_mcp.leetcode.circuit import CircuitBreaker
+from interview_prep_mcp.leetcode.client import LeetCodeClient
+from interview_prep_mcp.leetcode.types import CachedProblemInfo
+from ..conftest import make_problem
+
+
+async def drain(client: LeetCodeClient) -> None:
+    """Wait for all background refreshes to finish."""
+    while client._background_tasks:
+        await asyncio.gather(*client._background_tasks)
+
+
+class TestStaleWhileRevalidateCache:
+    """Tests for the cache container."""
+
+    def test_entries_go_stale(self) -> None:
+        """Test that entries are fresh within the TTL and stale after it."""
+        now = 0.0
+        cache: StaleWhileRevalidateCache[str] = StaleWhileRevalidateCache(10, clock=lambda: now)
+        cache.set("a", "value")
+
+        assert cache.lookup("a") == ("value", False)
+        now = 10.0
+        assert cache.lookup("a") == ("value", True)
+
+    def test_missing_key(self) -> None:
+        """Test that unknown keys return None."""
+        cache: StaleWhileRevalidateCache[str] = StaleWhileRevalidateCache(10)
+        assert cache.lookup("missing") is None
+        assert cache.get("missing") is None
+
+    def test_least_recently_used_evicted(self) -> None:
+        """Test that a bounded cache drops the entry used longest ago."""
+        cache: StaleWhileRevalidateCache[str] = StaleWhileRevalidateCache(10, max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        assert cache.lookup("a") == ("1", False)
+        cache.set("c", "3")
+
+        assert "b" not in cache
+        assert cache.get("a") == "1" and cache.get("c") == "3"
+        assert len(cache) == 2
+
+
+class TestProblemRevalidation:
+    """Tests for serving problems from the cache."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_problem_served_from_cache(self, client) -> None:  # type: ignore[no-untyped-def,misc]
+        """Test that a second fetch does not hit the network."""
+        upstream = AsyncMock(return_value=make_problem())
+        with patch.object(client, "_post_question_query", new=upstream):
+            first = await client.fetch_problem("two-sum")
+            second = await client.fetch_problem("two-sum")
+
+        assert first is second
+        assert upstream.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_problem_served_then_refreshed(self, client) -> None:  # type: ignore[no-untyped-def,misc]
+        """Test that a stale problem is returned immediately and refreshed in the background."""
+        now = 0.0
+        client._fetched_problems = StaleWhileRevalidateCache(10, clock=lambda: now)
+        client._fetched_problems.set("two-sum", make_problem(title="Old Title"))
+        now = 11.0
+
+        upstream = AsyncMock(return_value=make_problem(title="New Title"))
+        with patch.object(client, "_post_question_query", new=upstream):
+            problem = await client.fetch_problem("two-sum")
+            assert problem is not None
+            assert problem.title == "Old Title"
+            await drain(client)
+
+        assert upstream.call_count == 1
+        refreshed = client._fetched_problems.get("two-sum")
+        assert refreshed is not None
+        assert refreshed.title == "New Title"
+
+    @pytest.mark.asyncio
+    async def test_stale_problem_served_when_refresh_fails(self, client) -> None:  # type: ignore[no-untyped-def,misc]
+        """Test that a failed background refresh keeps the last known good copy."""
+        now = 0.0
+        client._fetched_problems = StaleWhileRevalidateCache(10, clock=lambda: now)
+        client._fetched_problems.set("two-sum", make_problem(title="Old Title"))
+        now = 11.0
+
+        upstream = AsyncMock(side_effect=httpx.ConnectError("refused"))
+        with patch.object(client, "_post_question_query", new=upstream):
+            problem = await client.fetch_problem("two-sum")
+            await drain(client)
+
+        assert problem is not None
+        assert problem.title == "Old Title"
+        assert client._fetched_problems.get("two-sum") is problem
+
+    @pytest.mark.asyncio
+    async def test_stale_problem_served_while_circuit_open(self, client) -> None:  # type: ignore[no-untyped-def,misc]
+        """Test that no refresh is attempted while the circuit is open."""
+        now = 0.0
+        client._fetched_problems = StaleWhileRevalidateCache(10, clock=lambda: now)
+        client._fetched_problems.set("two-sum", make_problem())
+        now = 11.0
+        client._circuit_breaker = CircuitBreaker(failure_threshold=1)
+        client._circuit_breaker.record_failure()
+
+        upstream = AsyncMock()
+        with patch.object(client, "_post_question_query", new=upstream):
+            problem = await client.fetch_problem("two-sum")
+
+        assert problem is not None
+        assert not client._background_tasks
+        upstream.assert_not_called()
+
+
+class TestCatalogRevalidation:
+    """Tests for serving the catalog while it is rebuilt."""
+
+    @pytest.mark.asyncio
+    async def test_stale_catalog_rebuilt_in_background(self, client) -> None:  # type: ignore[no-untyped-def,misc]
+        """Test that a stale catalog is served and rebuilt in the background."""
+        client._id_to_slug_cache = {"1": "two-sum"}
+        client._problem_cache = [
+            CachedProblemInfo(questionFrontendId="1", title="Two Sum", titleSlug="two-sum")
+        ]
+        client._catalog_built_at = 0.0
+
+        async def rebuild() -> dict[str, str]:
+            client._catalog_built_at = 1e12
+            return {"1": "two-sum", "2": "add-two-numbers"}
+
+        with patch.object(client, "_build_id_to_slug_cache", new=AsyncMock(side_effect=rebuild)):
+            with patch.object(client_module, "CATALOG_TTL_SECONDS", 0):
+                assert await client.get_slug_by_id(2) is None
+                await drain(client)
+
+        assert await client.get_slug_by_id(2) == "add-two-numbers"
@@ -0,0 +1,282 @@
+"""Tests for the SQLite-backed problem store."""
+
+import multiprocessing
+import sqlite3
+import pytest
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+from interview_prep_mcp.leetcode.client import LeetCodeClient, PROBLEM_TTL_SECONDS
+from interview_prep_mcp.leetcode.store import ProblemStore
+from interview_prep_mcp.leetcode.types import CachedProblemInfo
+from interview_prep_mcp.server import env_store
+from ..conftest import make_problem
+
+
+def write_problems(path: str, worker: int, count: int) -> None:
+    """Write problems from a separate process."""
+    store = ProblemStore(path)
+    for i in range(count):
+        store.put_problem_sync(make_problem(f"problem-{worker}-{i}"))
+    store.save_catalog_sync(
+        [
+            CachedProblemInfo(questionFrontendId=str(i), title=f"P{i}", titleSlug=f"p-{i}")
+            for i in range(100)
+        ]
+    )
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> ProblemStore:
+    """Create a store in a temporary directory."""
+    return ProblemStore(tmp_path / "problems.sqlite3")
+
+
+class TestProblemStore:
+    """Tests for ProblemStore."""
+
+    def test_uses_wal_mode(self, store: ProblemStore) -> None:
+        """Test that the database is in WAL mode."""
+        conn = sqlite3.connect(store.path)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        conn.close()
+
+    def test_problem_round_trip(self, store: ProblemStore) -> None:
+        """Test that a stored problem reads back identically."""
+        problem = make_problem()
+        store.put_problem_sync(problem)
+
+        stored = store.get_problem_sync("two-sum")
+
+        assert stored is not None
+        assert stored[0] == problem
+        assert 0 <= stored[1] < 5
+
+    def test_missing_problem(self, store: ProblemStore) -> None:
+        """Test that unknown slugs return None."""
+        assert store.get_problem_sync("missing") is None
+
+    def test_catalog_round_trip(self, store: ProblemStore) -> None:
+        """Test that the catalog keeps its order and fields."""
+        assert store.load_catalog_sync() is None
+        catalog = [
+            CachedProblemInfo(
+                questionFrontendId="2",
+                title="Add Two Numbers",
+                titleSlug="add-two-numbers",
+                difficulty="Medium",
+            ),
+            CachedProblemInfo(questionFrontendId="1", title="Two Sum", titleSlug="two-sum"),
+        ]
+        store.save_catalog_sync(catalog)
+        store.save_catalog_sync(catalog)
+
+        loaded = store.load_catalog_sync()
+
+        assert loaded is not None
+        assert loaded[0] == catalog
+
+    def test_old_schema_is_dropped(self, tmp_path: Path) -> None:
+        """Test that opening a version 1 database discards its catalog and problems."""
+        path = tmp_path / "problems.sqlite3"
+        conn = sqlite3.connect(path)
+        conn.executescript("""
+            CREATE TABLE problems (title_slug TEXT PRIMARY KEY, data TEXT NOT NULL,
+                                   fetched_at REAL NOT NULL);
+            CREATE TABLE catalog (position INTEGER PRIMARY KEY, question_frontend_id TEXT NOT NULL,
+                                  title TEXT NOT NULL, title_slug TEXT NOT NULL, difficulty TEXT);
+            CREATE TABLE metadata (key TEXT PRIMARY KEY, value REAL NOT NULL);
+            INSERT INTO catalog VALUES (0, '1', 'Two Sum', 'two-sum', 'Easy');
+            INSERT INTO metadata VALUES ('catalog_built_at', 0);
+            PRAGMA user_version=1;
+        """)
+        conn.execute(
+            "INSERT INTO problems VALUES (?, ?, 0)", ("two-sum", make_problem().model_dump_json())
+        )
+        conn.commit()
+        conn.close()
+
+        store = ProblemStore(path)
+
+        assert store.load_catalog_sync() is None
+        assert store.get_problem_sync("two-sum") is None
+        store.save_catalog_sync(
+            [CachedProblemInfo(questionFrontendId="1", title="Two Sum", titleSlug="two-sum")]
+        )
+        assert store.load_catalog_sync() is not None
+
+    def test_invalid_problem_is_a_miss(self, store: ProblemStore) -> None:
+        """Test that a row that no longer validates is deleted and reported as missing."""
+        conn = sqlite3.connect(store.path)
+        conn.execute("INSERT INTO problems VALUES ('two-sum', '{\"title\": \"Two Sum\"}', 0)")
+        conn.commit()
+        conn.close()
+
+        assert store.get_problem_sync("two-sum") is None
+        conn = sqlite3.connect(store.path)
+        assert conn.execute("SELECT COUNT(*) FROM problems").fetchone()[0] == 0
+        conn.close()
+
+    def test_reopen_existing_database(self, store: ProblemStore) -> None:
+        """Test that a second store on the same file sees existing data."""
+        store.put_problem_sync(make_problem())
+
+        assert ProblemStore(store.path).get_problem_sync("two-sum") is not None
+
+    @pytest.mark.asyncio
+    async def test_async_methods_swallow_sqlite_errors(self, store: ProblemStore) -> None:
+        """Test that SQLite failures degrade to cache misses."""
+        with patch.object(
+            store, "get_problem_sync", side_effect=sqlite3.OperationalError("locked")
+        ):
+            assert await store.get_problem("two-sum") is None
+        with patch.object(
+            store, "put_problem_sync", side_effect=sqlite3.OperationalError("locked")
+        ):
+            await store.put_problem(make_problem())
+
+    def test_concurrent_writers_across_processes(self, tmp_path: Path) -> None:
+        """Test that several processes can write to one store at once."""
+        path = str(tmp_path / "shared.sqlite3")
+        ProblemStore(path)
+        context = multiprocessing.get_context("spawn")
+        workers = [context.Process(target=write_problems, args=(path, w, 50)) for w in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=60)
+            assert worker.exitcode == 0
+
+        store = ProblemStore(path)
+        for w in range(4):
+            for i in range(50):
+                assert store.get_problem_sync(f"problem-{w}-{i}") is not None
+        loaded = store.load_catalog_sync()
+        assert loaded is not None
+        assert len(loaded[0]) == 100
+
+    def test_concurrent_opens_of_old_schema(self, tmp_path: Path) -> None:
+        """Test that processes opening an outdated store at once migrate it only once."""
+        path = str(tmp_path / "shared.sqlite3")
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE problems (title_slug TEXT PRIMARY KEY)")
+        conn.execute("PRAGMA user_version=1")
+        conn.commit()
+        conn.close()
+        context = multiprocessing.get_context("spawn")
+        workers = [context.Process(target=write_problems, args=(path, w, 20)) for w in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=60)
+            assert worker.exitcode == 0
+
+        store = ProblemStore(path)
+        for w in range(4):
+            for i in range(20):
+                assert store.get_problem_sync(f"problem-{w}-{i}") is not None
+
+
+class TestEnvStore:
+    """Tests for configuring the store from the environment."""
+
+    def test_path_from_environment(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a path value opens a store there."""
+        monkeypatch.setenv("INTERVIEW_PREP_STORE", str(tmp_path / "problems.sqlite3"))
+
+        store = env_store()
+
+        assert store is not None
+        assert store.path == tmp_path / "problems.sqlite3"
+
+    def test_corrupt_database_disables_store(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a store that cannot be opened is skipped instead of failing startup."""
+        path = tmp_path / "problems.sqlite3"
+        path.write_bytes(b"not a database" * 100)
+        monkeypatch.setenv("INTERVIEW_PREP_STORE", str(path))
+
+        assert env_store() is None
+
+
+class TestClientWithStore:
+    """Tests for LeetCodeClient backed by a shared store."""
+
+    @pytest.mark.asyncio
+    async def test_problem_fetched_by_one_client_is_local_for_another(
+        self, store: ProblemStore
+    ) -> None:
+        """Test that a second process-like client reads the problem from the store."""
+        first = LeetCodeClient(store=store)
+        with patch.object(
+            first, "_post_question_query", new=AsyncMock(return_value=make_problem())
+        ):
+            await first.fetch_problem("two-sum")
+
+        second = LeetCodeClient(store=store)
+        upstream = AsyncMock()
+        with patch.object(second, "_post_question_query", new=upstream):
+            problem = await second.fetch_problem("two-sum")
+
+        assert problem == make_problem()
+        upstream.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stale_stored_problem_is_revalidated(self, store: ProblemStore) -> None:
+        """Test that an old stored problem is served and refreshed in the background."""
+        store.put_problem_sync(make_problem(title="Old Title"))
+        client = LeetCodeClient(store=store)
+        refreshed = AsyncMock(return_value=make_problem(title="New Title"))
+
+        with (
+            patch.object(
+                store,
+                "get_problem",
+                new=AsyncMock(
+                    return_value=(make_problem(title="Old Title"), PROBLEM_TTL_SECONDS + 1)
+                ),
+            ),
+            patch.object(client, "_post_question_query", new=refreshed),
+        ):
+            problem = await client.fetch_problem("two-sum")
+            for task in list(client._background_tasks):
+                await task
+
+        assert problem is not None
+        assert problem.title == "Old Title"
+        stored = store.get_problem_sync("two-sum")
+        assert stored is not None
+        assert stored[0].title == "New Title"
+
+    @pytest.mark.asyncio
+    async def test_catalog_loaded_from_store(self, store: ProblemStore) -> None:
+        """Test that a stored catalog avoids the network build."""
+        store.save_catalog_sync(
+            [CachedProblemInfo(questionFrontendId="1", title="Two Sum", titleSlug="two-sum")]
+        )
+        client = LeetCodeClient(store=store)
+
+        with patch.object(client, "_build_id_to_slug_cache", new=AsyncMock()) as build:
+            assert await client.get_slug_by_id(1) == "two-sum"
+            results = await client.search_problems("two")
+
+        build.assert_not_called()
+        assert [r.titleSlug for r in results] == ["two-sum"]
+
+    @pytest.mark.asyncio
+    async def test_built_catalog_saved_to_store(self, store: ProblemStore) -> None:
+        """Test that a freshly built catalog is written to the store."""
+        client = LeetCodeClient(store=store)
+
+        async def build() -> dict[str, str]:
+            client._problem_cache = [
+                CachedProblemInfo(questionFrontendId="1", title="Two Sum", titleSlug="two-sum")
+            ]
+            return {"1": "two-sum"}
+
+        with patch.object(client, "_build_id_to_slug_cache", new=AsyncMock(side_effect=build)):
+            await client.get_slug_by_id(1)
+
+        loaded = store.load_catalog_sync()
+        assert loaded is not None
+        assert [p.titleSlug for p in loaded[0]] == ["two-sum"]
@@ -0,0 +1,205 @@
+"""Tests for streaming decode of the REST problem list."""
+
+import json
+import pytest
+from typing import AsyncIterator, Iterator
+from unittest.mock import AsyncMock, patch
+import httpx
+from interview_prep_mcp.leetcode.client import LeetCodeClient
+from interview_prep_mcp.leetcode.streaming import JSONArrayStream
+
+REST_PAYLOAD = json.dumps(
+    {
+        "user_name": "",
+        "num_total": 3,
+        "stat_status_pairs": [
+            {
+                "stat": {
+                    "frontend_question_id": 1,
+                    "question__title": "Two Sum",
+                    "question__title_slug": "two-sum",
+                },
+                "difficulty": {"level": 1},
+                "paid_only": False,
+            },
+            {
+                "stat": {
+                    "frontend_question_id": 42,
+                    "question__title": "Trapping Rain Water — ☔",
+                    "question__title_slug": "trapping-rain-water",
+                },
+                "difficulty": {"level": 3},
+                "paid_only": False,
+            },
+            {
+                "stat": {"frontend_question_id": 0, "question__title_slug": ""},
+                "difficulty": {"level": 2},
+            },
+        ],
+        "category_slug": "algorithms",
+    },
+    ensure_ascii=False,
+).encode()
+
+
+def split(body: bytes, size: int) -> Iterator[bytes]:
+    """Split bytes into fixed-size chunks."""
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+class TestJSONArrayStream:
+    """Tests for JSONArrayStream."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, len(REST_PAYLOAD)])
+    def test_decodes_all_items_for_any_chunking(self, chunk_size: int) -> None:
+        """Test that items are decoded regardless of where chunks split."""
+        stream = JSONArrayStream("stat_status_pairs")
+        items: list[object] = []
+        for chunk in split(REST_PAYLOAD, chunk_size):
+            items.extend(stream.feed(chunk))
+        stream.close()
+
+        assert items == json.loads(REST_PAYLOAD)["stat_status_pairs"]
+        assert stream.done
+
+    def test_items_yielded_before_body_ends(self) -> None:
+        """Test that completed items are returned as soon as their bytes arrive."""
+        stream = JSONArrayStream("stat_status_pairs")
+        cutoff = REST_PAYLOAD.index(b"trapping-rain-water")
+
+        items = stream.feed(REST_PAYLOAD[:cutoff])
+
+        assert len(items) == 1
+
+    def test_ignores_fields_after_array(self) -> None:
+        """Test that data after the closing bracket is ignored."""
+        stream = JSONArrayStream("items")
+        assert stream.feed(b'{"items": [1, 2], "items_again": [3]}') == [1, 2]
+        stream.close()
+
+    def test_missing_field_raises(self) -> None:
+        """Test that a body without the field is rejected."""
+        stream = JSONArrayStream("stat_status_pairs")
+        stream.feed(b'{"error": "blocked"}')
+
+        with pytest.raises(ValueError, match="not found"):
+            stream.close()
+
+    def test_truncated_array_raises(self) -> None:
+        """Test that a body cut off mid-array is rejected."""
+        stream = JSONArrayStream("stat_status_pairs")
+        stream.feed(REST_PAYLOAD[: len(REST_PAYLOAD) // 2])
+
+        with pytest.raises(ValueError, match="ended inside"):
+            stream.close()
+
+
+def patch_rest_transport(body: bytes, status_code: int = 200):  # type: ignore[no-untyped-def]
+    """Patch httpx.AsyncClient to serve ``body`` in small chunks."""
+    real_async_client = httpx.AsyncClient
+
+    async def chunks() -> AsyncIterator[bytes]:
+        for chunk in split(body, 16):
+            yield chunk
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status_code, content=chunks())
+
+    return patch(
+        "httpx.AsyncClient",
+        side_effect=lambda *args, **kwargs: real_async_client(
+            transport=httpx.MockTransport(handler)
+        ),
+    )
+
+
+class TestBuildCacheFromApi:
+    """Tests for the streamed REST catalog build."""
+
+    @pytest.mark.asyncio
+    async def test_builds_catalog_from_stream(self, client) -> None:  # type: ignore[no-untyped-def,misc]
+        """Test that the streamed REST payload populates both caches."""
+        with patch_rest_transport(REST_PAYLOAD):
+            cache = await client._build_cache_from_api()
+
+        assert cache == {"1": "two-sum", "42": "trapping-rain-water"}
+        assert client._problem_cache is not None
+        assert [p.difficulty for p in client._problem_cache] == ["Easy", "Hard"]
+        assert client._problem_cache[1].title == "Trapping Rain Water — ☔"
+
+    @pytest.mark.asyncio
+    async def test_truncated_payload_raises(self, client) -> None:  # type: ignore[no-untyped-def,misc]
+        """Test that a truncated body raises instead of caching a partial catalog."""
+        with patch_rest_transport(REST_PAYLOAD[:200]):
+            with pytest.raises(ValueError):
+                await client._build_cache_from_api()
+
+        assert client._problem_cache is None
+
+
+class TestCatalogSource:
+    """Tests for choosing the catalog source."""
+
+    @pytest.mark.asyncio
+    async def test_rest_source_skips_graphql(self) -> None:
+        """Test that catalog_source='rest' builds from the single REST request."""
+        client = LeetCodeClient(catalog_source="rest")
+        with (
+            patch.object(
+                client, "_build_cache_from_api", new=AsyncMock(return_value={"1": "two-sum"})
+            ),
+            patch.object(client, "_fetch_catalog_page", new=AsyncMock()) as graphql,
+        ):
+            cache = await client._build_id_to_slug_cache()
+
+        assert cache == {"1": "two-sum"}
+        graphql.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rest_source_falls_back_to_graphql(self) -> None:
+        """Test that a failed REST build falls back to paginated GraphQL."""
+        client = LeetCodeClient(catalog_source="rest")
+        page = {
+            "data": {
+                "problemsetQuestionList": {
+                    "total": 1,
+                    "questions": [
+                        {
+                            "questionFrontendId": "1",
+                            "title": "Two Sum",
+                            "titleSlug": "two-sum",
+                            "difficulty": "Easy",
+                        }
+                    ],
+                }
+            }
+        }
+        with (
+            patch.object(
+                client, "_build_cache_from_api", new=AsyncMock(side_effect=ValueError("truncated"))
+            ),
+            patch.object(client, "_fetch_catalog_page", new=AsyncMock(return_value=page)),
+        ):
+            cache = await client._build_id_to_slug_cache()
+
+        assert cache == {"1": "two-sum"}
+
+    @pytest.mark.asyncio
+    async def test_rest_source_not_requested_twice(self) -> None:
+        """Test that REST is not retried as the fallback when GraphQL also fails."""
+        client = LeetCodeClient(catalog_source="rest")
+        with (
+            patch.object(
+                client, "_build_cache_from_api", new=AsyncMock(side_effect=ValueError("truncated"))
+            ) as rest,
+            patch.object(
+                client,
+                "_fetch_catalog_page",
+                new=AsyncMock(side_effect=httpx.ConnectError("refused")),
+            ),
+        ):
+            with pytest.raises(httpx.ConnectError):
+                await client._build_id_to_slug_cache()
+
+        assert rest.call_count == 1
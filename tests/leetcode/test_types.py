@@ -293,4 +293,26 @@ class TestProblem:
             langSlug="python3",
             code=""
         )
-        assert snippet.code == ""
\ No newline at end of file
+        assert snippet.code == ""
+
+    def test_problem_content_hash(self) -> None:
+        """Test that the hash follows what is shown, and only that."""
+
+        def make(content: str = "<p>Test</p>", similar: object = None) -> Problem:
+            return Problem(
+                questionId="1",
+                questionFrontendId="1",
+                title="Two Sum",
+                titleSlug="two-sum",
+                difficulty="Easy",
+                content=content,
+                topicTags=[TopicTag(name="Array", slug="array")],
+                codeSnippets=[CodeSnippet(lang="Python3", langSlug="python3", code="pass")],
+                similarQuestions=similar,  # type: ignore[arg-type]
+            )
+
+        problem = make()
+        assert len(problem.content_hash) == 16
+        assert problem.content_hash == make().content_hash
+        assert problem.content_hash == make(similar=["3sum"]).content_hash
+        assert problem.content_hash != make(content="<p>Edited</p>").content_hash
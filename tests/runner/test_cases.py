@@ -0,0 +1,64 @@
+"""Tests for test case and signature parsing."""
+
+import pytest
+from interview_prep_mcp.runner.cases import (
+    expected_outputs,
+    outputs_match,
+    parse_expected,
+    parse_signature,
+    split_cases,
+)
+
+
+class TestCases:
+    """Tests for runner.cases."""
+
+    def test_parse_signature(self) -> None:
+        """Test reading the method, parameters and annotations from a template."""
+        template = (
+            "# Definition for a binary tree node.\n# class TreeNode:\n"
+            "#     def __init__(self, val=0):\n\n"
+            "class Solution:\n"
+            "    def merge(self, intervals: List[List[int]], lookup: Dict[int, str], "
+            "root: Optional[TreeNode]) -> None:\n"
+            "        "
+        )
+
+        signature = parse_signature(template)
+
+        assert signature.method == "merge"
+        assert signature.params == ["intervals", "lookup", "root"]
+        assert signature.annotations == ["List[List[int]]", "Dict[int, str]", "Optional[TreeNode]"]
+        assert signature.returns == "None"
+
+    def test_design_problems_are_rejected(self) -> None:
+        """Test that templates without class Solution cannot be run."""
+        with pytest.raises(ValueError, match="design problems"):
+            parse_signature("class LRUCache:\n    def get(self, key: int) -> int:\n        ")
+
+    def test_split_cases(self) -> None:
+        """Test grouping input lines by the method's arity."""
+        assert split_cases("[2,7,11,15]\n9\n\n[3,2,4]\n6\n", 2) == [
+            ["[2,7,11,15]", "9"],
+            ["[3,2,4]", "6"],
+        ]
+        with pytest.raises(ValueError, match="2 line"):
+            split_cases("[1]\n2\n3", 2)
+
+    def test_expected_outputs(self) -> None:
+        """Test extracting Output: lines from a description."""
+        content = (
+            "<pre><strong>Input:</strong> nums = [2,7,11,15], target = 9\n"
+            "<strong>Output:</strong> [0,1]\n<strong>Explanation:</strong> ...</pre>"
+            '<pre><strong>Input:</strong> s = "ab"\n<strong>Output:</strong> true</pre>'
+        )
+
+        assert expected_outputs(content) == ["[0,1]", "true"]
+
+    def test_outputs_match(self) -> None:
+        """Test comparison rules: strict booleans, float tolerance, raw text."""
+        assert outputs_match([0, 1], parse_expected("[0,1]"))
+        assert outputs_match(2.000001, parse_expected("2.00000"))
+        assert not outputs_match(1, parse_expected("true"))
+        assert not outputs_match([1, 0], parse_expected("[0,1]"))
+        assert not outputs_match(2, parse_expected("2, nums = [1,2,_]"))
@@ -0,0 +1,105 @@
+"""Tests for empirical complexity fitting and input growth."""
+
+import math
+import random
+import pytest
+from typing import Callable, List
+from interview_prep_mcp.runner.complexity import (
+    Sample,
+    best_fit,
+    fit_models,
+    grow_case,
+    grow_value,
+    size_parameters,
+    sizes,
+)
+
+
+def samples(f: Callable[[int], float], ns: List[int], jitter: float = 0.05) -> List[Sample]:
+    rng = random.Random(1)
+    return [Sample(n=n, seconds=f(n) * (1 + rng.uniform(-jitter, jitter))) for n in ns]
+
+
+GEOMETRIC = sizes(100_000)
+
+
+class TestFitting:
+    """Tests for fit_models and best_fit."""
+
+    @pytest.mark.parametrize(
+        "model, f",
+        [
+            ("O(n)", lambda n: 2e-5 + 1e-7 * n),
+            ("O(n log n)", lambda n: 2e-5 + 1e-7 * n * math.log2(n)),
+            ("O(n^2)", lambda n: 2e-5 + 1e-9 * n * n),
+        ],
+    )
+    def test_polynomial_growth(self, model: str, f: Callable[[int], float]) -> None:
+        """Test that noisy polynomial timings are classified correctly."""
+        measured = samples(f, GEOMETRIC)
+
+        assert best_fit(fit_models(measured), measured).model == model
+
+    def test_growth_within_noise_is_constant(self) -> None:
+        """Test that timings within the noise floor are O(1)."""
+        measured = samples(lambda n: 2e-6 + 2e-6 * math.log2(n) / 17, GEOMETRIC, jitter=0.5)
+
+        assert best_fit(fit_models(measured), measured).model == "O(1)"
+
+    def test_exponential_growth(self) -> None:
+        """Test that exponential timings (base other than 2) are recognized and extrapolated."""
+        measured = samples(lambda n: 1e-6 * 1.618**n, [8, 11, 16, 23, 32])
+
+        best = best_fit(fit_models(measured), measured)
+
+        assert best.model == "O(2^n)"
+        assert best.coefficient == pytest.approx(1.618, rel=0.02)
+        assert best.predict(45) > 100
+
+    def test_exponential_is_not_considered_for_large_n(self) -> None:
+        """Test that O(2^n) is only fitted when every n is small."""
+        assert "O(2^n)" not in {
+            fit.model for fit in fit_models(samples(lambda n: 1e-7 * n, GEOMETRIC))
+        }
+
+    def test_needs_two_samples(self) -> None:
+        """Test that one sample cannot be fitted."""
+        with pytest.raises(ValueError):
+            fit_models([Sample(n=8, seconds=1e-6)])
+
+
+class TestInputGrowth:
+    """Tests for generating inputs shaped like an example."""
+
+    def test_sizes_grow_geometrically(self) -> None:
+        """Test the size schedule."""
+        assert sizes(64) == [8, 11, 16, 23, 32, 45, 64]
+
+    def test_grow_lists_strings_and_grids(self) -> None:
+        """Test growth of each argument shape."""
+        rng = random.Random(0)
+
+        nums, size = grow_value([2, 7, 11, 15], 100, rng)
+        assert isinstance(nums, list)
+        assert size == 100 and len(nums) == 100 and min(nums) >= 2 and max(nums) <= 102
+        word, _ = grow_value("abca", 50, rng)
+        assert isinstance(word, str)
+        assert len(word) == 50 and set(word) <= {"a", "b", "c"}
+        edges, _ = grow_value([[0, 1], [1, 2]], 10, rng)
+        assert isinstance(edges, list)
+        assert len(edges) == 10 and all(edge in ([0, 1], [1, 2]) for edge in edges)
+        grid, cells = grow_value([["1", "0", "1"], ["0", "1", "1"]], 50, rng)
+        assert isinstance(grid, list)
+        assert cells == 49 and len(grid) == 7 and all(len(row) == 7 for row in grid)
+        tree, _ = grow_value([3, 9, 20, None, None, 15, 7], 20, rng)
+        assert isinstance(tree, list)
+        assert None not in tree
+
+    def test_integers_grow_only_without_lists(self) -> None:
+        """Test that target-like integers keep their value."""
+        assert size_parameters([[2, 7, 11, 15], 9]) == [0]
+        assert size_parameters([5]) == [0]
+
+        lines, size = grow_case([[1, 2], 3], [0], 4, random.Random(0))
+        assert size == 4 and lines[1] == "3" and len(lines[0].split(",")) == 4
+        assert grow_case([3], [0], 16, random.Random(0)) == (["16"], 16)
@@ -0,0 +1,97 @@
+"""Tests for constraint parsing."""
+
+from interview_prep_mcp.runner.constraints import (
+    Range,
+    Reference,
+    constraint_lines,
+    parse_constraints,
+    parse_number,
+    size_limit,
+)
+
+TWO_SUM = (
+    "<p>Given an array...</p><p><strong>Constraints:</strong></p><ul>"
+    "<li><code>2 &lt;= nums.length &lt;= 10<sup>4</sup></code></li>"
+    "<li><code>-10<sup>9</sup> &lt;= nums[i] &lt;= 10<sup>9</sup></code></li>"
+    "<li><code>-10<sup>9</sup> &lt;= target &lt;= 10<sup>9</sup></code></li>"
+    "<li><strong>Only one valid answer exists.</strong></li></ul>"
+)
+GRID = (
+    "<p><strong>Constraints:</strong></p><ul><li><code>m == grid.length</code></li>"
+    "<li><code>n == grid[i].length</code></li><li><code>1 &lt;= m, n &lt;= 300</code></li></ul>"
+)
+
+SORTED = (
+    "<p><strong>Constraints:</strong></p><ul><li><code>n == nums.length</code></li>"
+    "<li><code>1 &lt;= n &lt;= 10<sup>5</sup></code></li>"
+    "<li><code>0 &lt;= nums[i] &lt;= n</code></li>"
+    "<li><code>1 &lt;= k &lt; nums.length</code></li>"
+    "<li>All the integers of <code>nums</code> are <strong>unique</strong>.</li>"
+    "<li><code>nums</code> is sorted in <strong>non-increasing</strong> order.</li>"
+    "<li><code>s</code> consists of lowercase English letters and digits.</li>"
+    "<li><code>t[i]</code> is either <code>'0'</code> or <code>'1'</code>.</li></ul>"
+)
+
+
+class TestConstraints:
+    """Tests for runner.constraints."""
+
+    def test_constraint_lines(self) -> None:
+        """Test that exponents survive and entities are decoded."""
+        assert constraint_lines(TWO_SUM)[:2] == [
+            "2 <= nums.length <= 10^4",
+            "-10^9 <= nums[i] <= 10^9",
+        ]
+        assert constraint_lines("<p>No constraints here</p>") == []
+
+    def test_parse_number(self) -> None:
+        """Test the number notations LeetCode uses."""
+        assert parse_number("10^4") == 10_000
+        assert parse_number("5 * 10^4") == 50_000
+        assert parse_number("2^31 - 1") == 2_147_483_647
+        assert parse_number("-10^9") == -1_000_000_000
+        assert parse_number("1e9 + 7") == 1_000_000_007
+        assert parse_number("2^63 - 1") == 9_223_372_036_854_775_807
+        assert parse_number("1.5 * 10^3") == 1_500
+        assert parse_number("10^-2") == 0
+        assert parse_number("nums.length") is None
+
+    def test_size_limit(self) -> None:
+        """Test length bounds, value bounds of other parameters and aliases."""
+        assert size_limit(TWO_SUM, ["nums"]) == 10_000
+        assert size_limit(TWO_SUM, ["s"]) is None
+        assert size_limit(GRID, ["grid"]) == 300
+        assert size_limit("<p>Constraints:</p><ul><li>1 &lt;= n &lt;= 45</li></ul>", ["n"]) == 45
+
+    def test_parse_constraints(self) -> None:
+        """Test ranges, aliases, references, character sets and properties."""
+        constraints = parse_constraints(TWO_SUM)
+        assert constraints.lengths == {"nums": Range(low=2, high=10_000)}
+        assert constraints.values["nums[i]"] == Range(low=-(10**9), high=10**9)
+        assert constraints.values["target"] == Range(low=-(10**9), high=10**9)
+
+        grid = parse_constraints(GRID)
+        assert grid.aliases == {"m": "grid", "n": "grid[i]"}
+        assert grid.lengths == {"grid": Range(low=1, high=300), "grid[i]": Range(low=1, high=300)}
+
+        constraints = parse_constraints(SORTED)
+        assert constraints.lengths["nums"] == Range(low=1, high=100_000)
+        assert constraints.references == {
+            "nums[i]": Reference(name="n"),
+            "k": Reference(name="nums.length", offset=-1),
+        }
+        assert constraints.distinct == ["nums"]
+        assert constraints.order == {"nums": "desc"}
+        assert constraints.alphabets["s"] == "abcdefghijklmnopqrstuvwxyz0123456789"
+        assert constraints.alphabets["t[i]"] == "01"
+
+    def test_parse_constraints_node_count(self) -> None:
+        """Test "The number of nodes in the tree is in the range [0, 10^4]"."""
+        constraints = parse_constraints(
+            "<p><strong>Constraints:</strong></p><ul>"
+            "<li>The number of nodes in the tree is in the range "
+            "<code>[0, 10<sup>4</sup>]</code>.</li>"
+            "<li><code>-100 &lt;= Node.val &lt;= 100</code></li></ul>"
+        )
+        assert constraints.node_count == Range(low=0, high=10_000)
+        assert constraints.values["Node.val"] == Range(low=-100, high=100)
@@ -0,0 +1,147 @@
+"""Tests for the worker pool running solutions."""
+
+import sys
+import time
+import pytest
+from typing import Iterator
+from unittest.mock import patch
+from interview_prep_mcp.runner import pool as pool_module
+from interview_prep_mcp.runner.pool import SolutionError, WorkerPool
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="test workers need POSIX")
+
+TWO_SUM = """
+class Solution:
+    def twoSum(self, nums: List[int], target: int) -> List[int]:
+        seen = {}
+        for i, n in enumerate(nums):
+            if target - n in seen:
+                return [seen[target - n], i]
+            seen[n] = i
+"""
+CASES = [["[2,7,11,15]", "9"], ["[3,2,4]", "6"], ["[3,3]", "6"]]
+
+
+@pytest.fixture
+def pool() -> Iterator[WorkerPool]:
+    workers = WorkerPool(size=1)
+    yield workers
+    workers.close()
+
+
+class TestWorkerPool:
+    """Tests for WorkerPool."""
+
+    def test_runs_cases_in_a_reused_worker(self, pool: WorkerPool) -> None:
+        """Test that cases run and the worker is kept for the next run."""
+        first = pool.run(TWO_SUM, "twoSum", ["List[int]", "int"], "List[int]", CASES, 5, 256)
+        second = pool.run(TWO_SUM, "twoSum", ["List[int]", "int"], "List[int]", CASES[:1], 5, 256)
+
+        assert [r["output"] for r in first] == [[0, 1], [1, 2], [0, 1]]
+        assert all(r["status"] == "ok" for r in first + second)
+        assert pool.metrics() == {"size": 1, "spawned": 1, "replaced": 0, "spawn_failures": 0}
+
+    def test_timeout_replaces_worker_and_continues(self, pool: WorkerPool) -> None:
+        """Test that a case over its timeout is reported and later cases still run."""
+        code = (
+            "class Solution:\n"
+            "    def f(self, n):\n"
+            "        while n == 2:\n"
+            "            pass\n"
+            "        return n\n"
+        )
+
+        results = pool.run(code, "f", [""], None, [["1"], ["2"], ["3"]], 0.5, 256)
+
+        assert [r["status"] for r in results] == ["ok", "timeout", "ok"]
+        assert results[2]["output"] == 3
+        assert pool.metrics()["replaced"] == 1
+
+    def test_errors_stdout_and_linked_structures(self, pool: WorkerPool) -> None:
+        """Test error line numbers, captured prints and ListNode conversion."""
+        code = (
+            "class Solution:\n"
+            "    def reverse(self, head: Optional[ListNode]) -> Optional[ListNode]:\n"
+            "        print('visiting', head.val)\n"
+            "        prev = None\n"
+            "        while head:\n"
+            "            head.next, prev, head = prev, head, head.next\n"
+            "        return prev\n"
+        )
+
+        results = pool.run(
+            code,
+            "reverse",
+            ["Optional[ListNode]"],
+            "Optional[ListNode]",
+            [["[1,2,3]"], ["[]"]],
+            5,
+            256,
+        )
+
+        assert results[0] == {
+            "status": "ok",
+            "output": [3, 2, 1],
+            "seconds": results[0]["seconds"],
+            "stdout": "visiting 1\n",
+        }
+        assert results[1]["status"] == "error"
+        assert (
+            results[1]["error"]
+            == "AttributeError: 'NoneType' object has no attribute 'val' (line 3)"
+        )
+
+    def test_memory_limit(self, pool: WorkerPool) -> None:
+        """Test that allocating past the limit is reported as memory_limit."""
+        code = (
+            "class Solution:\n    def f(self, n):\n        return len(bytearray(n * 1024 * 1024))\n"
+        )
+
+        results = pool.run(code, "f", [""], None, [["512"]], 5, 64)
+
+        assert results[0]["status"] == "memory_limit"
+
+    def test_solution_that_does_not_load(self, pool: WorkerPool) -> None:
+        """Test that syntax errors and a missing class raise SolutionError."""
+        with pytest.raises(SolutionError, match="SyntaxError"):
+            pool.run("class Solution(:\n", "f", [""], None, [["1"]], 5, 256)
+        with pytest.raises(SolutionError, match="does not define class Solution"):
+            pool.run("x = 1\n", "f", [""], None, [["1"]], 5, 256)
+
+    def test_failed_replacement_is_reported_and_retried(self, pool: WorkerPool) -> None:
+        """Test that a replacement that cannot start fails the next run instead of hanging."""
+        pool.start()
+        spawn = pool._spawn
+        with (
+            patch.object(pool_module, "SPAWN_RETRY_SECONDS", 0),
+            patch.object(pool, "_spawn", side_effect=OSError(24, "Too many open files")),
+        ):
+            pool.run(
+                "class Solution:\n    def f(self):\n        while True: pass\n",
+                "f",
+                [],
+                None,
+                [[]],
+                0.5,
+                256,
+            )
+            deadline = time.monotonic() + 5
+            while not pool._missing and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            with pytest.raises(RuntimeError, match="Too many open files"):
+                pool.run(TWO_SUM, "twoSum", ["List[int]", "int"], "List[int]", CASES, 5, 256)
+
+        assert pool.metrics()["spawn_failures"] == pool_module.SPAWN_ATTEMPTS + 1
+        with patch.object(pool, "_spawn", side_effect=spawn):
+            results = pool.run(TWO_SUM, "twoSum", ["List[int]", "int"], "List[int]", CASES, 5, 256)
+        assert all(r["status"] == "ok" for r in results)
+
+    def test_waiting_for_a_worker_times_out(self, pool: WorkerPool) -> None:
+        """Test that a run fails when no worker becomes free in time."""
+        pool.start()
+        pool._idle.get()
+
+        with patch.object(pool_module, "IDLE_WAIT_SECONDS", 0.05):
+            with pytest.raises(RuntimeError, match="No test worker became free"):
+                pool.run(TWO_SUM, "twoSum", ["List[int]", "int"], "List[int]", CASES, 5, 256)
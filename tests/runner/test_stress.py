@@ -0,0 +1,138 @@
+"""Tests for maximal-size input generation."""
+
+import json
+import pytest
+
+pytest.importorskip("numpy")
+
+from interview_prep_mcp.runner.cases import Signature
+from interview_prep_mcp.runner.constraints import Constraints, Range, Reference
+from interview_prep_mcp.runner import stress
+from interview_prep_mcp.runner.stress import StressGenerator, stress_case
+
+TWO_SUM = Constraints(
+    lengths={"nums": Range(low=2, high=10_000)},
+    values={"nums[i]": Range(low=-(10**9), high=10**9), "target": Range(low=-(10**9), high=10**9)},
+)
+
+
+def signature(**annotations: str) -> Signature:
+    return Signature(
+        method="solve",
+        params=list(annotations),
+        annotations=list(annotations.values()),
+        returns="int",
+    )
+
+
+class TestStressCase:
+    """Tests for stress_case and StressGenerator."""
+
+    def test_lists_reach_the_constraints(self) -> None:
+        """Test maximal length, values within bounds and LeetCode's line format."""
+        lines, arguments = stress_case(
+            signature(nums="List[int]", target="int"),
+            [[2, 7, 11, 15], 9],
+            TWO_SUM,
+        )
+
+        nums = json.loads(lines[0])
+        assert len(lines) == 2 and " " not in lines[0]
+        assert len(nums) == 10_000
+        assert all(-(10**9) <= value <= 10**9 for value in nums)
+        assert json.loads(lines[1]) == 10**9
+        assert arguments[0].shape == [10_000] and arguments[0].from_constraints
+
+    def test_seed_and_scale(self) -> None:
+        """Test that a seed reproduces the case and scale shrinks it."""
+        args = (signature(nums="List[int]", target="int"), [[2, 7, 11, 15], 9], TWO_SUM)
+
+        assert stress_case(*args, seed=3) == stress_case(*args, seed=3)
+        assert stress_case(*args, seed=3)[0] != stress_case(*args, seed=4)[0]
+        assert len(json.loads(stress_case(*args, scale=0.1)[0][0])) == 1_000
+
+    def test_properties_and_references(self) -> None:
+        """Test unique, sorted, a bound given by another name and a length alias."""
+        constraints = Constraints(
+            lengths={"nums": Range(low=1, high=1_000)},
+            values={"n": Range(low=1, high=1_000), "nums[i]": Range(low=0), "k": Range(low=1)},
+            aliases={"n": "nums"},
+            references={
+                "nums[i]": Reference(name="n"),
+                "k": Reference(name="nums.length", offset=-1),
+            },
+            distinct=["nums"],
+            order={"nums": "desc"},
+        )
+
+        lines, _ = stress_case(
+            signature(n="int", nums="List[int]", k="int"), [3, [3, 2, 1], 1], constraints
+        )
+
+        n, nums, k = (json.loads(line) for line in lines)
+        assert n == len(nums) == 1_000
+        assert nums == sorted(set(nums), reverse=True)
+        assert max(nums) <= 1_000
+        assert k == 999
+
+    def test_strings_grids_and_trees(self) -> None:
+        """Test alphabets, word width, grid shape and node counts."""
+        generator = StressGenerator(
+            Constraints(
+                lengths={
+                    "s": Range(high=500),
+                    "words": Range(high=100),
+                    "words[i]": Range(high=5),
+                    "grid": Range(high=30),
+                    "grid[i]": Range(high=40),
+                },
+                alphabets={"s": "ab", "grid[i][i]": "01"},
+                node_count=Range(low=0, high=200),
+                values={"Node.val": Range(low=-5, high=5)},
+            )
+        )
+
+        s, _ = generator.generate("s", "str", "abba")
+        words, _ = generator.generate("words", "List[str]", ["cat", "dog"])
+        grid, argument = generator.generate("grid", "List[List[str]]", [["1", "0"], ["0", "1"]])
+        tree, _ = generator.generate("root", "Optional[TreeNode]", [1, None, 2])
+        assert (
+            isinstance(s, str)
+            and isinstance(words, list)
+            and isinstance(grid, list)
+            and isinstance(tree, list)
+        )
+
+        assert len(s) == 500 and set(s) <= {"a", "b"}
+        assert len(words) == 100 and {len(word) for word in words} == {5}
+        assert argument.shape == [30, 40] and {cell for row in grid for cell in row} <= {"0", "1"}
+        assert len(tree) == 200 and all(-5 <= value <= 5 for value in tree)
+
+    def test_scaled_node_count_respects_lower_bound(self) -> None:
+        """Test that scaling a node count never goes below its minimum."""
+        generator = StressGenerator(Constraints(node_count=Range(low=10, high=100)), scale=0.01)
+
+        nodes, argument = generator.generate("head", "Optional[ListNode]", [1, 2, 3])
+
+        assert isinstance(nodes, list) and len(nodes) == 10
+        assert argument.shape == [10]
+
+    def test_caps_huge_grids(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a grid larger than MAX_ELEMENTS cells loses rows."""
+        monkeypatch.setattr(stress, "MAX_ELEMENTS", 1_000)
+        generator = StressGenerator(
+            Constraints(lengths={"g": Range(high=10**5), "g[i]": Range(high=100)})
+        )
+
+        grid, argument = generator.generate("g", "List[List[int]]", [[1, 2, 3]])
+        assert isinstance(grid, list)
+
+        assert argument.capped and argument.shape == [10, 100] and len(grid) == 10
+
+    def test_unknown_types_keep_the_example(self) -> None:
+        """Test that arguments the generator does not model are passed through."""
+        lines, arguments = stress_case(
+            signature(board="List[List[List[int]]]"), [[[[1]]]], Constraints()
+        )
+
+        assert lines == ["[[[1]]]"] and arguments[0].kind == "example"
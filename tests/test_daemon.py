@@ -0,0 +1,243 @@
+"""Tests for the shared daemon and its stdio-shim client."""
+
+import asyncio
+import json
+import pytest
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, cast
+from unittest.mock import MagicMock, patch
+from interview_prep_mcp.daemon import DaemonClient, DaemonError, absolute_paths, serve
+
+
+async def echo_handler(tool: str, arguments: Dict[str, object]) -> Dict[str, object]:
+    """Echo the call back, sleeping first if asked to and failing on 'fail'."""
+    await asyncio.sleep(cast(float, arguments.get("delay", 0)))
+    if tool == "fail":
+        raise ValueError("Failed to load problem: boom")
+    return {"tool": tool, "arguments": arguments}
+
+
+@pytest.fixture
+def socket_path(tmp_path: Path) -> Path:
+    """Socket path short enough for AF_UNIX."""
+    return tmp_path / "d.sock"
+
+
+@pytest.fixture
+async def daemon(socket_path: Path) -> AsyncIterator["asyncio.Task[None]"]:
+    """Run a daemon with the echo handler in the background."""
+    task = asyncio.create_task(serve(socket_path, echo_handler))
+    while not socket_path.exists():
+        await asyncio.sleep(0.01)
+    yield task
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+class TestDaemon:
+    """Tests for serve() and DaemonClient."""
+
+    @pytest.mark.asyncio
+    async def test_call_round_trip(self, daemon, socket_path: Path) -> None:  # type: ignore[no-untyped-def,misc]
+        """Test that a tool call reaches the handler and the result comes back."""
+        client = DaemonClient(socket_path, autospawn=False)
+
+        result = await client.call("load_problem", {"title_slug": "two-sum"})
+        await client.aclose()
+
+        assert result == {"tool": "load_problem", "arguments": {"title_slug": "two-sum"}}
+
+    @pytest.mark.asyncio
+    async def test_tool_error_raised_as_daemon_error(self, daemon, socket_path: Path) -> None:  # type: ignore[no-untyped-def,misc]
+        """Test that handler errors surface with their message."""
+        client = DaemonClient(socket_path, autospawn=False)
+
+        with pytest.raises(DaemonError, match="Failed to load problem: boom"):
+            await client.call("fail", {})
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_are_multiplexed(self, daemon, socket_path: Path) -> None:  # type: ignore[no-untyped-def,misc]
+        """Test that a slow call does not hold up a fast one on the same connection."""
+        client = DaemonClient(socket_path, autospawn=False)
+        finished: List[str] = []
+
+        async def call(name: str, delay: float) -> None:
+            await client.call(name, {"delay": delay})
+            finished.append(name)
+
+        await asyncio.gather(call("slow", 0.2), call("fast", 0))
+        await client.aclose()
+
+        assert finished == ["fast", "slow"]
+
+    @pytest.mark.asyncio
+    async def test_no_daemon_without_autospawn(self, socket_path: Path) -> None:
+        """Test that a missing daemon is reported when spawning is disabled."""
+        client = DaemonClient(socket_path, autospawn=False)
+
+        with pytest.raises(DaemonError, match="No daemon listening"):
+            await client.call("load_problem", {})
+
+    @pytest.mark.asyncio
+    async def test_second_daemon_exits_immediately(self, daemon, socket_path: Path) -> None:  # type: ignore[no-untyped-def,misc]
+        """Test that only one daemon can own a socket path."""
+        await asyncio.wait_for(serve(socket_path, echo_handler), timeout=1)
+
+        assert not daemon.done()
+
+    @pytest.mark.asyncio
+    async def test_reconnects_after_daemon_restart(self, socket_path: Path) -> None:
+        """Test that the client retries on a new connection after the daemon restarts."""
+        first = asyncio.create_task(serve(socket_path, echo_handler))
+        while not socket_path.exists():
+            await asyncio.sleep(0.01)
+        client = DaemonClient(socket_path, autospawn=False)
+        await client.call("load_problem", {})
+
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        second = asyncio.create_task(serve(socket_path, echo_handler))
+        while not socket_path.exists():
+            await asyncio.sleep(0.01)
+
+        try:
+            assert await client.call("load_problem", {"n": 2}) == {
+                "tool": "load_problem",
+                "arguments": {"n": 2},
+            }
+        finally:
+            await client.aclose()
+            second.cancel()
+            await asyncio.gather(second, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_autospawns_daemon(self, socket_path: Path) -> None:
+        """Test that the client starts a daemon when none is listening."""
+        spawned: List["asyncio.Task[None]"] = []
+
+        def fake_spawn(path: Path) -> MagicMock:
+            spawned.append(asyncio.create_task(serve(path, echo_handler)))
+            return MagicMock(poll=MagicMock(return_value=None))
+
+        client = DaemonClient(socket_path, start_timeout=5)
+        with patch("interview_prep_mcp.daemon.spawn_daemon", side_effect=fake_spawn):
+            result = await client.call("load_problem", {})
+
+        await client.aclose()
+        for task in spawned:
+            task.cancel()
+        await asyncio.gather(*spawned, return_exceptions=True)
+        assert len(spawned) == 1
+        assert result == {"tool": "load_problem", "arguments": {}}
+
+    @pytest.mark.asyncio
+    async def test_spawned_daemon_crash_fails_fast(self, socket_path: Path) -> None:
+        """Test that a daemon that dies on startup is reported without waiting out the timeout."""
+        crashed = MagicMock(poll=MagicMock(return_value=1), returncode=1)
+        client = DaemonClient(socket_path, start_timeout=30)
+
+        with patch("interview_prep_mcp.daemon.spawn_daemon", return_value=crashed):
+            with pytest.raises(DaemonError, match="exited with code 1"):
+                await asyncio.wait_for(client.call("load_problem", {}), timeout=5)
+
+    @pytest.mark.asyncio
+    async def test_warm_up_runs_before_listening(self, socket_path: Path) -> None:
+        """Test that the started hook completes before the socket appears."""
+        seen: List[bool] = []
+
+        async def started() -> None:
+            seen.append(socket_path.exists())
+
+        task = asyncio.create_task(serve(socket_path, echo_handler, started=started))
+        while not socket_path.exists():
+            await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        assert seen == [False]
+        assert not socket_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_non_object_request_gets_error(self, daemon, socket_path: Path) -> None:  # type: ignore[no-untyped-def,misc]
+        """Test that a non-object JSON line or a malformed call is answered with an error."""
+        reader, writer = await asyncio.open_unix_connection(str(socket_path))
+        writer.write(b"[]\n")
+        writer.write(b'{"id": 2, "tool": "load_problem", "arguments": [1]}\n')
+        await writer.drain()
+
+        response = json.loads(await asyncio.wait_for(reader.readline(), timeout=5))
+        malformed = json.loads(await asyncio.wait_for(reader.readline(), timeout=5))
+        writer.close()
+
+        assert response == {"id": None, "error": "Request must be a JSON object"}
+        assert malformed == {"id": 2, "error": "Request needs a tool name and an arguments object"}
+
+    @pytest.mark.asyncio
+    async def test_invalid_json_keeps_connection(self, daemon, socket_path: Path) -> None:  # type: ignore[no-untyped-def,misc]
+        """Test that a line that is not JSON gets an error and later calls still work."""
+        reader, writer = await asyncio.open_unix_connection(str(socket_path))
+        writer.write(b"{not json\n")
+        writer.write(b'{"id": 3, "tool": "load_problem", "arguments": {}}\n')
+        await writer.drain()
+
+        error = json.loads(await asyncio.wait_for(reader.readline(), timeout=5))
+        response = json.loads(await asyncio.wait_for(reader.readline(), timeout=5))
+        writer.close()
+
+        assert error == {"id": None, "error": "Request is not valid JSON"}
+        assert response == {"id": 3, "result": {"tool": "load_problem", "arguments": {}}}
+
+    @pytest.mark.asyncio
+    async def test_sent_write_call_not_resent(self, socket_path: Path) -> None:
+        """Test that a call dropped after it was sent is only resent for read-only tools."""
+        calls: List[str] = []
+
+        async def dropping_handler(tool: str, arguments: Dict[str, object]) -> Dict[str, object]:
+            calls.append(tool)
+            if len(calls) <= 2:
+                raise asyncio.CancelledError
+            return {"tool": tool}
+
+        async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            line = await reader.readline()
+            request = json.loads(line)
+            try:
+                result = await dropping_handler(request["tool"], request["arguments"])
+            except asyncio.CancelledError:
+                writer.close()
+                return
+            writer.write(json.dumps({"id": request["id"], "result": result}).encode() + b"\n")
+            await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_unix_server(handle, path=str(socket_path))
+        client = DaemonClient(socket_path, autospawn=False, read_only_tools={"load_problem"})
+        try:
+            with pytest.raises(DaemonError, match="may have run"):
+                await client.call("scaffold_workspace", {})
+            assert await client.call("load_problem", {}) == {"tool": "load_problem"}
+        finally:
+            await client.aclose()
+            server.close()
+            await server.wait_closed()
+
+        assert calls == ["scaffold_workspace", "load_problem", "load_problem"]
+
+
+class TestAbsolutePaths:
+    """Tests for absolute_paths."""
+
+    def test_relative_paths_resolved(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that workspace and output_path are made absolute and other arguments kept."""
+        monkeypatch.chdir(tmp_path)
+
+        arguments = absolute_paths(
+            {"workspace": "solutions", "output_path": "/tmp/in.txt", "title_slug": "a/b"}
+        )
+
+        assert arguments == {
+            "workspace": str(tmp_path / "solutions"),
+            "output_path": "/tmp/in.txt",
+            "title_slug": "a/b",
+        }
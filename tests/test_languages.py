@@ -0,0 +1,86 @@
+"""Tests for the language registry."""
+
+from interview_prep_mcp.file_generator.naming import suggest_filename
+from interview_prep_mcp.languages import LANGUAGES, resolve_language
+from interview_prep_mcp.leetcode.types import CodeSnippet, Problem
+
+
+def problem_with(*snippets: CodeSnippet) -> Problem:
+    return Problem(
+        questionId="1",
+        questionFrontendId="1",
+        title="Two Sum",
+        titleSlug="two-sum",
+        difficulty="Easy",
+        content="",
+        topicTags=[],
+        codeSnippets=list(snippets),
+    )
+
+
+class TestResolveLanguage:
+    """Tests for resolve_language."""
+
+    def test_slug_name_and_alias(self) -> None:
+        """Test that slugs, display names and aliases resolve case-insensitively."""
+        for key in ("golang", "Go", "GO"):
+            language = resolve_language(key)
+            assert language is not None and language.slug == "golang"
+        cpp = resolve_language("C++")
+        assert cpp is not None and (cpp.slug, cpp.extension, cpp.comment) == ("cpp", "cpp", "//")
+        assert resolve_language("cobol") is None
+
+    def test_slug_wins_over_alias(self) -> None:
+        """Test that "python" is Python 2's slug before it is a Python3 alias."""
+        python = resolve_language("python")
+        assert python is not None and python.slug == "python"
+        py = resolve_language("py")
+        assert py is not None and py.slug == "python3"
+
+    def test_keys_are_unambiguous(self) -> None:
+        """Test that slugs are unique and aliases are lowercase."""
+        slugs = [language.slug for language in LANGUAGES]
+        assert len(slugs) == len(set(slugs))
+        assert all(alias == alias.lower() for language in LANGUAGES for alias in language.aliases)
+
+
+class TestProblemSnippets:
+    """Tests for the per-problem snippet map."""
+
+    def test_lookup_by_slug_name_and_alias(self) -> None:
+        """Test that a snippet is found by any of its keys."""
+        go = CodeSnippet(lang="Go", langSlug="golang", code="func twoSum() {}")
+        problem = problem_with(go)
+
+        assert problem.code_snippet("golang") is go
+        assert problem.code_snippet("Go") is go
+        assert problem.code_snippet("go") is go
+        assert problem.code_snippet("rust") is None
+
+    def test_python_prefers_python2_snippet_when_present(self) -> None:
+        """Test that the alias only applies when no snippet has that slug."""
+        python2 = CodeSnippet(lang="Python", langSlug="python", code="class Solution(object):")
+        python3 = CodeSnippet(lang="Python3", langSlug="python3", code="class Solution:")
+
+        assert problem_with(python3, python2).code_snippet("python") is python2
+        assert problem_with(python3).code_snippet("python") is python3
+
+    def test_map_survives_serialization(self) -> None:
+        """Test that problems loaded from JSON (e.g., the store) get the map too."""
+        problem = problem_with(CodeSnippet(lang="C++", langSlug="cpp", code="class Solution {};"))
+
+        loaded = Problem.model_validate_json(problem.model_dump_json())
+
+        snippet = loaded.code_snippet("c++")
+        assert snippet is not None and snippet.langSlug == "cpp"
+
+
+class TestFilenameConsistency:
+    """Tests that filenames use the same registry as snippet lookup."""
+
+    def test_aliases_get_extensions(self) -> None:
+        """Test that anything resolving to a snippet also gets its extension."""
+        assert suggest_filename("1", "Two Sum", "go") == "1_two_sum.go"
+        assert suggest_filename("1", "Two Sum", "Python3") == "1_two_sum.py"
+        assert suggest_filename("1", "Two Sum", "pythondata") == "1_two_sum.py"
+        assert suggest_filename("1", "Two Sum", "bash") == "1_two_sum.sh"
@@ -0,0 +1,95 @@
+"""Tests for structured JSON logging."""
+
+import json
+import logging
+import pytest
+from pathlib import Path
+from typing import Dict, Iterator, List
+from unittest.mock import MagicMock
+from interview_prep_mcp import logs, server
+from interview_prep_mcp.logs import (
+    DeferredQueueHandler,
+    EventRecord,
+    configure_logging,
+    log_event,
+    parse_sample_rates,
+    stop_logging,
+)
+
+logger = logging.getLogger("interview_prep_mcp.tests")
+
+
+@pytest.fixture
+def log_path(tmp_path: Path) -> Iterator[Path]:
+    """A log file; logging is switched off again after the test."""
+    yield tmp_path / "logs" / "server.log"
+    stop_logging()
+
+
+def read_events(path: Path) -> List[Dict[str, object]]:
+    """Flush the queue and parse the log file."""
+    stop_logging()
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestLogging:
+    """Tests for configure_logging and log_event."""
+
+    def test_events_as_json_lines(self, log_path: Path) -> None:
+        """Test the line format, that nothing is written before configuration, and levels."""
+        log_event(logger, logging.WARNING, "before.configure")
+        configure_logging(str(log_path), level="info")
+
+        log_event(
+            logger, logging.INFO, "upstream.request", operation="questionContent", seconds=0.25
+        )
+        log_event(logger, logging.DEBUG, "cache.miss", title_slug="two-sum")
+        log_event(logger, logging.WARNING, "odd.value", value=Path("/tmp"))
+
+        events = read_events(log_path)
+        assert [event["event"] for event in events] == ["upstream.request", "odd.value"]
+        first = events[0]
+        assert first["level"] == "info" and first["logger"] == "interview_prep_mcp.tests"
+        assert first["operation"] == "questionContent" and first["seconds"] == 0.25
+        assert str(first["ts"]).endswith("Z") and isinstance(first["pid"], int)
+        assert events[1]["value"] == "/tmp"
+
+    def test_sampling(self, log_path: Path) -> None:
+        """Test per-event sample rates and their parsing."""
+        configure_logging(str(log_path), sample_rates=parse_sample_rates("noisy=0, half=0.5"))
+
+        for _ in range(100):
+            log_event(logger, logging.INFO, "noisy")
+        log_event(logger, logging.INFO, "kept")
+
+        assert [event["event"] for event in read_events(log_path)] == ["kept"]
+        assert parse_sample_rates(" cache.hit=0.01 ,") == {"cache.hit": 0.01}
+        with pytest.raises(ValueError, match="Invalid sample rate 'cache.hit=2'"):
+            parse_sample_rates("cache.hit=2")
+        with pytest.raises(ValueError, match="Invalid sample rate"):
+            parse_sample_rates("cache.hit")
+
+    def test_never_stdout_and_no_eager_formatting(self) -> None:
+        """Test that stdout is refused and queued records are not formatted by the caller."""
+        with pytest.raises(ValueError, match="stdout"):
+            configure_logging("stdout")
+        with pytest.raises(ValueError, match="Unknown log level"):
+            configure_logging("stderr", level="verbose")
+
+        record = EventRecord("x", logging.INFO, "event", {"big": [1, 2, 3]}, 1.0)
+        handler = DeferredQueueHandler(MagicMock())
+        assert handler.prepare(record) is record and record.msg == "event"
+        assert logs._listener is None
+
+    @pytest.mark.asyncio
+    async def test_tool_calls(self, log_path: Path) -> None:
+        """Test that tool calls are logged with their outcome."""
+        configure_logging(str(log_path))
+
+        with pytest.raises(ValueError):
+            await server.run_tool("no_such_tool", {"b": 1, "a": 2})
+
+        [event] = read_events(log_path)
+        assert event["event"] == "tool.call" and event["tool"] == "no_such_tool"
+        assert event["arguments"] == ["a", "b"] and event["ok"] is False
+        assert "Unknown tool" in str(event["error"])
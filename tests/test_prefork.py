@@ -0,0 +1,93 @@
+"""Tests for the pre-fork worker supervisor."""
+
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+import time
+from pathlib import Path
+from interview_prep_mcp.prefork import bind_socket
+
+SUPERVISOR = textwrap.dedent("""
+    import os, sys, time
+    from pathlib import Path
+    from interview_prep_mcp import prefork
+
+    prefork.MIN_WORKER_LIFETIME = 0.1
+    out = Path(sys.argv[1])
+    snapshot = {"catalog": "built once in the parent"}
+
+    def target():
+        marker = out / str(os.getpid())
+        marker.write_text(snapshot["catalog"])
+        # The first worker crashes so the supervisor has to replace it
+        if not (out / "crashed").exists():
+            (out / "crashed").touch()
+            raise SystemExit(3)
+        time.sleep(60)
+
+    prefork.run_workers(2, target)
+    (out / "supervisor-exited").touch()
+""")
+
+
+def wait_for(predicate, timeout: float = 10) -> bool:  # type: ignore[no-untyped-def]
+    """Poll until predicate() is true or the timeout passes."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def worker_pids(out: Path) -> list[int]:
+    """PIDs of workers that have started."""
+    return [int(p.name) for p in out.iterdir() if p.name.isdigit()]
+
+
+def alive(pid: int) -> bool:
+    """Whether a process exists."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+class TestRunWorkers:
+    """Tests for run_workers()."""
+
+    def test_forks_restarts_and_stops_workers(self, tmp_path: Path) -> None:
+        """Test that workers share the parent's state, are replaced, and stop on SIGTERM."""
+        supervisor = subprocess.Popen([sys.executable, "-c", SUPERVISOR, str(tmp_path)])
+        try:
+            # Two initial workers plus one replacement for the crashed worker
+            assert wait_for(lambda: len(worker_pids(tmp_path)) == 3)
+            pids = worker_pids(tmp_path)
+            assert all(
+                (tmp_path / str(pid)).read_text() == "built once in the parent" for pid in pids
+            )
+            assert sum(alive(pid) for pid in pids) == 2
+
+            supervisor.send_signal(signal.SIGTERM)
+            assert supervisor.wait(timeout=10) == 0
+            assert (tmp_path / "supervisor-exited").exists()
+            assert not any(alive(pid) for pid in pids)
+        finally:
+            if supervisor.poll() is None:
+                supervisor.kill()
+
+
+class TestBindSocket:
+    """Tests for bind_socket()."""
+
+    def test_socket_is_listening_and_inheritable(self) -> None:
+        """Test that the socket can be handed to forked workers."""
+        sock = bind_socket("127.0.0.1", 0)
+        try:
+            assert sock.get_inheritable()
+            assert sock.getsockname()[1] > 0
+        finally:
+            sock.close()
@@ -0,0 +1,154 @@
+"""Tests for serving MCP over HTTP."""
+
+import asyncio
+import json
+import socket
+import pytest
+from typing import AsyncIterator, Dict, List
+from unittest.mock import AsyncMock, patch
+import uvicorn
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+from mcp.client.streamable_http import streamablehttp_client
+from mcp.types import TextContent
+from starlette.routing import Mount, Route
+from interview_prep_mcp import server
+
+
+def free_port() -> int:
+    """Find an unused local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port: int = sock.getsockname()[1]
+        return port
+
+
+@pytest.fixture
+async def http_server() -> AsyncIterator[str]:
+    """Run the HTTP app on a local port with the LeetCode client stubbed out."""
+
+    async def execute(**kwargs: object) -> Dict[str, object]:
+        await asyncio.sleep(0.05)
+        return {"titleSlug": kwargs["title_slug"]}
+
+    port = free_port()
+    tools = server.get_tools()
+    with (
+        patch.object(tools.load_problem, "initialize", new=AsyncMock()),
+        patch.object(tools.load_problem, "execute", side_effect=execute),
+        patch.object(tools.client, "aclose", new=AsyncMock()),
+    ):
+        uvicorn_server = uvicorn.Server(
+            uvicorn.Config(
+                server.create_http_app(), host="127.0.0.1", port=port, log_level="warning"
+            )
+        )
+        task = asyncio.create_task(uvicorn_server.serve())
+        while not uvicorn_server.started:
+            await asyncio.sleep(0.01)
+        yield f"http://127.0.0.1:{port}"
+        uvicorn_server.should_exit = True
+        await task
+
+
+def result_text(content: List[object]) -> str:
+    """Extract the text of a single-item tool result."""
+    item = content[0]
+    assert isinstance(item, TextContent)
+    return item.text
+
+
+class TestHttpTransport:
+    """Tests for the Streamable HTTP and SSE endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_streamable_http_tool_call(self, http_server: str) -> None:
+        """Test listing and calling tools over Streamable HTTP."""
+        async with streamablehttp_client(f"{http_server}/mcp") as (read, write, _):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                tools = await session.list_tools()
+                result = await session.call_tool("load_problem", {"title_slug": "two-sum"})
+
+        assert "load_problem" in [tool.name for tool in tools.tools]
+        assert json.loads(result_text(list(result.content))) == {"titleSlug": "two-sum"}
+
+    @pytest.mark.asyncio
+    async def test_sse_tool_call(self, http_server: str) -> None:
+        """Test calling a tool over the HTTP+SSE transport."""
+        async with sse_client(f"{http_server}/sse") as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                result = await session.call_tool("load_problem", {"title_slug": "add-two-numbers"})
+
+        assert json.loads(result_text(list(result.content))) == {"titleSlug": "add-two-numbers"}
+
+    @pytest.mark.asyncio
+    async def test_sessions_share_one_process(self, http_server: str) -> None:
+        """Test that several concurrent clients are served by the same tool instance."""
+
+        async def one_client(slug: str) -> str:
+            async with streamablehttp_client(f"{http_server}/mcp") as (read, write, _):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    result = await session.call_tool("load_problem", {"title_slug": slug})
+                    return result_text(list(result.content))
+
+        slugs = [f"problem-{i}" for i in range(5)]
+        texts = await asyncio.gather(*(one_client(slug) for slug in slugs))
+
+        assert [json.loads(text)["titleSlug"] for text in texts] == slugs
+
+    @pytest.mark.asyncio
+    async def test_tool_calls_capped(self, http_server: str) -> None:
+        """Test that at most INTERVIEW_PREP_MAX_CONCURRENT_CALLS calls run at once."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_run_tool(name: str, arguments: Dict[str, object]) -> Dict[str, object]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return {}
+
+        with (
+            patch.object(server, "tool_call_slots", asyncio.Semaphore(2)),
+            patch.object(server, "run_tool", side_effect=slow_run_tool),
+        ):
+            async with streamablehttp_client(f"{http_server}/mcp") as (read, write, _):
+                async with ClientSession(read, write) as session:
+                    await session.initialize()
+                    await asyncio.gather(
+                        *(
+                            session.call_tool("load_problem", {"title_slug": "two-sum"})
+                            for _ in range(6)
+                        )
+                    )
+
+        assert peak == 2
+
+    def test_stateless_app_serves_streamable_http_only(self) -> None:
+        """Test that worker-mode apps drop the session-bound SSE endpoints."""
+        routes = server.create_http_app(stateless=True).routes
+        paths = [route.path for route in routes if isinstance(route, (Route, Mount))]
+
+        assert paths == ["/mcp"]
+
+    def test_invalid_call_limit_rejected_at_startup(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that a bad INTERVIEW_PREP_MAX_CONCURRENT_CALLS stops the server before it runs."""
+        monkeypatch.setenv("INTERVIEW_PREP_MAX_CONCURRENT_CALLS", "zero")
+        monkeypatch.setattr(server, "tool_call_slots", None)
+        monkeypatch.setattr("sys.argv", ["interview-prep-mcp", "--http"])
+
+        with patch.object(server, "run_http") as run_http:
+            with pytest.raises(SystemExit):
+                server.main()
+
+        run_http.assert_not_called()
+        assert "INTERVIEW_PREP_MAX_CONCURRENT_CALLS must be a positive integer" in (
+            capsys.readouterr().err
+        )
@@ -0,0 +1,117 @@
+"""Tests for daily_problem tool."""
+
+import asyncio
+import pytest
+from datetime import datetime, timezone
+from typing import Dict, List, Mapping
+from unittest.mock import MagicMock, patch
+from interview_prep_mcp.leetcode import client as client_module
+from interview_prep_mcp.tools import daily_problem
+from interview_prep_mcp.tools.daily_problem import DailyProblemTool, seconds_until_prewarm
+from ..leetcode.conftest import mock_async_client
+
+
+def daily_response(date: str, slug: str) -> Dict[str, object]:
+    """activeDailyCodingChallengeQuestion as GraphQL returns it."""
+    return {
+        "data": {
+            "activeDailyCodingChallengeQuestion": {
+                "date": date,
+                "link": f"/problems/{slug}/",
+                "question": {
+                    "questionId": "1",
+                    "questionFrontendId": "1",
+                    "title": slug.title(),
+                    "titleSlug": slug,
+                    "difficulty": "Easy",
+                    "content": "<p>Today</p>",
+                    "topicTags": [],
+                    "codeSnippets": [
+                        {"lang": "Python3", "langSlug": "python3", "code": "class Solution: ..."}
+                    ],
+                    "hints": [],
+                    "similarQuestions": "[]",
+                },
+            }
+        }
+    }
+
+
+@pytest.fixture
+def mock_httpx_response() -> MagicMock:
+    """A successful httpx response whose JSON the test sets."""
+    return MagicMock()
+
+
+class TestDailyProblemTool:
+    """Tests for DailyProblemTool and LeetCodeClient.fetch_daily_challenge."""
+
+    @pytest.mark.asyncio
+    async def test_one_request_per_day(
+        self, mock_httpx_response: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that concurrent and repeated calls on one day share one request."""
+        monkeypatch.setattr(client_module, "utc_today", lambda: "2026-10-19")
+        mock_httpx_response.json.return_value = daily_response("2026-10-19", "two-sum")
+        tool = DailyProblemTool()
+
+        with mock_async_client(mock_httpx_response) as http:
+            results = await asyncio.gather(*(tool.execute(language="python3") for _ in range(5)))
+            again = await tool.execute()
+
+        assert http.post.call_count == 1
+        assert "activeDailyCodingChallengeQuestion" in str(
+            http.post.call_args.kwargs["json"]["query"]
+        )
+        assert all(result == results[0] for result in results)
+        assert results[0]["title_slug"] == "two-sum" and results[0]["code"] == "class Solution: ..."
+        assert results[0]["date"] == "2026-10-19"
+        assert results[0]["link"] == "https://leetcode.com/problems/two-sum/"
+        assert again["code_snippets"] == {"python3": "class Solution: ..."}
+        assert tool.client.is_cached("two-sum")
+        assert tool._prewarm_task is not None and not tool._prewarm_task.done()
+        tool._prewarm_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_rollover(
+        self, mock_httpx_response: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the new day, a late publication retried after a delay, and upstream failure."""
+        today = ["2026-10-19"]
+        monkeypatch.setattr(client_module, "utc_today", lambda: today[0])
+        monkeypatch.setattr(daily_problem, "utc_today", lambda: today[0])
+        monkeypatch.setattr(client_module, "DAILY_RETRY_SECONDS", 0)
+        monkeypatch.setattr(daily_problem, "DAILY_RETRY_SECONDS", 0)
+        responses: List[Dict[str, object]] = [
+            daily_response("2026-10-19", "two-sum"),
+            daily_response("2026-10-19", "two-sum"),
+            daily_response("2026-10-20", "add-two-numbers"),
+        ]
+        requests: List[Mapping[str, object]] = []
+
+        async def post(url: str, json: Mapping[str, object], **kwargs: object) -> object:
+            requests.append(json)
+            mock_httpx_response.json.return_value = responses.pop(0)
+            return mock_httpx_response
+
+        tool = DailyProblemTool()
+        with mock_async_client(side_effect=post):
+            assert (await tool.execute())["title_slug"] == "two-sum"
+            today[0] = "2026-10-20"
+            # LeetCode has not rolled over on the first try
+            await tool.prewarm()
+            assert (await tool.execute())["title_slug"] == "add-two-numbers"
+            assert len(requests) == 3
+
+        with patch.object(tool.client, "_fetch_daily_upstream", side_effect=RuntimeError("down")):
+            today[0] = "2026-10-21"
+            # The last known challenge is served while LeetCode fails
+            assert (await tool.execute())["date"] == "2026-10-20"
+        assert tool._prewarm_task is not None
+        tool._prewarm_task.cancel()
+
+    def test_seconds_until_prewarm(self) -> None:
+        """Test that pre-warming is scheduled shortly after the next UTC midnight."""
+        now = datetime(2026, 10, 19, 23, 59, 0, tzinfo=timezone.utc)
+
+        assert seconds_until_prewarm(now) == 60 + daily_problem.PREWARM_DELAY_SECONDS
@@ -0,0 +1,105 @@
+"""Tests for estimate_complexity tool."""
+
+import math
+import pytest
+from typing import Dict, List, Optional, Tuple
+from unittest.mock import patch
+from interview_prep_mcp.leetcode.scheduler import Priority
+from interview_prep_mcp.leetcode.types import CodeSnippet, Problem
+from interview_prep_mcp.runner.complexity import Sample, sizes
+from interview_prep_mcp.tools.estimate_complexity import EstimateComplexityTool
+
+TWO_SUM = Problem(
+    questionId="1",
+    questionFrontendId="1",
+    title="Two Sum",
+    titleSlug="two-sum",
+    difficulty="Easy",
+    content=(
+        "<p><strong>Constraints:</strong></p><ul>"
+        "<li><code>2 &lt;= nums.length &lt;= 10<sup>4</sup></code></li>"
+        "<li><code>-10<sup>9</sup> &lt;= target &lt;= 10<sup>9</sup></code></li></ul>"
+    ),
+    topicTags=[],
+    exampleTestcases="[2,7,11,15]\n9\n[3,2,4]\n6",
+    codeSnippets=[
+        CodeSnippet(
+            lang="Python3",
+            langSlug="python3",
+            code=(
+                "class Solution:\n"
+                "    def twoSum(self, nums: List[int], target: int) -> List[int]:\n"
+                "        "
+            ),
+        )
+    ],
+)
+SOLUTION = "class Solution:\n    def twoSum(self, nums, target):\n        return [0, 1]\n"
+
+
+async def fetch(title_slug: str, priority: Priority = Priority.INTERACTIVE) -> Optional[Problem]:
+    return TWO_SUM if title_slug == "two-sum" else None
+
+
+def quadratic(*args: object) -> Tuple[List[Sample], Optional[Dict[str, object]]]:
+    """Stand-in for measure(): an O(n^2) solution that timed out at n=4096."""
+    return [Sample(n=n, seconds=1e-5 + 5e-8 * n * n) for n in sizes(2896)], {
+        "n": 4096,
+        "status": "timeout",
+    }
+
+
+class TestEstimateComplexityTool:
+    """Tests for EstimateComplexityTool."""
+
+    @pytest.mark.asyncio
+    async def test_reports_complexity_against_constraints(self) -> None:
+        """Test the fit, the size parameter and the verdict at the constraint."""
+        tool = EstimateComplexityTool()
+
+        with (
+            patch.object(tool.client, "fetch_problem", side_effect=fetch),
+            patch(
+                "interview_prep_mcp.tools.estimate_complexity.measure", side_effect=quadratic
+            ) as measure,
+        ):
+            result = await tool.execute(SOLUTION, title_slug="two-sum", max_seconds=5)
+
+        # Sizes are capped at the constraint, and only nums grows
+        assert measure.call_args.args[4] == 10_000
+        assert result["size_parameters"] == ["nums"]
+        assert result["complexity"] == "O(n^2)"
+        assert result["also_consistent_with"] == []
+        assert result["fits"][0]["model"] == "O(n^2)"
+        assert result["constraint_max_n"] == 10_000
+        assert math.isclose(result["predicted_seconds_at_max_n"], 5.0, rel_tol=0.05)
+        assert result["likely_tle"] is True
+        assert result["stopped"] == {"n": 4096, "status": "timeout"}
+
+    @pytest.mark.asyncio
+    async def test_runs_real_workers(self) -> None:
+        """Test an end-to-end measurement on a short budget."""
+        tool = EstimateComplexityTool()
+        try:
+            with patch.object(tool.client, "fetch_problem", side_effect=fetch):
+                result = await tool.execute(
+                    SOLUTION, title_slug="two-sum", max_seconds=1, max_size=256
+                )
+        finally:
+            tool.pool.close()
+
+        assert [sample["n"] for sample in result["samples"]] == sizes(256)
+        assert result["complexity"] == "O(1)"
+        assert result["likely_tle"] is False
+
+    @pytest.mark.asyncio
+    async def test_invalid_arguments(self) -> None:
+        """Test argument validation."""
+        tool = EstimateComplexityTool()
+        with pytest.raises(ValueError, match="max_seconds"):
+            await tool.execute(SOLUTION, title_slug="two-sum", max_seconds=0)
+        with pytest.raises(ValueError, match="max_size"):
+            await tool.execute(SOLUTION, title_slug="two-sum", max_size=10**9)
+        with patch.object(tool.client, "fetch_problem", side_effect=fetch):
+            with pytest.raises(ValueError, match="Problem not found"):
+                await tool.execute(SOLUTION, title_slug="nope")
@@ -0,0 +1,97 @@
+"""Tests for load_problem content hashes and not-modified responses."""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+from interview_prep_mcp.tools.load_problem import LoadProblemTool
+from interview_prep_mcp.leetcode.types import Problem, ProblemSummary, CodeSnippet, TopicTag
+
+
+@pytest.fixture
+def problem() -> Problem:
+    """A problem with two code snippets."""
+    return Problem(
+        questionId="1",
+        questionFrontendId="1",
+        title="Two Sum",
+        titleSlug="two-sum",
+        difficulty="Easy",
+        content="<p>Given an array of integers...</p>",
+        topicTags=[TopicTag(name="Array", slug="array")],
+        codeSnippets=[
+            CodeSnippet(lang="Python3", langSlug="python3", code="class Solution:\n    pass"),
+            CodeSnippet(lang="Java", langSlug="java", code="class Solution {\n}"),
+        ],
+        exampleTestcases="[2,7,11,15]\n9",
+    )
+
+
+@pytest.fixture
+def tool(problem: Problem) -> LoadProblemTool:
+    """A LoadProblemTool whose client returns the problem."""
+    tool = LoadProblemTool()
+    tool.client.fetch_problem = AsyncMock(return_value=problem)  # type: ignore[method-assign]
+    tool.client.fetch_problem_by_id = AsyncMock(return_value=problem)  # type: ignore[method-assign]
+    return tool
+
+
+class TestNotModified:
+    """Tests for content_hash and if_none_match."""
+
+    @pytest.mark.asyncio
+    async def test_current_hash_returns_stub(self, tool: LoadProblemTool) -> None:
+        """Test that a matching hash skips formatting and a stale one does not."""
+        full = await tool.execute(title_slug="two-sum")
+        assert isinstance(full, dict)
+
+        with patch.object(tool, "_format_problem") as format_problem:
+            stub = await tool.execute(problem_id=1, if_none_match=full["content_hash"])
+
+        format_problem.assert_not_called()
+        assert stub == {
+            "not_modified": True,
+            "problem_id": "1",
+            "title_slug": "two-sum",
+            "content_hash": full["content_hash"],
+        }
+        stale = await tool.execute(title_slug="two-sum", if_none_match="0123456789abcdef")
+        assert isinstance(stale, dict)
+        assert stale["description"] and stale["content_hash"] == full["content_hash"]
+
+    @pytest.mark.asyncio
+    async def test_hash_per_language(self, tool: LoadProblemTool) -> None:
+        """Test that each language filter has its own version."""
+        everything = await tool.execute(title_slug="two-sum")
+        python = await tool.execute(title_slug="two-sum", language="py")
+        java = await tool.execute(title_slug="two-sum", language="java")
+        python3 = await tool.execute(title_slug="two-sum", language="python3")
+        missing = await tool.execute(title_slug="two-sum", language="rust")
+        assert (
+            isinstance(everything, dict) and isinstance(python, dict) and isinstance(python3, dict)
+        )
+        assert isinstance(java, dict) and isinstance(missing, dict)
+
+        assert len({everything["content_hash"], python["content_hash"], java["content_hash"]}) == 3
+        assert python["content_hash"] == python3["content_hash"]
+        assert "error" in missing and "content_hash" not in missing
+        # The hash of the full problem does not match a single-language request
+        reloaded = await tool.execute(
+            title_slug="two-sum", language="java", if_none_match=everything["content_hash"]
+        )
+        assert isinstance(reloaded, dict) and "code" in reloaded
+
+    @pytest.mark.asyncio
+    async def test_single_search_match(self, tool: LoadProblemTool) -> None:
+        """Test that a search resolving to one problem honours if_none_match."""
+        tool.client.search_problems = AsyncMock(  # type: ignore[method-assign]
+            return_value=[
+                ProblemSummary(
+                    questionFrontendId="1", title="Two Sum", titleSlug="two-sum", difficulty="Easy"
+                ),
+            ]
+        )
+        full = await tool.execute(problem_name="two sum")
+        assert isinstance(full, dict)
+
+        stub = await tool.execute(problem_name="two sum", if_none_match=full["content_hash"])
+
+        assert isinstance(stub, dict) and stub["not_modified"] is True
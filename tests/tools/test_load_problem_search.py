@@ -59,7 +59,7 @@ class TestLoadProblemSearch:
         assert isinstance(result, dict)
         assert result["title"] == "Two Sum"
         assert result["problem_id"] == "1"
-        tool.client.search_problems.assert_called_once_with("two sum", limit=10)
+        tool.client.search_problems.assert_called_once_with("two sum", limit=11, after=None)
         tool.client.fetch_problem.assert_called_once_with("two-sum")
 
     @pytest.mark.asyncio
@@ -112,6 +112,68 @@ class TestLoadProblemSearch:
         with pytest.raises(ValueError, match="Either title_slug, problem_id, or problem_name must be provided"):
             await tool.execute()
 
+    @pytest.mark.asyncio
+    async def test_execute_with_filters_only_lists_matches(self, tool) -> None:  # type: ignore[no-untyped-def,misc]
+        """Test that difficulty/tags without a name list the matching problems."""
+        tool.client.search_problems = AsyncMock(
+            return_value=[
+                ProblemSummary(
+                    questionFrontendId="62",
+                    title="Unique Paths",
+                    titleSlug="unique-paths",
+                    difficulty="Medium",
+                    tags=["math", "dynamic-programming"],
+                ),
+                ProblemSummary(
+                    questionFrontendId="198",
+                    title="House Robber",
+                    titleSlug="house-robber",
+                    difficulty="Medium",
+                    tags=["array", "dynamic-programming"],
+                ),
+            ]
+        )
+
+        result = await tool.execute(difficulty="Medium", tags=["dynamic-programming"])
+
+        tool.client.search_problems.assert_called_once_with(
+            "", limit=11, difficulty="Medium", tags=["dynamic-programming"], after=None
+        )
+        assert isinstance(result, dict)
+        assert result["query"] == "difficulty=Medium tags=dynamic-programming"
+        assert result["matches"][1]["topics"] == ["array", "dynamic-programming"]
+        assert result["matches"][1]["paid_only"] is False
+
+    @pytest.mark.asyncio
+    async def test_execute_with_name_and_filters(self, tool, sample_problem) -> None:  # type: ignore[no-untyped-def,misc]
+        """Test that filters are passed along with a name search."""
+        tool.client.search_problems = AsyncMock(
+            return_value=[
+                ProblemSummary(
+                    questionFrontendId="1", title="Two Sum", titleSlug="two-sum", difficulty="Easy"
+                )
+            ]
+        )
+        tool.client.fetch_problem = AsyncMock(return_value=sample_problem)
+
+        result = await tool.execute(problem_name="sum", difficulty="Easy")
+
+        tool.client.search_problems.assert_called_once_with(
+            "sum", limit=11, difficulty="Easy", tags=None, after=None
+        )
+        assert isinstance(result, dict)
+        assert result["title_slug"] == "two-sum"
+
+    @pytest.mark.asyncio
+    async def test_execute_with_filters_no_matches(self, tool) -> None:  # type: ignore[no-untyped-def,misc]
+        """Test the error when no problem satisfies the filters."""
+        tool.client.search_problems = AsyncMock(return_value=[])
+
+        with pytest.raises(
+            ValueError, match="No problems found matching: difficulty=Hard tags=tag-x"
+        ):
+            await tool.execute(difficulty="Hard", tags=["tag-x"])
+
     @pytest.mark.asyncio
     async def test_format_search_results(self, tool) -> None:  # type: ignore[no-untyped-def,misc]
         """Test formatting search results."""
@@ -161,4 +223,57 @@ class TestLoadProblemSearch:
 
         # Should only call search_problems, not the other methods
         tool.client.search_problems.assert_called_once()
-        tool.client.fetch_problem_by_id.assert_not_called()
\ No newline at end of file
+        tool.client.fetch_problem_by_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_paginates_with_cursor(self, tool) -> None:  # type: ignore[no-untyped-def,misc]
+        """Test that a full page carries a cursor that resumes after its last match."""
+        catalog = [
+            ProblemSummary(
+                questionFrontendId=str(i), title=f"Sum {i}", titleSlug=f"sum-{i}", difficulty="Easy"
+            )
+            for i in range(5)
+        ]
+
+        async def search(query: str, limit: int, after: object = None) -> list[ProblemSummary]:
+            start = 0 if after is None else [m.titleSlug for m in catalog].index(str(after)) + 1
+            return catalog[start : start + limit]
+
+        tool.client.search_problems = AsyncMock(side_effect=search)
+
+        first = await tool.execute(problem_name="sum", limit=2)
+        second = await tool.execute(problem_name="sum", limit=2, cursor=first["next_cursor"])
+        last = await tool.execute(problem_name="sum", limit=2, cursor=second["next_cursor"])
+
+        assert [m["title_slug"] for m in first["matches"]] == ["sum-0", "sum-1"]
+        assert [m["title_slug"] for m in second["matches"]] == ["sum-2", "sum-3"]
+        # A last page of one is still a page, not a loaded problem
+        assert [m["title_slug"] for m in last["matches"]] == ["sum-4"]
+        assert last["next_cursor"] is None
+        assert tool.client.search_problems.call_args_list[1].kwargs == {
+            "limit": 3,
+            "after": "sum-1",
+        }
+
+    @pytest.mark.asyncio
+    async def test_execute_rejects_foreign_cursor(self, tool) -> None:  # type: ignore[no-untyped-def,misc]
+        """Test limit validation and cursors from another search or garbage."""
+        tool.client.search_problems = AsyncMock(
+            return_value=[
+                ProblemSummary(
+                    questionFrontendId=str(i),
+                    title=f"Sum {i}",
+                    titleSlug=f"sum-{i}",
+                    difficulty="Easy",
+                )
+                for i in range(3)
+            ]
+        )
+        page = await tool.execute(problem_name="sum", limit=2)
+
+        with pytest.raises(ValueError, match="different search"):
+            await tool.execute(problem_name="path", cursor=page["next_cursor"])
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            await tool.execute(problem_name="sum", cursor="not-a-cursor")
+        with pytest.raises(ValueError, match="limit must be between 1 and 50"):
+            await tool.execute(problem_name="sum", limit=0)
@@ -0,0 +1,246 @@
+"""Tests for predictive prefetch."""
+
+import asyncio
+import pytest
+from typing import List
+from unittest.mock import AsyncMock, patch
+from interview_prep_mcp.leetcode.client import LeetCodeClient
+from interview_prep_mcp.leetcode.scheduler import Priority
+from interview_prep_mcp.leetcode.types import CachedProblemInfo, Problem, TopicTag
+from interview_prep_mcp.tools.load_problem import LoadProblemTool
+from interview_prep_mcp.tools.prefetch import Prefetcher
+from ..conftest import make_client, make_problem
+
+CATALOG = {
+    "197": "rising-temperature",
+    "198": "house-robber",
+    "199": "binary-tree-right-side-view",
+    "213": "house-robber-ii",
+    "337": "house-robber-iii",
+    "1": "two-sum",
+    "167": "two-sum-ii-input-array-is-sorted",
+}
+
+
+@pytest.fixture
+def catalog_client() -> LeetCodeClient:
+    """Client with a prebuilt catalog and no network access."""
+    return make_client(
+        [
+            CachedProblemInfo(
+                questionFrontendId=frontend_id, title=slug.replace("-", " ").title(), titleSlug=slug
+            )
+            for frontend_id, slug in CATALOG.items()
+        ]
+    )
+
+
+async def drain(prefetcher: Prefetcher) -> None:
+    """Wait for scheduled prefetches to finish."""
+    while prefetcher._tasks:
+        await asyncio.gather(*prefetcher._tasks)
+
+
+class TestPredict:
+    """Tests for Prefetcher.predict."""
+
+    @pytest.mark.asyncio
+    async def test_sequels_then_neighbours(self, catalog_client: LeetCodeClient) -> None:
+        """Test that numbered sequels rank ahead of adjacent IDs."""
+        prefetcher = Prefetcher(catalog_client, max_predictions=4)
+
+        predictions = await prefetcher.predict(make_problem("house-robber", frontend_id="198"))
+
+        assert predictions == [
+            "house-robber-ii",
+            "house-robber-iii",
+            "binary-tree-right-side-view",
+            "rising-temperature",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sequel_with_subtitle_predicts_original(
+        self, catalog_client: LeetCodeClient
+    ) -> None:
+        """Test that a subtitled sequel predicts the problem it continues."""
+        prefetcher = Prefetcher(catalog_client)
+
+        predictions = await prefetcher.predict(
+            make_problem("two-sum-ii-input-array-is-sorted", frontend_id="167")
+        )
+
+        assert predictions[0] == "two-sum"
+        assert "two-sum-ii-input-array-is-sorted" not in predictions
+
+    @pytest.mark.asyncio
+    async def test_only_catalog_problems_capped(self, catalog_client: LeetCodeClient) -> None:
+        """Test that predictions are limited to the catalog and max_predictions."""
+        prefetcher = Prefetcher(catalog_client, max_predictions=2)
+
+        predictions = await prefetcher.predict(make_problem("two-sum", frontend_id="1"))
+
+        # No problem 0 or 2 in the catalog
+        assert predictions == ["two-sum-ii-input-array-is-sorted"]
+        assert len(await prefetcher.predict(make_problem("house-robber", frontend_id="198"))) == 2
+
+
+class TestPredictFromTags:
+    """Tests for predictions from the catalog's tag index."""
+
+    @pytest.mark.asyncio
+    async def test_same_difficulty_and_tags_skipping_paid(self) -> None:
+        """Test that later problems sharing difficulty and tags are predicted, except paid ones."""
+        client = make_client(
+            [
+                CachedProblemInfo(
+                    questionFrontendId="70",
+                    title="Climbing Stairs",
+                    titleSlug="climbing-stairs",
+                    difficulty="Easy",
+                    tags=["dynamic-programming"],
+                ),
+                CachedProblemInfo(
+                    questionFrontendId="100",
+                    title="Same Tree",
+                    titleSlug="same-tree",
+                    difficulty="Easy",
+                    tags=["tree"],
+                ),
+                CachedProblemInfo(
+                    questionFrontendId="256",
+                    title="Paint House",
+                    titleSlug="paint-house",
+                    difficulty="Easy",
+                    paidOnly=True,
+                    tags=["dynamic-programming"],
+                ),
+                CachedProblemInfo(
+                    questionFrontendId="746",
+                    title="Min Cost Climbing Stairs",
+                    titleSlug="min-cost-climbing-stairs",
+                    difficulty="Easy",
+                    tags=["dynamic-programming"],
+                ),
+            ]
+        )
+        problem = make_problem("climbing-stairs", frontend_id="70")
+        problem.difficulty = "Easy"
+        problem.topicTags = [TopicTag(name="Dynamic Programming", slug="dynamic-programming")]
+
+        predictions = await Prefetcher(client).predict(problem)
+
+        assert predictions == ["min-cost-climbing-stairs"]
+
+
+class TestPrefetcher:
+    """Tests for scheduling prefetches and their metrics."""
+
+    @pytest.mark.asyncio
+    async def test_hit_after_prefetch(self, catalog_client: LeetCodeClient) -> None:
+        """Test that loading a prefetched problem counts as a hit, once."""
+        prefetcher = Prefetcher(catalog_client, max_predictions=1)
+
+        with patch.object(
+            catalog_client, "prefetch_problem", new=AsyncMock(return_value=True)
+        ) as prefetch:
+            prefetcher.record_load("house-robber", 0.5)
+            prefetcher.schedule(make_problem("house-robber", frontend_id="198"))
+            await drain(prefetcher)
+            prefetcher.record_load("house-robber-ii", 0.01)
+            prefetcher.record_load("house-robber-ii", 0.01)
+
+        prefetch.assert_awaited_once_with("house-robber-ii")
+        metrics = prefetcher.metrics()
+        assert metrics["loads"] == 3
+        assert metrics["hits"] == 1
+        assert metrics["misses"] == 2
+        assert metrics["prefetched"] == 1
+        assert metrics["precision"] == 1.0
+        assert metrics["mean_hit_seconds"] == 0.01
+
+    @pytest.mark.asyncio
+    async def test_skips_cached_and_counts_failures(self, catalog_client: LeetCodeClient) -> None:
+        """Test that cached problems are not prefetched and failures are counted."""
+        catalog_client._fetched_problems.set(
+            "house-robber-ii", make_problem("house-robber-ii", frontend_id="213")
+        )
+        prefetcher = Prefetcher(catalog_client, max_predictions=2)
+
+        with patch.object(
+            catalog_client, "prefetch_problem", new=AsyncMock(return_value=False)
+        ) as prefetch:
+            prefetcher.schedule(make_problem("house-robber", frontend_id="198"))
+            await drain(prefetcher)
+
+        prefetch.assert_awaited_once_with("house-robber-iii")
+        assert prefetcher.metrics()["failed"] == 1
+        assert prefetcher.metrics()["prefetched"] == 0
+
+    def test_metrics_empty(self, catalog_client: LeetCodeClient) -> None:
+        """Test that ratios are None before any load."""
+        metrics = Prefetcher(catalog_client).metrics()
+
+        assert metrics["loads"] == 0
+        assert metrics["hit_rate"] is None
+        assert metrics["precision"] is None
+
+
+class TestClientPrefetch:
+    """Tests for LeetCodeClient.prefetch_problem."""
+
+    @pytest.mark.asyncio
+    async def test_prefetch_priority_without_retries(self) -> None:
+        """Test that a prefetch is sent once, at prefetch priority."""
+        client = LeetCodeClient()
+        priorities: List[Priority] = []
+
+        async def post(query: str, variables: object, priority: Priority) -> Problem:
+            priorities.append(priority)
+            raise ConnectionError("upstream down")
+
+        with patch.object(client, "_post_question_query", side_effect=post):
+            assert await client.prefetch_problem("house-robber") is False
+
+        assert priorities == [Priority.PREFETCH]
+
+    @pytest.mark.asyncio
+    async def test_prefetch_caches_problem(self) -> None:
+        """Test that a successful prefetch lands in the cache."""
+        client = LeetCodeClient()
+        problem = make_problem("house-robber", frontend_id="198")
+
+        with patch.object(client, "_post_question_query", new=AsyncMock(return_value=problem)):
+            assert await client.prefetch_problem("house-robber") is True
+
+        assert client.is_cached("house-robber")
+
+
+class TestLoadProblemPrefetch:
+    """Tests for prefetch wiring in LoadProblemTool."""
+
+    def test_disabled_by_default(self) -> None:
+        """Test that prefetch is opt-in."""
+        assert LoadProblemTool().prefetcher is None
+
+    @pytest.mark.asyncio
+    async def test_load_schedules_prefetch(self, catalog_client: LeetCodeClient) -> None:
+        """Test that loading a problem prefetches its predictions."""
+        tool = LoadProblemTool(catalog_client, prefetch=True)
+        assert tool.prefetcher is not None
+        problem = make_problem("house-robber", frontend_id="198")
+
+        with (
+            patch.object(catalog_client, "fetch_problem", new=AsyncMock(return_value=problem)),
+            patch.object(
+                catalog_client, "prefetch_problem", new=AsyncMock(return_value=True)
+            ) as prefetch,
+        ):
+            await tool.execute(title_slug="house-robber")
+            await drain(tool.prefetcher)
+
+        assert [call.args[0] for call in prefetch.await_args_list] == [
+            "house-robber-ii",
+            "house-robber-iii",
+            "binary-tree-right-side-view",
+        ]
+        assert tool.prefetcher.metrics()["misses"] == 1
@@ -0,0 +1,132 @@
+"""Tests for load_problem_list tool."""
+
+import asyncio
+import pytest
+from typing import List, Optional
+from unittest.mock import AsyncMock, patch
+from interview_prep_mcp.leetcode.scheduler import Priority
+from interview_prep_mcp.leetcode.types import (
+    CachedProblemInfo,
+    Problem,
+    ProblemList,
+    ProblemListGroup,
+)
+from interview_prep_mcp.tools.load_problem import LoadProblemTool
+from interview_prep_mcp.tools.problem_list import ProblemListTool
+from ..conftest import make_client, make_problem
+
+PLAN = ProblemList(
+    kind="study_plan",
+    slug="plan",
+    name="Plan",
+    groups=[
+        ProblemListGroup(name="Arrays", titleSlugs=["two-sum", "premium", "missing"]),
+        ProblemListGroup(name="Strings", titleSlugs=["no-python", "broken", "two-sum"]),
+    ],
+)
+
+
+def make_tool(concurrency: int = 8) -> ProblemListTool:
+    client = make_client(
+        [
+            CachedProblemInfo(questionFrontendId="1", title="Two Sum", titleSlug="two-sum"),
+            CachedProblemInfo(
+                questionFrontendId="2", title="Premium", titleSlug="premium", paidOnly=True
+            ),
+        ]
+    )
+    return ProblemListTool(LoadProblemTool(client), concurrency=concurrency)
+
+
+class TestProblemListTool:
+    """Tests for ProblemListTool."""
+
+    @pytest.mark.asyncio
+    async def test_loads_in_order_with_per_problem_errors(self) -> None:
+        """Test the combined response: problems in order, groups, and errors instead of failure."""
+        tool = make_tool()
+        fetched: List[str] = []
+        priorities: List[Priority] = []
+
+        async def fetch(
+            title_slug: str, priority: Priority = Priority.INTERACTIVE
+        ) -> Optional[Problem]:
+            fetched.append(title_slug)
+            priorities.append(priority)
+            if title_slug == "broken":
+                raise ValueError("GraphQL errors: boom")
+            if title_slug == "missing":
+                return None
+            return make_problem(
+                title_slug, languages=["java" if title_slug == "no-python" else "python3"]
+            )
+
+        with (
+            patch.object(tool.client, "fetch_problem_list", new=AsyncMock(return_value=PLAN)),
+            patch.object(tool.client, "fetch_problem", side_effect=fetch),
+        ):
+            result = await tool.execute(slug="plan", include_description=False)
+
+        assert "premium" not in fetched
+        assert set(priorities) == {Priority.BACKGROUND}
+        assert (result["name"], result["total"], result["loaded"]) == ("Plan", 5, 1)
+        [problem] = result["problems"]
+        assert problem["title_slug"] == "two-sum" and problem["group"] == "Arrays"
+        assert problem["code"] == "class Solution: ..." and "description" not in problem
+        assert problem["content_hash"]
+        assert result["errors"] == [
+            {"problem": "premium", "error": "Premium problem"},
+            {"problem": "missing", "error": "Problem not found"},
+            {"problem": "no-python", "error": "Language 'python3' not available for this problem"},
+            {"problem": "broken", "error": "GraphQL errors: boom"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency(self) -> None:
+        """Test that at most ``concurrency`` problems are fetched at once."""
+        tool = make_tool(concurrency=2)
+        problem_list = ProblemList(
+            kind="list",
+            slug="l",
+            name="L",
+            groups=[
+                ProblemListGroup(name="L", titleSlugs=[f"p{i}" for i in range(6)]),
+            ],
+        )
+        running = peak = 0
+
+        async def fetch(
+            title_slug: str, priority: Priority = Priority.INTERACTIVE
+        ) -> Optional[Problem]:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return make_problem(title_slug)
+
+        with (
+            patch.object(
+                tool.client, "fetch_problem_list", new=AsyncMock(return_value=problem_list)
+            ),
+            patch.object(tool.client, "fetch_problem", side_effect=fetch),
+        ):
+            result = await tool.execute(slug="l", kind="list")
+
+        assert peak == 2
+        assert [p["title_slug"] for p in result["problems"]] == [f"p{i}" for i in range(6)]
+        assert (
+            "group" not in result["problems"][0]
+            and result["problems"][0]["description"] == "Problem"
+        )
+
+    @pytest.mark.asyncio
+    async def test_invalid_kind_and_unknown_list(self) -> None:
+        """Test argument validation and a plan LeetCode does not know."""
+        tool = make_tool()
+
+        with pytest.raises(ValueError, match="kind must be"):
+            await tool.execute(slug="plan", kind="favorites")
+        with patch.object(tool.client, "fetch_problem_list", new=AsyncMock(return_value=None)):
+            with pytest.raises(ValueError, match="Study plan not found: nope"):
+                await tool.execute(slug="nope")
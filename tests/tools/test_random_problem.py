@@ -0,0 +1,118 @@
+"""Tests for random_problem tool."""
+
+import pytest
+from collections import Counter
+from typing import List
+from unittest.mock import AsyncMock, patch
+from interview_prep_mcp.leetcode.types import CachedProblemInfo
+from interview_prep_mcp.tools.random_problem import RandomProblemTool
+
+
+def catalog() -> List[CachedProblemInfo]:
+    """Catalog with two free medium graph problems and a paid-only one."""
+    return [
+        CachedProblemInfo(
+            questionFrontendId="133",
+            title="Clone Graph",
+            titleSlug="clone-graph",
+            difficulty="Medium",
+            tags=["graph", "breadth-first-search"],
+        ),
+        CachedProblemInfo(
+            questionFrontendId="207",
+            title="Course Schedule",
+            titleSlug="course-schedule",
+            difficulty="Medium",
+            tags=["graph", "topological-sort"],
+        ),
+        CachedProblemInfo(
+            questionFrontendId="261",
+            title="Graph Valid Tree",
+            titleSlug="graph-valid-tree",
+            difficulty="Medium",
+            paidOnly=True,
+            tags=["graph"],
+        ),
+        CachedProblemInfo(
+            questionFrontendId="1",
+            title="Two Sum",
+            titleSlug="two-sum",
+            difficulty="Easy",
+            tags=["array", "hash-table"],
+        ),
+    ]
+
+
+@pytest.fixture
+def tool() -> RandomProblemTool:
+    """Random problem tool over a preloaded catalog."""
+    random_tool = RandomProblemTool()
+    random_tool.client._problem_cache = catalog()
+    return random_tool
+
+
+class TestRandomProblem:
+    """Tests for RandomProblemTool."""
+
+    @pytest.mark.asyncio
+    async def test_picks_only_free_matching_problems(self, tool: RandomProblemTool) -> None:
+        """Test that picks cover the free matches uniformly and never the paid-only one."""
+        picks = Counter(
+            [
+                (await tool.execute(difficulty="Medium", tags=["graph"]))["title_slug"]
+                for _ in range(400)
+            ]
+        )
+
+        assert set(picks) == {"clone-graph", "course-schedule"}
+        assert 150 < picks["clone-graph"] < 250
+
+    @pytest.mark.asyncio
+    async def test_seed_is_deterministic(self, tool: RandomProblemTool) -> None:
+        """Test that the same seed and filters give the same problem."""
+        first = await tool.execute(tags=["graph"], seed=7)
+        second = await tool.execute(tags=["graph"], seed=7)
+        others = {(await tool.execute(seed=seed))["title_slug"] for seed in range(20)}
+
+        assert first == second
+        assert first["candidates"] == 2
+        assert others == {"clone-graph", "course-schedule", "two-sum"}
+
+    @pytest.mark.asyncio
+    async def test_several_tags_intersect(self, tool: RandomProblemTool) -> None:
+        """Test that every given tag must match."""
+        result = await tool.execute(tags=["Graph", "Topological Sort"])
+
+        assert result["title_slug"] == "course-schedule"
+        assert result["candidates"] == 1
+        assert result["topics"] == ["graph", "topological-sort"]
+
+    @pytest.mark.asyncio
+    async def test_no_match_raises(self, tool: RandomProblemTool) -> None:
+        """Test the error when no free problem matches."""
+        with pytest.raises(ValueError, match="No free problems match"):
+            await tool.execute(difficulty="Hard", tags=["graph"])
+
+    @pytest.mark.asyncio
+    async def test_fetch_loads_full_problem(self, tool: RandomProblemTool) -> None:
+        """Test that fetch delegates to load_problem for the picked slug."""
+        loaded = {"title_slug": "two-sum", "code": "class Solution: ..."}
+        with patch.object(tool.loader, "execute", new=AsyncMock(return_value=loaded)) as execute:
+            result = await tool.execute(difficulty="Easy", fetch=True, language="python")
+
+        execute.assert_awaited_once_with(title_slug="two-sum", language="python")
+        assert result == {**loaded, "candidates": 1}
+
+    @pytest.mark.asyncio
+    async def test_loads_catalog_on_first_use(self) -> None:
+        """Test that the catalog is built when not loaded yet."""
+        random_tool = RandomProblemTool()
+
+        async def load_catalog() -> dict[str, str]:
+            random_tool.client._problem_cache = catalog()
+            return {p.questionFrontendId: p.titleSlug for p in catalog()}
+
+        with patch.object(random_tool.client, "_load_catalog", side_effect=load_catalog):
+            result = await random_tool.execute(difficulty="Easy")
+
+        assert result["title_slug"] == "two-sum"
@@ -0,0 +1,92 @@
+"""Tests for run_tests tool."""
+
+import sys
+import pytest
+from typing import AsyncIterator, Optional
+from unittest.mock import patch
+from interview_prep_mcp.leetcode.scheduler import Priority
+from interview_prep_mcp.leetcode.types import CodeSnippet, Problem
+from interview_prep_mcp.runner.pool import WorkerPool
+from interview_prep_mcp.tools.run_tests import RunTestsTool
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="test workers need POSIX")
+
+TWO_SUM = Problem(
+    questionId="1",
+    questionFrontendId="1",
+    title="Two Sum",
+    titleSlug="two-sum",
+    difficulty="Easy",
+    content=(
+        "<pre><strong>Input:</strong> nums = [2,7,11,15], target = 9\n"
+        "<strong>Output:</strong> [0,1]</pre>"
+        "<pre><strong>Input:</strong> nums = [3,2,4], target = 6\n"
+        "<strong>Output:</strong> [1,2]</pre>"
+    ),
+    topicTags=[],
+    exampleTestcases="[2,7,11,15]\n9\n[3,2,4]\n6",
+    codeSnippets=[
+        CodeSnippet(
+            lang="Python3",
+            langSlug="python3",
+            code=(
+                "class Solution:\n"
+                "    def twoSum(self, nums: List[int], target: int) -> List[int]:\n"
+                "        "
+            ),
+        )
+    ],
+)
+# Right for the first example only
+SOLUTION = "class Solution:\n    def twoSum(self, nums, target):\n        return [0, 1]\n"
+
+
+async def fetch(title_slug: str, priority: Priority = Priority.INTERACTIVE) -> Optional[Problem]:
+    return TWO_SUM if title_slug == "two-sum" else None
+
+
+@pytest.fixture
+async def tool() -> AsyncIterator[RunTestsTool]:
+    runner = RunTestsTool(pool=WorkerPool(size=1))
+    yield runner
+    runner.pool.close()
+
+
+class TestRunTestsTool:
+    """Tests for RunTestsTool."""
+
+    @pytest.mark.asyncio
+    async def test_judges_examples(self, tool: RunTestsTool) -> None:
+        """Test running against the examples with expected outputs from the description."""
+        with patch.object(tool.client, "fetch_problem", side_effect=fetch):
+            result = await tool.execute(SOLUTION, title_slug="two-sum")
+
+        assert result["method"] == "twoSum"
+        assert [case["status"] for case in result["cases"]] == ["passed", "failed"]
+        assert result["cases"][1]["input"] == {"nums": "[3,2,4]", "target": "6"}
+        assert result["cases"][1]["expected"] == [1, 2]
+        assert result["counts"] == {"passed": 1, "failed": 1}
+        assert result["all_passed"] is False
+
+    @pytest.mark.asyncio
+    async def test_custom_input_is_run_not_judged(self, tool: RunTestsTool) -> None:
+        """Test that custom cases report output without a verdict."""
+        with patch.object(tool.client, "fetch_problem", side_effect=fetch):
+            result = await tool.execute(SOLUTION, title_slug="two-sum", test_input="[1,1]\n2")
+
+        assert result["cases"][0]["status"] == "ran"
+        assert result["cases"][0]["output"] == [0, 1]
+        assert "expected" not in result["cases"][0]
+
+    @pytest.mark.asyncio
+    async def test_invalid_arguments(self, tool: RunTestsTool) -> None:
+        """Test argument validation and unknown problems."""
+        with pytest.raises(ValueError, match="title_slug or problem_id"):
+            await tool.execute(SOLUTION)
+        with pytest.raises(ValueError, match="timeout"):
+            await tool.execute(SOLUTION, title_slug="two-sum", timeout=60)
+        with patch.object(tool.client, "fetch_problem", side_effect=fetch):
+            with pytest.raises(ValueError, match="Problem not found"):
+                await tool.execute(SOLUTION, title_slug="nope")
+            with pytest.raises(ValueError, match="2 line"):
+                await tool.execute(SOLUTION, title_slug="two-sum", test_input="[1]")
@@ -0,0 +1,78 @@
+"""Tests for scaffold_workspace tool."""
+
+import pytest
+from pathlib import Path
+from typing import Optional
+from unittest.mock import patch
+from interview_prep_mcp.leetcode.scheduler import Priority
+from interview_prep_mcp.leetcode.types import CodeSnippet, Problem
+from interview_prep_mcp.tools.scaffold import ScaffoldTool
+
+
+def problem(problem_id: int, title: str, languages: tuple[str, ...] = ("python3",)) -> Problem:
+    return Problem(
+        questionId=str(problem_id),
+        questionFrontendId=str(problem_id),
+        title=title,
+        titleSlug=title.lower().replace(" ", "-"),
+        difficulty="Easy",
+        content=f"<p>{title}</p>",
+        topicTags=[],
+        exampleTestcases="1",
+        codeSnippets=[
+            CodeSnippet(lang=lang, langSlug=lang, code="class Solution: pass") for lang in languages
+        ],
+    )
+
+
+PROBLEMS = {
+    "two-sum": problem(1, "Two Sum"),
+    "3sum": problem(15, "3Sum"),
+    "sql-only": problem(175, "SQL Only", ("mysql",)),
+}
+
+
+async def fetch(title_slug: str, priority: Priority = Priority.INTERACTIVE) -> Optional[Problem]:
+    assert priority == Priority.BACKGROUND
+    return PROBLEMS.get(title_slug)
+
+
+class TestScaffoldTool:
+    """Tests for ScaffoldTool."""
+
+    @pytest.mark.asyncio
+    async def test_writes_stubs_and_reports_errors(self, tmp_path: Path) -> None:
+        """Test a bulk scaffold with a missing problem and a missing template."""
+        tool = ScaffoldTool()
+        tool.client._id_to_slug_cache = {"15": "3sum"}
+
+        with patch.object(tool.client, "fetch_problem", side_effect=fetch):
+            result = await tool.execute(
+                str(tmp_path),
+                title_slugs=["two-sum", "sql-only", "nope"],
+                problem_ids=[15],
+                language="py",
+            )
+            rerun = await tool.execute(
+                str(tmp_path), title_slugs=["two-sum"], problem_ids=[15], language="py"
+            )
+
+        assert result["language"] == "python3"
+        assert result["counts"] == {"written": 2}
+        assert sorted(f["path"] for f in result["files"]) == ["15_3sum.py", "1_two_sum.py"]
+        assert (tmp_path / "1_two_sum.py").read_text().startswith("# 1. Two Sum (Easy)\n")
+        assert result["errors"] == [
+            {"problem": "nope", "error": "Problem not found"},
+            {"problem": "sql-only", "error": "No Python3 template"},
+        ]
+        assert rerun["counts"] == {"unchanged": 2}
+
+    @pytest.mark.asyncio
+    async def test_invalid_arguments(self, tmp_path: Path) -> None:
+        """Test argument validation."""
+        tool = ScaffoldTool()
+
+        with pytest.raises(ValueError, match="title_slugs or problem_ids"):
+            await tool.execute(str(tmp_path))
+        with pytest.raises(ValueError, match="Unknown language"):
+            await tool.execute(str(tmp_path), title_slugs=["two-sum"], language="cobol")
@@ -0,0 +1,90 @@
+"""Tests for similar_problems tool."""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+from interview_prep_mcp.leetcode.types import CachedProblemInfo, Problem
+from interview_prep_mcp.tools.similar_problems import SimilarProblemsTool
+
+
+@pytest.fixture
+def tool() -> SimilarProblemsTool:
+    """Tool over a small catalog and graph."""
+    similar_tool = SimilarProblemsTool()
+    client = similar_tool.client
+    client._problem_cache = [
+        CachedProblemInfo(
+            questionFrontendId="1", title="Two Sum", titleSlug="two-sum", difficulty="Easy"
+        ),
+        CachedProblemInfo(
+            questionFrontendId="15", title="3Sum", titleSlug="3sum", difficulty="Medium"
+        ),
+        CachedProblemInfo(
+            questionFrontendId="18", title="4Sum", titleSlug="4sum", difficulty="Medium"
+        ),
+    ]
+    client._id_to_slug_cache = {p.questionFrontendId: p.titleSlug for p in client._problem_cache}
+    client.similar.add("two-sum", ["3sum"])
+    return similar_tool
+
+
+class TestSimilarProblems:
+    """Tests for SimilarProblemsTool."""
+
+    @pytest.mark.asyncio
+    async def test_neighbours_with_catalog_details(self, tool: SimilarProblemsTool) -> None:
+        """Test that results carry catalog metadata and no fetch happens."""
+        with patch.object(tool.client, "fetch_problem", new=AsyncMock()) as fetch:
+            result = await tool.execute(problem_id=1)
+
+        fetch.assert_not_awaited()
+        assert result["title_slug"] == "two-sum"
+        assert result["similar"] == [
+            {
+                "title_slug": "3sum",
+                "hops": 1,
+                "problem_id": "15",
+                "title": "3Sum",
+                "difficulty": "Medium",
+                "paid_only": False,
+            }
+        ]
+        assert "uncollected" not in result
+
+    @pytest.mark.asyncio
+    async def test_uncollected_problem_is_fetched(self, tool: SimilarProblemsTool) -> None:
+        """Test that a problem without collected links is fetched once."""
+
+        async def fetch(title_slug: str) -> Problem:
+            tool.client.similar.add(title_slug, ["4sum"])
+            return Problem(
+                questionId="15",
+                questionFrontendId="15",
+                title="3Sum",
+                titleSlug=title_slug,
+                difficulty="Medium",
+                content="",
+                topicTags=[],
+                codeSnippets=[],
+                similarQuestions=["4sum"],
+            )
+
+        with patch.object(tool.client, "fetch_problem", side_effect=fetch) as fetch_mock:
+            result = await tool.execute(title_slug="3sum", hops=2)
+
+        fetch_mock.assert_awaited_once_with("3sum")
+        assert [(s["title_slug"], s["hops"]) for s in result["similar"]] == [
+            ("two-sum", 1),
+            ("4sum", 1),
+        ]
+        assert result["uncollected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_arguments(self, tool: SimilarProblemsTool) -> None:
+        """Test argument validation and unknown problems."""
+        with pytest.raises(ValueError, match="must be provided"):
+            await tool.execute()
+        with pytest.raises(ValueError, match="hops must be between 1 and 3"):
+            await tool.execute(title_slug="two-sum", hops=4)
+        with patch.object(tool.client, "fetch_problem", new=AsyncMock(return_value=None)):
+            with pytest.raises(ValueError, match="Problem not found: missing"):
+                await tool.execute(title_slug="missing")
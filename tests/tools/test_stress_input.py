@@ -0,0 +1,94 @@
+"""Tests for generate_stress_input tool."""
+
+import json
+import pytest
+from pathlib import Path
+from typing import Optional
+from unittest.mock import patch
+from interview_prep_mcp.leetcode.scheduler import Priority
+from interview_prep_mcp.leetcode.types import CodeSnippet, Problem
+
+pytest.importorskip("numpy")
+
+from interview_prep_mcp.tools import stress_input
+from interview_prep_mcp.tools.stress_input import StressInputTool
+
+TWO_SUM = Problem(
+    questionId="1",
+    questionFrontendId="1",
+    title="Two Sum",
+    titleSlug="two-sum",
+    difficulty="Easy",
+    content=(
+        "<p><strong>Constraints:</strong></p><ul>"
+        "<li><code>2 &lt;= nums.length &lt;= 10<sup>4</sup></code></li>"
+        "<li><code>-10<sup>9</sup> &lt;= nums[i] &lt;= 10<sup>9</sup></code></li>"
+        "<li><code>-10<sup>9</sup> &lt;= target &lt;= 10<sup>9</sup></code></li></ul>"
+    ),
+    topicTags=[],
+    exampleTestcases="[2,7,11,15]\n9\n[3,2,4]\n6",
+    codeSnippets=[
+        CodeSnippet(
+            lang="Python3",
+            langSlug="python3",
+            code=(
+                "class Solution:\n"
+                "    def twoSum(self, nums: List[int], target: int) -> List[int]:\n"
+                "        "
+            ),
+        )
+    ],
+)
+
+
+async def fetch(title_slug: str, priority: Priority = Priority.INTERACTIVE) -> Optional[Problem]:
+    return TWO_SUM if title_slug == "two-sum" else None
+
+
+class TestStressInputTool:
+    """Tests for StressInputTool."""
+
+    @pytest.mark.asyncio
+    async def test_inline_input(self) -> None:
+        """Test that a small enough case is returned with how it was built."""
+        tool = StressInputTool()
+
+        with patch.object(tool.client, "fetch_problem", side_effect=fetch):
+            result = await tool.execute(title_slug="two-sum", scale=0.01)
+
+        nums, target = (json.loads(line) for line in result["input"].splitlines())
+        assert len(nums) == 100 and target == 10**9
+        assert result["method"] == "twoSum"
+        assert result["constraints"]["lengths"] == {"nums": {"low": 2, "high": 10_000}}
+        assert result["arguments"][0]["shape"] == [100]
+
+    @pytest.mark.asyncio
+    async def test_large_input_needs_a_file(self, tmp_path: Path) -> None:
+        """Test the inline limit and writing to output_path."""
+        tool = StressInputTool()
+        path = tmp_path / "cases" / "two-sum.txt"
+
+        with (
+            patch.object(tool.client, "fetch_problem", side_effect=fetch),
+            patch.object(stress_input, "MAX_INLINE_CHARS", 1_000),
+        ):
+            with pytest.raises(ValueError, match="pass output_path"):
+                await tool.execute(title_slug="two-sum")
+            result = await tool.execute(title_slug="two-sum", output_path=str(path))
+
+        assert "input" not in result and result["output_path"] == str(path)
+        assert len(json.loads(path.read_text().splitlines()[0])) == 10_000
+        assert result["characters"] == len(path.read_text())
+
+    @pytest.mark.asyncio
+    async def test_invalid_arguments(self) -> None:
+        """Test argument validation and unknown problems."""
+        tool = StressInputTool()
+
+        with pytest.raises(ValueError, match="Either title_slug or problem_id"):
+            await tool.execute()
+        with pytest.raises(ValueError, match="scale must be"):
+            await tool.execute(title_slug="two-sum", scale=2)
+        with patch.object(tool.client, "fetch_problem", side_effect=fetch):
+            with pytest.raises(ValueError, match="Problem not found: missing"):
+                await tool.execute(title_slug="missing")
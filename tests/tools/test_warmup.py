@@ -0,0 +1,108 @@
+"""Tests for the startup warm-up manifest."""
+
+import pytest
+from pathlib import Path
+from typing import List, Optional
+from unittest.mock import patch
+from interview_prep_mcp.leetcode.scheduler import Priority
+from interview_prep_mcp.leetcode.store import ProblemStore
+from interview_prep_mcp.leetcode.types import CachedProblemInfo, Problem
+from interview_prep_mcp.tools.load_problem import LoadProblemTool
+from interview_prep_mcp.tools.warmup import Warmup, parse_manifest, read_manifest
+from ..conftest import make_client, make_problem
+
+CATALOG = [
+    CachedProblemInfo(questionFrontendId="1", title="Two Sum", titleSlug="two-sum"),
+    CachedProblemInfo(questionFrontendId="2", title="Add Two Numbers", titleSlug="add-two-numbers"),
+    CachedProblemInfo(questionFrontendId="3", title="Paid", titleSlug="paid", paidOnly=True),
+    CachedProblemInfo(questionFrontendId="4", title="Median", titleSlug="median"),
+    CachedProblemInfo(questionFrontendId="5", title="Palindrome", titleSlug="palindrome"),
+]
+
+
+class TestManifest:
+    """Tests for parse_manifest and read_manifest."""
+
+    def test_entries_comments_and_commas(self) -> None:
+        """Test that lines, commas and comments all separate entries."""
+        text = "# interview loop\ntop 3, two-sum\n\n  42  # trapping rain water\nTOP:10\n"
+
+        assert parse_manifest(text) == ["top 3", "two-sum", "42", "TOP:10"]
+
+    def test_invalid_entry(self) -> None:
+        """Test that an entry that is not a slug, ID or "top N" is rejected."""
+        with pytest.raises(ValueError, match="Invalid warm-up entry 'Two Sum'"):
+            parse_manifest("two-sum, Two Sum")
+
+    def test_file_or_inline(self, tmp_path: Path) -> None:
+        """Test that a path is read and anything else is parsed inline."""
+        path = tmp_path / "warmup.txt"
+        path.write_text("two-sum\nmedian\n")
+
+        assert read_manifest(str(path)) == ["two-sum", "median"]
+        assert read_manifest("top 5") == ["top 5"]
+
+
+class TestWarmup:
+    """Tests for Warmup."""
+
+    @pytest.mark.asyncio
+    async def test_resolves_entries_and_reports_sources(self, tmp_path: Path) -> None:
+        """Test top N, IDs and slugs, and the memory/disk/network split."""
+        store = ProblemStore(tmp_path / "problems.sqlite3")
+        store.put_problem_sync(make_problem("median"))
+        client = make_client(CATALOG, store)
+        client._fetched_problems.set("two-sum", make_problem("two-sum"))
+        fetched: List[str] = []
+
+        async def upstream(
+            slug: str, priority: Priority = Priority.INTERACTIVE
+        ) -> Optional[Problem]:
+            assert priority == Priority.BACKGROUND
+            fetched.append(slug)
+            if slug == "palindrome":
+                return None
+            client._fetched_problems.set(slug, make_problem(slug))
+            return make_problem(slug)
+
+        warmup = Warmup(
+            client, ["top 3", "2", "palindrome", "99", "no-such-problem"], concurrency=2
+        )
+        with patch.object(client, "_request_problem", side_effect=upstream):
+            report = await warmup.run()
+
+        assert sorted(fetched) == ["add-two-numbers", "palindrome"]
+        assert (report.problems, report.memory, report.disk, report.network) == (4, 1, 1, 1)
+        assert report.failed == 3 and report.disk_fraction == pytest.approx(0.333)
+        assert report.errors == [
+            {"problem": "99", "error": "Unknown problem ID"},
+            {"problem": "no-such-problem", "error": "Not in the catalog"},
+            {"problem": "palindrome", "error": "Problem not found: palindrome"},
+        ]
+        assert report.status == "done" and client.is_cached("median")
+
+    @pytest.mark.asyncio
+    async def test_runs_once(self) -> None:
+        """Test that starting it again, or awaiting it, does not reload."""
+        client = make_client(CATALOG)
+        calls: List[str] = []
+
+        async def upstream(
+            slug: str, priority: Priority = Priority.INTERACTIVE
+        ) -> Optional[Problem]:
+            calls.append(slug)
+            return make_problem(slug)
+
+        tool = LoadProblemTool(client, warmup=["two-sum"])
+        assert tool.warmup is not None and tool.warmup.metrics() is None
+        with patch.object(client, "_request_problem", side_effect=upstream):
+            await tool.initialize()
+            report = await tool.warmup.run()
+            tool.warmup.start()
+            assert await tool.warmup.run() is report
+
+        assert calls == ["two-sum"]
+        assert report.network == 1 and report.disk_fraction == 0.0
+        metrics = tool.warmup.metrics()
+        assert metrics is not None and metrics["status"] == "done"
+        assert LoadProblemTool(client).warmup is None